@@ -1,44 +1,227 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from functools import lru_cache
+import hashlib
+import os
 from pathlib import Path
 import sqlite3
+import threading
+from typing import Iterator
+import weakref
 
 from core.corpus.migrations.runner import apply_migrations_to_connection
 from core.corpus.predicate import register_predicate_functions
 
 
 _SCHEMA_PATH = Path(__file__).with_name('schema.sql')
+_MIGRATIONS_DIR = Path(__file__).with_name('migrations')
+_READER_MMAP_BYTES = int(os.getenv('CORPUS_DB_MMAP_BYTES', str(256 * 1024 * 1024)))
+_READER_CACHE_KIB = int(os.getenv('CORPUS_DB_CACHE_KIB', str(64 * 1024)))
+_READER_BUSY_TIMEOUT_MS = int(os.getenv('CORPUS_DB_BUSY_TIMEOUT_MS', '5000'))
+
+_fts5_checked = False
+_fts5_lock = threading.Lock()
 
 
 def open_corpus_db(path: Path) -> sqlite3.Connection:
-    """Open the corpus SQLite DB and apply the idempotent schema on every open."""
+    """Open the corpus SQLite DB, applying schema and migrations unless already current.
+
+    The DB's ``user_version`` carries a stamp of ``schema.sql`` plus the
+    migrations; when it matches, the schema script and migration runner are
+    skipped.  The FTS5 smoke test runs once per process.
+    """
     db_path = Path(path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    db = _connect(db_path)
+    db.execute('PRAGMA foreign_keys=ON')
+    _ensure_fts5_available(db)
+    register_predicate_functions(db)
+
+    if _stored_schema_stamp(db) != corpus_schema_stamp():
+        db.execute('PRAGMA journal_mode=WAL')
+        with db:
+            db.executescript(_SCHEMA_PATH.read_text(encoding='utf-8'))
+        apply_migrations_to_connection(db)
+        db.execute(f'PRAGMA user_version={corpus_schema_stamp()}')
+
+    return db
+
+
+@lru_cache(maxsize=1)
+def corpus_schema_stamp() -> int:
+    """Positive 28-bit digest of ``schema.sql``, the migration files and their runner."""
+    digest = hashlib.sha256(_SCHEMA_PATH.read_bytes())
+    for path in sorted([*_MIGRATIONS_DIR.glob('*.sql'), _MIGRATIONS_DIR / 'runner.py']):
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes())
+    return int(digest.hexdigest()[:7], 16) or 1
+
+
+class _ReaderSlot:
+    """Holds one thread's reader in its thread-local storage.
+
+    The slot dies with the thread's locals when the thread exits, and its
+    finalizer closes the reader.
+    """
+
+    __slots__ = ('db', '__weakref__')
+
+    def __init__(self, db: sqlite3.Connection) -> None:
+        self.db = db
+
+
+def _release_reader(
+    pool_ref: 'weakref.ReferenceType[CorpusConnectionPool]',
+    slot_id: int,
+    db: sqlite3.Connection,
+    pid: int,
+) -> None:
+    if os.getpid() != pid:
+        return  # inherited across fork; the child must not close it
+    pool = pool_ref()
+    if pool is not None:
+        with pool._lock:
+            if pool._connections.get(slot_id) is db:
+                del pool._connections[slot_id]
+    db.close()
+
+
+class CorpusConnectionPool:
+    """Process-wide, per-thread read-only connections to one corpus DB.
+
+    The schema is brought current once (through ``open_corpus_db``) before the
+    first reader opens.  Readers are ``query_only`` with larger mmap/page
+    caches and are kept for the life of the thread: each sits in a
+    thread-local slot whose finalizer closes it once the thread exits, so
+    short-lived worker threads do not leak connections.  A forked child
+    starts a fresh set.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._schema_ready = False
+        self._pid = os.getpid()
+
+    def connection(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+        slot = getattr(self._local, 'slot', None)
+        if slot is None:
+            self._ensure_schema()
+            db = self._open_reader()
+            slot = _ReaderSlot(db)
+            weakref.finalize(slot, _release_reader, weakref.ref(self), id(slot), db, self._pid)
+            self._local.slot = slot
+            with self._lock:
+                self._connections[id(slot)] = db
+        return slot.db
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        db = self.connection()
+        try:
+            yield db
+        finally:
+            if db.in_transaction:
+                db.rollback()
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, {}
+            local, self._local = self._local, threading.local()
+        # Dropping the old locals fires the slot finalizers, which take the lock.
+        del local
+        for db in connections.values():
+            db.close()
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with self._lock:
+            if not self._schema_ready:
+                open_corpus_db(self.path).close()
+                self._schema_ready = True
+
+    def _open_reader(self) -> sqlite3.Connection:
+        # Shared with close() from other threads; only the owning thread ever runs queries.
+        db = _connect(self.path, check_same_thread=False)
+        db.execute('PRAGMA foreign_keys=ON')
+        db.execute(f'PRAGMA busy_timeout={_READER_BUSY_TIMEOUT_MS}')
+        db.execute(f'PRAGMA mmap_size={_READER_MMAP_BYTES}')
+        db.execute(f'PRAGMA cache_size={-_READER_CACHE_KIB}')
+        db.execute('PRAGMA temp_store=MEMORY')
+        db.execute('PRAGMA query_only=ON')
+        _ensure_fts5_available(db)
+        register_predicate_functions(db)
+        return db
+
+    def _reset_after_fork(self) -> None:
+        # Connections inherited across fork must not be used (or closed) by the child.
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections = {}
+        self._pid = os.getpid()
+
+
+_pools: dict[Path, CorpusConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def corpus_connection_pool(path: Path) -> CorpusConnectionPool:
+    """The process-wide read pool for ``path``."""
+    key = Path(os.path.abspath(os.fspath(path)))
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(key, CorpusConnectionPool(key))
+    return pool
+
+
+@contextmanager
+def corpus_reader(path: Path) -> Iterator[sqlite3.Connection]:
+    """This thread's pooled read-only connection to the corpus DB at ``path``."""
+    with corpus_connection_pool(path).reader() as db:
+        yield db
+
+
+def close_corpus_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _connect(db_path: Path, *, check_same_thread: bool = True) -> sqlite3.Connection:
     db = sqlite3.connect(
         db_path,
         detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        check_same_thread=check_same_thread,
     )
     db.row_factory = sqlite3.Row
-    db.execute('PRAGMA journal_mode=WAL')
-    db.execute('PRAGMA foreign_keys=ON')
-
-    _ensure_fts5_available(db)
-    register_predicate_functions(db)
+    return db
 
-    with db:
-        db.executescript(_SCHEMA_PATH.read_text(encoding='utf-8'))
-    apply_migrations_to_connection(db)
 
-    return db
+def _stored_schema_stamp(db: sqlite3.Connection) -> int:
+    return int(db.execute('PRAGMA user_version').fetchone()[0])
 
 
 def _ensure_fts5_available(db: sqlite3.Connection) -> None:
-    try:
-        db.execute('CREATE VIRTUAL TABLE temp.__fts5_smoke USING fts5(content)')
-        db.execute('DROP TABLE temp.__fts5_smoke')
-    except sqlite3.OperationalError as exc:
-        raise RuntimeError('SQLite FTS5 is required for corpus indexing') from exc
+    global _fts5_checked
+    if not _fts5_checked:
+        with _fts5_lock:
+            if not _fts5_checked:
+                try:
+                    db.execute('CREATE VIRTUAL TABLE temp.__fts5_smoke USING fts5(content)')
+                    db.execute('DROP TABLE temp.__fts5_smoke')
+                except sqlite3.OperationalError as exc:
+                    raise RuntimeError('SQLite FTS5 is required for corpus indexing') from exc
+                _fts5_checked = True
 
     try:
         db.execute('SELECT fts5_version()').fetchone()
@@ -47,4 +230,11 @@ def _ensure_fts5_available(db: sqlite3.Connection) -> None:
         db.create_function('fts5_version', 0, lambda: sqlite3.sqlite_version)
 
 
-__all__ = ['open_corpus_db']
+__all__ = [
+    'CorpusConnectionPool',
+    'close_corpus_pools',
+    'corpus_connection_pool',
+    'corpus_reader',
+    'corpus_schema_stamp',
+    'open_corpus_db',
+]
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 import sqlite3
+from typing import ContextManager
 
 from core.corpus._paths import corpus_db_path, corpus_root
 from core.corpus import edgar_api_client
-from core.corpus.db import open_corpus_db
+from core.corpus.db import corpus_reader
 from core.corpus.frontmatter import parse_frontmatter
 from core.corpus.offsets import slice_scoped_text_with_offsets
 from core.corpus.search import _quality_filter_sql, _resolved_source_url_sql, _search
@@ -72,8 +73,7 @@ def filings_search(
     validate_search_inputs(query, universe, limit)
     resolved_form_types = _resolve_filings_form_types(form_type)
 
-    db = _open_runtime_db()
-    try:
+    with _runtime_reader() as db:
         return _search(
             db=db,
             query=query,
@@ -88,8 +88,6 @@ def filings_search(
             include_low_confidence_supersession=include_low_confidence_supersession,
             limit=limit,
         )
-    finally:
-        db.close()
 
 
 def filings_read(
@@ -523,8 +521,8 @@ def _corpus_db_path() -> Path:
     return corpus_db_path()
 
 
-def _open_runtime_db() -> sqlite3.Connection:
-    return open_corpus_db(_corpus_db_path())
+def _runtime_reader() -> ContextManager[sqlite3.Connection]:
+    return corpus_reader(_corpus_db_path())
 
 
 __all__ = [
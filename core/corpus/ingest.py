@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 import os
 from pathlib import Path
 import sqlite3
+from typing import Iterable, Iterator
 import uuid
 
 from core.corpus._paths import normalize_corpus_path
@@ -20,8 +24,12 @@ from core.corpus.html_mapping import (
     sidecar_path_for_canonical,
     write_mapping_sidecar,
 )
-from core.corpus.section_map import parse_sections
-from core.corpus.sections_index import replace_sections_for_document
+from core.corpus.section_map import SectionRow, parse_sections
+from core.corpus.sections_index import (
+    append_sections,
+    delete_sections_for_documents,
+    replace_sections_for_document,
+)
 from core.corpus.supersession import update_is_superseded_by
 
 
@@ -97,6 +105,26 @@ _UPSERT_MUTABLE_COLUMNS = (
     'producer_instance_id',
     'producer_build_id',
 )
+_INGEST_WORKERS = int(os.getenv('CORPUS_INGEST_WORKERS', '4'))
+_PREPARE_WINDOW_PER_WORKER = 16
+
+
+@dataclass(frozen=True)
+class BulkIngestItem:
+    body: str
+    metadata: dict
+    html_mapping_source: dict | None = None
+
+
+@dataclass(frozen=True)
+class _PreparedDocument:
+    document_row: dict[str, object]
+    content_hash: str
+    canonical_path: Path
+    sections: list[SectionRow]
+    mapping_sidecar: dict | None
+    mapping_sidecar_path: Path | None
+    mapping_sidecar_hash: str | None
 
 
 def ingest_raw(
@@ -108,20 +136,88 @@ def ingest_raw(
     html_mapping_source: dict | None = None,
 ) -> IngestResult:
     """Single authoritative write path for corpus markdown and index rows."""
-    build_frontmatter(metadata, with_placeholder_hash=True)
-    assembled_text = assemble_canonical_text(metadata, body)
+    prepared = _prepare_document(
+        BulkIngestItem(body=body, metadata=metadata, html_mapping_source=html_mapping_source),
+        normalize_corpus_path(corpus_root),
+    )
+    document_row = prepared.document_row
+    mapping_record_count = 0
+
+    with db:
+        db.execute(_documents_upsert_sql(), tuple(document_row[column] for column in _DOCUMENT_COLUMNS))
+        replace_sections_for_document(db, str(document_row['document_id']), prepared.sections)
+        mapping_record_count = _ingest_prepared_mapping(db, prepared)
+        if _supersedes_with_high_confidence(document_row):
+            update_is_superseded_by(db, document_id=document_row['supersedes'])
+
+    return _ingest_result(prepared, mapping_record_count)
+
+
+def ingest_raw_bulk(
+    items: Iterable[BulkIngestItem],
+    corpus_root: Path,
+    db: sqlite3.Connection,
+    *,
+    batch_size: int = 500,
+    workers: int | None = None,
+) -> list[IngestResult]:
+    """Bulk variant of ``ingest_raw`` for backfills.
 
+    Canonicalization, hashing, file writes, section parsing and mapping
+    sidecars run in a process pool (``CORPUS_INGEST_WORKERS``).  Documents and
+    sections are then committed ``batch_size`` documents per transaction with
+    ``executemany``, and supersession for every high-confidence ``supersedes``
+    target of a committed batch is recomputed once at the end.  Items are
+    applied in order, so a superseding document must follow the one it
+    supersedes as with ``ingest_raw``.  Each committed batch stays committed
+    if a later item fails, and its supersession targets are still updated
+    before the error propagates.
+    """
     corpus_root = normalize_corpus_path(corpus_root)
+    results: list[IngestResult] = []
+    supersedes_targets: dict[str, None] = {}
+    batch: list[_PreparedDocument] = []
+    batch_document_ids: set[str] = set()
+
+    def _commit() -> None:
+        results.extend(_commit_prepared_batch(db, batch))
+        for prepared in batch:
+            if _supersedes_with_high_confidence(prepared.document_row):
+                supersedes_targets[str(prepared.document_row['supersedes'])] = None
+
+    try:
+        for prepared in _prepare_documents(items, corpus_root, workers):
+            document_id = str(prepared.document_row['document_id'])
+            if len(batch) >= batch_size or document_id in batch_document_ids:
+                _commit()
+                batch, batch_document_ids = [], set()
+            batch.append(prepared)
+            batch_document_ids.add(document_id)
+        if batch:
+            _commit()
+    finally:
+        if supersedes_targets:
+            with db:
+                for target in supersedes_targets:
+                    update_is_superseded_by(db, document_id=target)
+
+    return results
+
+
+def _prepare_document(item: BulkIngestItem, corpus_root: Path) -> _PreparedDocument:
+    """Finalize, write and parse one document; touches files only, never the DB."""
+    build_frontmatter(item.metadata, with_placeholder_hash=True)
+    assembled_text = assemble_canonical_text(item.metadata, item.body)
+
     staging_dir = corpus_root / '.staging'
     staging_dir.mkdir(parents=True, exist_ok=True)
-    staging_path = staging_dir / f'{uuid.uuid4()}.md'
-    staging_path.write_text(assembled_text, encoding='utf-8')
 
     finalized_text, content_hash = finalize_with_hash(assembled_text)
-    finalized_metadata = dict(metadata)
+    finalized_metadata = dict(item.metadata)
     finalized_metadata['content_hash'] = content_hash
     finalized_path = canonical_path(finalized_metadata, corpus_root)
     finalized_path.parent.mkdir(parents=True, exist_ok=True)
+    staging_path = staging_dir / f'{uuid.uuid4()}.md'
     staging_path.write_text(finalized_text, encoding='utf-8')
     os.rename(staging_path, finalized_path)
 
@@ -130,7 +226,7 @@ def ingest_raw(
         finalized_text=finalized_text,
         metadata=finalized_metadata,
         sections=sections,
-        sections_response=html_mapping_source,
+        sections_response=item.html_mapping_source,
         canonical_path=finalized_path,
     )
     mapping_sidecar_path: Path | None = None
@@ -141,33 +237,115 @@ def ingest_raw(
         mapping_sidecar_hash = write_mapping_sidecar(staging_sidecar_path, mapping_sidecar)
         os.rename(staging_sidecar_path, mapping_sidecar_path)
 
-    document_row = _build_document_row(finalized_metadata, finalized_path)
-    mapping_record_count = 0
+    return _PreparedDocument(
+        document_row=_build_document_row(finalized_metadata, finalized_path),
+        content_hash=content_hash,
+        canonical_path=finalized_path,
+        sections=list(sections),
+        mapping_sidecar=mapping_sidecar,
+        mapping_sidecar_path=mapping_sidecar_path,
+        mapping_sidecar_hash=mapping_sidecar_hash,
+    )
+
+
+def _prepare_documents(
+    items: Iterable[BulkIngestItem],
+    corpus_root: Path,
+    workers: int | None,
+) -> Iterator[_PreparedDocument]:
+    workers = min(workers or _INGEST_WORKERS, os.cpu_count() or 1)
+    prepare = partial(_prepare_document, corpus_root=corpus_root)
+    if workers <= 1:
+        yield from map(prepare, items)
+        return
+
+    # Bounded look-ahead so a large backfill never holds every parsed document in memory.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[_PreparedDocument]] = deque()
+        for item in items:
+            pending.append(executor.submit(prepare, item))
+            if len(pending) >= workers * _PREPARE_WINDOW_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _commit_prepared_batch(
+    db: sqlite3.Connection,
+    batch: list[_PreparedDocument],
+) -> list[IngestResult]:
+    document_ids = [str(prepared.document_row['document_id']) for prepared in batch]
+    mapping_record_counts: list[int] = []
 
     with db:
-        db.execute(_documents_upsert_sql(), tuple(document_row[column] for column in _DOCUMENT_COLUMNS))
-        replace_sections_for_document(db, str(document_row['document_id']), sections)
-        if mapping_sidecar is not None and mapping_sidecar_path is not None and mapping_sidecar_hash is not None:
-            mapping_result = ingest_mapping_sidecar(
-                db,
-                sidecar=mapping_sidecar,
-                sidecar_path=mapping_sidecar_path,
-                sidecar_hash=mapping_sidecar_hash,
-            )
-            mapping_record_count = mapping_result.record_count
-        if (
-            document_row.get('supersedes')
-            and document_row.get('supersedes_confidence') == 'high'
-        ):
-            update_is_superseded_by(db, document_id=document_row['supersedes'])
+        existing_ids = _existing_document_ids(db, document_ids)
+        db.executemany(
+            _documents_upsert_sql(),
+            [
+                tuple(prepared.document_row[column] for column in _DOCUMENT_COLUMNS)
+                for prepared in batch
+            ],
+        )
+        delete_sections_for_documents(
+            db,
+            [document_id for document_id in document_ids if document_id in existing_ids],
+        )
+        append_sections(
+            db,
+            [
+                (document_id, section)
+                for document_id, prepared in zip(document_ids, batch)
+                for section in prepared.sections
+            ],
+        )
+        for prepared in batch:
+            mapping_record_counts.append(_ingest_prepared_mapping(db, prepared))
+
+    return [
+        _ingest_result(prepared, mapping_record_count)
+        for prepared, mapping_record_count in zip(batch, mapping_record_counts)
+    ]
+
+
+def _existing_document_ids(db: sqlite3.Connection, document_ids: list[str]) -> set[str]:
+    placeholders = ', '.join('?' for _ in document_ids)
+    return {
+        str(row[0])
+        for row in db.execute(
+            f'SELECT document_id FROM documents WHERE document_id IN ({placeholders})',
+            document_ids,
+        )
+    }
+
+
+def _ingest_prepared_mapping(db: sqlite3.Connection, prepared: _PreparedDocument) -> int:
+    if (
+        prepared.mapping_sidecar is None
+        or prepared.mapping_sidecar_path is None
+        or prepared.mapping_sidecar_hash is None
+    ):
+        return 0
+    mapping_result = ingest_mapping_sidecar(
+        db,
+        sidecar=prepared.mapping_sidecar,
+        sidecar_path=prepared.mapping_sidecar_path,
+        sidecar_hash=prepared.mapping_sidecar_hash,
+    )
+    return mapping_result.record_count
 
+
+def _supersedes_with_high_confidence(document_row: dict[str, object]) -> bool:
+    return bool(document_row.get('supersedes')) and document_row.get('supersedes_confidence') == 'high'
+
+
+def _ingest_result(prepared: _PreparedDocument, mapping_record_count: int) -> IngestResult:
     return IngestResult(
         status='complete',
-        document_id=document_row['document_id'],
-        content_hash=content_hash,
-        canonical_path=finalized_path,
+        document_id=str(prepared.document_row['document_id']),
+        content_hash=prepared.content_hash,
+        canonical_path=prepared.canonical_path,
         warnings=[],
-        mapping_sidecar_path=mapping_sidecar_path,
+        mapping_sidecar_path=prepared.mapping_sidecar_path,
         mapping_record_count=mapping_record_count,
     )
 
@@ -190,4 +368,4 @@ def _documents_upsert_sql() -> str:
     )
 
 
-__all__ = ['FrontmatterValidationError', 'IngestResult', 'ingest_raw']
+__all__ = ['BulkIngestItem', 'FrontmatterValidationError', 'IngestResult', 'ingest_raw', 'ingest_raw_bulk']
@@ -0,0 +1,54 @@
+CREATE TABLE IF NOT EXISTS corpus_write_generation (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO corpus_write_generation (id, generation) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_generation_insert
+AFTER INSERT ON documents
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_generation_update
+AFTER UPDATE ON documents
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_generation_delete
+AFTER DELETE ON documents
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sections_fts_metadata_generation_insert
+AFTER INSERT ON sections_fts_metadata
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sections_fts_metadata_generation_update
+AFTER UPDATE ON sections_fts_metadata
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sections_fts_metadata_generation_delete
+AFTER DELETE ON sections_fts_metadata
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sections_fts_metadata_state_generation_insert
+AFTER INSERT ON sections_fts_metadata_state
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sections_fts_metadata_state_generation_update
+AFTER UPDATE ON sections_fts_metadata_state
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
@@ -0,0 +1,12 @@
+CREATE TABLE IF NOT EXISTS corpus_file_manifest (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT,
+    document_id TEXT,
+    frontmatter_json TEXT,
+    scanned_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_corpus_file_manifest_document
+    ON corpus_file_manifest(document_id);
@@ -0,0 +1,101 @@
+CREATE TRIGGER IF NOT EXISTS trg_documents_sections_fts_metadata_update
+AFTER UPDATE OF
+    ticker,
+    source,
+    form_type,
+    fiscal_period,
+    filing_date,
+    extraction_status,
+    sector,
+    is_superseded_by
+ON documents
+WHEN NEW.ticker IS NOT OLD.ticker
+    OR NEW.source IS NOT OLD.source
+    OR NEW.form_type IS NOT OLD.form_type
+    OR NEW.fiscal_period IS NOT OLD.fiscal_period
+    OR NEW.filing_date IS NOT OLD.filing_date
+    OR NEW.extraction_status IS NOT OLD.extraction_status
+    OR NEW.sector IS NOT OLD.sector
+    OR NEW.is_superseded_by IS NOT OLD.is_superseded_by
+BEGIN
+    UPDATE sections_fts_metadata
+    SET
+        ticker = NEW.ticker,
+        source = NEW.source,
+        form_type = NEW.form_type,
+        fiscal_period = NEW.fiscal_period,
+        filing_date = CAST(NEW.filing_date AS TEXT),
+        extraction_status = COALESCE(NEW.extraction_status, 'complete'),
+        sector = NEW.sector,
+        is_superseded_by = NEW.is_superseded_by
+    WHERE document_id = NEW.document_id;
+END;
+
+DELETE FROM sections_fts_metadata
+WHERE fts_rowid NOT IN (SELECT rowid FROM sections_fts);
+
+UPDATE sections_fts_metadata
+SET
+    ticker = d.ticker,
+    source = d.source,
+    form_type = d.form_type,
+    fiscal_period = d.fiscal_period,
+    filing_date = CAST(d.filing_date AS TEXT),
+    extraction_status = COALESCE(d.extraction_status, 'complete'),
+    sector = d.sector,
+    is_superseded_by = d.is_superseded_by
+FROM documents d
+WHERE d.document_id = sections_fts_metadata.document_id
+    AND (
+        sections_fts_metadata.ticker IS NOT d.ticker
+        OR sections_fts_metadata.source IS NOT d.source
+        OR sections_fts_metadata.form_type IS NOT d.form_type
+        OR sections_fts_metadata.fiscal_period IS NOT d.fiscal_period
+        OR sections_fts_metadata.filing_date IS NOT CAST(d.filing_date AS TEXT)
+        OR sections_fts_metadata.extraction_status IS NOT COALESCE(d.extraction_status, 'complete')
+        OR sections_fts_metadata.sector IS NOT d.sector
+        OR sections_fts_metadata.is_superseded_by IS NOT d.is_superseded_by
+    );
+
+INSERT INTO sections_fts_metadata (
+    fts_rowid,
+    document_id,
+    ticker,
+    source,
+    form_type,
+    fiscal_period,
+    filing_date,
+    extraction_status,
+    sector,
+    is_superseded_by,
+    section,
+    speaker_name,
+    speaker_role,
+    char_start,
+    char_end
+)
+SELECT
+    s.rowid,
+    s.document_id,
+    d.ticker,
+    d.source,
+    d.form_type,
+    d.fiscal_period,
+    CAST(d.filing_date AS TEXT),
+    COALESCE(d.extraction_status, 'complete'),
+    d.sector,
+    d.is_superseded_by,
+    s.section,
+    s.speaker_name,
+    s.speaker_role,
+    s.char_start,
+    s.char_end
+FROM sections_fts s
+JOIN documents d ON d.document_id = s.document_id
+WHERE s.rowid NOT IN (SELECT fts_rowid FROM sections_fts_metadata);
+
+INSERT INTO sections_fts_metadata_state (id, is_complete, refreshed_at)
+VALUES (1, 1, CURRENT_TIMESTAMP)
+ON CONFLICT(id) DO UPDATE SET
+    is_complete = excluded.is_complete,
+    refreshed_at = excluded.refreshed_at;
@@ -0,0 +1,5 @@
+DROP TRIGGER IF EXISTS trg_sections_fts_metadata_generation_insert;
+DROP TRIGGER IF EXISTS trg_sections_fts_metadata_generation_update;
+DROP TRIGGER IF EXISTS trg_sections_fts_metadata_generation_delete;
+DROP TRIGGER IF EXISTS trg_sections_fts_metadata_state_generation_insert;
+DROP TRIGGER IF EXISTS trg_sections_fts_metadata_state_generation_update;
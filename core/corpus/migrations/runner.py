@@ -330,8 +330,20 @@ def _apply_migration(db: sqlite3.Connection, migration: _Migration) -> None:
 
 
 def _split_sql_statements(sql: str) -> list[str]:
-    statements = [statement.strip() for statement in sql.split(';')]
-    return [statement for statement in statements if statement]
+    # Re-join pieces until SQLite sees a complete statement, so trigger bodies
+    # (BEGIN ... ; ... END) stay whole.
+    statements: list[str] = []
+    pending = ''
+    for piece in sql.split(';'):
+        pending += piece + ';'
+        if sqlite3.complete_statement(pending):
+            statement = pending[:-1].strip()
+            if statement:
+                statements.append(statement)
+            pending = ''
+    if pending[:-1].strip():
+        statements.append(pending[:-1].strip())
+    return statements
 
 
 def _ensure_parser_provenance(
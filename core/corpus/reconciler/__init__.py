@@ -12,7 +12,13 @@ from core.corpus.reconciler.db_sync import (
     sync_documents,
     sync_sections_fts,
 )
-from core.corpus.reconciler.walker import AuthoritativeFile, scan_corpus
+from core.corpus.reconciler.walker import (
+    AuthoritativeFile,
+    CorpusScan,
+    clear_corpus_manifest,
+    scan_corpus,
+    scan_corpus_incremental,
+)
 
 
 @dataclass(frozen=True)
@@ -27,14 +33,35 @@ def reconcile(
     corpus_root: Path,
     db: sqlite3.Connection,
     logger: Logger | None = None,
+    *,
+    full: bool = False,
+    workers: int | None = None,
 ) -> ReconcilerReport:
-    """Reconcile corpus files back into documents, sections_fts, and supersession state."""
+    """Reconcile corpus files back into documents, sections_fts, and supersession state.
+
+    Driven by the ``corpus_file_manifest`` table: only documents whose files
+    were added, changed or removed since the last reconcile (plus documents
+    missing from the DB) are re-parsed and re-synced.  ``full=True`` forgets
+    the manifest first and rebuilds every document.
+    """
     logger = logger or getLogger(__name__)
 
     with db:
-        scan = scan_corpus(corpus_root)
-        doc_report = sync_documents(db, scan, logger)
-        sections_report = sync_sections_fts(db, scan)
+        if full:
+            clear_corpus_manifest(db, corpus_root)
+        corpus_scan = scan_corpus_incremental(corpus_root, db, workers=workers)
+        scan = corpus_scan.files
+        known_document_ids = {row['document_id'] for row in db.execute('SELECT document_id FROM documents')}
+        refresh_ids = set(corpus_scan.changed_document_ids) | (scan.keys() - known_document_ids)
+        logger.info(
+            'corpus_scan: documents=%d files_parsed=%d files_removed=%d documents_refreshed=%d',
+            len(scan),
+            corpus_scan.files_parsed,
+            corpus_scan.files_removed,
+            len(refresh_ids & scan.keys()),
+        )
+        doc_report = sync_documents(db, scan, logger, document_ids=refresh_ids)
+        sections_report = sync_sections_fts(db, scan, document_ids=refresh_ids)
         supersession_updates = recompute_supersession(db)
         divergences = [authoritative for authoritative in scan.values() if authoritative.other_files]
         for authoritative in divergences:
@@ -55,12 +82,15 @@ def reconcile(
 
 __all__ = [
     'AuthoritativeFile',
+    'CorpusScan',
     'DBSyncReport',
     'ReconcilerReport',
     'SectionsFtsReport',
+    'clear_corpus_manifest',
     'reconcile',
     'recompute_supersession',
     'scan_corpus',
+    'scan_corpus_incremental',
     'sync_documents',
     'sync_sections_fts',
 ]
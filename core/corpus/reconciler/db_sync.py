@@ -5,6 +5,7 @@ from datetime import date, datetime, timezone
 from logging import Logger
 from pathlib import Path
 import sqlite3
+from typing import Collection
 
 from core.corpus.frontmatter import FRONTMATTER_PATTERN, FrontmatterValidationError, parse_frontmatter
 from core.corpus.reconciler.walker import AuthoritativeFile
@@ -54,6 +55,7 @@ _DOCUMENT_COLUMNS = (
 )
 _UPSERT_COLUMNS = _DOCUMENT_COLUMNS + ('last_indexed',)
 _UPDATE_COLUMNS = tuple(column for column in _DOCUMENT_COLUMNS if column != 'document_id')
+_SELECT_CHUNK_SIZE = 500
 
 
 @dataclass(frozen=True)
@@ -74,19 +76,38 @@ def sync_documents(
     db: sqlite3.Connection,
     scan_result: dict[str, AuthoritativeFile],
     logger: Logger,
+    document_ids: Collection[str] | None = None,
 ) -> DBSyncReport:
-    """Apply authoritative scan results to the documents table."""
-    existing_rows = {
-        row['document_id']: row
-        for row in db.execute(_select_documents_sql())
-    }
-    available_document_ids = set(existing_rows)
+    """Apply authoritative scan results to the documents table.
+
+    With ``document_ids`` only those documents are upserted; orphan detection
+    still covers the whole scan.
+    """
+    if document_ids is None:
+        existing_rows = {
+            row['document_id']: row
+            for row in db.execute(_select_documents_sql())
+        }
+        available_document_ids = set(existing_rows)
+    else:
+        existing_rows = _select_document_rows(db, sorted(set(document_ids)))
+        available_document_ids = {
+            row['document_id']
+            for row in db.execute('SELECT document_id FROM documents')
+        }
 
     rows_inserted = 0
     rows_updated = 0
     now_value = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')
 
-    pending = sorted(scan_result.items(), key=lambda item: item[0])
+    pending = sorted(
+        (
+            (document_id, authoritative)
+            for document_id, authoritative in scan_result.items()
+            if document_ids is None or document_id in document_ids
+        ),
+        key=lambda item: item[0],
+    )
     while pending:
         next_round = []
         progressed = False
@@ -169,11 +190,19 @@ def sync_documents(
 def sync_sections_fts(
     db: sqlite3.Connection,
     scan_result: dict[str, AuthoritativeFile],
+    document_ids: Collection[str] | None = None,
 ) -> SectionsFtsReport:
-    """Delete and rebuild sections_fts rows from authoritative disk files."""
+    """Delete and rebuild sections_fts rows from authoritative disk files.
+
+    With ``document_ids`` only those documents are re-read and rebuilt.
+    """
     total_sections_inserted = 0
+    refreshed = 0
 
     for document_id, authoritative in scan_result.items():
+        if document_ids is not None and document_id not in document_ids:
+            continue
+        refreshed += 1
         text = authoritative.file_path.read_text(encoding='utf-8')
         body = _extract_body(text)
         source = str(authoritative.frontmatter['source'])
@@ -185,7 +214,7 @@ def sync_sections_fts(
     mark_sections_fts_metadata_complete(db)
 
     return SectionsFtsReport(
-        document_ids_refreshed=len(scan_result),
+        document_ids_refreshed=refreshed,
         total_sections_inserted=total_sections_inserted,
     )
 
@@ -237,6 +266,16 @@ def _select_documents_sql() -> str:
     return f"SELECT {', '.join(select_columns)} FROM documents"
 
 
+def _select_document_rows(db: sqlite3.Connection, document_ids: list[str]) -> dict[str, sqlite3.Row]:
+    rows: dict[str, sqlite3.Row] = {}
+    for start in range(0, len(document_ids), _SELECT_CHUNK_SIZE):
+        chunk = document_ids[start:start + _SELECT_CHUNK_SIZE]
+        placeholders = ', '.join('?' for _ in chunk)
+        for row in db.execute(f'{_select_documents_sql()} WHERE document_id IN ({placeholders})', chunk):
+            rows[row['document_id']] = row
+    return rows
+
+
 def _update_documents_sql() -> str:
     assignments = ', '.join(f'{column} = ?' for column in _UPDATE_COLUMNS)
     return f'UPDATE documents SET {assignments}, last_indexed = ? WHERE document_id = ?'
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
+import json
 import logging
+import os
 from pathlib import Path
 import re
-from typing import Any
+import sqlite3
+from typing import Any, Iterator
 
 import yaml
 
@@ -23,6 +27,9 @@ _LOGGER = logging.getLogger(__name__)
 _SEMVER_PATTERN = re.compile(r'^(?P<major>\d+)\.(?P<minor>\d+)(?:\.(?P<patch>\d+))?$')
 _MIN_SORTABLE_TIMESTAMP = (0, 0, 0, 0, 0, 0, 0)
 _MIN_SORTABLE_SEMVER = (0, 0, 0)
+_RECONCILE_WORKERS = int(os.getenv('CORPUS_RECONCILE_WORKERS', '4'))
+_PARALLEL_PARSE_MIN_FILES = 64
+_PARSE_CHUNK_SIZE = 32
 
 
 @dataclass(frozen=True)
@@ -43,30 +50,163 @@ class _ScannedFile:
     sort_key: tuple[tuple[int, int, int, int, int, int, int], tuple[int, int, int], str]
 
 
+@dataclass(frozen=True)
+class CorpusScan:
+    files: dict[str, AuthoritativeFile]
+    changed_document_ids: frozenset[str]
+    files_parsed: int
+    files_removed: int
+
+
 def scan_corpus(corpus_root: Path) -> dict[str, AuthoritativeFile]:
     """Walk corpus markdown files and pick one authoritative file per document_id."""
     root = Path(corpus_root)
     if not root.exists():
         return {}
 
-    grouped: dict[str, list[_ScannedFile]] = {}
+    scanned_files: list[_ScannedFile] = []
+    for path in _iter_corpus_files(root):
+        frontmatter = _load_frontmatter(path)
+        if frontmatter is None:
+            continue
+        scanned_files.append(_scanned_file(normalize_corpus_path(path), frontmatter))
+
+    return _pick_authoritative(scanned_files)
+
+
+def scan_corpus_incremental(
+    corpus_root: Path,
+    db: sqlite3.Connection,
+    *,
+    workers: int | None = None,
+) -> CorpusScan:
+    """Scan via the ``corpus_file_manifest`` table, parsing only new or changed files.
+
+    A file whose (size, mtime_ns) matches its manifest row reuses the stored
+    frontmatter; manifest rows under ``corpus_root`` with no file left are
+    deleted.  ``changed_document_ids`` covers every document whose set of
+    files changed, i.e. whose authoritative file may differ from last scan.
+    The caller owns the transaction.
+    """
+    root = normalize_corpus_path(corpus_root)
+    root_prefix = os.path.join(str(root), '')
+    manifest = {
+        row['path']: row
+        for row in db.execute(
+            'SELECT path, size, mtime_ns, document_id, frontmatter_json FROM corpus_file_manifest'
+        )
+        if row['path'].startswith(root_prefix)
+    }
+
+    scanned_files: list[_ScannedFile] = []
+    to_parse: list[tuple[Path, int, int]] = []
+    seen_paths: set[str] = set()
+    if root.exists():
+        for path in _iter_corpus_files(root):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            file_path = normalize_corpus_path(path)
+            key = str(file_path)
+            seen_paths.add(key)
+            row = manifest.get(key)
+            if row is not None and row['size'] == stat.st_size and row['mtime_ns'] == stat.st_mtime_ns:
+                if row['frontmatter_json'] is not None:
+                    scanned_files.append(_scanned_file(file_path, json.loads(row['frontmatter_json'])))
+                continue
+            to_parse.append((file_path, stat.st_size, stat.st_mtime_ns))
+
+    changed_document_ids: set[str] = set()
+    now_value = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')
+    parsed = _load_frontmatters([file_path for file_path, _, _ in to_parse], workers)
+    for (file_path, size, mtime_ns), frontmatter in zip(to_parse, parsed):
+        previous = manifest.get(str(file_path))
+        if previous is not None and previous['document_id'] is not None:
+            changed_document_ids.add(previous['document_id'])
+        frontmatter_json = None
+        if frontmatter is not None:
+            scanned = _scanned_file(file_path, frontmatter)
+            scanned_files.append(scanned)
+            changed_document_ids.add(scanned.document_id)
+            try:
+                frontmatter_json = json.dumps(frontmatter, sort_keys=True)
+            except (TypeError, ValueError):
+                # Not representable; leave it out of the manifest so it is re-read next scan.
+                db.execute('DELETE FROM corpus_file_manifest WHERE path = ?', (str(file_path),))
+                continue
+        db.execute(
+            """
+            INSERT INTO corpus_file_manifest (
+                path, size, mtime_ns, content_hash, document_id, frontmatter_json, scanned_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                size = excluded.size,
+                mtime_ns = excluded.mtime_ns,
+                content_hash = excluded.content_hash,
+                document_id = excluded.document_id,
+                frontmatter_json = excluded.frontmatter_json,
+                scanned_at = excluded.scanned_at
+            """,
+            (
+                str(file_path),
+                size,
+                mtime_ns,
+                frontmatter['content_hash'] if frontmatter is not None else None,
+                frontmatter['document_id'] if frontmatter is not None else None,
+                frontmatter_json,
+                now_value,
+            ),
+        )
+
+    removed_paths = manifest.keys() - seen_paths
+    for path in removed_paths:
+        if manifest[path]['document_id'] is not None:
+            changed_document_ids.add(manifest[path]['document_id'])
+    db.executemany(
+        'DELETE FROM corpus_file_manifest WHERE path = ?',
+        [(path,) for path in sorted(removed_paths)],
+    )
+
+    return CorpusScan(
+        files=_pick_authoritative(scanned_files),
+        changed_document_ids=frozenset(changed_document_ids),
+        files_parsed=len(to_parse),
+        files_removed=len(removed_paths),
+    )
+
+
+def clear_corpus_manifest(db: sqlite3.Connection, corpus_root: Path) -> int:
+    """Forget manifest rows under ``corpus_root`` so the next scan re-reads every file."""
+    root_prefix = os.path.join(str(normalize_corpus_path(corpus_root)), '')
+    cursor = db.execute(
+        "DELETE FROM corpus_file_manifest WHERE substr(path, 1, ?) = ?",
+        (len(root_prefix), root_prefix),
+    )
+    return int(cursor.rowcount or 0)
+
+
+def _iter_corpus_files(root: Path) -> Iterator[Path]:
     for path in sorted(root.rglob('*.md')):
         if not path.is_file() or '.staging' in path.parts:
             continue
+        yield path
 
-        frontmatter = _load_frontmatter(path)
-        if frontmatter is None:
-            continue
 
-        document_id = frontmatter['document_id']
-        scanned = _ScannedFile(
-            document_id=document_id,
-            file_path=normalize_corpus_path(path),
-            content_hash=frontmatter['content_hash'],
-            frontmatter=frontmatter,
-            sort_key=_authoritative_sort_key(frontmatter),
-        )
-        grouped.setdefault(document_id, []).append(scanned)
+def _scanned_file(file_path: Path, frontmatter: dict[str, Any]) -> _ScannedFile:
+    return _ScannedFile(
+        document_id=frontmatter['document_id'],
+        file_path=file_path,
+        content_hash=frontmatter['content_hash'],
+        frontmatter=frontmatter,
+        sort_key=_authoritative_sort_key(frontmatter),
+    )
+
+
+def _pick_authoritative(scanned_files: list[_ScannedFile]) -> dict[str, AuthoritativeFile]:
+    grouped: dict[str, list[_ScannedFile]] = {}
+    for scanned in sorted(scanned_files, key=lambda item: item.file_path):
+        grouped.setdefault(scanned.document_id, []).append(scanned)
 
     result: dict[str, AuthoritativeFile] = {}
     for document_id, files in grouped.items():
@@ -83,6 +223,20 @@ def scan_corpus(corpus_root: Path) -> dict[str, AuthoritativeFile]:
     return result
 
 
+def _load_frontmatters(paths: list[Path], workers: int | None) -> list[dict[str, Any] | None]:
+    """``_load_frontmatter`` over ``paths`` in order, in a process pool when worthwhile."""
+    workers = min(workers or _RECONCILE_WORKERS, os.cpu_count() or 1)
+    if workers <= 1 or len(paths) < _PARALLEL_PARSE_MIN_FILES:
+        return [_load_frontmatter(path) for path in paths]
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_load_frontmatter, paths, chunksize=_PARSE_CHUNK_SIZE))
+    except Exception as exc:
+        _LOGGER.warning('corpus frontmatter worker pool failed (%s); parsing in-process', exc)
+        return [_load_frontmatter(path) for path in paths]
+
+
 def _load_frontmatter(path: Path) -> dict[str, Any] | None:
     text = path.read_text(encoding='utf-8')
 
@@ -205,4 +359,10 @@ def _sortable_pipeline_semver(value: Any) -> tuple[int, int, int]:
     )
 
 
-__all__ = ['AuthoritativeFile', 'scan_corpus']
+__all__ = [
+    'AuthoritativeFile',
+    'CorpusScan',
+    'clear_corpus_manifest',
+    'scan_corpus',
+    'scan_corpus_incremental',
+]
@@ -232,3 +232,81 @@ CREATE TABLE IF NOT EXISTS sections_fts_metadata_state (
     refreshed_at TIMESTAMP,
     CHECK (is_complete IN (0, 1))
 );
+
+-- Write counter readers key caches on.  Triggers bump it per documents row;
+-- section writers (core.corpus.sections_index) bump it once per call, since
+-- sections_fts cannot carry triggers and per-row sidecar triggers would
+-- rewrite this row once per section.
+CREATE TABLE IF NOT EXISTS corpus_write_generation (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO corpus_write_generation (id, generation) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_generation_insert
+AFTER INSERT ON documents
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_generation_update
+AFTER UPDATE ON documents
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_generation_delete
+AFTER DELETE ON documents
+BEGIN
+    UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1;
+END;
+
+-- Reconciler scan cache: files whose (size, mtime_ns) still match are not
+-- re-read; document_id / frontmatter_json are NULL for skipped files.
+CREATE TABLE IF NOT EXISTS corpus_file_manifest (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT,
+    document_id TEXT,
+    frontmatter_json TEXT,
+    scanned_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_corpus_file_manifest_document
+    ON corpus_file_manifest(document_id);
+
+-- Keeps sections_fts_metadata in step with the document columns it copies.
+CREATE TRIGGER IF NOT EXISTS trg_documents_sections_fts_metadata_update
+AFTER UPDATE OF
+    ticker,
+    source,
+    form_type,
+    fiscal_period,
+    filing_date,
+    extraction_status,
+    sector,
+    is_superseded_by
+ON documents
+WHEN NEW.ticker IS NOT OLD.ticker
+    OR NEW.source IS NOT OLD.source
+    OR NEW.form_type IS NOT OLD.form_type
+    OR NEW.fiscal_period IS NOT OLD.fiscal_period
+    OR NEW.filing_date IS NOT OLD.filing_date
+    OR NEW.extraction_status IS NOT OLD.extraction_status
+    OR NEW.sector IS NOT OLD.sector
+    OR NEW.is_superseded_by IS NOT OLD.is_superseded_by
+BEGIN
+    UPDATE sections_fts_metadata
+    SET
+        ticker = NEW.ticker,
+        source = NEW.source,
+        form_type = NEW.form_type,
+        fiscal_period = NEW.fiscal_period,
+        filing_date = CAST(NEW.filing_date AS TEXT),
+        extraction_status = COALESCE(NEW.extraction_status, 'complete'),
+        sector = NEW.sector,
+        is_superseded_by = NEW.is_superseded_by
+    WHERE document_id = NEW.document_id;
+END;
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+import os
 import re
 import sqlite3
+import threading
 
 from core.corpus.sections_index import sections_fts_metadata_is_complete
 from core.corpus.types import InvalidInputError, SearchHit, SearchResponse
@@ -37,6 +40,10 @@ _QUOTED_PHRASE_RE = re.compile(r'"([^"]*)"')
 _WORD_RE = re.compile(r'\w+')
 _MAX_SUBPHRASE_FALLBACKS = 16
 
+_MATCH_CACHE_SIZE = int(os.getenv('CORPUS_SEARCH_CACHE_SIZE', '256'))
+_MATCH_CACHE: OrderedDict[tuple[object, ...], tuple[list[sqlite3.Row], int, int, int]] = OrderedDict()
+_MATCH_CACHE_LOCK = threading.Lock()
+
 
 def _classify_snippet(snippet: str) -> tuple[str, str | None]:
     """Classify a corpus search snippet as prose / table / mixed and extract scale hint.
@@ -149,6 +156,10 @@ def _quality_filter_sql(alias: str = 'd') -> str:
     return f"COALESCE({column}, 'complete') IN ({visible_values})"
 
 
+def _superseded_filter_sql(alias: str = 'd') -> str:
+    return f'{alias}.is_superseded_by IS NULL'
+
+
 def _execute_match(
     db: sqlite3.Connection,
     sql: str,
@@ -176,97 +187,163 @@ def _run_match_queries(
     match_expr: str,
     limit: int,
     *,
-    include_superseded: bool,
-    superseded_variant_clauses: list[str] | None,
-    superseded_variant_params: list[object] | None,
-    include_low_quality: bool,
-    low_quality_variant_clauses: list[str] | None,
-    low_quality_variant_params: list[object] | None,
+    superseded_filter: str | None,
+    low_quality_filter: str | None,
     use_section_metadata: bool,
 ) -> tuple[list[sqlite3.Row], int, int, int]:
-    """Run rows + total count + optional variant counts with one MATCH expr.
-
-    Variant counts are 0 when their corresponding include flag is already true.
+    """Run rows + total count + variant counts with one MATCH expr.
+
+    ``where_clauses`` is the broadest variant (superseded and low-quality rows
+    included); ``superseded_filter`` / ``low_quality_filter`` are the
+    predicates the caller did not opt out of.  The total and both variant
+    counts come from a single aggregate scan, and the ranked rows are only
+    fetched when something matched.  Variant counts are 0 when their filter is
+    None.  Results are memoized per corpus write generation.
     """
+    cache_key = _match_cache_key(
+        db,
+        where_clauses,
+        where_params,
+        match_expr,
+        limit,
+        superseded_filter,
+        low_quality_filter,
+        use_section_metadata,
+    )
+    if cache_key is not None:
+        cached = _match_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
     where_sql = ' AND '.join(where_clauses + ['s.content MATCH ?'])
     base_params = [*where_params, match_expr]
     from_sql = _search_from_sql(use_section_metadata)
     section_alias = 'm' if use_section_metadata else 's'
+    superseded_sql = superseded_filter or '1'
+    low_quality_sql = low_quality_filter or '1'
 
-    rows = _execute_match(
+    counts = _execute_match(
         db,
         f"""
         SELECT
-            d.document_id,
-            d.ticker,
-            COALESCE(d.company_name, '') AS company_name,
-            d.source,
-            d.form_type,
-            COALESCE(d.fiscal_period, '') AS fiscal_period,
-            COALESCE(CAST(d.filing_date AS TEXT), '') AS filing_date,
-            COALESCE(d.extraction_status, 'complete') AS extraction_status,
-            d.is_superseded_by IS NOT NULL AS is_superseded,
-            {_LOW_CONFIDENCE_SUPERSEDER_EXISTS_SQL} AS has_low_confidence_supersession,
-            {section_alias}.section,
-            snippet(sections_fts, 2, '<b>', '</b>', '...', 20) AS snippet,
-            d.file_path,
-            {section_alias}.char_start,
-            {section_alias}.char_end,
-            {_resolved_source_url_sql('d')} AS source_url,
-            d.source_url_deep,
-            d.source_accession,
-            bm25(sections_fts) AS rank
+            COALESCE(SUM(CASE WHEN ({superseded_sql}) AND ({low_quality_sql}) THEN 1 ELSE 0 END), 0) AS total,
+            COALESCE(SUM(CASE WHEN {low_quality_sql} THEN 1 ELSE 0 END), 0) AS superseded_variant,
+            COALESCE(SUM(CASE WHEN {superseded_sql} THEN 1 ELSE 0 END), 0) AS low_quality_variant
         {from_sql}
         WHERE {where_sql}
-        ORDER BY rank ASC, d.document_id ASC, {section_alias}.char_start ASC
-        LIMIT ?
         """,
-        [*base_params, limit],
+        base_params,
         query=match_expr,
-    ).fetchall()
-
-    total_matches = int(
-        db.execute(
+    ).fetchone()
+    total_matches = int(counts['total'])
+    superseded_count = int(counts['superseded_variant']) if superseded_filter is not None else 0
+    low_quality_count = int(counts['low_quality_variant']) if low_quality_filter is not None else 0
+
+    rows: list[sqlite3.Row] = []
+    if total_matches:
+        visible_sql = ' AND '.join(
+            where_clauses
+            + [clause for clause in (superseded_filter, low_quality_filter) if clause is not None]
+            + ['s.content MATCH ?']
+        )
+        rows = _execute_match(
+            db,
             f"""
-            SELECT COUNT(*) AS count
+            SELECT
+                d.document_id,
+                d.ticker,
+                COALESCE(d.company_name, '') AS company_name,
+                d.source,
+                d.form_type,
+                COALESCE(d.fiscal_period, '') AS fiscal_period,
+                COALESCE(CAST(d.filing_date AS TEXT), '') AS filing_date,
+                COALESCE(d.extraction_status, 'complete') AS extraction_status,
+                d.is_superseded_by IS NOT NULL AS is_superseded,
+                {_LOW_CONFIDENCE_SUPERSEDER_EXISTS_SQL} AS has_low_confidence_supersession,
+                {section_alias}.section,
+                snippet(sections_fts, 2, '<b>', '</b>', '...', 20) AS snippet,
+                d.file_path,
+                {section_alias}.char_start,
+                {section_alias}.char_end,
+                {_resolved_source_url_sql('d')} AS source_url,
+                d.source_url_deep,
+                d.source_accession,
+                bm25(sections_fts) AS rank
             {from_sql}
-            WHERE {where_sql}
+            WHERE {visible_sql}
+            ORDER BY rank ASC, d.document_id ASC, {section_alias}.char_start ASC
+            LIMIT ?
             """,
-            base_params,
-        ).fetchone()['count']
+            [*base_params, limit],
+            query=match_expr,
+        ).fetchall()
+
+    result = (rows, total_matches, superseded_count, low_quality_count)
+    if cache_key is not None:
+        _match_cache_put(cache_key, result)
+    return result
+
+
+def _corpus_write_generation(db: sqlite3.Connection) -> int | None:
+    """Write counter bumped by documents triggers and section writers; None before migration 0006."""
+    try:
+        row = db.execute('SELECT generation FROM corpus_write_generation WHERE id = 1').fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return int(row['generation']) if row is not None else None
+
+
+def _match_cache_key(
+    db: sqlite3.Connection,
+    where_clauses: list[str],
+    where_params: list[object],
+    match_expr: str,
+    limit: int,
+    superseded_filter: str | None,
+    low_quality_filter: str | None,
+    use_section_metadata: bool,
+) -> tuple[object, ...] | None:
+    if _MATCH_CACHE_SIZE <= 0:
+        return None
+    db_file = next(
+        (str(row['file']) for row in db.execute('PRAGMA database_list') if row['name'] == 'main'),
+        '',
+    )
+    generation = _corpus_write_generation(db)
+    if not db_file or generation is None:
+        return None
+    return (
+        db_file,
+        generation,
+        use_section_metadata,
+        tuple(where_clauses),
+        tuple(where_params),
+        match_expr,
+        limit,
+        superseded_filter,
+        low_quality_filter,
     )
 
-    superseded_count = 0
-    if not include_superseded:
-        assert superseded_variant_clauses is not None
-        assert superseded_variant_params is not None
-        superseded_count = int(
-            db.execute(
-                f"""
-                SELECT COUNT(*) AS count
-                {from_sql}
-                WHERE {' AND '.join(superseded_variant_clauses + ['s.content MATCH ?'])}
-                """,
-                [*superseded_variant_params, match_expr],
-            ).fetchone()['count']
-        )
 
-    low_quality_count = 0
-    if not include_low_quality:
-        assert low_quality_variant_clauses is not None
-        assert low_quality_variant_params is not None
-        low_quality_count = int(
-            db.execute(
-                f"""
-                SELECT COUNT(*) AS count
-                {from_sql}
-                WHERE {' AND '.join(low_quality_variant_clauses + ['s.content MATCH ?'])}
-                """,
-                [*low_quality_variant_params, match_expr],
-            ).fetchone()['count']
-        )
+def _match_cache_get(key: tuple[object, ...]) -> tuple[list[sqlite3.Row], int, int, int] | None:
+    with _MATCH_CACHE_LOCK:
+        result = _MATCH_CACHE.get(key)
+        if result is not None:
+            _MATCH_CACHE.move_to_end(key)
+        return result
+
 
-    return rows, total_matches, superseded_count, low_quality_count
+def _match_cache_put(key: tuple[object, ...], result: tuple[list[sqlite3.Row], int, int, int]) -> None:
+    with _MATCH_CACHE_LOCK:
+        _MATCH_CACHE[key] = result
+        _MATCH_CACHE.move_to_end(key)
+        while len(_MATCH_CACHE) > _MATCH_CACHE_SIZE:
+            _MATCH_CACHE.popitem(last=False)
+
+
+def clear_search_cache() -> None:
+    with _MATCH_CACHE_LOCK:
+        _MATCH_CACHE.clear()
 
 
 def _search_from_sql(use_section_metadata: bool) -> str:
@@ -345,6 +422,9 @@ def _search(
     document_filter_alias = 'm' if use_section_metadata else 'd'
     section_filter_alias = 'm' if use_section_metadata else 's'
 
+    # Counts for the superseded / low-quality variants come from the same
+    # aggregate scan, so filter the broadest variant and pass the two
+    # opt-out predicates separately.
     where_clauses, where_params = _build_where_clause(
         form_types=form_types,
         sources=sources,
@@ -354,52 +434,14 @@ def _search(
         speaker_role=speaker_role,
         date_from=date_from,
         date_to=date_to,
-        include_superseded=include_superseded,
-        include_low_quality=include_low_quality,
+        include_superseded=True,
+        include_low_quality=True,
         include_low_confidence_supersession=include_low_confidence_supersession,
         document_alias=document_filter_alias,
         section_alias=section_filter_alias,
     )
-
-    superseded_variant_clauses = None
-    superseded_variant_params = None
-    if not include_superseded:
-        superseded_variant_where, superseded_variant_params = _build_where_clause(
-            form_types=form_types,
-            sources=sources,
-            universe=universe,
-            sector=sector,
-            section=section,
-            speaker_role=speaker_role,
-            date_from=date_from,
-            date_to=date_to,
-            include_superseded=True,
-            include_low_quality=include_low_quality,
-            include_low_confidence_supersession=include_low_confidence_supersession,
-            document_alias=document_filter_alias,
-            section_alias=section_filter_alias,
-        )
-        superseded_variant_clauses = superseded_variant_where
-
-    low_quality_variant_clauses = None
-    low_quality_variant_params = None
-    if not include_low_quality:
-        low_quality_variant_where, low_quality_variant_params = _build_where_clause(
-            form_types=form_types,
-            sources=sources,
-            universe=universe,
-            sector=sector,
-            section=section,
-            speaker_role=speaker_role,
-            date_from=date_from,
-            date_to=date_to,
-            include_superseded=include_superseded,
-            include_low_quality=True,
-            include_low_confidence_supersession=include_low_confidence_supersession,
-            document_alias=document_filter_alias,
-            section_alias=section_filter_alias,
-        )
-        low_quality_variant_clauses = low_quality_variant_where
+    superseded_filter = None if include_superseded else _superseded_filter_sql(document_filter_alias)
+    low_quality_filter = None if include_low_quality else _quality_filter_sql(document_filter_alias)
 
     rows, total_matches, superseded_count, low_quality_count = _run_match_queries(
         db,
@@ -407,12 +449,8 @@ def _search(
         where_params,
         normalized_query,
         limit,
-        include_superseded=include_superseded,
-        superseded_variant_clauses=superseded_variant_clauses,
-        superseded_variant_params=superseded_variant_params,
-        include_low_quality=include_low_quality,
-        low_quality_variant_clauses=low_quality_variant_clauses,
-        low_quality_variant_params=low_quality_variant_params,
+        superseded_filter=superseded_filter,
+        low_quality_filter=low_quality_filter,
         use_section_metadata=use_section_metadata,
     )
 
@@ -460,12 +498,8 @@ def _search(
                 where_params=where_params,
                 match_expr=match_expr,
                 limit=limit,
-                include_superseded=include_superseded,
-                superseded_variant_clauses=superseded_variant_clauses,
-                superseded_variant_params=superseded_variant_params,
-                include_low_quality=include_low_quality,
-                low_quality_variant_clauses=low_quality_variant_clauses,
-                low_quality_variant_params=low_quality_variant_params,
+                superseded_filter=superseded_filter,
+                low_quality_filter=low_quality_filter,
                 use_section_metadata=use_section_metadata,
             )
             if candidate_total == 0 and not use_even_if_empty:
@@ -576,7 +610,7 @@ def _build_where_clause(
         params.append(date_to)
 
     if not include_superseded:
-        clauses.append(f'{document_alias}.is_superseded_by IS NULL')
+        clauses.append(_superseded_filter_sql(document_alias))
 
     if not include_low_quality:
         clauses.append(_quality_filter_sql(document_alias))
@@ -591,4 +625,4 @@ def _placeholders(values: list[object]) -> str:
     return ', '.join('?' for _ in values)
 
 
-__all__ = ['_quality_filter_sql', '_search']
+__all__ = ['_quality_filter_sql', '_search', 'clear_search_cache']
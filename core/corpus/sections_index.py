@@ -1,14 +1,71 @@
 from __future__ import annotations
 
 import sqlite3
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any
 
 from core.corpus.section_map import SectionRow
 
 
+_SECTIONS_METADATA_INSERT_SELECT_SQL = """
+    INSERT INTO sections_fts_metadata (
+        fts_rowid,
+        document_id,
+        ticker,
+        source,
+        form_type,
+        fiscal_period,
+        filing_date,
+        extraction_status,
+        sector,
+        is_superseded_by,
+        section,
+        speaker_name,
+        speaker_role,
+        char_start,
+        char_end
+    )
+    SELECT
+        s.rowid,
+        s.document_id,
+        d.ticker,
+        d.source,
+        d.form_type,
+        d.fiscal_period,
+        CAST(d.filing_date AS TEXT),
+        COALESCE(d.extraction_status, 'complete'),
+        d.sector,
+        d.is_superseded_by,
+        s.section,
+        s.speaker_name,
+        s.speaker_role,
+        s.char_start,
+        s.char_end
+    FROM sections_fts s
+    JOIN documents d ON d.document_id = s.document_id
+"""
+
+
+def bump_corpus_write_generation(db: sqlite3.Connection) -> None:
+    """Advance the search-cache write counter once for a section write.
+
+    Section writers call this instead of relying on per-row triggers, so a
+    bulk write moves the counter once rather than once per section.  No-op on
+    DBs that predate migration 0006.
+    """
+    try:
+        db.execute('UPDATE corpus_write_generation SET generation = generation + 1 WHERE id = 1')
+    except sqlite3.OperationalError:
+        pass
+
+
 def delete_sections_for_document(db: sqlite3.Connection, document_id: str) -> None:
     """Delete FTS rows and sidecar metadata for one document."""
+    _delete_sections_for_document(db, document_id)
+    bump_corpus_write_generation(db)
+
+
+def _delete_sections_for_document(db: sqlite3.Connection, document_id: str) -> None:
     db.execute('DELETE FROM sections_fts_metadata WHERE document_id = ?', (document_id,))
     db.execute('DELETE FROM sections_fts WHERE document_id = ?', (document_id,))
 
@@ -20,7 +77,8 @@ def replace_sections_for_document(
 ) -> int:
     """Replace one document's FTS rows and sidecar rows in the same transaction."""
     document = _document_metadata(db, document_id)
-    delete_sections_for_document(db, document_id)
+    _delete_sections_for_document(db, document_id)
+    bump_corpus_write_generation(db)
 
     inserted = 0
     for section in sections:
@@ -56,51 +114,97 @@ def replace_sections_for_document(
     return inserted
 
 
-def rebuild_sections_fts_metadata(db: sqlite3.Connection) -> int:
-    """Rebuild sidecar metadata from existing documents and sections_fts rows."""
-    with db:
-        db.execute('DELETE FROM sections_fts_metadata')
-        cursor = db.execute(
-            """
-            INSERT INTO sections_fts_metadata (
-                fts_rowid,
+def delete_sections_for_documents(db: sqlite3.Connection, document_ids: Sequence[str]) -> None:
+    """Delete FTS rows and sidecar metadata for many documents.
+
+    Goes through the sidecar's rowids when it is complete, avoiding one
+    sections_fts scan per document.
+    """
+    params = [(document_id,) for document_id in document_ids]
+    if not params:
+        return
+    if sections_fts_metadata_is_complete(db):
+        db.executemany(
+            'DELETE FROM sections_fts WHERE rowid IN '
+            '(SELECT fts_rowid FROM sections_fts_metadata WHERE document_id = ?)',
+            params,
+        )
+    else:
+        db.executemany('DELETE FROM sections_fts WHERE document_id = ?', params)
+    db.executemany('DELETE FROM sections_fts_metadata WHERE document_id = ?', params)
+    bump_corpus_write_generation(db)
+
+
+def append_sections(
+    db: sqlite3.Connection,
+    sections: Sequence[tuple[str, SectionRow]],
+) -> int:
+    """Bulk-insert ``(document_id, section)`` FTS rows plus their sidecar rows.
+
+    The documents rows must already exist.  Rowids are assigned explicitly so
+    the FTS insert can use ``executemany`` and the sidecar can be filled with
+    one INSERT ... SELECT over the new rowid range; call inside the write
+    transaction.
+    """
+    if not sections:
+        return 0
+    last = db.execute('SELECT rowid FROM sections_fts ORDER BY rowid DESC LIMIT 1').fetchone()
+    first_rowid = (int(last[0]) if last is not None else 0) + 1
+    db.executemany(
+        """
+        INSERT INTO sections_fts (
+            rowid,
+            document_id,
+            section,
+            content,
+            char_start,
+            char_end,
+            speaker_name,
+            speaker_role
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            (
+                first_rowid + offset,
                 document_id,
-                ticker,
-                source,
-                form_type,
-                fiscal_period,
-                filing_date,
-                extraction_status,
-                sector,
-                is_superseded_by,
-                section,
-                speaker_name,
-                speaker_role,
-                char_start,
-                char_end
+                section.section,
+                section.content,
+                section.char_start,
+                section.char_end,
+                section.speaker_name,
+                section.speaker_role,
             )
-            SELECT
-                s.rowid,
-                s.document_id,
-                d.ticker,
-                d.source,
-                d.form_type,
-                d.fiscal_period,
-                CAST(d.filing_date AS TEXT),
-                COALESCE(d.extraction_status, 'complete'),
-                d.sector,
-                d.is_superseded_by,
-                s.section,
-                s.speaker_name,
-                s.speaker_role,
-                s.char_start,
-                s.char_end
-            FROM sections_fts s
-            JOIN documents d ON d.document_id = s.document_id
-            """
-        )
+            for offset, (document_id, section) in enumerate(sections)
+        ),
+    )
+    db.execute(
+        f'{_SECTIONS_METADATA_INSERT_SELECT_SQL} WHERE s.rowid BETWEEN ? AND ?',
+        (first_rowid, first_rowid + len(sections) - 1),
+    )
+    bump_corpus_write_generation(db)
+    return len(sections)
+
+
+def rebuild_sections_fts_metadata(db: sqlite3.Connection) -> int:
+    """Repair sidecar metadata against documents and sections_fts rows.
+
+    Only orphaned, missing or drifted sidecar rows are touched; returns how
+    many.  Routine writes keep the sidecar current on their own (section
+    writers insert sidecar rows, a documents trigger copies metadata changes).
+    """
+    with db:
+        deleted = db.execute(
+            'DELETE FROM sections_fts_metadata WHERE fts_rowid NOT IN (SELECT rowid FROM sections_fts)'
+        ).rowcount
+        updated = refresh_all_sections_metadata_from_documents(db)
+        inserted = db.execute(
+            f'{_SECTIONS_METADATA_INSERT_SELECT_SQL} '
+            'WHERE s.rowid NOT IN (SELECT fts_rowid FROM sections_fts_metadata)'
+        ).rowcount
         mark_sections_fts_metadata_complete(db)
-    return int(cursor.rowcount or 0)
+        if deleted or inserted:
+            bump_corpus_write_generation(db)
+    return int(deleted or 0) + int(updated or 0) + int(inserted or 0)
 
 
 def mark_sections_fts_metadata_complete(db: sqlite3.Connection) -> None:
@@ -169,47 +273,40 @@ def refresh_sections_metadata_for_document(
             document_id,
         ),
     )
+    bump_corpus_write_generation(db)
 
 
-def refresh_all_sections_metadata_from_documents(db: sqlite3.Connection) -> None:
-    db.execute(
+def refresh_all_sections_metadata_from_documents(db: sqlite3.Connection) -> int:
+    """Re-copy document metadata into sidecar rows that have drifted from it."""
+    cursor = db.execute(
         """
         UPDATE sections_fts_metadata
         SET
-            ticker = (
-                SELECT d.ticker FROM documents d
-                WHERE d.document_id = sections_fts_metadata.document_id
-            ),
-            source = (
-                SELECT d.source FROM documents d
-                WHERE d.document_id = sections_fts_metadata.document_id
-            ),
-            form_type = (
-                SELECT d.form_type FROM documents d
-                WHERE d.document_id = sections_fts_metadata.document_id
-            ),
-            fiscal_period = (
-                SELECT d.fiscal_period FROM documents d
-                WHERE d.document_id = sections_fts_metadata.document_id
-            ),
-            filing_date = (
-                SELECT CAST(d.filing_date AS TEXT) FROM documents d
-                WHERE d.document_id = sections_fts_metadata.document_id
-            ),
-            extraction_status = COALESCE((
-                SELECT d.extraction_status FROM documents d
-                WHERE d.document_id = sections_fts_metadata.document_id
-            ), 'complete'),
-            sector = (
-                SELECT d.sector FROM documents d
-                WHERE d.document_id = sections_fts_metadata.document_id
-            ),
-            is_superseded_by = (
-                SELECT d.is_superseded_by FROM documents d
-                WHERE d.document_id = sections_fts_metadata.document_id
+            ticker = d.ticker,
+            source = d.source,
+            form_type = d.form_type,
+            fiscal_period = d.fiscal_period,
+            filing_date = CAST(d.filing_date AS TEXT),
+            extraction_status = COALESCE(d.extraction_status, 'complete'),
+            sector = d.sector,
+            is_superseded_by = d.is_superseded_by
+        FROM documents d
+        WHERE d.document_id = sections_fts_metadata.document_id
+            AND (
+                sections_fts_metadata.ticker IS NOT d.ticker
+                OR sections_fts_metadata.source IS NOT d.source
+                OR sections_fts_metadata.form_type IS NOT d.form_type
+                OR sections_fts_metadata.fiscal_period IS NOT d.fiscal_period
+                OR sections_fts_metadata.filing_date IS NOT CAST(d.filing_date AS TEXT)
+                OR sections_fts_metadata.extraction_status IS NOT COALESCE(d.extraction_status, 'complete')
+                OR sections_fts_metadata.sector IS NOT d.sector
+                OR sections_fts_metadata.is_superseded_by IS NOT d.is_superseded_by
             )
         """
     )
+    if cursor.rowcount:
+        bump_corpus_write_generation(db)
+    return int(cursor.rowcount or 0)
 
 
 def _document_metadata(db: sqlite3.Connection, document_id: str) -> Mapping[str, Any]:
@@ -283,7 +380,10 @@ def _insert_section_metadata(
 
 
 __all__ = [
+    'append_sections',
+    'bump_corpus_write_generation',
     'delete_sections_for_document',
+    'delete_sections_for_documents',
     'mark_sections_fts_metadata_complete',
     'mark_sections_fts_metadata_incomplete',
     'rebuild_sections_fts_metadata',
@@ -2,47 +2,44 @@ from __future__ import annotations
 
 import sqlite3
 
-from core.corpus.sections_index import (
-    refresh_all_sections_metadata_from_documents,
-    refresh_sections_metadata_for_document,
-)
+
+# Highest-priority high-confidence superseder of ``documents``; NULL when none.
+_SUPERSEDER_SQL = """
+    SELECT d2.document_id FROM documents d2
+    WHERE d2.supersedes = documents.document_id
+      AND d2.supersedes_confidence = 'high'
+    ORDER BY d2.filing_date DESC, d2.document_id DESC
+    LIMIT 1
+"""
 
 
 def update_is_superseded_by(
     db: sqlite3.Connection,
     document_id: str | None = None,
 ) -> int:
-    """Apply the confidence-gated D14 derived-column rule."""
+    """Apply the confidence-gated D14 derived-column rule.
+
+    Only rows whose derived value changes are written (and returned as the
+    count); the documents trigger carries those changes into
+    sections_fts_metadata.
+    """
     if document_id is None:
-        cur1 = db.execute('UPDATE documents SET is_superseded_by = NULL')
-        cur2 = db.execute(
-            """
-            UPDATE documents SET is_superseded_by = (
-                SELECT d2.document_id FROM documents d2
-                WHERE d2.supersedes = documents.document_id
-                  AND d2.supersedes_confidence = 'high'
-                ORDER BY d2.filing_date DESC, d2.document_id DESC
-                LIMIT 1
-            )
+        cur = db.execute(
+            f"""
+            UPDATE documents SET is_superseded_by = ({_SUPERSEDER_SQL})
+            WHERE is_superseded_by IS NOT ({_SUPERSEDER_SQL})
             """
         )
-        refresh_all_sections_metadata_from_documents(db)
-        return (cur1.rowcount or 0) + (cur2.rowcount or 0)
+        return cur.rowcount or 0
 
     cur = db.execute(
-        """
-        UPDATE documents SET is_superseded_by = (
-            SELECT d2.document_id FROM documents d2
-            WHERE d2.supersedes = documents.document_id
-              AND d2.supersedes_confidence = 'high'
-            ORDER BY d2.filing_date DESC, d2.document_id DESC
-            LIMIT 1
-        )
+        f"""
+        UPDATE documents SET is_superseded_by = ({_SUPERSEDER_SQL})
         WHERE document_id = ?
+          AND is_superseded_by IS NOT ({_SUPERSEDER_SQL})
         """,
         (document_id,),
     )
-    refresh_sections_metadata_for_document(db, document_id)
     return cur.rowcount or 0
 
 
@@ -4,9 +4,10 @@ from dataclasses import dataclass
 from pathlib import Path
 import re
 import sqlite3
+from typing import ContextManager
 
 from core.corpus._paths import corpus_db_path, corpus_root
-from core.corpus.db import open_corpus_db
+from core.corpus.db import corpus_reader
 from core.corpus.frontmatter import parse_frontmatter
 from core.corpus.offsets import slice_scoped_text_with_offsets
 from core.corpus.search import _quality_filter_sql, _resolved_source_url_sql, _search
@@ -59,8 +60,7 @@ def transcripts_search(
     validate_search_inputs(query, universe, limit)
     section_key = _validate_transcript_section(section, allow_both=True)
 
-    db = _open_runtime_db()
-    try:
+    with _runtime_reader() as db:
         return _search(
             db=db,
             query=query,
@@ -76,8 +76,6 @@ def transcripts_search(
             include_low_confidence_supersession=include_low_confidence_supersession,
             limit=limit,
         )
-    finally:
-        db.close()
 
 
 def transcripts_read(
@@ -404,8 +402,8 @@ def _corpus_db_path() -> Path:
     return corpus_db_path()
 
 
-def _open_runtime_db() -> sqlite3.Connection:
-    return open_corpus_db(_corpus_db_path())
+def _runtime_reader() -> ContextManager[sqlite3.Connection]:
+    return corpus_reader(_corpus_db_path())
 
 
 __all__ = [
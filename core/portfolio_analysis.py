@@ -238,6 +238,19 @@ def analyze_portfolio(
             "security_types": security_types,
             "target_allocation": config.get("target_allocation"),
             "ticker_alias_map": ticker_alias_map,
+            # Inputs of the PortfolioRiskModel behind the view, so consumers
+            # (e.g. the factor Monte Carlo) can reach the same model.
+            "risk_model_inputs": {
+                "start_date": config["start_date"],
+                "end_date": config["end_date"],
+                "stock_factor_proxies": config.get("stock_factor_proxies"),
+                "asset_classes": asset_classes,
+                "ticker_alias_map": ticker_alias_map,
+                "currency_map": currency_map,
+                "instrument_types": instrument_types,
+                "contract_identities": contract_identities,
+                "security_identities": config.get("security_identities"),
+            },
             "step_timings_ms": step_timings,
         }
     )
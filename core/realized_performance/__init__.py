@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from . import _helpers, aggregation, backfill, engine, fx, holdings, mwr, nav, pricing, provider_flows, timeline
+from . import _helpers, aggregation, backfill, checkpoints, engine, fx, holdings, mwr, nav, panel, pricing, provider_flows, timeline
 from ._helpers import *
 from .aggregation import *
 from .backfill import *
+from .checkpoints import *
 from .engine import *
 from .fx import *
 from .holdings import *
 from .mwr import *
 from .nav import *
+from .panel import *
 from .pricing import *
 from .provider_flows import *
 from .timeline import *
@@ -61,8 +63,10 @@ __all__ = [
     "fx",
     "timeline",
     "nav",
+    "panel",
     "provider_flows",
     "backfill",
+    "checkpoints",
     "engine",
     "aggregation",
     "compute_performance_metrics",
@@ -104,8 +108,10 @@ for _mod_all in (
     fx.__all__,
     timeline.__all__,
     nav.__all__,
+    panel.__all__,
     provider_flows.__all__,
     backfill.__all__,
+    checkpoints.__all__,
     engine.__all__,
     aggregation.__all__,
 ):
@@ -6,6 +6,7 @@ import re
 import settings
 import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
@@ -53,7 +54,10 @@ from trading_analysis.fifo_matcher import FIFOMatcher, IncompleteTrade, OpenLot
 from trading_analysis.instrument_meta import InstrumentMeta, coerce_instrument_type
 from trading_analysis.symbol_utils import parse_option_contract_identity_from_symbol
 
-from . import _helpers, engine, holdings, mwr as _mwr, nav
+from . import _helpers, engine, holdings, mwr as _mwr, nav, panel, pricing
+
+
+_REALIZED_ACCOUNT_WORKERS = max(1, int(os.getenv("REALIZED_ACCOUNT_WORKERS", "4")))
 
 
 class RealizedPerformanceAccountAggregationError(RuntimeError):
@@ -79,6 +83,26 @@ def _prefetch_fifo_transactions(
     account_filters: Optional[list[tuple[str, str, str | None]]] = None,
 ) -> List[Dict[str, Any]]:
     """Fetch and normalize FIFO transactions once for account discovery."""
+    return _prefetch_transaction_source(
+        positions=positions,
+        user_email=user_email,
+        source=source,
+        institution=institution,
+        account=account,
+        account_filters=account_filters,
+    ).fifo_transactions
+
+
+def _prefetch_transaction_source(
+    *,
+    positions,
+    user_email: str,
+    source: str,
+    institution: Optional[str],
+    account: Optional[str] = None,
+    account_filters: Optional[list[tuple[str, str, str | None]]] = None,
+) -> engine.PrefetchedTransactionSource:
+    """Load the transaction source once; keep the raw payload for account scopes."""
     allow_stale_existing_transaction_store = True
     for position_row in list(getattr(getattr(positions, "data", None), "positions", []) or []):
         try:
@@ -109,15 +133,19 @@ def _prefetch_fifo_transactions(
     )
     trading_analyzer_cls = _helpers._shim_attr("TradingAnalyzer", TradingAnalyzer)
 
+    schwab_security_lookup = None
     csv_store = CSVTransactionProvider()
     if account_filters is None and csv_store.has_source(user_email, source):
+        kind = "csv"
         store_data = csv_store.load_transactions(user_email, source)
+        source_data = store_data
         fifo_transactions = list(store_data.get("fifo_transactions") or [])
         if settings.EXERCISE_COST_BASIS_ENABLED:
             from trading_analysis.exercise_linkage import link_option_exercises
 
             fifo_transactions = link_option_exercises(fifo_transactions)
     elif transaction_store_read:
+        kind = "store"
         from inputs.transaction_store import (
             ensure_store_fresh,
             ensure_store_fresh_for_portfolio,
@@ -157,11 +185,13 @@ def _prefetch_fifo_transactions(
                 institution=institution,
                 account=account,
             )
+        source_data = store_data
         fifo_transactions = list(store_data.get("fifo_transactions") or [])
         if settings.EXERCISE_COST_BASIS_ENABLED:
             from trading_analysis.exercise_linkage import link_option_exercises
             fifo_transactions = link_option_exercises(fifo_transactions)
     else:
+        kind = "provider"
         if institution:
             fetch_result = fetch_transactions_for_source_fn(
                 user_email=user_email,
@@ -176,6 +206,7 @@ def _prefetch_fifo_transactions(
                 account=account,
             )
 
+        source_data = fetch_result
         payload = getattr(fetch_result, "payload", fetch_result)
         if not isinstance(payload, dict):
             raise ValueError(
@@ -206,7 +237,12 @@ def _prefetch_fifo_transactions(
             if match_institution(txn.get("_institution") or "", institution)
         ]
     fifo_transactions.sort(key=lambda row: _helpers._to_datetime(row.get("date")) or datetime.min)
-    return fifo_transactions
+    return engine.PrefetchedTransactionSource(
+        kind=kind,
+        data=source_data,
+        fifo_transactions=fifo_transactions,
+        schwab_security_lookup=schwab_security_lookup,
+    )
 
 def _looks_like_display_name(candidate: str, institution: str) -> bool:
     """Return True if candidate looks like a provider display name, not a real account ID.
@@ -1319,7 +1355,7 @@ def _analyze_realized_performance_account_aggregated(
         )
 
     try:
-        prefetch_fifo = _prefetch_fifo_transactions(
+        prefetched_source = _prefetch_transaction_source(
             positions=positions,
             user_email=user_email,
             source=source,
@@ -1328,7 +1364,7 @@ def _analyze_realized_performance_account_aggregated(
         )
         account_ids = _discover_account_ids(
             positions,
-            prefetch_fifo,
+            prefetched_source.fifo_transactions,
             institution,
         )
     except Exception as exc:
@@ -1358,9 +1394,25 @@ def _analyze_realized_performance_account_aggregated(
             account_filters=account_filters,
         )
 
-    per_account: Dict[str, RealizedPerformanceResult] = {}
-    per_account_errors: Dict[str, str] = {}
-    for account_id in account_ids:
+    # One registry for every scope so provider clients and their caches are shared.
+    price_registry = price_registry or pricing._build_default_price_registry()
+    # One price/FX panel too, seeded with the institution-wide transaction
+    # window so the first scope's fetch already covers every later account.
+    earliest_txn_date = min(
+        (
+            dt
+            for dt in (_helpers._to_datetime(txn.get("date")) for txn in prefetched_source.fifo_transactions)
+            if dt is not None
+        ),
+        default=None,
+    )
+    market_data = panel.RealizedMarketDataPanel(
+        window_start=earliest_txn_date - timedelta(days=62) if earliest_txn_date is not None else None,
+        window_end=datetime.now(),
+    )
+    use_per_symbol_inception = bool(match_institution(institution, "schwab"))
+
+    def _run_account_scope(account_id: str) -> Tuple[Optional[RealizedPerformanceResult], Optional[str]]:
         try:
             account_result = engine._analyze_realized_performance_single_scope(
                 positions=positions,
@@ -1374,15 +1426,14 @@ def _analyze_realized_performance_account_aggregated(
                 backfill_path=backfill_path,
                 price_registry=price_registry,
                 inception_override=inception_override,
-                use_per_symbol_inception=bool(match_institution(institution, "schwab")),
+                use_per_symbol_inception=use_per_symbol_inception,
                 account_filters=account_filters,
+                prefetched_source=prefetched_source,
+                market_data=market_data,
             )
             if isinstance(account_result, dict):
                 if account_result.get("status") == "error":
-                    per_account_errors[account_id] = str(
-                        account_result.get("message") or "unknown error"
-                    )
-                    continue
+                    return None, str(account_result.get("message") or "unknown error")
                 account_result = RealizedPerformanceResult.from_analysis_dict(account_result)
 
             pf = getattr(getattr(account_result, "realized_metadata", None), "_postfilter", None) or {}
@@ -1392,11 +1443,34 @@ def _analyze_realized_performance_account_aggregated(
                 if not pf.get(key)
             ]
             if missing_keys:
-                per_account_errors[account_id] = f"missing _postfilter keys: {missing_keys}"
-                continue
-            per_account[account_id] = account_result
+                return None, f"missing _postfilter keys: {missing_keys}"
+            return account_result, None
         except Exception as exc:
-            per_account_errors[account_id] = str(exc)
+            return None, str(exc)
+
+    outcomes: Dict[str, Tuple[Optional[RealizedPerformanceResult], Optional[str]]] = {}
+    max_account_workers = min(len(account_ids), _REALIZED_ACCOUNT_WORKERS)
+    if max_account_workers <= 1:
+        for account_id in account_ids:
+            outcomes[account_id] = _run_account_scope(account_id)
+    else:
+        with ThreadPoolExecutor(max_workers=max_account_workers) as executor:
+            future_to_account = {
+                executor.submit(_run_account_scope, account_id): account_id
+                for account_id in account_ids
+            }
+            for future in as_completed(future_to_account):
+                outcomes[future_to_account[future]] = future.result()
+
+    # Merge in discovery order so the summed series do not depend on completion order.
+    per_account: Dict[str, RealizedPerformanceResult] = {}
+    per_account_errors: Dict[str, str] = {}
+    for account_id in account_ids:
+        account_result, error = outcomes[account_id]
+        if error is not None:
+            per_account_errors[account_id] = error
+        else:
+            per_account[account_id] = account_result
 
     if per_account_errors:
         raise RealizedPerformanceAccountAggregationError(institution, per_account_errors)
@@ -1501,6 +1575,7 @@ def analyze_realized_performance(
 
 __all__ = [
     '_prefetch_fifo_transactions',
+    '_prefetch_transaction_source',
     '_looks_like_display_name',
     '_discover_account_ids',
     '_discover_schwab_account_ids',
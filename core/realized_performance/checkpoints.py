@@ -0,0 +1,258 @@
+"""Persistent month-boundary checkpoints for the realized cash replay.
+
+``nav.derive_cash_and_external_flows`` folds every trade, income, provider
+flow and futures MTM event from inception.  After a replay it stores the
+fold state as of the start of the latest event month; the next replay over
+the same history restores that state and only folds the events from that
+month on.
+
+A checkpoint is trusted only when the prefix still has the stored event
+count and last event date, and the prefix's final month (events plus the FX
+points they read) and the replay options digest to what was stored.  Checking
+that costs one bisect plus one month of events, not the whole history, so
+appended, dropped or late-arriving events simply miss and replay in full; an
+in-place amendment of older months that keeps the count and last date is not
+detected (``clear_replay_checkpoints`` after such a backfill).  Slots are keyed
+by the options plus the first month of events, which pins one slot per
+account history without threading scope names through.
+
+Only the cash fold resumes; FIFO matching, the position timeline and the NAV
+series are still rebuilt from the full history on every run.
+
+Disabled unless ``REALIZED_REPLAY_CHECKPOINT_DIR`` is set.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from portfolio_risk_engine.result_cache import DiskViewCache, decode_view, encode_view
+from settings import REALIZED_REPLAY_CHECKPOINT_DIR, REALIZED_REPLAY_CHECKPOINT_MAX_BYTES
+from utils.logging import portfolio_logger
+
+_FORMAT_VERSION = "replay-v2"
+
+
+class ReplayCheckpointCache(DiskViewCache):
+    """Disk store for replay checkpoints; no TTL, LRU-evicted past ``max_bytes``."""
+
+    _SUFFIX = ".replay.z"
+
+
+@dataclass
+class ReplayCheckpoint:
+    """Cash replay state covering every event dated strictly before ``boundary``."""
+
+    boundary: datetime
+    event_count: int
+    last_event_date: datetime
+    prefix_fingerprint: str
+    state: Any
+    cash_snapshots: List[Tuple[datetime, float]]
+    external_flows: List[Tuple[datetime, float]]
+
+
+_backend: Optional[ReplayCheckpointCache] = None
+_backend_initialized = False
+
+
+def set_replay_checkpoint_backend(backend: Optional[ReplayCheckpointCache]) -> None:
+    """Install (or with ``None`` disable) the checkpoint store."""
+    global _backend, _backend_initialized
+    _backend = backend
+    _backend_initialized = True
+
+
+def get_replay_checkpoint_backend() -> Optional[ReplayCheckpointCache]:
+    global _backend, _backend_initialized
+    if not _backend_initialized:
+        _backend_initialized = True
+        if REALIZED_REPLAY_CHECKPOINT_DIR:
+            try:
+                _backend = ReplayCheckpointCache(
+                    REALIZED_REPLAY_CHECKPOINT_DIR,
+                    ttl_seconds=0,
+                    max_bytes=REALIZED_REPLAY_CHECKPOINT_MAX_BYTES,
+                )
+            except OSError as exc:
+                portfolio_logger.warning("Realized replay checkpoints disabled: %s", exc)
+                _backend = None
+    return _backend
+
+
+def month_start(when: datetime) -> datetime:
+    return datetime(when.year, when.month, 1)
+
+
+def _digest(parts: Iterable[Any]) -> str:
+    """SHA-256 over the ``repr`` of each part (bytes are hashed as-is)."""
+    digest = hashlib.sha256(_FORMAT_VERSION.encode("utf-8"))
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else repr(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def _event_chunks(events: Sequence[Dict[str, Any]], size: int = 4096) -> Iterable[List[Dict[str, Any]]]:
+    """Events in slices, so digesting a long history never builds one huge ``repr``."""
+    return (list(events[start:start + size]) for start in range(0, len(events), size))
+
+
+def _next_month(when: datetime) -> Tuple[int, int, int]:
+    return (when.year + 1, 1, 1) if when.month == 12 else (when.year, when.month + 1, 1)
+
+
+def replay_slot(events: Sequence[Dict[str, Any]], options: Any) -> str:
+    """Slot key: replay options plus the events of the first calendar month."""
+    first_boundary = datetime(*_next_month(events[0]["date"]))
+    head = events[: bisect.bisect_left(events, first_boundary, key=lambda event: event["date"])]
+    return _digest(["slot", options, *_event_chunks(head)])
+
+
+def _fx_window_parts(
+    fx_cache: Dict[str, pd.Series],
+    earliest_by_currency: Dict[str, datetime],
+    window_start: datetime,
+    boundary: datetime,
+) -> List[Any]:
+    """
+    FX points the window's events can read: those in ``[window_start,
+    boundary)`` and the last one before it (the at-or-before lookup), plus
+    the first later point only when an event predates the whole series (the
+    nearest-forward fallback).  The still-moving
+    current-month point is thus left out for the usual case.
+    """
+    parts: List[Any] = []
+    start_ns = pd.Timestamp(window_start).to_datetime64()
+    boundary_ns = pd.Timestamp(boundary).to_datetime64()
+    for currency in sorted(earliest_by_currency):
+        series = fx_cache.get(currency)
+        parts.append(currency)
+        if series is None or len(series) == 0:
+            parts.append("missing")
+            continue
+        clean = series.dropna()
+        if not isinstance(clean.index, pd.DatetimeIndex):
+            clean.index = pd.to_datetime(clean.index)
+        clean = clean.sort_index()
+        index = clean.index.to_numpy(dtype="datetime64[ns]")
+        lo = int(np.searchsorted(index, start_ns, side="left"))
+        cut = int(np.searchsorted(index, boundary_ns, side="left"))
+        if len(index) and pd.Timestamp(earliest_by_currency[currency]).to_datetime64() < index[0]:
+            cut += 1
+        lo = min(max(lo - 1, 0), cut)
+        parts.append(index[lo:cut].tobytes())
+        parts.append(pd.to_numeric(clean.iloc[lo:cut], errors="coerce").to_numpy(dtype=float).tobytes())
+    return parts
+
+
+def prefix_fingerprint(
+    events: Sequence[Dict[str, Any]],
+    event_count: int,
+    boundary: datetime,
+    fx_cache: Dict[str, pd.Series],
+    options: Any,
+) -> str:
+    """
+    Digest of the last month of ``events[:event_count]`` and its FX points.
+
+    O(one month of events); together with the event count and last event
+    date it stands in for the whole prefix (see the module docstring).
+    """
+    if event_count <= 0:
+        return _digest(["prefix", options, boundary, 0])
+    window_start = month_start(events[event_count - 1]["date"])
+    tail_start = bisect.bisect_left(events, window_start, 0, event_count, key=lambda event: event["date"])
+    tail = events[tail_start:event_count]
+    earliest_by_currency: Dict[str, datetime] = {}
+    for event in tail:
+        currency = str(event.get("currency") or "USD").upper()
+        if currency != "USD":
+            earliest_by_currency.setdefault(currency, event["date"])
+    return _digest(
+        [
+            "prefix",
+            options,
+            boundary,
+            event_count,
+            *_fx_window_parts(fx_cache, earliest_by_currency, window_start, boundary),
+            *_event_chunks(tail),
+        ]
+    )
+
+
+def load_checkpoint(
+    slot: str,
+    events: Sequence[Dict[str, Any]],
+    fx_cache: Dict[str, pd.Series],
+    options: Any,
+) -> Optional[ReplayCheckpoint]:
+    """The slot's checkpoint when it still matches ``events``; else ``None``."""
+    backend = get_replay_checkpoint_backend()
+    if backend is None:
+        return None
+    payload = backend.get(slot)
+    if payload is None:
+        return None
+    try:
+        checkpoint = decode_view(payload)
+    except Exception as exc:
+        portfolio_logger.warning("Discarding unreadable replay checkpoint %s: %s", slot[:12], exc)
+        return None
+    if not isinstance(checkpoint, ReplayCheckpoint):
+        return None
+    event_count = bisect.bisect_left(events, checkpoint.boundary, key=lambda event: event["date"])
+    if event_count != checkpoint.event_count or not 0 < event_count < len(events):
+        return None
+    if events[event_count - 1]["date"] != checkpoint.last_event_date:
+        return None
+    fingerprint = prefix_fingerprint(events, event_count, checkpoint.boundary, fx_cache, options)
+    if fingerprint != checkpoint.prefix_fingerprint:
+        return None
+    return checkpoint
+
+
+def store_checkpoint(slot: str, checkpoint: ReplayCheckpoint) -> None:
+    backend = get_replay_checkpoint_backend()
+    if backend is None:
+        return
+    try:
+        payload = encode_view(checkpoint)
+    except Exception as exc:
+        portfolio_logger.warning("Replay checkpoint not serializable (%s); skipping", exc)
+        return
+    backend.set(slot, payload)
+
+
+def replay_checkpoint_stats() -> Dict[str, Any]:
+    backend = get_replay_checkpoint_backend()
+    if backend is None:
+        return {"cache_type": "disabled"}
+    return backend.stats()
+
+
+def clear_replay_checkpoints() -> None:
+    backend = get_replay_checkpoint_backend()
+    if backend is not None:
+        backend.clear()
+
+
+__all__ = [
+    "ReplayCheckpoint",
+    "ReplayCheckpointCache",
+    "set_replay_checkpoint_backend",
+    "get_replay_checkpoint_backend",
+    "replay_slot",
+    "prefix_fingerprint",
+    "load_checkpoint",
+    "store_checkpoint",
+    "replay_checkpoint_stats",
+    "clear_replay_checkpoints",
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
 import re
@@ -72,10 +73,68 @@ from utils.logging import portfolio_logger
 from services.security_type_service import SecurityTypeService
 
 from . import _helpers, backfill, fx, holdings, mwr as _mwr, nav, pricing, provider_flows, timeline
+from .panel import RealizedMarketDataPanel
 
 
 _REALIZED_PRICE_FETCH_WORKERS = max(1, int(os.getenv("REALIZED_PRICE_FETCH_WORKERS", "8")))
 
+# Institution-wide rows a scope narrows to its account, by payload shape.
+_STORE_ACCOUNT_ROW_KEYS = ("flex_option_price_rows", "fetch_metadata")
+_PROVIDER_ACCOUNT_ROW_KEYS = ("ibkr_flex_option_prices",)
+
+
+def _narrow_rows_to_account(rows: Any, account: str) -> None:
+    """Drop rows of other accounts in place; rows without an account are kept."""
+    if not isinstance(rows, list):
+        return
+    rows[:] = [
+        row for row in rows
+        if not isinstance(row, dict)
+        or not (str(row.get("account_id") or "").strip() or str(row.get("account_name") or "").strip())
+        or holdings._match_account(row, account)
+    ]
+
+
+@dataclass(frozen=True)
+class PrefetchedTransactionSource:
+    """Institution-wide transaction source loaded once and shared by account scopes.
+
+    ``kind`` is ``"csv"``, ``"store"`` or ``"provider"`` and mirrors the load
+    branch in ``_analyze_realized_performance_single_scope``.  ``data`` is the
+    CSV/store payload dict or the provider fetch result.  Scopes apply their
+    own institution/account filters in memory, so an unscoped load serves
+    every account.
+    """
+
+    kind: str
+    data: Any
+    fifo_transactions: List[Dict[str, Any]] = field(default_factory=list)
+    schwab_security_lookup: Any = None
+
+    def scope_payload(self, account: Optional[str] = None) -> Any:
+        """Return a private deep copy of ``data`` narrowed to ``account``.
+
+        Scopes run on worker threads, so each gets its own copy (provider
+        fetch results included) and never shares mutable rows.  With
+        ``account`` the fetch metadata (warnings/errors) and flex option
+        price rows keep only that account's rows, as the transactions are
+        filtered; rows carrying no account identity are institution-wide and
+        kept.
+        """
+        payload = copy.deepcopy(self.data)
+        if not account:
+            return payload
+        if isinstance(payload, dict):
+            for key in _STORE_ACCOUNT_ROW_KEYS:
+                _narrow_rows_to_account(payload.get(key), account)
+        else:
+            _narrow_rows_to_account(getattr(payload, "fetch_metadata", None), account)
+            provider_payload = getattr(payload, "payload", None)
+            if isinstance(provider_payload, dict):
+                for key in _PROVIDER_ACCOUNT_ROW_KEYS:
+                    _narrow_rows_to_account(provider_payload.get(key), account)
+        return payload
+
 
 class RealizedPerformancePricingError(RuntimeError):
     """Raised when realized NAV would require zero-valuing unpriced symbols."""
@@ -212,6 +271,8 @@ def _analyze_realized_performance_single_scope(
     *,
     inception_override: Optional[datetime] = None,
     use_per_symbol_inception: bool = False,
+    prefetched_source: PrefetchedTransactionSource | None = None,
+    market_data: RealizedMarketDataPanel | None = None,
 ) -> Union["RealizedPerformanceResult", Dict[str, Any]]:
     """Compute realized performance metrics and realized metadata from transactions.
 
@@ -231,6 +292,10 @@ def _analyze_realized_performance_single_scope(
       holdings attribution for coverage/synthetic diagnostics.
     - Provider flow events are used directly when configured and sufficiently
       covered; otherwise the path falls back to inferred cash-flow reconstruction.
+    - ``prefetched_source`` (account aggregation) skips the transaction load and
+      reuses the institution-wide source; account filters still apply below.
+    - ``market_data`` shares price/FX series (and their NAV lookup arrays)
+      across scopes; a scope-local panel is used when none is passed.
 
     Debug pointer:
     - If realized returns look wrong, inspect ``warnings`` and
@@ -347,6 +412,7 @@ def _analyze_realized_performance_single_scope(
         }:
             segment = "all"
         price_registry = price_registry or pricing._build_default_price_registry()
+        market_data = market_data or RealizedMarketDataPanel()
         institution = (institution or "").strip() or None
         account = (account or "").strip() or None
         if source not in {"all", "snaptrade", "plaid", "ibkr_flex", "ibkr_statement", "schwab", "schwab_csv"}:
@@ -407,9 +473,21 @@ def _analyze_realized_performance_single_scope(
         }
 
         csv_store = CSVTransactionProvider()
-        if account_filters is None and csv_store.has_source(user_email, source):
-            with timing.step("load_csv_transactions"):
-                store_data = csv_store.load_transactions(user_email, source)
+        if prefetched_source is not None:
+            load_kind = prefetched_source.kind
+        elif account_filters is None and csv_store.has_source(user_email, source):
+            load_kind = "csv"
+        elif transaction_store_read:
+            load_kind = "store"
+        else:
+            load_kind = "provider"
+
+        if load_kind == "csv":
+            if prefetched_source is not None:
+                store_data = prefetched_source.scope_payload(account)
+            else:
+                with timing.step("load_csv_transactions"):
+                    store_data = csv_store.load_transactions(user_email, source)
             fifo_transactions = list(store_data.get("fifo_transactions") or [])
             if settings.EXERCISE_COST_BASIS_ENABLED:
                 from trading_analysis.exercise_linkage import link_option_exercises
@@ -438,47 +516,50 @@ def _analyze_realized_performance_single_scope(
 
             provider_first_mode = True
             provider_fetch_metadata = list(fetch_metadata_rows)
-        elif transaction_store_read:
-            from inputs.transaction_store import (
-                ensure_store_fresh,
-                ensure_store_fresh_for_portfolio,
-                load_from_store,
-                load_from_store_for_portfolio,
-            )
-            from utils.user_resolution import resolve_user_id
-
-            user_id = resolve_user_id(user_email)
-            with timing.step("load_transaction_store"):
-                if account_filters:
-                    ensure_store_fresh_for_portfolio(
-                        user_id=user_id,
-                        user_email=user_email,
-                        account_filters=account_filters,
-                        provider=source,
-                        max_age_hours=transaction_store_max_age_hours,
-                        retry_cooldown_minutes=transaction_store_retry_cooldown_minutes,
-                        allow_stale_existing=allow_stale_existing_transaction_store,
-                    )
-                    store_data = load_from_store_for_portfolio(
-                        user_id=user_id,
-                        account_filters=account_filters,
-                        source=source,
-                    )
-                else:
-                    ensure_store_fresh(
-                        user_id=user_id,
-                        user_email=user_email,
-                        provider=source,
-                        max_age_hours=transaction_store_max_age_hours,
-                        retry_cooldown_minutes=transaction_store_retry_cooldown_minutes,
-                        allow_stale_existing=allow_stale_existing_transaction_store,
-                    )
-                    store_data = load_from_store(
-                        user_id=user_id,
-                        source=source,
-                        institution=institution,
-                        account=account,
-                    )
+        elif load_kind == "store":
+            if prefetched_source is not None:
+                store_data = prefetched_source.scope_payload(account)
+            else:
+                from inputs.transaction_store import (
+                    ensure_store_fresh,
+                    ensure_store_fresh_for_portfolio,
+                    load_from_store,
+                    load_from_store_for_portfolio,
+                )
+                from utils.user_resolution import resolve_user_id
+
+                user_id = resolve_user_id(user_email)
+                with timing.step("load_transaction_store"):
+                    if account_filters:
+                        ensure_store_fresh_for_portfolio(
+                            user_id=user_id,
+                            user_email=user_email,
+                            account_filters=account_filters,
+                            provider=source,
+                            max_age_hours=transaction_store_max_age_hours,
+                            retry_cooldown_minutes=transaction_store_retry_cooldown_minutes,
+                            allow_stale_existing=allow_stale_existing_transaction_store,
+                        )
+                        store_data = load_from_store_for_portfolio(
+                            user_id=user_id,
+                            account_filters=account_filters,
+                            source=source,
+                        )
+                    else:
+                        ensure_store_fresh(
+                            user_id=user_id,
+                            user_email=user_email,
+                            provider=source,
+                            max_age_hours=transaction_store_max_age_hours,
+                            retry_cooldown_minutes=transaction_store_retry_cooldown_minutes,
+                            allow_stale_existing=allow_stale_existing_transaction_store,
+                        )
+                        store_data = load_from_store(
+                            user_id=user_id,
+                            source=source,
+                            institution=institution,
+                            account=account,
+                        )
             fifo_transactions = list(store_data.get("fifo_transactions") or [])
             if settings.EXERCISE_COST_BASIS_ENABLED:
                 from trading_analysis.exercise_linkage import link_option_exercises
@@ -507,20 +588,23 @@ def _analyze_realized_performance_single_scope(
             provider_first_mode = True
             provider_fetch_metadata = list(fetch_metadata_rows)
         else:
-            with timing.step("fetch_transactions"):
-                if institution:
-                    fetch_result = fetch_transactions_for_source_fn(
-                        user_email=user_email,
-                        source=source,
-                        institution=institution,
-                        account=account,
-                    )
-                else:
-                    fetch_result = fetch_transactions_for_source_fn(
-                        user_email=user_email,
-                        source=source,
-                        account=account,
-                    )
+            if prefetched_source is not None:
+                fetch_result = prefetched_source.scope_payload(account)
+            else:
+                with timing.step("fetch_transactions"):
+                    if institution:
+                        fetch_result = fetch_transactions_for_source_fn(
+                            user_email=user_email,
+                            source=source,
+                            institution=institution,
+                            account=account,
+                        )
+                    else:
+                        fetch_result = fetch_transactions_for_source_fn(
+                            user_email=user_email,
+                            source=source,
+                            account=account,
+                        )
             payload = getattr(fetch_result, "payload", fetch_result)
             fetch_metadata_rows = list(getattr(fetch_result, "fetch_metadata", []) or [])
             warnings.extend(
@@ -537,12 +621,15 @@ def _analyze_realized_performance_single_scope(
                     provider = row.get("provider", "unknown")
                     if provider not in fetch_errors:
                         fetch_errors[provider] = str(err)
-            with timing.step("build_schwab_security_lookup"):
-                schwab_security_lookup = get_schwab_security_lookup_fn(
-                    user_email=user_email,
-                    source=source,
-                    payload=payload,
-                )
+            if prefetched_source is not None and prefetched_source.schwab_security_lookup is not None:
+                schwab_security_lookup = prefetched_source.schwab_security_lookup
+            else:
+                with timing.step("build_schwab_security_lookup"):
+                    schwab_security_lookup = get_schwab_security_lookup_fn(
+                        user_email=user_email,
+                        source=source,
+                        payload=payload,
+                    )
             provider_first_mode = realized_use_provider_flows
 
             if provider_first_mode:
@@ -1044,6 +1131,7 @@ def _analyze_realized_performance_single_scope(
                 inception_date=fx_cache_start,
                 end_date=end_date,
                 warnings=warnings,
+                market_data=market_data,
             )
 
         # Delta-gap analysis: identify symbols where short inference should be
@@ -1196,14 +1284,13 @@ def _analyze_realized_performance_single_scope(
         unpriceable_reason_counts: Counter[str] = Counter()
         unpriceable_reasons: Dict[str, str] = {}
 
+        timeline_final_quantities = position_timeline.final_quantities()
+
         def _timeline_position_still_open(ticker: str) -> bool:
-            for tl_key, tl_events in position_timeline.items():
-                if tl_key[0] != ticker or not tl_events:
-                    continue
-                cumulative_qty = sum(float(event[1]) for event in tl_events)
-                if abs(cumulative_qty) > 1e-9:
-                    return True
-            return False
+            return any(
+                tl_key[0] == ticker and abs(final_qty) > 1e-9
+                for tl_key, final_qty in timeline_final_quantities.items()
+            )
 
         def _resolve_price_for_ticker(ticker: str) -> Dict[str, Any]:
             raw_types = ticker_instrument_types.get(ticker, {"equity"})
@@ -1274,7 +1361,7 @@ def _analyze_realized_performance_single_scope(
                                 f"Priced option {ticker} using FIFO close-price terminal heuristic."
                             )
                     else:
-                        price_result = pricing._fetch_price_from_chain(
+                        price_result = market_data.fetch_price(
                             price_registry.get_price_chain("option"),
                             ticker,
                             price_fetch_start,
@@ -1283,7 +1370,7 @@ def _analyze_realized_performance_single_scope(
                             contract_identity=contract_identity,
                             ticker_alias_map=ticker_alias_map or None,
                         )
-                        norm = _helpers._series_from_cache(price_result.series)
+                        norm = price_result.series
                         if not norm.empty and OPTION_MULTIPLIER_NAV_ENABLED:
                             mult = _helpers._as_float(
                                 (contract_identity or {}).get("multiplier"), 1.0
@@ -1349,7 +1436,7 @@ def _analyze_realized_performance_single_scope(
                             )
                             unpriceable_reason = "bond_missing_identifiers"
                     else:
-                        price_result = pricing._fetch_price_from_chain(
+                        price_result = market_data.fetch_price(
                             chain,
                             ticker,
                             price_fetch_start,
@@ -1358,7 +1445,7 @@ def _analyze_realized_performance_single_scope(
                             contract_identity=contract_identity,
                             ticker_alias_map=ticker_alias_map or None,
                         )
-                        norm = _helpers._series_from_cache(price_result.series)
+                        norm = price_result.series
                         local_ibkr_priced_symbols: Dict[str, set[str]] = defaultdict(set)
                         chain_reason = pricing._emit_pricing_diagnostics(
                             ticker=ticker,
@@ -1373,7 +1460,7 @@ def _analyze_realized_performance_single_scope(
                         if norm.empty or norm.dropna().empty:
                             unpriceable_reason = chain_reason
                 else:
-                    price_result = pricing._fetch_price_from_chain(
+                    price_result = market_data.fetch_price(
                         chain,
                         ticker,
                         price_fetch_start,
@@ -1382,7 +1469,7 @@ def _analyze_realized_performance_single_scope(
                         contract_identity=contract_identity,
                         ticker_alias_map=ticker_alias_map or None,
                     )
-                    norm = _helpers._series_from_cache(price_result.series)
+                    norm = price_result.series
                     local_ibkr_priced_symbols: Dict[str, set[str]] = defaultdict(set)
                     chain_reason = pricing._emit_pricing_diagnostics(
                         ticker=ticker,
@@ -1490,6 +1577,7 @@ def _analyze_realized_performance_single_scope(
                         inception_date=inception_date,
                         end_date=end_date,
                         warnings=warnings,
+                        market_data=market_data,
                     )
                 )
 
@@ -2428,6 +2516,7 @@ def _analyze_realized_performance_single_scope(
                         fx_cache=fx_cache,
                         cash_snapshots=cash_snapshots,
                         futures_keys=futures_keys,
+                        market_data=market_data,
                     ).iloc[0]
                 )
                 monthly_nav = nav.compute_monthly_nav(
@@ -2437,6 +2526,7 @@ def _analyze_realized_performance_single_scope(
                     fx_cache=fx_cache,
                     cash_snapshots=cash_snapshots,
                     futures_keys=futures_keys,
+                    market_data=market_data,
                 )
                 daily_nav = monthly_nav.copy()
             else:
@@ -2447,6 +2537,7 @@ def _analyze_realized_performance_single_scope(
                     fx_cache=fx_cache,
                     cash_snapshots=cash_snapshots,
                     futures_keys=futures_keys,
+                    market_data=market_data,
                 )
                 monthly_nav = pd.Series(
                     [_helpers._value_at_or_before(daily_nav, ts, default=np.nan) for ts in month_end_index],
@@ -2504,6 +2595,7 @@ def _analyze_realized_performance_single_scope(
                     fx_cache=fx_cache,
                     cash_snapshots=observed_cash_snapshots,
                     futures_keys=futures_keys,
+                    market_data=market_data,
                 )
                 observed_daily_nav = observed_monthly_nav.copy()
             else:
@@ -2514,6 +2606,7 @@ def _analyze_realized_performance_single_scope(
                     fx_cache=fx_cache,
                     cash_snapshots=observed_cash_snapshots,
                     futures_keys=futures_keys,
+                    market_data=market_data,
                 )
                 observed_monthly_nav = pd.Series(
                     [_helpers._value_at_or_before(observed_daily_nav, ts, default=np.nan) for ts in month_end_index],
@@ -3304,6 +3397,7 @@ def _analyze_realized_performance_single_scope(
         }
 
 __all__ = [
+    'PrefetchedTransactionSource',
     'RealizedPerformancePricingError',
     '_analyze_realized_performance_single_scope',
 ]
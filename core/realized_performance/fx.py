@@ -6,7 +6,7 @@ import re
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -52,6 +52,9 @@ from trading_analysis.symbol_utils import parse_option_contract_identity_from_sy
 
 from . import _helpers
 
+if TYPE_CHECKING:
+    from .panel import RealizedMarketDataPanel
+
 def _event_fx_rate(currency: str, when: datetime, fx_cache: Dict[str, pd.Series]) -> float:
     """Get FX currency->USD rate for event timestamp."""
     ccy = (currency or "USD").upper()
@@ -90,8 +93,13 @@ def _build_fx_cache(
     inception_date: datetime,
     end_date: datetime,
     warnings: List[str],
+    market_data: Optional["RealizedMarketDataPanel"] = None,
 ) -> Dict[str, pd.Series]:
-    """Fetch and normalize daily FX series for requested currencies."""
+    """Fetch and normalize daily FX series for requested currencies.
+
+    With ``market_data`` each currency is fetched once per session and the
+    shared series is served for this window.
+    """
     fx_cache: Dict[str, pd.Series] = {}
     for ccy in sorted({str(c or "USD").upper() for c in currencies}):
         if ccy == "USD":
@@ -99,9 +107,12 @@ def _build_fx_cache(
             continue
 
         try:
-            series = _helpers._series_from_cache(
-                get_daily_fx_series(ccy, inception_date, end_date)
-            )
+            if market_data is not None:
+                series = market_data.fx_series(ccy, inception_date, end_date, get_daily_fx_series)
+            else:
+                series = _helpers._series_from_cache(
+                    get_daily_fx_series(ccy, inception_date, end_date)
+                )
         except Exception as exc:
             raise RuntimeError(f"FX series fetch failed for {ccy}") from exc
 
@@ -2,10 +2,9 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import List, Optional, Sequence, Tuple
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
-from scipy.optimize import brentq, newton
 
 from . import _helpers
 
@@ -18,95 +17,260 @@ _BRACKETS: Tuple[Tuple[float, float], ...] = (
     (-0.95, 25.0),
     (-0.99, 100.0),
 )
+_SECONDS_PER_YEAR = 365.25 * 86400.0
+_ROOT_TOL = 1e-10
+_MAX_ITER = 100
+
+
+def _year_fractions(dates: Sequence[datetime] | np.ndarray) -> np.ndarray:
+    """Years since the first date (clipped at 0) for naive datetimes."""
+    stamps = np.asarray(dates, dtype="datetime64[us]")
+    seconds = (stamps - stamps[0]) / np.timedelta64(1, "s")
+    return np.maximum(seconds, 0.0) / _SECONDS_PER_YEAR
+
+
+def _xnpv_with_derivative(
+    rates: np.ndarray,
+    years: np.ndarray,
+    amounts: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    XNPV and d(XNPV)/d(rate) for a batch of cash-flow rows.
+
+    ``rates`` is (n,), ``years``/``amounts`` are (n, flows) with zero-amount
+    padding.  Rates <= -1 and overflowing discount factors give ``inf``.
+    """
+    rates = np.asarray(rates, dtype=float)
+    valid = rates > -1.0
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        log_base = np.log1p(np.where(valid, rates, 0.0))
+        discounted = amounts * np.exp(-years * log_base[:, None])
+        value = discounted.sum(axis=1)
+        derivative = -(years * discounted).sum(axis=1) / (1.0 + np.where(valid, rates, 0.0))
+    bad = ~valid | ~np.isfinite(value)
+    value = np.where(bad, np.inf, value)
+    derivative = np.where(bad | ~np.isfinite(derivative), np.nan, derivative)
+    return value, derivative
 
 
 def _xnpv(rate: float, dates: Sequence[datetime], amounts: Sequence[float]) -> float:
-    if rate <= -1.0:
-        return np.inf
-    base = 1.0 + rate
-    start = dates[0]
-    total = 0.0
-    for when, amount in zip(dates, amounts):
-        years = max((when - start).total_seconds(), 0.0) / (365.25 * 86400.0)
-        try:
-            total += float(amount) / (base ** years)
-        except (OverflowError, ZeroDivisionError):
-            return np.inf
-    return float(total)
+    years = _year_fractions(dates)[None, :]
+    flows = np.asarray(amounts, dtype=float)[None, :]
+    value, _ = _xnpv_with_derivative(np.array([rate]), years, flows)
+    return float(value[0])
 
 
-def xirr(dates: Sequence[datetime], amounts: Sequence[float], guess: float = 0.1) -> Optional[float]:
+def _solve_bracketed(
+    years: np.ndarray,
+    amounts: np.ndarray,
+    low: np.ndarray,
+    high: np.ndarray,
+    f_low: np.ndarray,
+) -> np.ndarray:
+    """
+    Safeguarded Newton/bisection root of each row inside ``[low, high]``.
+
+    Each row's bracket has a sign change.  A Newton step is taken when it
+    stays inside the current bracket and shrinks faster than bisection;
+    otherwise the row bisects, so every row converges like ``brentq``.
+    """
+    low, high, f_low = low.copy(), high.copy(), f_low.copy()
+    x = 0.5 * (low + high)
+    step_old = high - low
+    active = np.arange(len(x))
+    for _ in range(_MAX_ITER):
+        if not active.size:
+            break
+        f, df = _xnpv_with_derivative(x[active], years[active], amounts[active])
+        exact = f == 0.0
+        same_sign = np.sign(f) == np.sign(f_low[active])
+        low[active] = np.where(same_sign, x[active], low[active])
+        f_low[active] = np.where(same_sign, f, f_low[active])
+        high[active] = np.where(same_sign, high[active], x[active])
+
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+            candidate = x[active] - f / df
+        lo, hi = low[active], high[active]
+        use_newton = (
+            np.isfinite(candidate)
+            & (candidate > lo)
+            & (candidate < hi)
+            & (np.abs(2.0 * f) <= np.abs(step_old[active] * df))
+        )
+        x_new = np.where(use_newton, candidate, 0.5 * (lo + hi))
+        step_old[active] = np.abs(x_new - x[active])
+        converged = exact | (step_old[active] <= 2e-12 + 4 * np.finfo(float).eps * np.abs(x_new))
+        x[active] = np.where(exact, x[active], x_new)
+        active = active[~converged]
+    return x
+
+
+def _newton(years: np.ndarray, amounts: np.ndarray, guess: float) -> np.ndarray:
+    """Damped Newton with the analytic derivative from ``guess``; NaN where it fails."""
+    x = np.full(len(years), float(guess))
+    active = np.arange(len(x))
+    for _ in range(_MAX_ITER):
+        if not active.size:
+            break
+        f, df = _xnpv_with_derivative(x[active], years[active], amounts[active])
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+            candidate = x[active] - f / df
+        failed = ~np.isfinite(candidate)
+        # Keep iterates above -1 by halving the distance to it.
+        candidate = np.where(candidate <= -1.0, 0.5 * (x[active] - 1.0), candidate)
+        converged = np.abs(candidate - x[active]) <= 1.48e-8 * (1.0 + np.abs(x[active]))
+        x[active] = np.where(failed, np.nan, candidate)
+        active = active[~(converged | failed)]
+    x[active] = np.nan
+    f, _ = _xnpv_with_derivative(np.where(np.isfinite(x), x, 0.0), years, amounts)
+    return np.where(np.isfinite(x) & (x > -1.0) & (np.abs(f) < 1e-6), x, np.nan)
+
+
+def _clean_cash_flows(
+    dates: Sequence[datetime],
+    amounts: Sequence[float],
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Sorted (year fractions, amounts), or ``None`` when XIRR is undefined."""
     if len(dates) != len(amounts) or len(dates) < 2:
         return None
 
-    cleaned: List[Tuple[datetime, float]] = []
-    for raw_dt, raw_amt in zip(dates, amounts):
-        dt = _helpers._to_datetime(raw_dt)
-        if dt is None:
-            continue
-        cleaned.append((dt, _helpers._as_float(raw_amt, 0.0)))
-    if len(cleaned) < 2:
-        return None
+    # Fast path: naive datetimes and numeric amounts convert as whole arrays.
+    try:
+        if not all(type(dt) is datetime and dt.tzinfo is None for dt in dates):
+            raise TypeError
+        stamps = np.asarray(dates, dtype="datetime64[us]")
+        values = np.asarray(amounts, dtype=float)
+        values = np.where(np.isfinite(values), values, 0.0)
+    except (TypeError, ValueError):
+        cleaned: List[Tuple[datetime, float]] = []
+        for raw_dt, raw_amt in zip(dates, amounts):
+            dt = _helpers._to_datetime(raw_dt)
+            if dt is None:
+                continue
+            cleaned.append((dt, _helpers._as_float(raw_amt, 0.0)))
+        if len(cleaned) < 2:
+            return None
+        stamps = np.asarray([row[0] for row in cleaned], dtype="datetime64[us]")
+        values = np.array([row[1] for row in cleaned], dtype=float)
 
-    cleaned.sort(key=lambda row: row[0])
-    ordered_dates = [row[0] for row in cleaned]
-    ordered_amounts = [row[1] for row in cleaned]
-    has_positive = any(val > 0.0 for val in ordered_amounts)
-    has_negative = any(val < 0.0 for val in ordered_amounts)
-    if not (has_positive and has_negative):
+    order = np.argsort(stamps, kind="stable")
+    stamps, values = stamps[order], values[order]
+    if not ((values > 0.0).any() and (values < 0.0).any()):
         return None
+    return _year_fractions(stamps), values
 
-    def _f(rate: float) -> float:
-        return _xnpv(rate, ordered_dates, ordered_amounts)
 
+def _solve_xirr(years: np.ndarray, amounts: np.ndarray, guess: float) -> np.ndarray:
+    """XIRR for padded rows: first sign-changing bracket of ``_BRACKETS``, then Newton."""
+    n = len(years)
+    roots = np.full(n, np.nan)
+    unresolved = np.ones(n, dtype=bool)
     for low, high in _BRACKETS:
-        f_low = _f(low)
-        f_high = _f(high)
-        if not np.isfinite(f_low) or not np.isfinite(f_high):
+        rows = np.flatnonzero(unresolved)
+        if not rows.size:
+            break
+        f_low, _ = _xnpv_with_derivative(np.full(rows.size, low), years[rows], amounts[rows])
+        f_high, _ = _xnpv_with_derivative(np.full(rows.size, high), years[rows], amounts[rows])
+        finite = np.isfinite(f_low) & np.isfinite(f_high)
+        at_low = finite & (np.abs(f_low) < _ROOT_TOL)
+        at_high = finite & ~at_low & (np.abs(f_high) < _ROOT_TOL)
+        crossing = finite & ~at_low & ~at_high & (f_low * f_high < 0.0)
+        roots[rows[at_low]] = low
+        roots[rows[at_high]] = high
+        if crossing.any():
+            solve = rows[crossing]
+            roots[solve] = _solve_bracketed(
+                years[solve],
+                amounts[solve],
+                np.full(solve.size, low),
+                np.full(solve.size, high),
+                f_low[crossing],
+            )
+        unresolved[rows[at_low | at_high | crossing]] = False
+
+    rows = np.flatnonzero(unresolved)
+    if rows.size:
+        _LOG.warning(
+            "XIRR bracket search found no sign change in [%s, %s] for %d of %d cash-flow series.",
+            _BRACKETS[0],
+            _BRACKETS[-1],
+            rows.size,
+            n,
+        )
+        fallback = _newton(years[rows], amounts[rows], guess)
+        # Without a bracket Newton can land on valid but absurd roots; keep the bracket band.
+        low, high = _BRACKETS[-1]
+        implausible = np.isfinite(fallback) & ((fallback <= low) | (fallback >= high))
+        if implausible.any():
+            _LOG.warning(
+                "XIRR fallback rejected %d root(s) outside (%s, %s).",
+                int(implausible.sum()),
+                low,
+                high,
+            )
+            fallback[implausible] = np.nan
+        roots[rows] = fallback
+    return roots
+
+
+def xirr_batch(
+    cash_flows: Sequence[Tuple[Sequence[datetime], Sequence[float]]],
+    guess: float = 0.1,
+) -> List[Optional[float]]:
+    """
+    XIRR of many ``(dates, amounts)`` series at once.
+
+    Series are padded into arrays (grouped by flow count so one long series
+    does not pad the rest) and solved together; each result matches
+    ``xirr`` on that series alone.
+    """
+    results: List[Optional[float]] = [None] * len(cash_flows)
+    by_width: dict[int, List[Tuple[int, np.ndarray, np.ndarray]]] = {}
+    for position, (dates, amounts) in enumerate(cash_flows):
+        cleaned = _clean_cash_flows(dates, amounts)
+        if cleaned is None:
             continue
-        if abs(f_low) < 1e-10:
-            return low
-        if abs(f_high) < 1e-10:
-            return high
-        if f_low * f_high < 0.0:
-            try:
-                root = brentq(_f, low, high, maxiter=1000)
-                if np.isfinite(root) and root > -1.0:
-                    return float(root)
-            except Exception:
-                continue
+        width = 1 << (len(cleaned[0]) - 1).bit_length()
+        by_width.setdefault(width, []).append((position, *cleaned))
 
-    _LOG.warning("XIRR bracket search found no sign change in [%s, %s].", _BRACKETS[0], _BRACKETS[-1])
+    for width, rows in by_width.items():
+        years = np.zeros((len(rows), width))
+        amounts = np.zeros((len(rows), width))
+        for row, (_, row_years, row_amounts) in enumerate(rows):
+            years[row, : len(row_years)] = row_years
+            amounts[row, : len(row_amounts)] = row_amounts
+        roots = _solve_xirr(years, amounts, guess)
+        for (position, _, _), root in zip(rows, roots):
+            if np.isfinite(root) and root > -1.0:
+                results[position] = float(root)
+    return results
 
-    try:
-        root = newton(_f, x0=guess, maxiter=100)
-        if np.isfinite(root) and root > -1.0 and abs(_f(root)) < 1e-6:
-            return float(root)
-    except Exception:
-        pass
-    return None
 
+def xirr(dates: Sequence[datetime], amounts: Sequence[float], guess: float = 0.1) -> Optional[float]:
+    return xirr_batch([(dates, amounts)], guess=guess)[0]
 
-def compute_mwr(
+
+def _mwr_cash_flows(
     external_flows: List[Tuple[datetime, float]],
     nav_start: float,
     nav_end: float,
     start_date: datetime,
     end_date: datetime,
-) -> Tuple[Optional[float], str]:
+) -> Tuple[Optional[Tuple[Optional[float], str]], Optional[Tuple[List[datetime], List[float]]]]:
+    """Either a final ``(mwr, status)`` or the XIRR cash flows of the window."""
     start = _helpers._to_datetime(start_date)
     end = _helpers._to_datetime(end_date)
     if start is None or end is None or end <= start:
-        return None, "no_data"
+        return (None, "no_data"), None
 
     days = max((end - start).total_seconds() / 86400.0, 0.0)
     if days < 30.0:
-        return None, "no_data"
+        return (None, "no_data"), None
 
     nav_start_value = _helpers._as_float(nav_start, np.nan)
     nav_end_value = _helpers._as_float(nav_end, np.nan)
     if not np.isfinite(nav_start_value) or not np.isfinite(nav_end_value) or abs(nav_start_value) <= 1e-9:
-        return None, "no_data"
+        return (None, "no_data"), None
 
     flows_in_window: List[Tuple[datetime, float]] = []
     for raw_when, raw_amount in list(external_flows or []):
@@ -122,14 +286,14 @@ def compute_mwr(
     if not flows_in_window:
         ratio = nav_end_value / nav_start_value
         if ratio < 0.0:
-            return None, "failed"
+            return (None, "failed"), None
         try:
             annualized = (ratio ** (365.25 / days)) - 1.0
         except (OverflowError, ValueError, ZeroDivisionError):
-            return None, "failed"
+            return (None, "failed"), None
         if not np.isfinite(annualized):
-            return None, "failed"
-        return float(annualized), "success"
+            return (None, "failed"), None
+        return (float(annualized), "success"), None
 
     # XIRR investor convention: cash out from investor is negative, cash in is positive.
     cash_dates: List[datetime] = [start]
@@ -138,14 +302,55 @@ def compute_mwr(
     cash_amounts.extend(-float(amount) for _, amount in flows_in_window)
     cash_dates.append(end)
     cash_amounts.append(float(nav_end_value))
+    return None, (cash_dates, cash_amounts)
+
+
+def compute_mwr(
+    external_flows: List[Tuple[datetime, float]],
+    nav_start: float,
+    nav_end: float,
+    start_date: datetime,
+    end_date: datetime,
+) -> Tuple[Optional[float], str]:
+    return compute_mwr_batch(
+        [
+            {
+                "external_flows": external_flows,
+                "nav_start": nav_start,
+                "nav_end": nav_end,
+                "start_date": start_date,
+                "end_date": end_date,
+            }
+        ]
+    )[0]
+
+
+def compute_mwr_batch(windows: Sequence[Mapping[str, Any]]) -> List[Tuple[Optional[float], str]]:
+    """
+    ``compute_mwr`` for many accounts, positions or windows in one solve.
+
+    Each item holds ``compute_mwr``'s keyword arguments.  Windows that need
+    an IRR are solved together by ``xirr_batch``; results keep input order.
+    """
+    results: List[Tuple[Optional[float], str]] = [(None, "failed")] * len(windows)
+    pending: List[int] = []
+    cash_flows: List[Tuple[List[datetime], List[float]]] = []
+    for position, window in enumerate(windows):
+        final, flows = _mwr_cash_flows(**window)
+        if final is not None:
+            results[position] = final
+            continue
+        pending.append(position)
+        cash_flows.append(flows)
 
-    irr = xirr(cash_dates, cash_amounts)
-    if irr is None:
-        return None, "failed"
-    return float(irr), "success"
+    for position, irr in zip(pending, xirr_batch(cash_flows)):
+        results[position] = (float(irr), "success") if irr is not None else (None, "failed")
+    return results
 
 
 __all__ = [
     "xirr",
+    "xirr_batch",
     "compute_mwr",
+    "compute_mwr_batch",
 ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import copy
 import json
 import os
 import re
@@ -58,13 +60,39 @@ from trading_analysis.fifo_matcher import FIFOMatcher, IncompleteTrade, OpenLot
 from trading_analysis.instrument_meta import InstrumentMeta, coerce_instrument_type
 from trading_analysis.symbol_utils import parse_option_contract_identity_from_symbol
 
-from . import _helpers, fx as fx_module, provider_flows
+from . import _helpers, checkpoints, fx as fx_module, provider_flows
+from .panel import RealizedMarketDataPanel, _prepare_lookup
+from .timeline import PositionTimeline
 
 
 class RiskFreeRateUnavailable(RuntimeError):
     """Raised when realized performance cannot load a provider-backed risk-free rate."""
 
 
+@dataclass
+class _CashReplayState:
+    """Fold state of ``derive_cash_and_external_flows`` between two events (checkpointed)."""
+
+    cash: float = 0.0
+    outstanding_injections: float = 0.0
+    futures_positions: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    futures_contract_price: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    futures_contract_fx: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    futures_contract_margin_rate: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    futures_contract_multiplier: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    futures_inception_margin_captured: bool = False
+    futures_inception_margin_usd: float = 0.0
+    futures_inception_date: Optional[_date_type] = None
+    futures_notional_suppressed_usd: float = 0.0
+    futures_fee_cash_impact_usd: float = 0.0
+    futures_unknown_action_count: int = 0
+    futures_missing_fx_count: int = 0
+    futures_mtm_cash_impact_usd: float = 0.0
+    unpriceable_suppressed_count: int = 0
+    unpriceable_suppressed_usd: float = 0.0
+    unpriceable_suppressed_symbols: Set[str] = field(default_factory=set)
+
+
 def derive_cash_and_external_flows(
     fifo_transactions: List[Dict[str, Any]],
     income_with_currency: List[Dict[str, Any]],
@@ -84,6 +112,11 @@ def derive_cash_and_external_flows(
     would otherwise go negative. Negative external flows represent subsequent
     withdrawals (repayment) when later events replenish cash above outstanding
     inferred contributions.
+
+    With ``REALIZED_REPLAY_CHECKPOINT_DIR`` set, the fold resumes from a
+    persisted month-boundary checkpoint whenever the earlier history still
+    matches its fingerprint, so a daily refresh only folds the latest month.
+    Only this fold resumes; callers still rebuild FIFO, timeline and NAV.
     """
     if replay_diagnostics is not None:
         replay_diagnostics.setdefault("futures_txn_count_replayed", 0)
@@ -261,31 +294,84 @@ def derive_cash_and_external_flows(
 
     events.sort(key=lambda e: (e["date"], _helpers.TYPE_ORDER.get(e["event_type"], 99)))
 
-    cash = 0.0
-    outstanding_injections = 0.0
-    cash_snapshots: List[Tuple[datetime, float]] = []
-    external_flows: List[Tuple[datetime, float]] = []
     provider_mode = bool(provider_flow_events)
     inference_enabled = ((not provider_mode) or (not disable_inference_when_provider_mode)) and not force_disable_inference
     _DEFAULT_MARGIN_RATE = 0.10
-    _futures_positions: Dict[Tuple[str, str], float] = {}
-    _futures_contract_price: Dict[Tuple[str, str], float] = {}
-    _futures_contract_fx: Dict[Tuple[str, str], float] = {}
-    _futures_contract_margin_rate: Dict[Tuple[str, str], float] = {}
-    _futures_contract_multiplier: Dict[Tuple[str, str], float] = {}
-    _futures_inception_margin_captured = False
-    futures_inception_margin_usd = 0.0
-    _futures_inception_date: Optional[_date_type] = None
-    futures_notional_suppressed_usd = 0.0
-    futures_fee_cash_impact_usd = 0.0
-    futures_unknown_action_count = 0
-    futures_missing_fx_count = 0
-    futures_mtm_cash_impact_usd = 0.0
-    unpriceable_suppressed_count = 0
-    unpriceable_suppressed_usd = 0.0
-    unpriceable_suppressed_symbols: set[str] = set()
-
-    for event in events:
+
+    # Resume from the latest month-boundary checkpoint when the history
+    # before it is unchanged, and capture a new one at the start of the
+    # latest event month (see ``checkpoints``).
+    replay_options = (
+        provider_mode,
+        inference_enabled,
+        sorted(_suppress_symbols),
+        OPTION_MULTIPLIER_NAV_ENABLED,
+        sorted(IBKR_TRANSACTION_SOURCES),
+    )
+    checkpoint_slot: Optional[str] = None
+    resume: Optional[checkpoints.ReplayCheckpoint] = None
+    if events and checkpoints.get_replay_checkpoint_backend() is not None:
+        checkpoint_slot = checkpoints.replay_slot(events, replay_options)
+        resume = checkpoints.load_checkpoint(checkpoint_slot, events, fx_cache, replay_options)
+    start_index = resume.event_count if resume is not None else 0
+    state = resume.state if resume is not None else _CashReplayState()
+    cash_snapshots: List[Tuple[datetime, float]] = list(resume.cash_snapshots) if resume is not None else []
+    external_flows: List[Tuple[datetime, float]] = list(resume.external_flows) if resume is not None else []
+    capture_index: Optional[int] = None
+    if checkpoint_slot is not None:
+        capture_boundary = checkpoints.month_start(events[-1]["date"])
+        capture_index = bisect.bisect_left(events, capture_boundary, key=lambda e: e["date"])
+        if capture_index <= start_index:
+            capture_index = None
+    captured: Optional[Tuple[_CashReplayState, List[Tuple[datetime, float]]]] = None
+
+    cash = state.cash
+    outstanding_injections = state.outstanding_injections
+    _futures_positions = state.futures_positions
+    _futures_contract_price = state.futures_contract_price
+    _futures_contract_fx = state.futures_contract_fx
+    _futures_contract_margin_rate = state.futures_contract_margin_rate
+    _futures_contract_multiplier = state.futures_contract_multiplier
+    _futures_inception_margin_captured = state.futures_inception_margin_captured
+    futures_inception_margin_usd = state.futures_inception_margin_usd
+    _futures_inception_date = state.futures_inception_date
+    futures_notional_suppressed_usd = state.futures_notional_suppressed_usd
+    futures_fee_cash_impact_usd = state.futures_fee_cash_impact_usd
+    futures_unknown_action_count = state.futures_unknown_action_count
+    futures_missing_fx_count = state.futures_missing_fx_count
+    futures_mtm_cash_impact_usd = state.futures_mtm_cash_impact_usd
+    unpriceable_suppressed_count = state.unpriceable_suppressed_count
+    unpriceable_suppressed_usd = state.unpriceable_suppressed_usd
+    unpriceable_suppressed_symbols = state.unpriceable_suppressed_symbols
+
+    for event_index in range(start_index, len(events)):
+        event = events[event_index]
+        if event_index == capture_index:
+            captured = (
+                copy.deepcopy(
+                    _CashReplayState(
+                        cash=cash,
+                        outstanding_injections=outstanding_injections,
+                        futures_positions=_futures_positions,
+                        futures_contract_price=_futures_contract_price,
+                        futures_contract_fx=_futures_contract_fx,
+                        futures_contract_margin_rate=_futures_contract_margin_rate,
+                        futures_contract_multiplier=_futures_contract_multiplier,
+                        futures_inception_margin_captured=_futures_inception_margin_captured,
+                        futures_inception_margin_usd=futures_inception_margin_usd,
+                        futures_inception_date=_futures_inception_date,
+                        futures_notional_suppressed_usd=futures_notional_suppressed_usd,
+                        futures_fee_cash_impact_usd=futures_fee_cash_impact_usd,
+                        futures_unknown_action_count=futures_unknown_action_count,
+                        futures_missing_fx_count=futures_missing_fx_count,
+                        futures_mtm_cash_impact_usd=futures_mtm_cash_impact_usd,
+                        unpriceable_suppressed_count=unpriceable_suppressed_count,
+                        unpriceable_suppressed_usd=unpriceable_suppressed_usd,
+                        unpriceable_suppressed_symbols=unpriceable_suppressed_symbols,
+                    )
+                ),
+                list(external_flows),
+            )
         event_type = event["event_type"]
         is_futures = bool(event.get("is_futures", False))
         normalized_symbol = str(event.get("symbol") or "").strip().upper()
@@ -444,6 +530,23 @@ def derive_cash_and_external_flows(
             for ck, cqty in _futures_positions.items()
         )
 
+    if captured is not None:
+        captured_state, captured_flows = captured
+        checkpoints.store_checkpoint(
+            checkpoint_slot,
+            checkpoints.ReplayCheckpoint(
+                boundary=capture_boundary,
+                event_count=capture_index,
+                last_event_date=events[capture_index - 1]["date"],
+                prefix_fingerprint=checkpoints.prefix_fingerprint(
+                    events, capture_index, capture_boundary, fx_cache, replay_options
+                ),
+                state=captured_state,
+                cash_snapshots=cash_snapshots[:capture_index],
+                external_flows=captured_flows,
+            ),
+        )
+
     if warnings is not None and _futures_positions:
         open_contracts = ", ".join(
             f"{sym}({exp})" if exp else sym
@@ -555,6 +658,7 @@ def derive_cash_and_external_flows(
 
     timing.add_details(
         event_count=len(events),
+        resumed_event_count=start_index,
         provider_mode=provider_mode,
         inference_enabled=inference_enabled,
     )
@@ -562,18 +666,24 @@ def derive_cash_and_external_flows(
     return cash_snapshots, external_flows
 
 def compute_monthly_nav(
-    position_timeline: Dict[Tuple[str, str, str], List[Tuple[datetime, float]]],
+    position_timeline: Union[PositionTimeline, Dict[Tuple[str, str, str], List[Tuple[datetime, float]]]],
     month_ends: List[datetime],
     price_cache: Dict[str, pd.Series],
     fx_cache: Dict[str, pd.Series],
     cash_snapshots: List[Tuple[datetime, float]],
     futures_keys: Optional[Set[Tuple[str, str, str]]] = None,
+    market_data: Optional[RealizedMarketDataPanel] = None,
 ) -> pd.Series:
     """Compute month-end NAV = valued positions + derived cash.
 
     Futures positions are excluded from position valuation because their P&L
     is already captured in cash via FUTURES_MTM daily settlement events.
     Including notional value would double-count and massively inflate NAV.
+
+    With ``market_data`` the sorted lookup arrays come from the shared panel
+    instead of being rebuilt from every series on each call.  Quantities for
+    every position and month end are read from the columnar timeline in one
+    pass; a legacy ``{key: [(date, qty), ...]}`` mapping is converted first.
     """
     if not month_ends:
         return pd.Series(dtype=float)
@@ -585,18 +695,6 @@ def compute_monthly_nav(
         futures_key_count=len(futures_keys or set()),
     )
 
-    def _prepare_lookup(series: pd.Series | None) -> tuple[np.ndarray, np.ndarray] | None:
-        if series is None or len(series) == 0:
-            return None
-        prepared = series.dropna()
-        if prepared.empty:
-            return None
-        if not isinstance(prepared.index, pd.DatetimeIndex):
-            prepared.index = pd.to_datetime(prepared.index)
-        prepared = prepared.sort_index()
-        index_ns = prepared.index.to_numpy(dtype="datetime64[ns]").astype(np.int64, copy=False)
-        return index_ns, prepared.to_numpy(dtype=float, copy=False)
-
     def _lookup_prepared(
         prepared: tuple[np.ndarray, np.ndarray] | None,
         when_ns: int,
@@ -654,13 +752,14 @@ def compute_monthly_nav(
 
     month_end_index = pd.DatetimeIndex(pd.to_datetime(month_ends)).sort_values()
     month_end_ns = month_end_index.to_numpy(dtype="datetime64[ns]").astype(np.int64, copy=False)
+    prepare = market_data.prepared_lookup if market_data is not None else _prepare_lookup
     with timing.step("prepare_lookups"):
         prepared_price_cache = {
-            ticker: _prepare_lookup(series)
+            ticker: prepare(series)
             for ticker, series in price_cache.items()
         }
         prepared_fx_cache = {
-            currency.upper(): _prepare_lookup(series)
+            currency.upper(): prepare(series)
             for currency, series in fx_cache.items()
         }
 
@@ -688,34 +787,13 @@ def compute_monthly_nav(
                 nav_values[has_cash] = cash_values[cash_pos[has_cash]]
 
     with timing.step("value_positions"):
-        for key, events in position_timeline.items():
+        timeline = PositionTimeline.from_events(position_timeline or {})
+        held = timeline.quantities_at(month_end_ns)
+        for code, key in enumerate(timeline):
             if futures_keys and key in futures_keys:
                 continue
 
-            normalized_events = sorted(
-                (
-                    pd.Timestamp(d).to_pydatetime().replace(tzinfo=None),
-                    _helpers._as_float(q, 0.0),
-                )
-                for d, q in events
-            )
-            if not normalized_events:
-                continue
-
-            event_dates_ns = np.array(
-                [pd.Timestamp(d).to_datetime64() for d, _ in normalized_events],
-                dtype="datetime64[ns]",
-            ).astype(np.int64, copy=False)
-            cumulative_quantities = np.cumsum(
-                np.array([qty for _, qty in normalized_events], dtype=float)
-            )
-            quantity_pos = np.searchsorted(event_dates_ns, month_end_ns, side="right") - 1
-            active_mask = quantity_pos >= 0
-            if not np.any(active_mask):
-                continue
-
-            quantity_values = np.zeros(len(month_end_ns), dtype=float)
-            quantity_values[active_mask] = cumulative_quantities[quantity_pos[active_mask]]
+            quantity_values = held[code]
             nonzero_mask = np.abs(quantity_values) >= 1e-9
             if not np.any(nonzero_mask):
                 continue
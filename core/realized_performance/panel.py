@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import json
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from providers.interfaces import PriceSeriesProvider
+
+from . import _helpers, pricing
+
+
+PreparedLookup = Tuple[np.ndarray, np.ndarray]
+
+
+def _to_ns(when: Any) -> int:
+    return int(pd.Timestamp(when).to_datetime64().astype("datetime64[ns]").astype(np.int64))
+
+
+def _day_floor_ns(when: Any) -> int:
+    return int(pd.Timestamp(when).normalize().to_datetime64().astype("datetime64[ns]").astype(np.int64))
+
+
+def _prepare_lookup(series: pd.Series | None) -> PreparedLookup | None:
+    """Sorted int64 ns index + float values with NaNs dropped (NAV lookup layout)."""
+    if series is None or len(series) == 0:
+        return None
+    prepared = series.dropna()
+    if prepared.empty:
+        return None
+    if not isinstance(prepared.index, pd.DatetimeIndex):
+        prepared.index = pd.to_datetime(prepared.index)
+    prepared = prepared.sort_index()
+    index_ns = prepared.index.to_numpy(dtype="datetime64[ns]").astype(np.int64, copy=False)
+    return index_ns, prepared.to_numpy(dtype=float, copy=False)
+
+
+@dataclass(frozen=True)
+class _PanelSeries:
+    """One fetched series over ``[start_ns, end_ns]`` plus its prepared lookup arrays."""
+
+    series: pd.Series
+    index_ns: np.ndarray
+    start_ns: int
+    end_ns: int
+    lookup: PreparedLookup | None
+    lookup_ns: np.ndarray
+
+    @classmethod
+    def build(cls, series: pd.Series, start: Any, end: Any) -> "_PanelSeries":
+        series = _helpers._series_from_cache(series)
+        index_ns = series.index.to_numpy(dtype="datetime64[ns]").astype(np.int64, copy=False)
+        lookup = _prepare_lookup(series)
+        lookup_ns = lookup[0] if lookup is not None else np.array([], dtype=np.int64)
+        return cls(series, index_ns, _day_floor_ns(start), _to_ns(end), lookup, lookup_ns)
+
+    def covers(self, start: Any, end: Any) -> bool:
+        return self.start_ns <= _day_floor_ns(start) and _day_floor_ns(end) <= _day_floor_ns(
+            pd.Timestamp(self.end_ns)
+        )
+
+    def window(self, start: Any, end: Any) -> Tuple[pd.Series, PreparedLookup | None]:
+        """Zero-copy views of the series and lookup arrays restricted to ``[start, end]``."""
+        start_ns, end_ns = _to_ns(start), _to_ns(end)
+        lo = int(np.searchsorted(self.index_ns, start_ns, side="left"))
+        hi = int(np.searchsorted(self.index_ns, end_ns, side="right"))
+        series = self.series.iloc[lo:hi]
+        if self.lookup is None:
+            return series, None
+        lo = int(np.searchsorted(self.lookup_ns, start_ns, side="left"))
+        hi = int(np.searchsorted(self.lookup_ns, end_ns, side="right"))
+        if lo >= hi:
+            return series, None
+        return series, (self.lookup[0][lo:hi], self.lookup[1][lo:hi])
+
+
+class RealizedMarketDataPanel:
+    """
+    Session-level price and FX series shared by realized-performance scopes.
+
+    Every (price chain, ticker, instrument type, contract identity, alias)
+    and every FX currency is fetched once over the union of the requested
+    windows (seeded by ``window_start``/``window_end``) and served to each
+    scope as a slice of the same arrays.  ``prepared_lookup`` hands NAV the
+    pre-sorted int64 index/value arrays without re-preparing per call.
+    Failed fetches are cached too, so every scope sees the same outcome.
+    Thread-safe: concurrent scopes asking for the same series wait on one
+    fetch.
+    """
+
+    def __init__(
+        self,
+        window_start: Optional[datetime] = None,
+        window_end: Optional[datetime] = None,
+    ) -> None:
+        self.window_start = window_start
+        self.window_end = window_end
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[Any, ...], threading.Lock] = {}
+        self._prices: Dict[Tuple[Any, ...], Tuple[_PanelSeries, pricing.PriceResult]] = {}
+        self._fx: Dict[str, _PanelSeries | Exception] = {}
+        self._windows: Dict[Tuple[Any, ...], pd.Series] = {}
+        self._lookups: Dict[int, PreparedLookup | None] = {}
+        self.fetches = 0
+        self.hits = 0
+
+    def _key_lock(self, key: Tuple[Any, ...]) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _count(self, *, fetched: bool) -> None:
+        with self._lock:
+            if fetched:
+                self.fetches += 1
+            else:
+                self.hits += 1
+
+    def _fetch_window(self, start: Any, end: Any, cached: _PanelSeries | None) -> Tuple[Any, Any]:
+        starts = [pd.Timestamp(start)]
+        ends = [pd.Timestamp(end)]
+        if self.window_start is not None:
+            starts.append(pd.Timestamp(self.window_start))
+        if self.window_end is not None:
+            ends.append(pd.Timestamp(self.window_end))
+        if cached is not None:
+            starts.append(pd.Timestamp(cached.start_ns))
+            ends.append(pd.Timestamp(cached.end_ns))
+        return min(starts).to_pydatetime(), max(ends).to_pydatetime()
+
+    def _remember(self, series: pd.Series, lookup: PreparedLookup | None) -> None:
+        series_id = id(series)
+        with self._lock:
+            if series_id in self._lookups:
+                return
+            self._lookups[series_id] = lookup
+        weakref.finalize(series, self._lookups.pop, series_id, None)
+
+    def _serve(self, key: Tuple[Any, ...], entry: _PanelSeries, start: Any, end: Any) -> pd.Series:
+        window_key = (key, entry.start_ns, entry.end_ns, _to_ns(start), _to_ns(end))
+        with self._lock:
+            served = self._windows.get(window_key)
+        if served is not None:
+            return served
+        served, lookup = entry.window(start, end)
+        self._remember(served, lookup)
+        with self._lock:
+            return self._windows.setdefault(window_key, served)
+
+    def fetch_price(
+        self,
+        providers: list[PriceSeriesProvider],
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        *,
+        instrument_type: str,
+        contract_identity: dict[str, Any] | None,
+        ticker_alias_map: dict[str, str] | None,
+    ) -> pricing.PriceResult:
+        """``pricing._fetch_price_from_chain`` served from the panel.
+
+        The returned ``series`` is normalized and shared; callers must not
+        mutate it in place.
+        """
+        key = (
+            "price",
+            tuple(getattr(provider, "provider_name", repr(provider)) for provider in providers),
+            symbol,
+            instrument_type,
+            json.dumps(contract_identity or {}, sort_keys=True, default=str),
+            frozenset((ticker_alias_map or {}).items()),
+        )
+        with self._key_lock(key):
+            cached = self._prices.get(key)
+            if cached is None or not cached[0].covers(start_date, end_date):
+                fetch_start, fetch_end = self._fetch_window(
+                    start_date, end_date, cached[0] if cached else None
+                )
+                result = pricing._fetch_price_from_chain(
+                    providers,
+                    symbol,
+                    fetch_start,
+                    fetch_end,
+                    instrument_type=instrument_type,
+                    contract_identity=contract_identity,
+                    ticker_alias_map=ticker_alias_map,
+                )
+                cached = (_PanelSeries.build(result.series, fetch_start, fetch_end), result)
+                self._prices[key] = cached
+                self._count(fetched=True)
+            else:
+                self._count(fetched=False)
+        entry, result = cached
+        return pricing.PriceResult(
+            series=self._serve(key, entry, start_date, end_date),
+            success_provider=result.success_provider,
+            attempts=list(result.attempts),
+        )
+
+    def fx_series(
+        self,
+        currency: str,
+        start_date: datetime,
+        end_date: datetime,
+        loader: Callable[[str, datetime, datetime], pd.Series],
+    ) -> pd.Series:
+        """FX series for ``currency`` over the window; re-raises a cached fetch error."""
+        key = ("fx", currency)
+        with self._key_lock(key):
+            cached = self._fx.get(currency)
+            if cached is None or (
+                isinstance(cached, _PanelSeries) and not cached.covers(start_date, end_date)
+            ):
+                fetch_start, fetch_end = self._fetch_window(
+                    start_date, end_date, cached if isinstance(cached, _PanelSeries) else None
+                )
+                try:
+                    cached = _PanelSeries.build(loader(currency, fetch_start, fetch_end), fetch_start, fetch_end)
+                except Exception as exc:
+                    cached = exc
+                self._fx[currency] = cached
+                self._count(fetched=True)
+            else:
+                self._count(fetched=False)
+        if isinstance(cached, Exception):
+            raise cached
+        return self._serve(key, cached, start_date, end_date)
+
+    def prepared_lookup(self, series: pd.Series | None) -> PreparedLookup | None:
+        """Prepared NAV lookup arrays; panel-served series reuse their views."""
+        if series is None:
+            return None
+        series_id = id(series)
+        with self._lock:
+            if series_id in self._lookups:
+                return self._lookups[series_id]
+        lookup = _prepare_lookup(series)
+        self._remember(series, lookup)
+        return lookup
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "fetches": self.fetches,
+                "hits": self.hits,
+                "price_series": len(self._prices),
+                "fx_series": len(self._fx),
+            }
+
+
+__all__ = [
+    'RealizedMarketDataPanel',
+]
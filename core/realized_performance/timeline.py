@@ -5,9 +5,10 @@ import os
 import re
 import sys
 from collections import Counter, defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -353,6 +354,223 @@ def _build_seed_open_lots(
 
     return seeded, seed_warnings
 
+PositionKey = Tuple[str, str, str]
+
+_TIMELINE_TXN_DIRECTIONS = {
+    "BUY": ("LONG", 1.0),
+    "SELL": ("LONG", -1.0),
+    "SHORT": ("SHORT", 1.0),
+    "COVER": ("SHORT", -1.0),
+}
+_FILTERED_INSTRUMENT_TYPES = frozenset({"fx_artifact", "unknown"})
+_NAT_NS = np.iinfo(np.int64).min
+_HOMOGENEOUS_INFERRED_DTYPES = frozenset({"string", "datetime", "date", "integer", "boolean", "empty"})
+
+
+def _datetimes_to_ns(values: Iterable[Optional[datetime]]) -> np.ndarray:
+    """Naive datetimes as int64 ns (``None`` -> NaT)."""
+    return np.array(list(values), dtype="datetime64[us]").astype("datetime64[ns]").view(np.int64)
+
+
+def _ns_to_datetime(value: int) -> datetime:
+    """Inverse of ``_datetimes_to_ns`` for one value."""
+    return np.datetime64(int(value), "ns").astype("datetime64[us]").item()
+
+
+def _factorize_raw(values: List[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """
+    Codes and distinct values of raw transaction fields.
+
+    Homogeneous columns without missing values (the usual case) go through
+    ``pd.factorize``.  Anything else is keyed on (type, value) so that
+    ``1``/``1.0``/``True`` and ``None``/``NaN`` stay distinct — they parse
+    differently.  Unhashable values get a code each.
+    """
+    if pd.api.types.infer_dtype(values, skipna=False) in _HOMOGENEOUS_INFERRED_DTYPES:
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+        if not (codes < 0).any():
+            return codes.astype(np.int64, copy=False), list(uniques)
+    index: Dict[Any, int] = {}
+    uniques: List[Any] = []
+    codes = np.empty(len(values), dtype=np.int64)
+    for row, value in enumerate(values):
+        try:
+            token: Any = (value.__class__, value)
+            code = index.get(token)
+        except TypeError:
+            token, code = None, None
+        if code is None:
+            code = len(uniques)
+            uniques.append(value)
+            if token is not None:
+                index[token] = code
+        codes[row] = code
+    return codes, uniques
+
+
+def _parse_distinct(values: List[Any], parse: Any) -> np.ndarray:
+    """``parse`` applied once per distinct raw value, broadcast back to rows."""
+    codes, uniques = _factorize_raw(values)
+    parsed = np.empty(len(uniques), dtype=object)
+    parsed[:] = [parse(value) for value in uniques]
+    return parsed[codes]
+
+
+def _transaction_frame(fifo_transactions: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Columnar view of FIFO transactions, one row per transaction in input order.
+
+    Dates, symbols, currencies, types and inferred instrument types are parsed
+    once per distinct raw value rather than once per row.  ``ts_ns`` is int64
+    ns (NaT when the date does not parse) and ``quantity`` is absolute.
+    """
+    fields = ("date", "currency", "quantity", "instrument_type", "is_option", "is_futures", "contract_identity")
+    raw = {name: [txn.get(name) for txn in fifo_transactions] for name in fields}
+    raw["symbol"] = [txn.get("symbol", "") for txn in fifo_transactions]
+    raw["type"] = [txn.get("type", "") for txn in fifo_transactions]
+
+    date_codes, distinct_dates = _factorize_raw(raw["date"])
+    ts_ns = _datetimes_to_ns([_helpers._to_datetime(value) for value in distinct_dates])[date_codes]
+    try:
+        quantity = np.asarray(raw["quantity"], dtype=float).reshape(len(fifo_transactions))
+        quantity = np.where(np.isfinite(quantity), quantity, 0.0)
+    except (TypeError, ValueError):
+        quantity = _parse_distinct(raw["quantity"], lambda value: _helpers._as_float(value, 0.0)).astype(float)
+
+    # Inference reads five raw fields; run it once per distinct combination.
+    inference_fields = ("instrument_type", "type", "symbol", "is_option", "is_futures")
+    instrument_type = np.empty(len(fifo_transactions), dtype=object)
+    if fifo_transactions:
+        combo = np.zeros(len(fifo_transactions), dtype=np.int64)
+        for name in inference_fields:
+            codes, uniques = _factorize_raw(raw[name])
+            combo = pd.factorize(combo * len(uniques) + codes)[0]
+        _, first_rows, combo_of_row = np.unique(combo, return_index=True, return_inverse=True)
+        inferred = np.empty(len(first_rows), dtype=object)
+        inferred[:] = [
+            _helpers._infer_instrument_type_from_transaction({name: raw[name][row] for name in inference_fields})
+            for row in first_rows
+        ]
+        instrument_type = inferred[np.asarray(combo_of_row).reshape(-1)]
+
+    return pd.DataFrame(
+        {
+            "ts_ns": ts_ns,
+            "symbol": _parse_distinct(raw["symbol"], lambda value: str(value).strip()),
+            "currency": _parse_distinct(raw["currency"], lambda value: str(value or "USD").upper()),
+            "type": _parse_distinct(raw["type"], lambda value: str(value).upper()),
+            "quantity": np.abs(quantity),
+            "instrument_type": instrument_type,
+            "contract_identity": pd.Series(raw["contract_identity"], dtype=object),
+        }
+    )
+
+
+class PositionTimeline(Mapping):
+    """
+    Columnar position timeline keyed by (ticker, currency, direction).
+
+    Events live in flat arrays — int64 key codes, int64 ns timestamps and
+    signed quantities — sorted by (key, time) with ties in insertion order,
+    plus the group-wise cumulative quantity.  ``quantities_at`` reads every
+    position at every valuation date with a single ``searchsorted``.
+
+    It also reads as the legacy ``{key: [(datetime, qty), ...]}`` mapping;
+    those per-key lists are only built when asked for.
+    """
+
+    def __init__(
+        self,
+        keys: List[PositionKey],
+        codes: np.ndarray,
+        times_ns: np.ndarray,
+        quantities: np.ndarray,
+    ) -> None:
+        codes = np.asarray(codes, dtype=np.int64)
+        times_ns = np.asarray(times_ns, dtype=np.int64)
+        quantities = np.asarray(quantities, dtype=float)
+        order = np.lexsort((times_ns, codes))
+        self._keys = list(keys)
+        self._index = {key: code for code, key in enumerate(self._keys)}
+        self.codes = codes[order]
+        self.times_ns = times_ns[order]
+        self.quantities = quantities[order]
+        self.cumulative = (
+            pd.Series(self.quantities).groupby(self.codes, sort=False).cumsum().to_numpy(dtype=float)
+        )
+        self.offsets = np.searchsorted(self.codes, np.arange(len(self._keys) + 1), side="left")
+        self._event_lists: Dict[PositionKey, List[Tuple[datetime, float]]] = {}
+
+    @classmethod
+    def from_events(
+        cls,
+        position_events: Mapping[PositionKey, Iterable[Tuple[Any, Any]]],
+    ) -> "PositionTimeline":
+        """Build from a legacy ``{key: [(date, qty), ...]}`` mapping."""
+        if isinstance(position_events, PositionTimeline):
+            return position_events
+        keys: List[PositionKey] = []
+        codes: List[int] = []
+        dates: List[datetime] = []
+        quantities: List[float] = []
+        for key, events in (position_events or {}).items():
+            for when, qty in events:
+                dates.append(pd.Timestamp(when).to_pydatetime().replace(tzinfo=None))
+                quantities.append(_helpers._as_float(qty, 0.0))
+                codes.append(len(keys))
+            keys.append(key)
+        return cls(keys, np.array(codes, dtype=np.int64), _datetimes_to_ns(dates), np.array(quantities, dtype=float))
+
+    def __getitem__(self, key: PositionKey) -> List[Tuple[datetime, float]]:
+        code = self._index[key]
+        events = self._event_lists.get(key)
+        if events is None:
+            lo, hi = self.offsets[code], self.offsets[code + 1]
+            dates = self.times_ns[lo:hi].view("datetime64[ns]").astype("datetime64[us]").tolist()
+            events = list(zip(dates, self.quantities[lo:hi].tolist()))
+            self._event_lists[key] = events
+        return events
+
+    def __iter__(self) -> Iterator[PositionKey]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def final_quantities(self) -> Dict[PositionKey, float]:
+        """Net quantity per key after its last event."""
+        return {
+            key: float(self.cumulative[end - 1]) if end > start else 0.0
+            for key, start, end in zip(self._keys, self.offsets[:-1], self.offsets[1:])
+        }
+
+    def quantities_at(self, when_ns: np.ndarray) -> np.ndarray:
+        """
+        Quantity held per key (rows) at each ``when_ns`` (columns), events at that instant included.
+
+        Event and query times share one dense rank grid so each (key, rank)
+        packs into a single sortable int64.
+        """
+        when_ns = np.asarray(when_ns, dtype=np.int64)
+        held = np.zeros((len(self._keys), len(when_ns)), dtype=float)
+        if len(self.times_ns) == 0 or len(when_ns) == 0:
+            return held
+        grid = np.unique(np.concatenate([self.times_ns, when_ns]))
+        span = len(grid)
+        packed_events = self.codes * span + np.searchsorted(grid, self.times_ns)
+        packed_queries = (
+            np.arange(len(self._keys), dtype=np.int64)[:, None] * span
+            + np.searchsorted(grid, when_ns)[None, :]
+        )
+        position = np.searchsorted(packed_events, packed_queries, side="right") - 1
+        inside = position >= self.offsets[:-1, None]
+        held[inside] = self.cumulative[position[inside]]
+        return held
+
+
 def build_position_timeline(
     fifo_transactions: List[Dict[str, Any]],
     current_positions: Dict[str, Dict[str, Any]],
@@ -362,7 +580,7 @@ def build_position_timeline(
     *,
     use_per_symbol_inception: bool = False,
 ) -> Tuple[
-    Dict[Tuple[str, str, str], List[Tuple[datetime, float]]],
+    PositionTimeline,
     List[Dict[str, str]],
     List[Dict[str, Any]],
     Dict[Tuple[str, str, str], InstrumentMeta],
@@ -378,14 +596,11 @@ def build_position_timeline(
     """
     del ticker_alias_map  # Reserved for future use.
 
-    position_events: Dict[Tuple[str, str, str], List[Tuple[datetime, float]]] = defaultdict(list)
     synthetic_positions: List[Dict[str, str]] = []
     synthetic_entries: List[Dict[str, Any]] = []
     instrument_meta: Dict[Tuple[str, str, str], InstrumentMeta] = {}
     warnings: List[str] = []
 
-    opening_qty: Dict[Tuple[str, str, str], float] = defaultdict(float)
-    exit_qty: Dict[Tuple[str, str, str], float] = defaultdict(float)
     filtered_keys: set[Tuple[str, str, str]] = set()
     filtered_warning_keys: set[Tuple[str, str, str, str]] = set()
     conflict_warning_keys: set[Tuple[Tuple[str, str, str], str, str]] = set()
@@ -420,62 +635,103 @@ def build_position_timeline(
         if existing.get("contract_identity") is None and contract_identity is not None:
             existing["contract_identity"] = contract_identity
 
-    for txn in fifo_transactions:
-        date = _helpers._to_datetime(txn.get("date"))
-        if date is None:
-            continue
-
-        symbol = str(txn.get("symbol", "")).strip()
-        if not symbol:
-            continue
-        currency = str(txn.get("currency") or "USD").upper()
-        txn_type = str(txn.get("type", "")).upper()
-        qty = abs(_helpers._as_float(txn.get("quantity"), 0.0))
-        if qty <= 0:
-            continue
-        instrument_type = _helpers._infer_instrument_type_from_transaction(txn)
-        contract_identity = txn.get("contract_identity")
-
-        if txn_type == "BUY":
-            key = (symbol, currency, "LONG")
-        elif txn_type == "SELL":
-            key = (symbol, currency, "LONG")
-        elif txn_type == "SHORT":
-            key = (symbol, currency, "SHORT")
-        elif txn_type == "COVER":
-            key = (symbol, currency, "SHORT")
-        else:
-            continue
+    # Transactions, columnar: mask out unusable rows, code the keys, and take
+    # per-key firsts and sums with group operations instead of a row loop.
+    txns = _transaction_frame(fifo_transactions)
+    txn_direction = txns["type"].map({t: d for t, (d, _) in _TIMELINE_TXN_DIRECTIONS.items()})
+    txn_sign = txns["type"].map({t: s for t, (_, s) in _TIMELINE_TXN_DIRECTIONS.items()}).fillna(0.0).to_numpy(dtype=float)
+    dated = txns["ts_ns"].to_numpy() != _NAT_NS
+    usable = dated & (txns["symbol"] != "").to_numpy() & (txns["quantity"] > 0).to_numpy() & txn_direction.notna().to_numpy()
+    filtered_rows = usable & txns["instrument_type"].isin(list(_FILTERED_INSTRUMENT_TYPES)).to_numpy()
+    kept_rows = usable & ~filtered_rows
+    txns["direction"] = txn_direction
+    key_columns = ["symbol", "currency", "direction"]
+
+    # Warnings surface in transaction order, as they would from a row walk.
+    row_warnings: List[Tuple[int, str]] = []
+    filtered_txns = txns[filtered_rows]
+    first_filtered = filtered_txns.drop_duplicates(key_columns + ["instrument_type"])
+    for row, symbol, currency, direction, instrument_type in first_filtered[key_columns + ["instrument_type"]].itertuples(name=None):
+        filtered_keys.add((symbol, currency, direction))
+        filtered_warning_keys.add((symbol, currency, direction, instrument_type))
+        row_warnings.append(
+            (row, f"Filtered {symbol} ({currency}, {direction}) from timeline: instrument_type={instrument_type}.")
+        )
 
-        if instrument_type in {"fx_artifact", "unknown"}:
-            filtered_keys.add(key)
-            warn_key = (key[0], key[1], key[2], instrument_type)
-            if warn_key not in filtered_warning_keys:
-                warnings.append(
-                    f"Filtered {symbol} ({currency}, {key[2]}) from timeline: instrument_type={instrument_type}."
+    kept = txns[kept_rows]
+    key_codes = kept.groupby(key_columns, sort=False).ngroup().to_numpy(dtype=np.int64)
+    position_keys: List[Tuple[str, str, str]] = list(
+        kept[key_columns].drop_duplicates().itertuples(index=False, name=None)
+    )
+    key_index: Dict[Tuple[str, str, str], int] = {key: code for code, key in enumerate(position_keys)}
+    kept_sign = txn_sign[kept_rows]
+    kept_qty = kept["quantity"].to_numpy(dtype=float)
+    opening_by_code = np.bincount(key_codes, weights=kept_qty * (kept_sign > 0), minlength=len(position_keys))
+    exit_by_code = np.bincount(key_codes, weights=kept_qty * (kept_sign < 0), minlength=len(position_keys))
+    opening_qty: Dict[Tuple[str, str, str], float] = dict(zip(position_keys, opening_by_code.tolist()))
+    exit_qty: Dict[Tuple[str, str, str], float] = dict(zip(position_keys, exit_by_code.tolist()))
+
+    # Instrument meta: the first row of a key sets its type; later rows of
+    # another type warn once per type; the first dict identity among rows of
+    # the kept type fills contract_identity.
+    normalized_type = kept["instrument_type"].map(
+        {value: coerce_instrument_type(value, default="equity") for value in pd.unique(kept["instrument_type"])}
+    ).to_numpy(dtype=object)
+    first_pos = np.full(len(position_keys), len(key_codes), dtype=np.int64)
+    np.minimum.at(first_pos, key_codes, np.arange(len(key_codes)))
+    key_type = normalized_type[first_pos] if len(key_codes) else np.array([], dtype=object)
+    row_key_type = key_type[key_codes]
+    has_identity = np.fromiter(
+        (isinstance(identity, dict) for identity in kept["contract_identity"]), dtype=bool, count=len(kept)
+    )
+    identity_pos = np.full(len(position_keys), len(key_codes), dtype=np.int64)
+    identity_rows = np.flatnonzero(has_identity & (normalized_type == row_key_type))
+    np.minimum.at(identity_pos, key_codes[identity_rows], identity_rows)
+    identities = kept["contract_identity"].to_numpy(dtype=object)
+    for code, key in enumerate(position_keys):
+        instrument_meta[key] = {
+            "instrument_type": key_type[code],
+            "contract_identity": identities[identity_pos[code]] if identity_pos[code] < len(key_codes) else None,
+        }
+    conflict_pos = np.flatnonzero(normalized_type != row_key_type)
+    if len(conflict_pos):
+        conflicts = pd.DataFrame(
+            {"code": key_codes[conflict_pos], "ignored": normalized_type[conflict_pos], "row": kept.index[conflict_pos]}
+        ).drop_duplicates(["code", "ignored"])
+        for code, ignored, row in conflicts.itertuples(index=False, name=None):
+            key = position_keys[code]
+            existing_type = coerce_instrument_type(key_type[code], default="equity")
+            conflict_warning_keys.add((key, existing_type, ignored))
+            row_warnings.append(
+                (
+                    row,
+                    "Instrument type conflict for "
+                    f"{key[0]} ({key[1]}, {key[2]}): "
+                    f"kept {existing_type}, ignored {ignored}.",
                 )
-                filtered_warning_keys.add(warn_key)
-            continue
+            )
+    warnings.extend(message for _, message in sorted(row_warnings, key=lambda item: item[0]))
 
-        _register_instrument_meta(key, instrument_type, contract_identity)
+    event_codes: List[np.ndarray] = [key_codes]
+    event_times: List[np.ndarray] = [kept["ts_ns"].to_numpy(dtype=np.int64)]
+    event_qty: List[np.ndarray] = [kept_qty * kept_sign]
 
-        if txn_type in {"BUY", "SHORT"}:
-            position_events[key].append((date, qty))
-            opening_qty[key] += qty
-        else:
-            position_events[key].append((date, -qty))
-            exit_qty[key] += qty
+    def _add_event(key: Tuple[str, str, str], when: datetime, qty: float) -> None:
+        code = key_index.setdefault(key, len(position_keys))
+        if code == len(position_keys):
+            position_keys.append(key)
+        event_codes.append(np.array([code], dtype=np.int64))
+        event_times.append(_datetimes_to_ns([when]))
+        event_qty.append(np.array([qty], dtype=float))
 
     # Per-symbol earliest transaction date for more accurate synthetic placement.
     # Keyed by symbol (not symbol+direction) — conservative: uses earliest across
     # all directions for the rare case of long+short on same symbol.
-    earliest_txn_by_symbol: Dict[str, datetime] = {}
-    for txn in fifo_transactions:
-        sym = str(txn.get("symbol", "")).strip()
-        dt = _helpers._to_datetime(txn.get("date"))
-        if sym and dt:
-            if sym not in earliest_txn_by_symbol or dt < earliest_txn_by_symbol[sym]:
-                earliest_txn_by_symbol[sym] = dt
+    dated_txns = txns[dated & (txns["symbol"] != "").to_numpy()]
+    earliest_txn_by_symbol: Dict[str, datetime] = {
+        symbol: _ns_to_datetime(ts)
+        for symbol, ts in dated_txns.groupby("symbol", sort=False)["ts_ns"].min().items()
+    }
 
     synthetic_keys: set[Tuple[str, str, str]] = set()
     synthetic_qty_by_key: Dict[Tuple[str, str, str], float] = defaultdict(float)
@@ -530,7 +786,7 @@ def build_position_timeline(
             )
             estimated_current_value_usd = abs(_helpers._as_float(pos.get("value"), 0.0))
 
-            position_events[key].append((synthetic_date, missing_openings))
+            _add_event(key, synthetic_date, missing_openings)
             synthetic_keys.add(key)
             synthetic_qty_by_key[key] += missing_openings
             current_position_synthetic_keys.add(key)
@@ -611,7 +867,7 @@ def build_position_timeline(
         if key in current_position_synthetic_keys and synthetic_qty_by_key.get(key, 0.0) > 1e-9:
             continue
 
-        position_events[key].append((synthetic_date, qty))
+        _add_event(key, synthetic_date, qty)
         synthetic_keys.add(key)
         synthetic_qty_by_key[key] += qty
         synthetic_entries.append(
@@ -631,7 +887,7 @@ def build_position_timeline(
         )
 
     # For filtered futures incomplete trades, add compensating position events
-    # to balance the unmatched SELL/COVER that's already in position_events.
+    # to balance the unmatched SELL/COVER that's already in the timeline.
     for _inc in incomplete_trades:
         _inc_sym = str(getattr(_inc, "symbol", "")).strip()
         _inc_ccy = str(getattr(_inc, "currency", "USD")).upper()
@@ -642,7 +898,7 @@ def build_position_timeline(
             continue
         if _inc_key in current_position_synthetic_keys:
             continue
-        if _inc_key not in position_events:
+        if _inc_key not in key_index:
             continue
 
         _inc_qty = abs(_helpers._as_float(getattr(_inc, "quantity", 0), 0.0))
@@ -651,10 +907,7 @@ def build_position_timeline(
             continue
 
         _compensating_date = _inc_sell_date - timedelta(seconds=1)
-        position_events[_inc_key].append((_compensating_date, _inc_qty))
-
-    for key, events in position_events.items():
-        events.sort(key=lambda x: x[0])
+        _add_event(_inc_key, _compensating_date, _inc_qty)
 
     for ticker, currency, direction in sorted(synthetic_keys):
         synthetic_positions.append(
@@ -665,7 +918,13 @@ def build_position_timeline(
             }
         )
 
-    return dict(position_events), synthetic_positions, synthetic_entries, instrument_meta, warnings
+    position_timeline = PositionTimeline(
+        position_keys,
+        np.concatenate(event_codes),
+        np.concatenate(event_times),
+        np.concatenate(event_qty),
+    )
+    return position_timeline, synthetic_positions, synthetic_entries, instrument_meta, warnings
 
 def _create_synthetic_cash_events(
     synthetic_entries: List[Dict[str, Any]],
@@ -758,6 +1017,8 @@ __all__ = [
     '_synthetic_price_hint_from_position',
     '_detect_first_exit_without_opening',
     '_build_seed_open_lots',
+    'PositionTimeline',
+    '_transaction_frame',
     'build_position_timeline',
     '_create_synthetic_cash_events',
 ]
@@ -6,6 +6,7 @@
 # File: core/risk_orchestration.py
 
 import argparse
+import json
 from contextlib import redirect_stdout
 from datetime import datetime
 from io import StringIO
@@ -82,8 +83,13 @@ from utils.logging import (
     log_timing,
 )
 from portfolio_risk_engine.scenario_analysis import analyze_scenario
-from portfolio_risk_engine.optimization import optimize_min_variance, optimize_max_return
+from portfolio_risk_engine.optimization import (
+    optimize_efficient_frontier,
+    optimize_max_return,
+    optimize_min_variance,
+)
 from core.result_objects import (
+    EfficientFrontierResult,
     OptimizationResult, 
     StockAnalysisResult, 
     InterpretationResult, 
@@ -853,6 +859,35 @@ def run_max_return(
         # CLI MODE: Print formatted output  
         print(result.to_cli_report())
 
+def run_efficient_frontier(
+    filepath: Union[str, PortfolioData],
+    risk_yaml: Union[str, RiskLimitsData, Dict[str, Any], None] = "risk_limits.yaml",
+    *,
+    n_points: int = 15,
+    return_data: bool = False,
+) -> Union[None, EfficientFrontierResult]:
+    """
+    Trace the efficient frontier between the min-variance portfolio and the
+    max-return portfolio at the risk limit, under the same constraints as
+    :pyfunc:`run_max_return`.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the portfolio YAML file (its ``expected_returns`` drive the
+        return axis).
+    n_points : int, default 15
+        Requested frontier points.
+    return_data : bool, default False
+        If True, returns the ``EfficientFrontierResult``; otherwise prints
+        the API payload.
+    """
+    result = optimize_efficient_frontier(filepath, risk_yaml, n_points=n_points)
+
+    if return_data:
+        return result
+    print(json.dumps(make_json_safe(result.to_api_response()), indent=2))
+
 # ============================================================================
 # STOCK ANALYSIS
 # This handles individual stock risk analysis
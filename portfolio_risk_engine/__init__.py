@@ -4,9 +4,14 @@ from portfolio_risk_engine.portfolio_risk import (
     build_portfolio_view,
     normalize_weights,
     calculate_portfolio_performance_metrics,
+    ReturnSeriesContext,
+    PortfolioRiskModel,
+    FactorCovariance,
+    get_portfolio_risk_model,
 )
 from portfolio_risk_engine.providers import (
     PriceProvider,
+    BatchPriceProvider,
     FXProvider,
     set_price_provider,
     get_price_provider,
@@ -18,7 +23,12 @@ __all__ = [
     "build_portfolio_view",
     "normalize_weights",
     "calculate_portfolio_performance_metrics",
+    "ReturnSeriesContext",
+    "PortfolioRiskModel",
+    "FactorCovariance",
+    "get_portfolio_risk_model",
     "PriceProvider",
+    "BatchPriceProvider",
     "FXProvider",
     "set_price_provider",
     "get_price_provider",
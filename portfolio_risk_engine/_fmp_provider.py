@@ -7,6 +7,7 @@ from typing import Optional
 import pandas as pd
 
 from portfolio_risk_engine._ticker import select_fmp_symbol
+from portfolio_risk_engine.providers import _fetch_many_via_single
 
 
 class FMPPriceProvider:
@@ -22,6 +23,12 @@ class FMPPriceProvider:
 
         return _fn(ticker, start_date, end_date, **kw)
 
+    def fetch_monthly_close_many(self, tickers, start_date=None, end_date=None, **kw) -> pd.DataFrame:
+        return _fetch_many_via_single(self.fetch_monthly_close, tickers, start_date, end_date, **kw)
+
+    def fetch_monthly_total_return_price_many(self, tickers, start_date=None, end_date=None, **kw) -> pd.DataFrame:
+        return _fetch_many_via_single(self.fetch_monthly_total_return_price, tickers, start_date, end_date, **kw)
+
     def fetch_monthly_treasury_rates(self, maturity: str, start_date=None, end_date=None) -> pd.Series:
         from fmp.compat import fetch_monthly_treasury_rates as _fn  # type: ignore
 
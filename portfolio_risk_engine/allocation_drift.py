@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+import numpy as np
 
 DRIFT_ON_TARGET_THRESHOLD = 2.0
 DRIFT_WARNING_THRESHOLD = 5.0
@@ -58,3 +59,16 @@ def compute_allocation_drift(
         )
 
     return drift_rows
+
+
+def max_abs_allocation_drift(current_pct: np.ndarray, target_pct: np.ndarray) -> np.ndarray:
+    """Largest per-class ``|drift_pct|`` over the last (class) axis.
+
+    Array form of ``compute_allocation_drift`` for simulations: values are
+    percentage points, leading axes of ``current_pct`` (e.g. months ×
+    schedules) broadcast against ``target_pct``.  A class is off target
+    (``drift_status != "on_target"``) at threshold ``t`` when its drift is
+    ``>= t``, so ``max_abs_allocation_drift(...) >= t`` flags a rebalance.
+    """
+    drift_pct = np.asarray(current_pct, dtype=float) - np.asarray(target_pct, dtype=float)
+    return np.abs(drift_pct).max(axis=-1)
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from portfolio_risk_engine.allocation_drift import DRIFT_ON_TARGET_THRESHOLD, max_abs_allocation_drift
 from portfolio_risk_engine.config import DATA_QUALITY_THRESHOLDS
 from portfolio_risk_engine.data_loader import fetch_monthly_close
 from portfolio_risk_engine.factor_utils import calc_monthly_returns
-from portfolio_risk_engine.performance_metrics_engine import compute_performance_metrics
+from portfolio_risk_engine.performance_metrics_engine import (
+    compute_performance_metrics,
+    compute_performance_metrics_batch,
+)
 from portfolio_risk_engine.portfolio_risk import (
+    ReturnSeriesContext,
     _compute_factor_attribution,
     _compute_sector_attribution,
     _compute_security_attribution,
@@ -18,7 +24,9 @@ from portfolio_risk_engine.portfolio_risk import (
     _get_risk_free_rate,
     compute_portfolio_returns,
     compute_portfolio_returns_partial,
+    compute_portfolio_returns_partial_batch,
     get_returns_dataframe,
+    normalize_weights,
 )
 
 
@@ -63,6 +71,91 @@ def _build_annual_breakdown(
     return annual_rows
 
 
+def _observation_gates(start_date: str, end_date: str) -> Tuple[int, int]:
+    """Window-aware (min return observations, min CAPM observations)."""
+    default_min_obs = int(
+        DATA_QUALITY_THRESHOLDS.get("min_observations_for_expected_returns", 11)
+    )
+    min_capm_obs = int(
+        DATA_QUALITY_THRESHOLDS.get("min_observations_for_capm_regression", 12)
+    )
+    try:
+        requested_month_points = len(pd.date_range(start=start_date, end=end_date, freq="ME"))
+    except Exception:
+        requested_month_points = 0
+    requested_return_observations = max(1, requested_month_points - 1)
+    return min(default_min_obs, requested_return_observations), min_capm_obs
+
+
+def _attach_attribution(
+    performance_metrics: Dict[str, Any],
+    df_ret: pd.DataFrame,
+    weights: Dict[str, float],
+    port_ret: pd.Series,
+    start_date: str,
+    end_date: str,
+    fmp_ticker_map: Optional[Dict[str, str]],
+    return_context: Optional[ReturnSeriesContext],
+) -> None:
+    """Attribution analysis — same pattern as calculate_portfolio_performance_metrics()."""
+    try:
+        performance_metrics["security_attribution"] = _compute_security_attribution(
+            df_ret=df_ret, weights=weights,
+        )
+    except Exception:
+        performance_metrics["security_attribution"] = []
+
+    try:
+        performance_metrics["sector_attribution"] = _compute_sector_attribution(
+            df_ret=df_ret, weights=weights, ticker_alias_map=fmp_ticker_map,
+        )
+    except Exception:
+        performance_metrics["sector_attribution"] = []
+
+    try:
+        performance_metrics["factor_attribution"] = _compute_factor_attribution(
+            port_ret=port_ret, start_date=start_date, end_date=end_date,
+            ticker_alias_map=fmp_ticker_map, return_context=return_context,
+        )
+    except Exception:
+        performance_metrics["factor_attribution"] = []
+
+
+def _backtest_payload(
+    performance_metrics: Dict[str, Any],
+    port_ret: pd.Series,
+    bench_ret: pd.Series,
+    weights: Dict[str, float],
+    benchmark_ticker: str,
+    excluded_tickers: List[str],
+    combined_warnings: List[str],
+) -> Dict[str, Any]:
+    """Charting outputs and exclusion notes around computed metrics."""
+    cumulative_returns = (1.0 + port_ret).cumprod()
+    benchmark_cumulative = (1.0 + bench_ret).cumprod()
+
+    if excluded_tickers:
+        performance_metrics["excluded_tickers"] = excluded_tickers
+        performance_metrics[
+            "analysis_notes"
+        ] = f"Backtest completed with {len(excluded_tickers)} ticker(s) excluded due to insufficient data"
+    if combined_warnings:
+        performance_metrics["warnings"] = combined_warnings
+
+    return {
+        "performance_metrics": performance_metrics,
+        "monthly_returns": _series_to_month_dict(port_ret),
+        "benchmark_monthly_returns": _series_to_month_dict(bench_ret),
+        "cumulative_returns": _series_to_month_dict(cumulative_returns),
+        "benchmark_cumulative": _series_to_month_dict(benchmark_cumulative),
+        "annual_breakdown": _build_annual_breakdown(port_ret, bench_ret),
+        "weights": weights,
+        "benchmark_ticker": benchmark_ticker,
+        "excluded_tickers": excluded_tickers,
+        "warnings": combined_warnings,
+    }
+
+
 def run_backtest(
     weights: Dict[str, float],
     start_date: str,
@@ -72,37 +165,33 @@ def run_backtest(
     fmp_ticker_map: Optional[Dict[str, str]] = None,
     currency_map: Optional[Dict[str, str]] = None,
     instrument_types: Optional[Dict[str, str]] = None,
+    return_context: Optional[ReturnSeriesContext] = None,
 ) -> Dict[str, Any]:
     """
     Run a historical backtest for a target allocation over a fixed date window.
 
     Mirrors ``calculate_portfolio_performance_metrics()`` and adds backtest-
     specific charting outputs (monthly/cumulative series + annual breakdown).
+    The availability filter, returns frame and factor attribution share one
+    ``ReturnSeriesContext`` so each series is fetched once.
     """
     if not weights:
         return {"error": "Backtest requires non-empty weights"}
 
     # Window-aware observation gates (supports shorter windows like 1Y).
-    default_min_obs = int(
-        DATA_QUALITY_THRESHOLDS.get("min_observations_for_expected_returns", 11)
-    )
-    min_capm_obs = int(
-        DATA_QUALITY_THRESHOLDS.get("min_observations_for_capm_regression", 12)
-    )
-    try:
-        requested_month_points = len(pd.date_range(start=start_date, end=end_date, freq="ME"))
-    except Exception:
-        requested_month_points = 0
-    requested_return_observations = max(1, requested_month_points - 1)
-    min_obs = min(default_min_obs, requested_return_observations)
+    min_obs, min_capm_obs = _observation_gates(start_date, end_date)
+    if return_context is None:
+        return_context = ReturnSeriesContext()
 
     filtered_weights, excluded_tickers, warnings = _filter_tickers_by_data_availability(
         weights=weights,
         start_date=start_date,
         end_date=end_date,
         min_months=min_obs,
-        fmp_ticker_map=fmp_ticker_map,
+        ticker_alias_map=fmp_ticker_map,
+        currency_map=currency_map,
         instrument_types=instrument_types,
+        return_context=return_context,
     )
 
     if not filtered_weights:
@@ -116,10 +205,11 @@ def run_backtest(
         weights=filtered_weights,
         start_date=start_date,
         end_date=end_date,
-        fmp_ticker_map=fmp_ticker_map,
+        ticker_alias_map=fmp_ticker_map,
         currency_map=currency_map,
         min_observations=min_obs,
         instrument_types=instrument_types,
+        return_context=return_context,
     )
     portfolio_returns = compute_portfolio_returns_partial(df_ret, filtered_weights)
 
@@ -136,7 +226,7 @@ def run_backtest(
             benchmark_ticker,
             start_date,
             end_date,
-            fmp_ticker_map=fmp_ticker_map,
+            ticker_alias_map=fmp_ticker_map,
         )
         benchmark_returns = calc_monthly_returns(benchmark_prices)
     except Exception as exc:
@@ -164,28 +254,10 @@ def run_backtest(
         min_capm_observations=min_capm_obs,
     )
 
-    # Attribution analysis — same pattern as calculate_portfolio_performance_metrics()
-    try:
-        performance_metrics["security_attribution"] = _compute_security_attribution(
-            df_ret=df_ret, weights=filtered_weights,
-        )
-    except Exception:
-        performance_metrics["security_attribution"] = []
-
-    try:
-        performance_metrics["sector_attribution"] = _compute_sector_attribution(
-            df_ret=df_ret, weights=filtered_weights, fmp_ticker_map=fmp_ticker_map,
-        )
-    except Exception:
-        performance_metrics["sector_attribution"] = []
-
-    try:
-        performance_metrics["factor_attribution"] = _compute_factor_attribution(
-            port_ret=port_ret, start_date=start_date, end_date=end_date,
-            fmp_ticker_map=fmp_ticker_map,
-        )
-    except Exception:
-        performance_metrics["factor_attribution"] = []
+    _attach_attribution(
+        performance_metrics, df_ret, filtered_weights, port_ret,
+        start_date, end_date, fmp_ticker_map, return_context,
+    )
 
     combined_warnings = list(performance_metrics.get("warnings", []))
     full_returns = compute_portfolio_returns(df_ret, filtered_weights)
@@ -197,27 +269,488 @@ def run_backtest(
         )
     combined_warnings.extend(warnings)
 
-    cumulative_returns = (1.0 + port_ret).cumprod()
-    benchmark_cumulative = (1.0 + bench_ret).cumprod()
+    return _backtest_payload(
+        performance_metrics, port_ret, bench_ret, filtered_weights,
+        benchmark_ticker, excluded_tickers, combined_warnings,
+    )
 
-    if excluded_tickers:
-        performance_metrics["excluded_tickers"] = excluded_tickers
-        performance_metrics[
-            "analysis_notes"
-        ] = f"Backtest completed with {len(excluded_tickers)} ticker(s) excluded due to insufficient data"
-    if combined_warnings:
-        performance_metrics["warnings"] = combined_warnings
 
+def _weights_by_portfolio(
+    weights: Union[pd.DataFrame, Mapping[Hashable, Mapping[str, float]]],
+) -> Dict[Hashable, Dict[str, float]]:
+    """Portfolio name -> weight dict; NaN cells of a frame mean "not held"."""
+    if isinstance(weights, pd.DataFrame):
+        return {
+            name: {str(t): float(w) for t, w in row.items() if pd.notna(w)}
+            for name, row in weights.iterrows()
+        }
+    return {name: {t: float(w) for t, w in dict(p or {}).items()} for name, p in weights.items()}
+
+
+def run_backtest_batch(
+    weights: Union[pd.DataFrame, Mapping[Hashable, Mapping[str, float]]],
+    start_date: str,
+    end_date: str,
+    benchmark_ticker: str = "SPY",
+    risk_free_rate: Optional[float] = None,
+    fmp_ticker_map: Optional[Dict[str, str]] = None,
+    currency_map: Optional[Dict[str, str]] = None,
+    instrument_types: Optional[Dict[str, str]] = None,
+    return_context: Optional[ReturnSeriesContext] = None,
+    include_attribution: bool = True,
+) -> Dict[Hashable, Dict[str, Any]]:
+    """
+    Backtest many candidate allocations over one window in a single pass.
+
+    ``weights`` is a portfolios × tickers DataFrame (NaN = not held) or a
+    mapping of portfolio name -> weight dict.  The availability filter, the
+    returns panel, the benchmark and the risk-free rate are fetched once for
+    the union of tickers; every portfolio's return series comes from one
+    matmul (``compute_portfolio_returns_partial_batch``) and the metrics from
+    one ``compute_performance_metrics_batch`` call per distinct return
+    window.
+
+    Returns ``{name: run_backtest(...) output}`` in input order; each entry
+    is what ``run_backtest`` returns for that portfolio alone, including its
+    own ``error`` payload.  ``include_attribution=False`` skips the
+    per-portfolio security/sector/factor attribution (left as empty lists).
+    """
+    portfolios = _weights_by_portfolio(weights)
+    results: Dict[Hashable, Dict[str, Any]] = {}
+    for name, portfolio in portfolios.items():
+        if not portfolio:
+            results[name] = {"error": "Backtest requires non-empty weights"}
+    pending = [name for name in portfolios if name not in results]
+    if not pending:
+        return results
+
+    min_obs, min_capm_obs = _observation_gates(start_date, end_date)
+    if return_context is None:
+        return_context = ReturnSeriesContext()
+
+    # Availability is per ticker, so one pass over the union covers every portfolio.
+    union = {ticker: 1.0 for name in pending for ticker in portfolios[name]}
+    _, union_excluded, union_warnings = _filter_tickers_by_data_availability(
+        weights=union,
+        start_date=start_date,
+        end_date=end_date,
+        min_months=min_obs,
+        ticker_alias_map=fmp_ticker_map,
+        currency_map=currency_map,
+        instrument_types=instrument_types,
+        return_context=return_context,
+    )
+    exclusion_warning = dict(zip(union_excluded, union_warnings))
+
+    filtered: Dict[Hashable, Dict[str, float]] = {}
+    exclusions: Dict[Hashable, Tuple[List[str], List[str]]] = {}
+    for name in pending:
+        portfolio = portfolios[name]
+        excluded_tickers = [t for t in portfolio if t in exclusion_warning]
+        warnings = [exclusion_warning[t] for t in excluded_tickers]
+        exclusions[name] = (excluded_tickers, warnings)
+        valid = {t: w for t, w in portfolio.items() if t not in exclusion_warning}
+        total_valid_weight = sum(valid.values())
+        if not valid or total_valid_weight <= 0:
+            results[name] = {
+                "error": "Insufficient data for backtest - all tickers excluded",
+                "excluded_tickers": excluded_tickers,
+                "warnings": warnings,
+            }
+            continue
+        filtered[name] = {t: w / total_valid_weight for t, w in valid.items()}
+    if not filtered:
+        return {name: results[name] for name in portfolios}
+
+    # One union panel, un-intersected: each portfolio keeps the months where
+    # all of its own tickers have data, as ``get_returns_dataframe`` gives it.
+    panel_tickers = list(dict.fromkeys(t for w in filtered.values() for t in w))
+    raw_returns: Dict[str, pd.Series] = {}
+    get_returns_dataframe(
+        weights=dict.fromkeys(panel_tickers, 1.0),
+        start_date=start_date,
+        end_date=end_date,
+        ticker_alias_map=fmp_ticker_map,
+        currency_map=currency_map,
+        min_observations=min_obs,
+        instrument_types=instrument_types,
+        raw_returns_out=raw_returns,
+        return_context=return_context,
+    )
+    panel = pd.DataFrame(raw_returns).reindex(columns=panel_tickers).sort_index()
+
+    names = list(filtered)
+    weight_matrix = pd.DataFrame([filtered[name] for name in names], columns=panel_tickers)
+    missing = (~panel.notna().to_numpy()).astype(float) @ weight_matrix.notna().to_numpy(dtype=float).T
+    batch_returns = compute_portfolio_returns_partial_batch(panel, weight_matrix).where(missing == 0)
+
+    series_by_name: Dict[Hashable, pd.Series] = {}
+    for position, name in enumerate(names):
+        portfolio_returns = batch_returns.iloc[:, position].dropna().rename("portfolio")
+        if portfolio_returns.empty or len(portfolio_returns) < min_obs:
+            excluded_tickers, warnings = exclusions[name]
+            results[name] = {
+                "error": "Insufficient data for backtest after filtering",
+                "months_available": len(portfolio_returns),
+                "excluded_tickers": excluded_tickers,
+                "warnings": warnings,
+            }
+            continue
+        series_by_name[name] = portfolio_returns
+    if not series_by_name:
+        return {name: results[name] for name in portfolios}
+
+    try:
+        benchmark_prices = fetch_monthly_close(
+            benchmark_ticker,
+            start_date,
+            end_date,
+            ticker_alias_map=fmp_ticker_map,
+        )
+        benchmark_returns = calc_monthly_returns(benchmark_prices)
+    except Exception as exc:
+        for name in series_by_name:
+            results[name] = {"error": f"Could not fetch benchmark data for {benchmark_ticker}: {exc}"}
+        return {name: results[name] for name in portfolios}
+
+    # Portfolios sharing an aligned window get their metrics in one batch call.
+    windows: Dict[Tuple[Any, ...], List[Hashable]] = {}
+    aligned_by_name: Dict[Hashable, pd.DataFrame] = {}
+    for name, portfolio_returns in series_by_name.items():
+        aligned = pd.DataFrame(
+            {"portfolio": portfolio_returns, "benchmark": benchmark_returns}
+        ).dropna()
+        if aligned.empty:
+            results[name] = {"error": f"No overlapping data between portfolio and {benchmark_ticker}"}
+            continue
+        aligned_by_name[name] = aligned
+        windows.setdefault(tuple(aligned.index.asi8), []).append(name)
+    if not windows:
+        return {name: results[name] for name in portfolios}
+
+    resolved_risk_free_rate = _get_risk_free_rate(risk_free_rate, start_date, end_date)
+
+    for group in windows.values():
+        bench_ret = aligned_by_name[group[0]]["benchmark"]
+        frame = pd.DataFrame(
+            np.column_stack([aligned_by_name[name]["portfolio"].to_numpy() for name in group]),
+            index=bench_ret.index,
+            columns=range(len(group)),
+        )
+        group_metrics = compute_performance_metrics_batch(
+            portfolio_returns=frame,
+            benchmark_returns=bench_ret,
+            risk_free_rate=resolved_risk_free_rate,
+            benchmark_ticker=benchmark_ticker,
+            start_date=start_date,
+            end_date=end_date,
+            min_capm_observations=min_capm_obs,
+        )
+        for position, name in enumerate(group):
+            performance_metrics = group_metrics[position]
+            port_ret = aligned_by_name[name]["portfolio"]
+            weights_used = filtered[name]
+            if include_attribution:
+                _attach_attribution(
+                    performance_metrics, panel[list(weights_used)].dropna(), weights_used, port_ret,
+                    start_date, end_date, fmp_ticker_map, return_context,
+                )
+            else:
+                for key in ("security_attribution", "sector_attribution", "factor_attribution"):
+                    performance_metrics[key] = []
+
+            excluded_tickers, warnings = exclusions[name]
+            combined_warnings = list(performance_metrics.get("warnings", []))
+            combined_warnings.extend(warnings)
+            results[name] = _backtest_payload(
+                performance_metrics, port_ret, bench_ret, weights_used,
+                benchmark_ticker, excluded_tickers, combined_warnings,
+            )
+
+    return {name: results[name] for name in portfolios}
+
+
+_REBALANCE_MONTHS = {
+    "none": (),
+    "monthly": tuple(range(1, 13)),
+    "quarterly": (3, 6, 9, 12),
+    "semiannual": (6, 12),
+    "annual": (12,),
+}
+
+
+def _calendar_rebalance_mask(index: pd.DatetimeIndex, frequencies: List[str]) -> np.ndarray:
+    """months × schedules; True where the schedule rebalances at that month end."""
+    if not frequencies:
+        return np.zeros((len(index), 0), dtype=bool)
+    months = np.asarray(index.month)
+    mask = np.column_stack(
+        [np.isin(months, _REBALANCE_MONTHS[f]) for f in frequencies]
+    ).reshape(len(index), len(frequencies))
+    # A rebalance at the final month end has no later returns.
+    mask[-1:] = False
+    return mask
+
+
+def _cumulative_growth(returns: np.ndarray) -> np.ndarray:
+    """(months + 1) × tickers growth of 1, with a leading row of ones."""
+    return np.vstack([np.ones((1, returns.shape[1])), np.cumprod(1.0 + returns, axis=0)])
+
+
+def _segment_value(holdings: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """
+    Portfolio value of drifted ``holdings`` per unit of capital at the last rebalance.
+
+    ``target`` is always gross-normalized (``normalize=True``), so capital
+    not absorbed by net exposure (``1 - target.sum()``) sits as zero-return
+    cash and the value is 1 at every rebalance, long-only or long/short.
+    """
+    return 1.0 - target.sum() + holdings.sum(axis=-1)
+
+
+def _drift_rebalance_mask(
+    growth: np.ndarray,
+    target: np.ndarray,
+    class_matrix: np.ndarray,
+    thresholds: np.ndarray,
+) -> np.ndarray:
+    """
+    months × thresholds rebalance flags for drift-triggered schedules.
+
+    Rather than stepping month by month, every round evaluates the whole
+    drift path from each schedule's last rebalance at once (holdings grow
+    by ``growth[t] / growth[start - 1]``), jumps each schedule to its first
+    month with ``max_abs_allocation_drift >= threshold`` and restarts it
+    there.  Rounds = the largest number of rebalances of any schedule.
+    """
+    n_months = growth.shape[0] - 1
+    mask = np.zeros((n_months, len(thresholds)), dtype=bool)
+    target_pct = 100.0 * (target @ class_matrix)
+    starts = np.zeros(len(thresholds), dtype=int)
+    active = np.arange(len(thresholds))
+    while active.size:
+        first = int(starts[active].min())
+        holdings = target * growth[first + 1:, None, :] / growth[starts[active]][None, :, :]
+        weights = holdings / _segment_value(holdings, target)[..., None]
+        drift = max_abs_allocation_drift(100.0 * (weights @ class_matrix), target_pct)
+        months = np.arange(first, n_months)[:, None]
+        # The last month never triggers: a rebalance there has no later returns.
+        off_target = (drift >= thresholds[active]) & (months >= starts[active]) & (months < n_months - 1)
+        triggered = off_target.any(axis=0)
+        hit = first + off_target.argmax(axis=0)
+        mask[hit[triggered], active[triggered]] = True
+        starts[active[triggered]] = hit[triggered] + 1
+        active = active[triggered]
+    return mask
+
+
+def _simulate_rebalancing(
+    returns: np.ndarray,
+    target: np.ndarray,
+    rebalance: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Portfolio returns and turnover for every schedule, without a month loop.
+
+    ``returns`` is months × tickers, ``target`` gross-normalized weights and
+    ``rebalance`` months × schedules (reset to ``target`` at that month end).
+    Between rebalances holdings drift with cumulative growth, so month ``t``
+    of a segment starting at ``s0`` holds ``target * growth[t] / growth[s0 - 1]``
+    and the first month of every segment returns ``target @ returns[t]``,
+    as ``compute_portfolio_returns_partial`` does.
+
+    Returns ``(portfolio_returns, turnover)``, both months × schedules;
+    turnover is one-way (half the absolute weight change) at rebalances.
+    """
+    n_months, n_schedules = rebalance.shape
+    growth = _cumulative_growth(returns)
+    months = np.arange(n_months)[:, None]
+    segment_start = np.zeros((n_months, n_schedules), dtype=int)
+    segment_start[1:] = np.where(rebalance[:-1], months[1:], 0)
+    segment_start = np.maximum.accumulate(segment_start, axis=0)
+
+    holdings = target * growth[1:, None, :] / growth[segment_start]
+    value = _segment_value(holdings, target)
+    previous = np.where(
+        segment_start == months,
+        1.0,
+        np.vstack([np.ones((1, n_schedules)), value[:-1]]),
+    )
+    portfolio_returns = value / previous - 1.0
+    drifted = holdings / value[..., None]
+    turnover = np.where(rebalance, 0.5 * np.abs(drifted - target).sum(axis=-1), 0.0)
+    return portfolio_returns, turnover
+
+
+def run_rebalancing_backtest(
+    weights: Dict[str, float],
+    start_date: str,
+    end_date: str,
+    rebalance_frequencies: Sequence[str] = ("none", "monthly", "quarterly", "annual"),
+    drift_thresholds: Sequence[float] = (DRIFT_ON_TARGET_THRESHOLD,),
+    asset_classes: Optional[Dict[str, str]] = None,
+    benchmark_ticker: str = "SPY",
+    risk_free_rate: Optional[float] = None,
+    fmp_ticker_map: Optional[Dict[str, str]] = None,
+    currency_map: Optional[Dict[str, str]] = None,
+    instrument_types: Optional[Dict[str, str]] = None,
+    return_context: Optional[ReturnSeriesContext] = None,
+) -> Dict[str, Any]:
+    """
+    Walk-forward backtest of one target allocation under many rebalance schedules.
+
+    Weights drift with realized returns between rebalances and reset to the
+    target at each rebalance month end.  Schedules are calendar frequencies
+    (``"none"`` = buy and hold, ``"monthly"`` = fixed weights,
+    ``"quarterly"``, ``"semiannual"``, ``"annual"``) plus drift thresholds in
+    percentage points: a schedule rebalances when any holding — or any
+    class of ``asset_classes`` (ticker -> class), as in
+    ``compute_allocation_drift`` — is off target by at least the threshold.
+    The target is always scaled to gross exposure, so ``"monthly"`` matches
+    ``run_backtest`` only when ``PORTFOLIO_DEFAULTS["normalize_weights"]`` is
+    on or the weights already have unit gross exposure.
+
+    All schedules are simulated together as array operations over the
+    returns frame, and their metrics come from one
+    ``compute_performance_metrics_batch`` call.  Returns ``schedules`` (one
+    entry per schedule with rebalance count/dates, turnover, metrics and
+    monthly/cumulative series) plus the shared benchmark series, weights,
+    exclusions and warnings; or an ``error`` payload like ``run_backtest``.
+    """
+    if not weights:
+        return {"error": "Backtest requires non-empty weights"}
+    frequencies = list(rebalance_frequencies or ())
+    thresholds = np.asarray(list(drift_thresholds or ()), dtype=float)
+    if not frequencies and not thresholds.size:
+        return {"error": "Backtest requires at least one rebalance schedule"}
+    if (thresholds <= 0).any():
+        return {"error": "Drift thresholds must be positive percentage points"}
+    unknown = [f for f in frequencies if f not in _REBALANCE_MONTHS]
+    if unknown:
+        return {
+            "error": f"Unknown rebalance frequency {unknown}; "
+            f"expected one of {sorted(_REBALANCE_MONTHS)}"
+        }
+
+    min_obs, min_capm_obs = _observation_gates(start_date, end_date)
+    if return_context is None:
+        return_context = ReturnSeriesContext()
+
+    filtered_weights, excluded_tickers, warnings = _filter_tickers_by_data_availability(
+        weights=weights,
+        start_date=start_date,
+        end_date=end_date,
+        min_months=min_obs,
+        ticker_alias_map=fmp_ticker_map,
+        currency_map=currency_map,
+        instrument_types=instrument_types,
+        return_context=return_context,
+    )
+    if not filtered_weights:
+        return {
+            "error": "Insufficient data for backtest - all tickers excluded",
+            "excluded_tickers": excluded_tickers,
+            "warnings": warnings,
+        }
+
+    df_ret = get_returns_dataframe(
+        weights=filtered_weights,
+        start_date=start_date,
+        end_date=end_date,
+        ticker_alias_map=fmp_ticker_map,
+        currency_map=currency_map,
+        min_observations=min_obs,
+        instrument_types=instrument_types,
+        return_context=return_context,
+    )
+    tickers = [t for t in filtered_weights if t in df_ret.columns]
+    df_ret = df_ret[tickers].sort_index()
+    if df_ret.empty or len(df_ret) < min_obs:
+        return {
+            "error": "Insufficient data for backtest after filtering",
+            "months_available": len(df_ret),
+            "excluded_tickers": excluded_tickers,
+            "warnings": warnings,
+        }
+
+    try:
+        benchmark_prices = fetch_monthly_close(
+            benchmark_ticker,
+            start_date,
+            end_date,
+            ticker_alias_map=fmp_ticker_map,
+        )
+        benchmark_returns = calc_monthly_returns(benchmark_prices)
+    except Exception as exc:
+        return {"error": f"Could not fetch benchmark data for {benchmark_ticker}: {exc}"}
+
+    # Drift is path dependent, so simulate over the benchmark-aligned window.
+    window = df_ret.index.intersection(benchmark_returns.dropna().index)
+    if window.empty:
+        return {"error": f"No overlapping data between portfolio and {benchmark_ticker}"}
+    returns = df_ret.loc[window].to_numpy(dtype=float)
+    bench_ret = benchmark_returns.loc[window].astype(float)
+    # Drift and turnover are fractions of capital, so always scale to gross
+    # exposure, whatever PORTFOLIO_DEFAULTS["normalize_weights"] says.
+    normalized = normalize_weights({t: filtered_weights[t] for t in tickers}, normalize=True)
+    target = np.array([normalized[t] for t in tickers], dtype=float)
+
+    if asset_classes:
+        classes = list(dict.fromkeys(asset_classes.get(t, t) for t in tickers))
+        class_matrix = np.array(
+            [[float(asset_classes.get(t, t) == c) for c in classes] for t in tickers]
+        )
+    else:
+        class_matrix = np.eye(len(tickers))
+
+    rebalance = np.hstack([
+        _calendar_rebalance_mask(window, frequencies),
+        _drift_rebalance_mask(_cumulative_growth(returns), target, class_matrix, thresholds),
+    ])
+    portfolio_returns, turnover = _simulate_rebalancing(returns, target, rebalance)
+
+    labels = frequencies + [f"drift_{threshold:g}pp" for threshold in thresholds]
+    resolved_risk_free_rate = _get_risk_free_rate(risk_free_rate, start_date, end_date)
+    metrics = compute_performance_metrics_batch(
+        portfolio_returns=pd.DataFrame(portfolio_returns, index=window, columns=range(len(labels))),
+        benchmark_returns=bench_ret,
+        risk_free_rate=resolved_risk_free_rate,
+        benchmark_ticker=benchmark_ticker,
+        start_date=start_date,
+        end_date=end_date,
+        min_capm_observations=min_capm_obs,
+    )
+
+    years = len(window) / 12
+    schedules = []
+    for position, label in enumerate(labels):
+        port_ret = pd.Series(portfolio_returns[:, position], index=window, name="portfolio")
+        is_drift = position >= len(frequencies)
+        rebalance_dates = window[rebalance[:, position]]
+        schedules.append(
+            {
+                "label": label,
+                "rebalance": "drift" if is_drift else "calendar",
+                "frequency": None if is_drift else label,
+                "drift_threshold": float(thresholds[position - len(frequencies)]) if is_drift else None,
+                "rebalance_count": int(rebalance[:, position].sum()),
+                "rebalance_dates": [d.strftime("%Y-%m") for d in rebalance_dates],
+                "turnover": round(float(turnover[:, position].sum()) * 100, 2),
+                "annual_turnover": round(float(turnover[:, position].sum()) / years * 100, 2),
+                "performance_metrics": metrics[position],
+                "monthly_returns": _series_to_month_dict(port_ret),
+                "cumulative_returns": _series_to_month_dict((1.0 + port_ret).cumprod()),
+                "annual_breakdown": _build_annual_breakdown(port_ret, bench_ret),
+            }
+        )
+
+    combined_warnings = list(metrics[0].get("warnings", [])) + list(warnings)
     return {
-        "performance_metrics": performance_metrics,
-        "monthly_returns": _series_to_month_dict(port_ret),
+        "schedules": schedules,
         "benchmark_monthly_returns": _series_to_month_dict(bench_ret),
-        "cumulative_returns": _series_to_month_dict(cumulative_returns),
-        "benchmark_cumulative": _series_to_month_dict(benchmark_cumulative),
-        "annual_breakdown": _build_annual_breakdown(port_ret, bench_ret),
+        "benchmark_cumulative": _series_to_month_dict((1.0 + bench_ret).cumprod()),
         "weights": filtered_weights,
         "benchmark_ticker": benchmark_ticker,
         "excluded_tickers": excluded_tickers,
         "warnings": combined_warnings,
     }
-
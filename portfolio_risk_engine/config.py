@@ -107,6 +107,18 @@ _DEFAULTS: dict[str, Any] = {
     "DIVIDEND_LRU_SIZE": _env_int("DIVIDEND_LRU_SIZE", 100),
     "DIVIDEND_DATA_QUALITY_THRESHOLD": _env_float("DIVIDEND_DATA_QUALITY_THRESHOLD", 0.25),
     "PORTFOLIO_RISK_LRU_SIZE": _env_int("PORTFOLIO_RISK_LRU_SIZE", 100),
+    "PORTFOLIO_RISK_MODEL_CACHE_SIZE": _env_int("PORTFOLIO_RISK_MODEL_CACHE_SIZE", 16),
+    "PORTFOLIO_VIEW_CACHE_DIR": os.getenv("PORTFOLIO_VIEW_CACHE_DIR", ""),
+    "MONTHLY_PRICE_STORE_DIR": os.getenv("MONTHLY_PRICE_STORE_DIR", ""),
+    "PORTFOLIO_VIEW_CACHE_TTL_SECONDS": _env_float("PORTFOLIO_VIEW_CACHE_TTL_SECONDS", 86400.0),
+    "PORTFOLIO_VIEW_CACHE_MAX_BYTES": _env_int("PORTFOLIO_VIEW_CACHE_MAX_BYTES", 512 * 1024 * 1024),
+    "PORTFOLIO_VIEW_CACHE_SIGNING_KEY": os.getenv("PORTFOLIO_VIEW_CACHE_SIGNING_KEY", ""),
+    "MONTE_CARLO_CHUNK_BYTES": _env_int("MONTE_CARLO_CHUNK_BYTES", 256 * 1024 * 1024),
+    "FACTOR_TAIL_STATS_PATH": os.getenv("FACTOR_TAIL_STATS_PATH", ""),
+    "FACTOR_TAIL_STATS_RETENTION_DAYS": _env_int("FACTOR_TAIL_STATS_RETENTION_DAYS", 7),
+    "OPTIMIZER_PROBLEM_CACHE_SIZE": _env_int("OPTIMIZER_PROBLEM_CACHE_SIZE", 32),
+    "OPTIMIZER_FRONTIER_WORKERS": _env_int("OPTIMIZER_FRONTIER_WORKERS", 4),
+    "OPTIMIZER_COVARIANCE_MODEL": os.getenv("OPTIMIZER_COVARIANCE_MODEL", "sample"),
     "FMP_API_KEY": os.getenv("FMP_API_KEY", ""),
 }
 
@@ -132,6 +144,18 @@ SECURITY_TYPE_CRASH_MAPPING = _DEFAULTS["SECURITY_TYPE_CRASH_MAPPING"]
 DIVIDEND_LRU_SIZE = int(_DEFAULTS["DIVIDEND_LRU_SIZE"])
 DIVIDEND_DATA_QUALITY_THRESHOLD = float(_DEFAULTS["DIVIDEND_DATA_QUALITY_THRESHOLD"])
 PORTFOLIO_RISK_LRU_SIZE = int(_DEFAULTS["PORTFOLIO_RISK_LRU_SIZE"])
+PORTFOLIO_RISK_MODEL_CACHE_SIZE = int(_DEFAULTS["PORTFOLIO_RISK_MODEL_CACHE_SIZE"])
+PORTFOLIO_VIEW_CACHE_DIR = str(_DEFAULTS["PORTFOLIO_VIEW_CACHE_DIR"] or "")
+MONTHLY_PRICE_STORE_DIR = str(_DEFAULTS["MONTHLY_PRICE_STORE_DIR"] or "")
+PORTFOLIO_VIEW_CACHE_TTL_SECONDS = float(_DEFAULTS["PORTFOLIO_VIEW_CACHE_TTL_SECONDS"])
+PORTFOLIO_VIEW_CACHE_MAX_BYTES = int(_DEFAULTS["PORTFOLIO_VIEW_CACHE_MAX_BYTES"])
+PORTFOLIO_VIEW_CACHE_SIGNING_KEY = str(_DEFAULTS["PORTFOLIO_VIEW_CACHE_SIGNING_KEY"] or "")
+MONTE_CARLO_CHUNK_BYTES = int(_DEFAULTS["MONTE_CARLO_CHUNK_BYTES"])
+FACTOR_TAIL_STATS_PATH = str(_DEFAULTS["FACTOR_TAIL_STATS_PATH"] or "")
+FACTOR_TAIL_STATS_RETENTION_DAYS = int(_DEFAULTS["FACTOR_TAIL_STATS_RETENTION_DAYS"])
+OPTIMIZER_PROBLEM_CACHE_SIZE = int(_DEFAULTS["OPTIMIZER_PROBLEM_CACHE_SIZE"])
+OPTIMIZER_FRONTIER_WORKERS = int(_DEFAULTS["OPTIMIZER_FRONTIER_WORKERS"])
+OPTIMIZER_COVARIANCE_MODEL = str(_DEFAULTS["OPTIMIZER_COVARIANCE_MODEL"] or "sample")
 FMP_API_KEY = str(_DEFAULTS["FMP_API_KEY"])
 
 
@@ -15,6 +15,10 @@ This module provides data loaders with intelligent caching for:
 
 Caching model:
 - Disk cache: Parquet-backed with deterministic keys
+- Monthly price store: one append-only, month-segmented Parquet store per ticker
+  (``cache_read_window``) serving any date window and fetching only missing months;
+  ``fetch_monthly_close`` / ``fetch_monthly_total_return_price`` read through it
+  when ``MONTHLY_PRICE_STORE_DIR`` is set (opt-in, resolved to an absolute path)
 - Monthly-stable dividends: Cache keys use month tokens (YYYYMM) so data naturally
   refreshes on calendar month roll without TTL
 - In-memory LRU: Frequently called helpers are wrapped with lru_cache
@@ -40,6 +44,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Iterable, Callable, Union, Optional
 import hashlib
+import os
+import re
+import tempfile
 import pandas as pd
 from pandas.errors import EmptyDataError, ParserError
 
@@ -53,10 +60,12 @@ from portfolio_risk_engine._logging import (
 from portfolio_risk_engine.config import (
     DIVIDEND_LRU_SIZE,
     DIVIDEND_DATA_QUALITY_THRESHOLD,
+    MONTHLY_PRICE_STORE_DIR,
 )
 from portfolio_risk_engine._ticker import resolve_ticker_alias
 from portfolio_risk_engine.config import DIVIDEND_DEFAULTS
 from portfolio_risk_engine.providers import get_price_provider
+from portfolio_risk_engine.result_cache import current_data_version
 
 
 class DividendYieldUnavailable(RuntimeError):
@@ -147,6 +156,366 @@ def cache_write(
     return path
 
 
+# ── columnar monthly price store ──────────────────────────────────────
+# One directory per ticker holding month-range segments
+# (``seg_<YYYYMM>_<YYYYMM>.parquet``).  The segment file names are the
+# coverage index: a read for any window only opens the overlapping
+# segments, and a miss fetches and appends just the uncovered months.
+_SEGMENT_RE = re.compile(r"^seg_(\d{6})_(\d{6})\.parquet$")
+_STORE_EARLIEST = pd.Period("1900-01", freq="M")
+_STORE_INDEX_NAME = "date"
+MAX_STORE_SEGMENTS = 24
+_STORE_OVERLAP_RTOL = 1e-6
+_STORE_VALIDATED_FILE = "validated_version"
+
+
+def _to_month(value: Optional[Union[str, datetime, pd.Timestamp]], default: pd.Period) -> pd.Period:
+    if value is None:
+        return default
+    return pd.Timestamp(value).to_period("M")
+
+
+def _segment_name(first: pd.Period, last: pd.Period) -> str:
+    return f"seg_{first.strftime('%Y%m')}_{last.strftime('%Y%m')}.parquet"
+
+
+def _store_segments(store: Path) -> list[tuple[pd.Period, pd.Period, Path]]:
+    """Return ``(first_month, last_month, path)`` for every segment, sorted."""
+    if not store.is_dir():
+        return []
+    segments = []
+    for path in store.iterdir():
+        match = _SEGMENT_RE.match(path.name)
+        if not match:
+            continue
+        first = pd.Period(f"{match.group(1)[:4]}-{match.group(1)[4:]}", freq="M")
+        last = pd.Period(f"{match.group(2)[:4]}-{match.group(2)[4:]}", freq="M")
+        segments.append((first, last, path))
+    return sorted(segments, key=lambda seg: (seg[0], seg[1]))
+
+
+def _merge_ranges(ranges: Iterable[tuple[pd.Period, pd.Period]]) -> list[tuple[pd.Period, pd.Period]]:
+    merged: list[tuple[pd.Period, pd.Period]] = []
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    return merged
+
+
+def _missing_ranges(
+    covered: list[tuple[pd.Period, pd.Period]],
+    first: pd.Period,
+    last: pd.Period,
+) -> list[tuple[pd.Period, pd.Period]]:
+    """Month ranges inside ``[first, last]`` not covered by ``covered``."""
+    gaps = []
+    cursor = first
+    for cov_first, cov_last in covered:
+        if cov_last < cursor:
+            continue
+        if cov_first > last:
+            break
+        if cov_first > cursor:
+            gaps.append((cursor, cov_first - 1))
+        cursor = max(cursor, cov_last + 1)
+        if cursor > last:
+            break
+    if cursor <= last:
+        gaps.append((cursor, last))
+    return gaps
+
+
+def _as_store_frame(obj: Optional[pd.Series]) -> pd.DataFrame:
+    """Normalize a loader result to a sorted, single-column, date-indexed frame."""
+    if obj is None:
+        return pd.DataFrame({"value": pd.Series(dtype=float)}, index=pd.DatetimeIndex([], name=_STORE_INDEX_NAME))
+    if isinstance(obj, pd.DataFrame):
+        obj = obj.iloc[:, 0]
+    series = obj.copy()
+    series.index = pd.DatetimeIndex(pd.to_datetime(series.index), name=_STORE_INDEX_NAME)
+    series = series[~series.index.duplicated(keep="last")].sort_index()
+    return series.to_frame(name=str(obj.name) if obj.name is not None else "value")
+
+
+def _clip_months(df: pd.DataFrame, first: pd.Period, last: pd.Period) -> pd.DataFrame:
+    if df.empty:
+        return df
+    months = df.index.to_period("M")
+    return df[(months >= first) & (months <= last)]
+
+
+def _write_segment(store: Path, df: pd.DataFrame, first: pd.Period, last: pd.Period) -> Path:
+    store.mkdir(parents=True, exist_ok=True)
+    path = store / _segment_name(first, last)
+    # Unique per writer: threads of one process must not share a tmp file.
+    with tempfile.NamedTemporaryFile(dir=store, suffix=".tmp", delete=False) as handle:
+        tmp = Path(handle.name)
+    try:
+        df.to_parquet(tmp, engine="pyarrow", compression="zstd", index=True)
+        os.replace(tmp, path)               # atomic publish for concurrent readers
+    finally:
+        tmp.unlink(missing_ok=True)
+    return path
+
+
+def _read_segment(path: Path, first: pd.Period, last: pd.Period) -> Optional[pd.DataFrame]:
+    """Read only the rows of one segment that fall in ``[first, last]``."""
+    filters = [
+        (_STORE_INDEX_NAME, ">=", first.start_time),
+        (_STORE_INDEX_NAME, "<=", last.end_time),
+    ]
+    try:
+        return pd.read_parquet(path, engine="pyarrow", filters=filters)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Cache segment corrupted, deleting: {path.name} ({type(e).__name__}: {e})")
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _concat_segments(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    frames = [f for f in frames if f is not None]
+    if not frames:
+        return _as_store_frame(None)
+    name = frames[-1].columns[0]
+    series = pd.concat([f.iloc[:, 0] for f in frames])
+    series = series[~series.index.duplicated(keep="last")].sort_index()
+    return series.to_frame(name=name)
+
+
+def _overlap_consistent(stored: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+    """
+    True when freshly fetched rows agree with stored rows on shared months.
+
+    Split and dividend adjustments rescale a ticker's whole history, so a
+    disagreement on the overlap month means the stored segments are stale
+    and must not be stitched to the new data.
+    """
+    if stored.empty or fresh.empty:
+        return True
+    if stored.columns[0] != fresh.columns[0]:
+        return False
+    s = stored.iloc[:, 0]
+    f = fresh.iloc[:, 0]
+    s = s.groupby(s.index.to_period("M")).last()
+    f = f.groupby(f.index.to_period("M")).last()
+    shared = s.index.intersection(f.index)
+    if shared.empty:
+        return True
+    a = pd.to_numeric(s.loc[shared], errors="coerce").to_numpy(dtype=float)
+    b = pd.to_numeric(f.loc[shared], errors="coerce").to_numpy(dtype=float)
+    both = ~(pd.isna(a) | pd.isna(b))
+    if not both.any():
+        return True
+    return bool((abs(a[both] - b[both]) <= _STORE_OVERLAP_RTOL * abs(b[both]).clip(min=1e-12)).all())
+
+
+def _compact_store(store: Path) -> None:
+    """Rewrite each contiguous run of segments as one segment."""
+    segments = _store_segments(store)
+    if len(segments) <= MAX_STORE_SEGMENTS:
+        return
+    for run_first, run_last in _merge_ranges((first, last) for first, last, _ in segments):
+        members = [seg for seg in segments if seg[0] >= run_first and seg[1] <= run_last]
+        if len(members) < 2:
+            continue
+        merged = _concat_segments([_read_segment(path, first, last) for first, last, path in members])
+        written = _write_segment(store, merged, run_first, run_last)
+        for _, _, path in members:
+            if path != written:
+                path.unlink(missing_ok=True)
+
+
+def _store_validated_version(store: Path) -> Optional[str]:
+    try:
+        return (store / _STORE_VALIDATED_FILE).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def _mark_store_validated(store: Path, version: str) -> None:
+    store.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=store, suffix=".tmp", delete=False, encoding="utf-8") as handle:
+        handle.write(version)
+        tmp = Path(handle.name)
+    try:
+        os.replace(tmp, store / _STORE_VALIDATED_FILE)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _store_still_adjusted(
+    segments: list[tuple[pd.Period, pd.Period, Path]],
+    load: Callable[[pd.Period, pd.Period], pd.DataFrame],
+) -> bool:
+    """
+    True when the provider still agrees with the latest stored month.
+
+    Split and dividend adjustments rescale a ticker's history back from the
+    event, so re-fetching the newest persisted month is enough to detect
+    that every stored segment is stale.
+    """
+    seg_first, seg_last, path = max(segments, key=lambda seg: seg[1])
+    stored = _read_segment(path, seg_last, seg_last)
+    if stored is None or stored.empty:
+        return False
+    return _overlap_consistent(stored, load(seg_last, seg_last))
+
+
+def cache_read_window(
+    *,
+    ticker: str,
+    start_date: Optional[Union[str, datetime]],
+    end_date: Optional[Union[str, datetime]],
+    loader: Callable[[Optional[str], Optional[str]], Optional[pd.Series]],
+    cache_dir: Union[str, Path],
+    prefix: Optional[str] = None,
+) -> pd.Series:
+    """
+    Serve a monthly price window from the per-ticker columnar store.
+
+    Unlike ``cache_read`` (one file per key), every window for a ticker is
+    served from the same store directory.  Only the months not already on
+    disk are requested from ``loader(start, end)`` – typically just the tail
+    when the analysis end date rolls forward – and they are appended as a
+    new segment.  The current calendar month is never persisted because its
+    month-end value is still moving.
+
+    Once per data version (``result_cache.current_data_version``) the
+    newest stored month is re-fetched and compared; if the provider has
+    re-adjusted the history (split / dividend) every segment is dropped and
+    the window is fetched afresh, so neither fully covered windows nor
+    windows stitched onto old segments keep stale levels.
+
+    Example
+    -------
+    series = cache_read_window(
+        ticker     = "SPY",
+        start_date = "2019-01-31",
+        end_date   = "2024-06-30",
+        loader     = lambda s, e: provider.fetch_monthly_close("SPY", s, e),
+        cache_dir  = "/var/cache/risk/prices",
+    )
+
+    Args:
+        ticker: Ticker used to name the store when ``prefix`` is not given.
+        start_date: Window start (inclusive, month granularity); ``None`` for full history.
+        end_date: Window end (inclusive, month granularity); ``None`` for latest.
+        loader: ``(start_iso | None, end_iso) -> pd.Series`` month-end fetcher.
+        cache_dir: Root directory of the store.
+        prefix: Store name override (e.g. to separate close vs total return).
+
+    Returns:
+        pd.Series: Month-end values for the requested window, named as the loader named them.
+    """
+    cache_dir = Path(cache_dir).expanduser().resolve()
+    store = cache_dir / f"{prefix or ticker}.store"
+
+    current_month = pd.Timestamp.today().to_period("M")
+    first = _to_month(start_date, _STORE_EARLIEST)
+    last = min(_to_month(end_date, current_month), current_month)
+    persist_last = current_month - 1
+    if first > last:
+        return _as_store_frame(None).iloc[:, 0]
+
+    def _load(gap_first: pd.Period, gap_last: pd.Period) -> pd.DataFrame:
+        start_iso = None if gap_first <= _STORE_EARLIEST else gap_first.start_time.date().isoformat()
+        end_iso = gap_last.end_time.date().isoformat()
+        return _as_store_frame(loader(start_iso, end_iso))
+
+    segments = _store_segments(store)
+    version = current_data_version()
+    if segments and _store_validated_version(store) != version:
+        if not _store_still_adjusted(segments, _load):
+            for _, _, path in segments:
+                path.unlink(missing_ok=True)
+            segments = []
+        _mark_store_validated(store, version)
+
+    frames = []
+    for seg_first, seg_last, path in list(segments):
+        if seg_last >= first and seg_first <= last:
+            frame = _read_segment(path, max(first, seg_first), min(last, seg_last))
+            if frame is None:
+                segments.remove((seg_first, seg_last, path))
+                continue                    # corrupt segment dropped → months become a gap
+            frames.append(frame)
+    stored = _concat_segments(frames)
+
+    covered = _merge_ranges((seg_first, seg_last) for seg_first, seg_last, _ in segments)
+    fetched: list[pd.DataFrame] = []
+    for gap_first, gap_last in _missing_ranges(covered, first, last):
+        fresh = _clip_months(_load(gap_first, gap_last), gap_first, gap_last)
+        if gap_first <= persist_last:
+            seg_last = min(gap_last, persist_last)
+            _write_segment(store, _clip_months(fresh, gap_first, seg_last), gap_first, seg_last)
+        fetched.append(fresh)
+    if fetched:
+        if not segments:
+            _mark_store_validated(store, version)
+        _compact_store(store)
+
+    result = _concat_segments([stored] + fetched)
+    return _clip_months(result, first, last).iloc[:, 0]
+
+
+_STORE_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._^=-]")
+
+
+def _fetch_through_store(
+    kind: str,
+    fetch: Callable[..., pd.Series],
+    ticker: str,
+    start_date: Optional[Union[str, datetime]],
+    end_date: Optional[Union[str, datetime]],
+    *,
+    ticker_alias: Optional[str],
+    ticker_alias_map: Optional[dict[str, str]],
+    ticker_resolver: Any | None,
+    instrument_type: str | None,
+    contract_identity: dict[str, Any] | None,
+) -> pd.Series:
+    """
+    Route a monthly provider fetch through the columnar store.
+
+    The store is keyed by series kind, resolved data symbol, instrument
+    type and the active price provider, so tickers aliased to the same
+    symbol share history while a provider swap starts a fresh store.  Calls
+    with a custom ``ticker_resolver`` or ``contract_identity`` carry routing
+    the key cannot capture and go straight to the provider, as does
+    everything while ``MONTHLY_PRICE_STORE_DIR`` is unset.
+    """
+    kwargs = dict(
+        ticker_alias=ticker_alias,
+        ticker_alias_map=ticker_alias_map,
+        ticker_resolver=ticker_resolver,
+        instrument_type=instrument_type,
+        contract_identity=contract_identity,
+    )
+    if not MONTHLY_PRICE_STORE_DIR or ticker_resolver is not None or contract_identity:
+        return fetch(ticker, start_date, end_date, **kwargs)
+
+    data_symbol = resolve_ticker_alias(
+        ticker,
+        ticker_alias=ticker_alias,
+        ticker_alias_map=ticker_alias_map,
+    )
+    provider = type(get_price_provider())
+    provider_id = _hash([provider.__module__, provider.__qualname__])
+    prefix = _STORE_UNSAFE_RE.sub(
+        "_", "_".join(p for p in (kind, data_symbol, instrument_type, provider_id) if p)
+    )
+    return cache_read_window(
+        ticker=ticker,
+        start_date=start_date,
+        end_date=end_date,
+        loader=lambda start, end: fetch(ticker, start, end, **kwargs),
+        cache_dir=Path(MONTHLY_PRICE_STORE_DIR).expanduser().resolve(),
+        prefix=prefix,
+    )
+
+
 # In[2]:
 
 
@@ -180,7 +549,9 @@ def fetch_monthly_close(
     Returns:
         pd.Series: Month-end close prices indexed by date.
     """
-    return get_price_provider().fetch_monthly_close(
+    return _fetch_through_store(
+        "close",
+        get_price_provider().fetch_monthly_close,
         ticker,
         start_date,
         end_date,
@@ -249,7 +620,9 @@ def fetch_monthly_total_return_price(
         instrument_type (str, optional): Canonical instrument type for provider routing.
         contract_identity (dict, optional): Provider-specific contract metadata.
     """
-    return get_price_provider().fetch_monthly_total_return_price(
+    return _fetch_through_store(
+        "total_return",
+        get_price_provider().fetch_monthly_total_return_price,
         ticker,
         start_date,
         end_date,
@@ -0,0 +1,340 @@
+"""
+Efficient frontier engine.
+
+Sweeps annualized volatility targets between the min-variance portfolio and
+the max-return portfolio at the risk limit, maximising expected return at
+each target under the same constraints as
+``solve_max_return_with_risk_limits``.
+
+Every solve reuses the cached parametric CVXPY problem of
+``portfolio_optimizer`` (risk inputs, expected returns, caps and the
+variance budget are ``cp.Parameter``s), so the sweep only changes the
+variance budget between points and warm-starts from the neighbouring
+solution.  Intermediate points are split into contiguous chunks solved in
+worker processes (``OPTIMIZER_FRONTIER_WORKERS``); each worker compiles the
+problem once and walks its chunk in order.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from portfolio_risk_engine._logging import log_errors, log_timing, portfolio_logger
+from portfolio_risk_engine.config import OPTIMIZER_FRONTIER_WORKERS
+from portfolio_risk_engine.covariance_conditioning import condition_covariance_for_optimization
+from portfolio_risk_engine.portfolio_optimizer import (
+    _MAX_RETURN_SOLVERS,
+    _MIN_VARIANCE_SOLVERS,
+    _covariance_root,
+    _get_parametric_problem,
+    _resolve_covariance_model,
+    _risk_limit_rows,
+    _risk_view,
+)
+from portfolio_risk_engine.portfolio_risk import get_portfolio_risk_model, normalize_weights
+from portfolio_risk_engine.risk_helpers import compute_max_betas
+
+MIN_POINTS = 5
+MAX_POINTS = 30
+_MIN_POINTS_PER_WORKER = 4
+
+
+@dataclass
+class FrontierPoint:
+    """Single point on the efficient frontier."""
+    volatility: float          # Annualized volatility (decimal, e.g. 0.08 = 8%)
+    expected_return: float     # Expected annual return (decimal)
+    weights: Dict[str, float]  # Optimal weights at this risk level
+    is_feasible: bool          # Whether solver found a solution
+    label: str                 # "min_variance", "max_return", or "frontier_{i}"
+
+
+def _extract_problem_data(
+    weights: Dict[str, float],
+    config: Dict[str, Any],
+    risk_config: Dict[str, Any],
+    proxies: Dict[str, Dict[str, Any]],
+    expected_returns: Dict[str, float],
+    ticker_alias_map: Optional[Dict[str, str]],
+    instrument_types: Optional[Dict[str, str]],
+    covariance_model: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the risk view once and extract everything the sweep needs.
+
+    Mirrors the data preparation of ``solve_min_variance_with_risk_limits``
+    and ``solve_max_return_with_risk_limits`` (ticker filtering, sample or
+    factor covariance, beta and per-proxy caps).
+    """
+    start, end = config["start_date"], config["end_date"]
+    normalized = normalize_weights(weights, normalize=True)
+    summary, risk_inputs = _risk_view(
+        normalized, start, end, proxies,
+        ticker_alias_map=ticker_alias_map,
+        currency_map=config.get("currency_map"),
+        instrument_types=instrument_types,
+        contract_identities=config.get("contract_identities"),
+    )
+    risk_model = get_portfolio_risk_model(normalized, start, end, **risk_inputs)
+
+    cov_tickers = set(summary["covariance_matrix"].columns)
+    original_tickers = list(normalized.keys())
+    tickers = [t for t in original_tickers if t in cov_tickers]
+    if not tickers:
+        raise ValueError(f"No valid tickers with data found. All tickers failed: {original_tickers}")
+    if len(tickers) < len(original_tickers):
+        missing = set(original_tickers) - set(tickers)
+        portfolio_logger.warning("Frontier: dropping %d tickers with no data: %s", len(missing), missing)
+        remaining = {t: normalized[t] for t in tickers}
+        total = sum(remaining.values())
+        normalized = {t: w / total for t, w in remaining.items()}
+
+    covariance_model = _resolve_covariance_model(
+        covariance_model, len(tickers), summary.get("return_observation_count"),
+    )
+    if covariance_model == "factor":
+        factor_cov = risk_model.factor_covariance(tickers, ticker_alias_map)
+        risk_input, n_factors, variance = factor_cov, len(factor_cov.factors), factor_cov.variance
+    else:
+        covariance_result = condition_covariance_for_optimization(
+            summary["covariance_matrix"].loc[tickers, tickers],
+            observation_count=summary.get("return_observation_count"),
+        )
+        if covariance_result.applied:
+            portfolio_logger.warning(
+                "Frontier covariance conditioned for optimization: %s",
+                covariance_result.metadata,
+            )
+        cov = covariance_result.covariance.values
+        risk_input, n_factors, variance = _covariance_root(cov), None, (lambda w: float(w @ cov @ w))
+    beta_mat = summary["df_stock_betas"].fillna(0.0).loc[tickers]
+
+    covered = sum(1 for t in tickers if t in expected_returns)
+    if covered / len(tickers) < 0.8:
+        portfolio_logger.warning(
+            "Frontier: only %.0f%% of tickers have expected returns — "
+            "missing tickers default to 0%% return.",
+            covered / len(tickers) * 100,
+        )
+    mu = np.array([expected_returns.get(t, 0.0) for t in tickers], dtype=float)
+
+    worst_proxy_loss = risk_model.worst_factor_losses(proxies, ticker_alias_map)
+    max_betas = compute_max_betas(
+        proxies, start, end,
+        loss_limit_pct=risk_config["max_single_factor_loss"],
+        ticker_alias_map=ticker_alias_map,
+        worst_losses=worst_proxy_loss,
+    )
+    loss_lim = risk_config["max_single_factor_loss"]
+    proxy_caps = {
+        proxy: (np.inf if loss >= 0 else loss_lim / loss)
+        for proxy, loss in worst_proxy_loss.items()
+    }
+
+    # Min-variance caps every factor; max-return (and the sweep) only the
+    # aggregate market / momentum / value factors, as in the one-shot solvers.
+    min_var_limits = _risk_limit_rows(tickers, beta_mat, max_betas, proxy_caps, proxies)
+    agg_caps = {k: max_betas[k] for k in ("market", "momentum", "value") if k in max_betas}
+    max_ret_limits = _risk_limit_rows(tickers, beta_mat, agg_caps, proxy_caps, proxies)
+
+    current = np.array([normalized.get(t, 0.0) for t in tickers])
+    return {
+        "tickers": tickers,
+        "risk": risk_input,
+        "n_factors": n_factors,
+        "variance": variance,
+        "mu": mu,
+        "min_var_limits": min_var_limits,
+        "max_ret_limits": max_ret_limits,
+        "max_weight": risk_config["concentration_limits"]["max_single_stock_weight"],
+        "max_vol": risk_config["portfolio_limits"]["max_volatility"],
+        "current_vol": summary.get("volatility_annual", 0.0),
+        "current_ret": float(mu @ current),
+    }
+
+
+def _point(w: np.ndarray, data: Dict[str, Any], label: str) -> FrontierPoint:
+    variance = data["variance"](w)
+    return FrontierPoint(
+        volatility=math.sqrt(12 * max(variance, 0.0)),
+        expected_return=float(data["mu"] @ w),
+        weights={t: float(w[i]) for i, t in enumerate(data["tickers"])},
+        is_feasible=True,
+        label=label,
+    )
+
+
+def _solve_frontier_chunk(
+    tickers: List[str],
+    risk: Any,
+    n_factors: Optional[int],
+    mu: np.ndarray,
+    limits: Tuple[np.ndarray, np.ndarray],
+    max_weight: float,
+    targets: List[Tuple[int, float]],
+) -> List[Tuple[int, Optional[np.ndarray]]]:
+    """
+    Maximise return at each ``(index, annual vol target)`` in order.
+
+    Top-level so worker processes can run it; each process keeps its own
+    cached problem, and consecutive targets warm-start from one another.
+    """
+    limit_rows, limit_caps = limits
+    problem = _get_parametric_problem(
+        "max_return", tickers, len(limit_caps),
+        allow_short=False, abs_concentration=False, n_factors=n_factors,
+    )
+    results: List[Tuple[int, Optional[np.ndarray]]] = []
+    with problem.lock:
+        for index, vol_target in targets:
+            problem.set_data(
+                risk=risk,
+                max_weight=max_weight,
+                var_budget=(vol_target / np.sqrt(12)) ** 2,
+                limit_rows=limit_rows,
+                limit_caps=limit_caps,
+                mu=mu,
+            )
+            results.append((index, problem.solve(_MAX_RETURN_SOLVERS, report=False)))
+    return results
+
+
+def _sweep(data: Dict[str, Any], vol_targets: np.ndarray) -> List[Tuple[int, Optional[np.ndarray]]]:
+    """Solve all intermediate targets, in contiguous chunks across worker processes."""
+    targets = list(enumerate(vol_targets.tolist(), start=1))
+    args = (data["tickers"], data["risk"], data["n_factors"], data["mu"], data["max_ret_limits"], data["max_weight"])
+    n_chunks = min(
+        OPTIMIZER_FRONTIER_WORKERS,
+        os.cpu_count() or 1,
+        len(targets) // _MIN_POINTS_PER_WORKER,
+    )
+    if n_chunks <= 1:
+        return _solve_frontier_chunk(*args, targets)
+
+    chunks = [list(chunk) for chunk in np.array_split(np.arange(len(targets)), n_chunks)]
+    try:
+        with ProcessPoolExecutor(max_workers=n_chunks) as executor:
+            futures = [
+                executor.submit(_solve_frontier_chunk, *args, [targets[i] for i in chunk])
+                for chunk in chunks
+            ]
+            return [item for future in futures for item in future.result()]
+    except Exception as exc:
+        portfolio_logger.warning("Frontier worker pool failed (%s); solving points in-process.", exc)
+        return _solve_frontier_chunk(*args, targets)
+
+
+@log_errors("high")
+@log_timing(60.0)
+def compute_efficient_frontier(
+    weights: Dict[str, float],
+    config: Dict[str, Any],
+    risk_config: Dict[str, Any],
+    proxies: Dict[str, Dict[str, Any]],
+    expected_returns: Dict[str, float],
+    ticker_alias_map: Optional[Dict[str, str]] = None,
+    instrument_types: Optional[Dict[str, str]] = None,
+    n_points: int = 15,
+    covariance_model: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Compute the efficient frontier by sweeping volatility targets.
+
+    Steps:
+    1. Build the risk view once (Σ, betas, caps) via ``_extract_problem_data``
+    2. Solve min-variance → σ_min
+    3. Guard: if expected returns are zero / near-constant, return min-var only
+    4. Solve max-return at the risk limit → σ_max
+    5. Maximise Σ w_i μ_i s.t. σ_p ≤ σ_target for ``n_points - 2`` targets
+       between σ_min and σ_max (parallel chunks, warm-started)
+
+    ``covariance_model`` ("sample", "factor" or "auto") selects the risk
+    term as in the one-shot solvers; the factor form keeps 1,000+ name
+    sweeps at n·k cost.
+
+    Returns dict with frontier_points, current_portfolio, min_variance_point,
+    max_return_point, n_feasible and n_requested (the fields of
+    ``core.result_objects.EfficientFrontierResult``).
+    """
+    n_points = max(MIN_POINTS, min(MAX_POINTS, n_points))
+    data = _extract_problem_data(
+        weights, config, risk_config, proxies, expected_returns,
+        ticker_alias_map, instrument_types, covariance_model,
+    )
+    tickers, mu = data["tickers"], data["mu"]
+    full_budget = (data["max_vol"] / np.sqrt(12)) ** 2
+    current = {"volatility": data["current_vol"], "expected_return": data["current_ret"]}
+
+    # --- Min-variance endpoint ---
+    rows, caps = data["min_var_limits"]
+    problem = _get_parametric_problem(
+        "min_variance", tickers, len(caps),
+        allow_short=False, abs_concentration=True, n_factors=data["n_factors"],
+    )
+    with problem.lock:
+        problem.set_data(
+            risk=data["risk"], max_weight=data["max_weight"],
+            var_budget=full_budget, limit_rows=rows, limit_caps=caps,
+        )
+        w_min = problem.solve(_MIN_VARIANCE_SOLVERS, report=False)
+    if w_min is None:
+        raise ValueError("Min-variance solve failed — check risk constraints.")
+    min_var_point = _point(w_min, data, "min_variance")
+
+    # --- Guard: degenerate expected returns → min-var only ---
+    mu_range = float(mu.max() - mu.min())
+    if np.allclose(mu, 0) or mu_range < 1e-6:
+        portfolio_logger.warning(
+            "Expected returns are zero or near-constant (range=%.2e) — "
+            "frontier degenerates to min-variance point only.", mu_range,
+        )
+        return {
+            "frontier_points": [min_var_point],
+            "current_portfolio": current,
+            "min_variance_point": min_var_point,
+            "max_return_point": min_var_point,
+            "n_feasible": 1,
+            "n_requested": n_points,
+        }
+
+    # --- Max-return endpoint (full risk budget) ---
+    max_ret = _solve_frontier_chunk(
+        tickers, data["risk"], data["n_factors"], mu, data["max_ret_limits"], data["max_weight"],
+        [(0, data["max_vol"])],
+    )[0][1]
+    if max_ret is None:
+        raise ValueError("Max-return solve failed — check risk constraints and expected returns.")
+    max_ret_point = _point(max_ret, data, "max_return")
+
+    # --- Intermediate points ---
+    frontier = [min_var_point]
+    σ_min, σ_max = min_var_point.volatility, max_ret_point.volatility
+    if σ_max > σ_min + 1e-6:
+        vol_targets = np.linspace(σ_min, σ_max, n_points)[1:-1]
+        for index, w in sorted(_sweep(data, vol_targets), key=lambda item: item[0]):
+            if w is None:
+                # Any σ_target ≥ σ_min is feasible (min-var satisfies it), so a
+                # failure here is numerical, not true infeasibility.
+                portfolio_logger.warning(
+                    "Frontier point %d (σ_target=%.4f) failed numerically — skipping.",
+                    index, vol_targets[index - 1],
+                )
+                continue
+            frontier.append(_point(w, data, f"frontier_{index}"))
+    frontier.append(max_ret_point)
+    frontier.sort(key=lambda p: p.volatility)
+
+    return {
+        "frontier_points": frontier,
+        "current_portfolio": current,
+        "min_variance_point": min_var_point,
+        "max_return_point": max_ret_point,
+        "n_feasible": len(frontier),
+        "n_requested": n_points,
+    }
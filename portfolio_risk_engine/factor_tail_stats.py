@@ -0,0 +1,362 @@
+"""Persisted per-proxy tail statistics shared by worst-case, risk-limit and stress paths.
+
+``compute_max_betas`` (every optimizer and what-if run), the suggested risk
+limits in ``portfolio_risk_score`` and the factor stress impacts all need the
+same few numbers per factor proxy: the worst monthly return and its month,
+the worst excess return versus the market proxy, volatility and lower-tail
+quantiles.  ``FactorTailStatsTable`` computes them once per proxy, lookback
+window and data version (today's date unless overridden, see
+``result_cache.current_data_version``) and serves every later request from
+memory.
+
+When ``FACTOR_TAIL_STATS_PATH`` is set, rows are also persisted in a SQLite
+file so every worker process and restart shares them.  Refresh is
+incremental: only proxies without a row for the current data version are
+recomputed, and rows older than ``FACTOR_TAIL_STATS_RETENTION_DAYS`` are
+pruned on the first refresh of a new version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from portfolio_risk_engine._logging import portfolio_logger
+from portfolio_risk_engine.config import FACTOR_TAIL_STATS_PATH, FACTOR_TAIL_STATS_RETENTION_DAYS
+from portfolio_risk_engine.factor_utils import fetch_excess_return
+from portfolio_risk_engine.result_cache import current_data_version
+from portfolio_risk_engine.risk_helpers import (
+    WorstCaseDataUnavailable,
+    _alias_items,
+    _cached_proxy_monthly_returns,
+)
+
+TAIL_QUANTILES = (0.01, 0.05, 0.10)
+_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class ProxyTailStats:
+    """
+    Monthly-return tail statistics of one proxy over one lookback window.
+
+    ``market_proxy`` is set for excess-return rows (proxy minus market).
+    ``worst_date`` is the ``YYYY-MM`` month of ``worst``; ``vol_annual`` is
+    the monthly standard deviation scaled by sqrt(12).
+    """
+
+    proxy: str
+    market_proxy: Optional[str]
+    start_date: str
+    end_date: str
+    as_of: str
+    observations: int
+    worst: float
+    worst_date: str
+    vol_annual: float
+    q01: float
+    q05: float
+    q10: float
+
+    @classmethod
+    def from_returns(
+        cls,
+        returns: pd.Series,
+        *,
+        proxy: str,
+        market_proxy: Optional[str],
+        start_date: str,
+        end_date: str,
+        as_of: str,
+    ) -> "ProxyTailStats":
+        clean = pd.to_numeric(returns, errors="coerce").dropna()
+        if clean.empty:
+            label = f"{proxy} vs {market_proxy}" if market_proxy else proxy
+            raise WorstCaseDataUnavailable(f"No monthly returns available for factor proxy {label}")
+        worst_idx = clean.idxmin()
+        if not hasattr(worst_idx, "strftime"):
+            label = f"{proxy} vs {market_proxy}" if market_proxy else proxy
+            raise WorstCaseDataUnavailable(f"Worst return date is invalid for factor proxy {label}")
+        values = clean.to_numpy(dtype=float)
+        q01, q05, q10 = np.quantile(values, TAIL_QUANTILES)
+        return cls(
+            proxy=proxy,
+            market_proxy=market_proxy,
+            start_date=start_date,
+            end_date=end_date,
+            as_of=as_of,
+            observations=int(values.size),
+            worst=float(values.min()),
+            worst_date=worst_idx.strftime("%Y-%m"),
+            vol_annual=float(values.std(ddof=1) * np.sqrt(12.0)) if values.size > 1 else 0.0,
+            q01=float(q01),
+            q05=float(q05),
+            q10=float(q10),
+        )
+
+
+_COLUMNS = [f.name for f in fields(ProxyTailStats)]
+RowKey = Tuple[str, Optional[str], str, str, str]
+
+
+def _normalize_date(value: Any) -> str:
+    return pd.Timestamp(value).strftime("%Y-%m-%d")
+
+
+def _alias_key(ticker_alias_map: Optional[Dict[str, str]]) -> str:
+    items = _alias_items(ticker_alias_map)
+    if not items:
+        return ""
+    return hashlib.sha256(json.dumps(items).encode("utf-8")).hexdigest()[:16]
+
+
+class FactorTailStatsTable:
+    """
+    Per-proxy tail stats keyed by (proxy, market proxy, window, alias map).
+
+    Lookups are dict hits once a row exists for the current data version;
+    missing rows are computed in parallel from the memoized proxy return
+    series and written through to SQLite when ``path`` is given.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(path).expanduser().resolve() if path else None
+        self._lock = threading.Lock()
+        self._rows: Dict[RowKey, ProxyTailStats] = {}
+        self._version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS proxy_tail_stats ("
+                    "proxy TEXT NOT NULL, market_proxy TEXT NOT NULL DEFAULT '', "
+                    "start_date TEXT NOT NULL, end_date TEXT NOT NULL, alias_key TEXT NOT NULL, "
+                    "as_of TEXT NOT NULL, observations INTEGER, worst REAL, worst_date TEXT, "
+                    "vol_annual REAL, q01 REAL, q05 REAL, q10 REAL, "
+                    "PRIMARY KEY (proxy, market_proxy, start_date, end_date, alias_key))"
+                )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection for one transaction: commits or rolls back, then closes."""
+        conn = sqlite3.connect(str(self.path), timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _roll_version(self) -> str:
+        """Drop in-memory rows from an older data version; prune old persisted rows."""
+        version = current_data_version()
+        with self._lock:
+            if version == self._version:
+                return version
+            self._rows.clear()
+            self._version = version
+        if self.path is not None:
+            try:
+                cutoff = (pd.Timestamp(version) - timedelta(days=FACTOR_TAIL_STATS_RETENTION_DAYS)).strftime("%Y-%m-%d")
+            except (TypeError, ValueError):
+                cutoff = (date.today() - timedelta(days=FACTOR_TAIL_STATS_RETENTION_DAYS)).isoformat()
+            try:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM proxy_tail_stats WHERE as_of < ? AND as_of != ?", (cutoff, version))
+            except sqlite3.Error as exc:
+                portfolio_logger.warning("Factor tail stats prune failed: %s", exc)
+        return version
+
+    def _load_persisted(self, keys: Iterable[RowKey], version: str) -> Dict[RowKey, ProxyTailStats]:
+        if self.path is None:
+            return {}
+        found: Dict[RowKey, ProxyTailStats] = {}
+        try:
+            with self._connect() as conn:
+                for proxy, market_proxy, start_date, end_date, alias_key in keys:
+                    row = conn.execute(
+                        f"SELECT {', '.join(_COLUMNS)} FROM proxy_tail_stats "
+                        "WHERE proxy = ? AND market_proxy = ? AND start_date = ? AND end_date = ? "
+                        "AND alias_key = ? AND as_of = ?",
+                        (proxy, market_proxy or "", start_date, end_date, alias_key, version),
+                    ).fetchone()
+                    if row is not None:
+                        values = dict(zip(_COLUMNS, row))
+                        values["market_proxy"] = values["market_proxy"] or None
+                        found[(proxy, market_proxy, start_date, end_date, alias_key)] = ProxyTailStats(**values)
+        except sqlite3.Error as exc:
+            portfolio_logger.warning("Factor tail stats read failed: %s", exc)
+        return found
+
+    def _persist(self, rows: Dict[RowKey, ProxyTailStats]) -> None:
+        if self.path is None or not rows:
+            return
+        payload = []
+        for (_, _, _, _, alias_key), stats in rows.items():
+            values = asdict(stats)
+            values["market_proxy"] = values["market_proxy"] or ""
+            payload.append((*[values[name] for name in _COLUMNS], alias_key))
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO proxy_tail_stats ({', '.join(_COLUMNS)}, alias_key) "
+                    f"VALUES ({', '.join('?' for _ in range(len(_COLUMNS) + 1))})",
+                    payload,
+                )
+        except sqlite3.Error as exc:
+            portfolio_logger.warning("Factor tail stats write failed: %s", exc)
+
+    def _get(
+        self,
+        pairs: Iterable[Tuple[str, Optional[str]]],
+        start_date: str,
+        end_date: str,
+        ticker_alias_map: Optional[Dict[str, str]],
+    ) -> Dict[Tuple[str, Optional[str]], ProxyTailStats]:
+        version = self._roll_version()
+        start_date, end_date = _normalize_date(start_date), _normalize_date(end_date)
+        alias_key = _alias_key(ticker_alias_map)
+        keys = {
+            pair: (pair[0], pair[1], start_date, end_date, alias_key)
+            for pair in sorted(set(pairs), key=lambda p: (p[0], p[1] or ""))
+        }
+
+        result: Dict[Tuple[str, Optional[str]], ProxyTailStats] = {}
+        with self._lock:
+            for pair, key in keys.items():
+                if key in self._rows:
+                    result[pair] = self._rows[key]
+            self.hits += len(result)
+            self.misses += len(keys) - len(result)
+        missing = {pair: key for pair, key in keys.items() if pair not in result}
+        if not missing:
+            return result
+
+        persisted = self._load_persisted(missing.values(), version)
+        to_compute = {pair: key for pair, key in missing.items() if key not in persisted}
+        computed: Dict[RowKey, ProxyTailStats] = {}
+        if to_compute:
+            alias_items = _alias_items(ticker_alias_map)
+
+            def _compute(pair: Tuple[str, Optional[str]]) -> ProxyTailStats:
+                proxy, market_proxy = pair
+                if market_proxy is None:
+                    # Same data version as the rows being rebuilt, so a refresh
+                    # never reads proxy history memoized under an older one.
+                    returns = _cached_proxy_monthly_returns(
+                        proxy, start_date, end_date, alias_items, data_version=version
+                    )
+                else:
+                    try:
+                        returns = fetch_excess_return(
+                            proxy,
+                            market_proxy,
+                            start_date,
+                            end_date,
+                            ticker_alias_map=ticker_alias_map,
+                        )
+                    except Exception as exc:
+                        raise WorstCaseDataUnavailable(
+                            f"Unable to compute worst excess return for {proxy} vs {market_proxy}"
+                        ) from exc
+                return ProxyTailStats.from_returns(
+                    returns,
+                    proxy=proxy,
+                    market_proxy=market_proxy,
+                    start_date=start_date,
+                    end_date=end_date,
+                    as_of=version,
+                )
+
+            with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(to_compute))) as executor:
+                futures = {executor.submit(_compute, pair): pair for pair in to_compute}
+                for future in as_completed(futures):
+                    pair = futures[future]
+                    computed[to_compute[pair]] = future.result()
+            self._persist(computed)
+
+        fresh = {**persisted, **computed}
+        with self._lock:
+            if self._version == version:
+                self._rows.update(fresh)
+        for pair, key in missing.items():
+            result[pair] = fresh[key]
+        return result
+
+    def get_proxy_stats(
+        self,
+        proxies: Iterable[str],
+        start_date: str,
+        end_date: str,
+        ticker_alias_map: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, ProxyTailStats]:
+        """``{proxy: stats}`` of raw monthly returns over the window."""
+        rows = self._get(((str(p), None) for p in proxies), start_date, end_date, ticker_alias_map)
+        return {proxy: stats for (proxy, _), stats in rows.items()}
+
+    def get_excess_stats(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        start_date: str,
+        end_date: str,
+        ticker_alias_map: Optional[Dict[str, str]] = None,
+    ) -> Dict[Tuple[str, str], ProxyTailStats]:
+        """``{(factor_proxy, market_proxy): stats}`` of monthly excess returns."""
+        rows = self._get(((str(f), str(m)) for f, m in pairs), start_date, end_date, ticker_alias_map)
+        return {(proxy, market): stats for (proxy, market), stats in rows.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._version = None
+        if self.path is not None:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM proxy_tail_stats")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "sqlite" if self.path is not None else "memory",
+                "path": str(self.path) if self.path is not None else None,
+                "data_version": self._version,
+                "rows": len(self._rows),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0,
+            }
+
+
+_table: Optional[FactorTailStatsTable] = None
+_table_lock = threading.Lock()
+
+
+def set_factor_tail_stats_table(table: Optional[FactorTailStatsTable]) -> None:
+    """Install a table (``None`` resets to the configured default on next use)."""
+    global _table
+    with _table_lock:
+        _table = table
+
+
+def get_factor_tail_stats_table() -> FactorTailStatsTable:
+    global _table
+    with _table_lock:
+        if _table is None:
+            try:
+                _table = FactorTailStatsTable(FACTOR_TAIL_STATS_PATH or None)
+            except (OSError, sqlite3.Error) as exc:
+                portfolio_logger.warning("Factor tail stats persistence disabled: %s", exc)
+                _table = FactorTailStatsTable()
+        return _table
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import warnings
 from typing import Any, Dict, Optional
 
 import numpy as np
 import pandas as pd
 
 from core.result_objects import RiskAnalysisResult
+from portfolio_risk_engine._logging import portfolio_logger
+from portfolio_risk_engine.config import MONTE_CARLO_CHUNK_BYTES
+from portfolio_risk_engine.portfolio_risk import FactorCovariance, get_portfolio_risk_model
+
+SAMPLING_METHODS = ("pseudo", "sobol")
+SIMULATION_MODELS = ("covariance", "factor")
+_SOBOL_MAX_DIMENSION = 21201  # scipy's Sobol direction-number table
 
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
@@ -220,15 +228,187 @@ def _build_flat_result(
     }
 
 
+def _resolve_factor_covariance(
+    risk_result: RiskAnalysisResult,
+    tickers: list[str],
+) -> Optional[FactorCovariance]:
+    """
+    ``PortfolioRiskModel.factor_covariance`` for the result's universe.
+
+    Uses the risk-model inputs recorded in ``analysis_metadata`` so the
+    lookup lands on the model that produced the view (rebuilt only when the
+    view itself was served from cache).  Returns ``None`` when the result
+    does not carry them or the model cannot be built.
+    """
+    metadata = getattr(risk_result, "analysis_metadata", None) or {}
+    inputs = metadata.get("risk_model_inputs")
+    if not isinstance(inputs, dict) or not inputs.get("start_date") or not inputs.get("end_date"):
+        return None
+    try:
+        risk_model = get_portfolio_risk_model(tickers, **inputs)
+        return risk_model.factor_covariance(tickers, inputs.get("ticker_alias_map"))
+    except Exception as exc:
+        portfolio_logger.warning(f"Monte Carlo factor model unavailable: {exc}")
+        return None
+
+
+def _build_factor_model(
+    factor_covariance: FactorCovariance,
+    tickers: list[str],
+) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """
+    Monthly shock loadings ``(N, K)`` and residual vols ``(N,)``.
+
+    Built from the joint-regression ``FactorCovariance`` (``Σ = B F Bᵀ + D``)
+    the optimizer uses: ``loadings = B Rᵀ`` with ``Rᵀ R = F``, so K
+    independent shocks reproduce the correlated proxy factors (industry and
+    peer baskets included) and the residual is the regression's own
+    idiosyncratic variance.  Returns ``None`` when no ticker has a factor.
+    """
+    rows = {ticker: i for i, ticker in enumerate(factor_covariance.tickers)}
+    if not factor_covariance.factors or any(ticker not in rows for ticker in tickers):
+        return None
+    order = [rows[ticker] for ticker in tickers]
+    loadings = factor_covariance.loadings[order] @ factor_covariance.factor_root().T
+    # Largest factors first so quasi-random draws land where they matter.
+    loadings = loadings[:, np.argsort(-np.abs(loadings).sum(axis=0), kind="stable")]
+    residual_vol = np.sqrt(np.clip(factor_covariance.idio_var[order], 0.0, None))
+    return loadings, residual_vol
+
+
+def _principal_transform(transform: np.ndarray) -> np.ndarray:
+    """
+    Re-factor ``transform @ transform.T`` so columns are ordered by variance.
+
+    The implied covariance is unchanged; quasi-random draws are spent on the
+    leading principal directions where they reduce error the most.
+    """
+    if transform.shape[0] <= 1:
+        return transform
+    implied = transform @ transform.T
+    eigenvalues, eigenvectors = np.linalg.eigh((implied + implied.T) / 2.0)
+    order = np.argsort(eigenvalues)[::-1]
+    scales = np.sqrt(np.clip(eigenvalues[order], 0.0, None))
+    return eigenvectors[:, order] * scales
+
+
+class _ShockSampler:
+    """
+    Standard-normal shock blocks of shape ``(paths, months, shocks)``.
+
+    Consecutive ``draw`` calls continue one stream, so a seeded run gives the
+    same paths regardless of chunk size.  With ``sampling="sobol"`` the
+    leading shock dimensions of every month come from a scrambled Sobol
+    sequence (capped by the sequence's maximum dimension); the rest are
+    pseudo-random.  With ``antithetic`` every draw is followed by its mirror.
+    """
+
+    def __init__(
+        self,
+        rng: np.random.Generator,
+        time_horizon_months: int,
+        n_shocks: int,
+        sampling: str = "pseudo",
+        antithetic: bool = False,
+    ) -> None:
+        self.rng = rng
+        self.time_horizon_months = time_horizon_months
+        self.n_shocks = n_shocks
+        self.antithetic = antithetic
+        self.quasi_shocks = 0
+        self._sobol = None
+        if sampling == "sobol":
+            from scipy.stats import qmc
+
+            self.quasi_shocks = min(n_shocks, _SOBOL_MAX_DIMENSION // time_horizon_months)
+            if self.quasi_shocks:
+                self._sobol = qmc.Sobol(
+                    d=time_horizon_months * self.quasi_shocks,
+                    scramble=True,
+                    seed=rng,
+                )
+
+    def _base(self, n_paths: int) -> np.ndarray:
+        shocks = np.empty((n_paths, self.time_horizon_months, self.n_shocks), dtype=float)
+        if self._sobol is not None:
+            from scipy.special import ndtri
+
+            with warnings.catch_warnings():
+                # Balance is best at powers of two; other counts are still valid draws.
+                warnings.simplefilter("ignore", UserWarning)
+                uniforms = self._sobol.random(n_paths)
+            np.clip(uniforms, 1e-12, 1.0 - 1e-12, out=uniforms)
+            shocks[:, :, : self.quasi_shocks] = ndtri(uniforms).reshape(
+                n_paths, self.time_horizon_months, self.quasi_shocks
+            )
+        if self.quasi_shocks < self.n_shocks:
+            shocks[:, :, self.quasi_shocks :] = self.rng.standard_normal(
+                size=(n_paths, self.time_horizon_months, self.n_shocks - self.quasi_shocks)
+            )
+        return shocks
+
+    def draw(self, n_paths: int) -> np.ndarray:
+        if not self.antithetic:
+            return self._base(n_paths)
+        base = self._base((n_paths + 1) // 2)
+        paired = np.stack([base, -base], axis=1).reshape(-1, *base.shape[1:])
+        return paired[:n_paths]
+
+
+def _resolve_chunk_size(
+    num_simulations: int,
+    time_horizon_months: int,
+    n_shocks: int,
+    n_assets: int,
+    chunk_size: Optional[int],
+    antithetic: bool,
+) -> int:
+    if chunk_size is None:
+        # Shock block plus the asset-return block dominate the working set.
+        bytes_per_path = time_horizon_months * max(n_shocks + n_assets, 1) * np.dtype(float).itemsize
+        chunk_size = max(1, int(MONTE_CARLO_CHUNK_BYTES // bytes_per_path))
+    chunk_size = min(int(chunk_size), num_simulations)
+    if antithetic and chunk_size > 1:
+        chunk_size -= chunk_size % 2  # keep mirror pairs inside one chunk
+    return chunk_size
+
+
 def run_monte_carlo(
     risk_result: RiskAnalysisResult,
     num_simulations: int = 1000,
     time_horizon_months: int = 12,
     portfolio_value: Optional[float] = None,
+    *,
+    seed: Optional[int | np.random.Generator] = None,
+    antithetic: bool = False,
+    sampling: str = "pseudo",
+    chunk_size: Optional[int] = None,
+    model: str = "covariance",
+    factor_covariance: Optional[FactorCovariance] = None,
 ) -> Dict[str, Any]:
     """
     Run monthly Monte Carlo simulation from RiskAnalysisResult inputs.
 
+    Paths are simulated in chunks so the per-asset shock tensor never exceeds
+    ``MONTE_CARLO_CHUNK_BYTES`` (or ``chunk_size`` paths); only the portfolio
+    value paths, ``num_simulations x (time_horizon_months + 1)``, are kept for
+    the exact percentile and terminal statistics.
+
+    Args:
+        seed: Seed or ``np.random.Generator`` for reproducible runs.
+        antithetic: Pair every shock path with its mirror image.
+        sampling: ``"pseudo"`` (default) or ``"sobol"`` for scrambled
+            quasi-random shocks on the leading principal directions.
+        chunk_size: Paths per chunk; defaults to the memory budget.
+        model: ``"covariance"`` (default) factors the asset covariance;
+            ``"factor"`` draws K factor shocks plus N independent residuals
+            from the risk model's ``FactorCovariance``, which is O(NK) per
+            step and stays well-posed when there are more names than months
+            of history.  Falls back to ``"covariance"`` (with a warning)
+            when no factor model is available.
+        factor_covariance: ``PortfolioRiskModel.factor_covariance`` for the
+            result's tickers; looked up from ``analysis_metadata`` when omitted.
+
     Notes:
     - Uses monthly covariance directly (no annual-to-monthly scaling).
     - Floors asset monthly returns at -99% to avoid impossible <-100% asset moves.
@@ -237,6 +417,12 @@ def run_monte_carlo(
         raise ValueError("num_simulations must be > 0")
     if time_horizon_months <= 0:
         raise ValueError("time_horizon_months must be > 0")
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"sampling must be one of {SAMPLING_METHODS}")
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0")
+    if model not in SIMULATION_MODELS:
+        raise ValueError(f"model must be one of {SIMULATION_MODELS}")
 
     initial_value = _safe_float(
         portfolio_value if portfolio_value is not None else getattr(risk_result, "total_value", None),
@@ -252,25 +438,59 @@ def run_monte_carlo(
 
     weight_vector = _resolve_weight_vector(tickers, raw_weights)
     monthly_drift = _resolve_monthly_drift(risk_result, tickers)
-    transform = _build_correlation_transform(covariance)
+
+    warnings_out: list[str] = []
+    factor_model = None
+    if model == "factor":
+        if factor_covariance is None:
+            factor_covariance = _resolve_factor_covariance(risk_result, tickers)
+        if factor_covariance is not None:
+            factor_model = _build_factor_model(factor_covariance, tickers)
+        if factor_model is None:
+            warnings_out.append(
+                "Factor model unavailable (no factor covariance for these tickers); "
+                "simulated from the asset covariance instead"
+            )
+    if factor_model is not None:
+        loadings, residual_vol = factor_model
+    else:
+        loadings = _build_correlation_transform(covariance)
+        if sampling == "sobol":
+            loadings = _principal_transform(loadings)
+        residual_vol = None
 
     n_assets = len(tickers)
-    rng = np.random.default_rng()
-    z = rng.standard_normal(size=(num_simulations, time_horizon_months, n_assets))
-    correlated_shocks = z @ transform.T
-    monthly_asset_returns = correlated_shocks + monthly_drift.reshape(1, 1, -1)
-    monthly_asset_returns = np.clip(monthly_asset_returns, -0.99, None)
-
-    monthly_portfolio_returns = monthly_asset_returns @ weight_vector
-    monthly_portfolio_returns = np.clip(monthly_portfolio_returns, -0.99, None)
-
-    growth = 1.0 + monthly_portfolio_returns
-    compounded = initial_value * np.cumprod(growth, axis=1)
-    paths = np.concatenate(
-        [np.full((num_simulations, 1), initial_value, dtype=float), compounded],
-        axis=1,
+    n_factors = loadings.shape[1]
+    n_shocks = n_factors + (n_assets if residual_vol is not None else 0)
+    sampler = _ShockSampler(
+        np.random.default_rng(seed),
+        time_horizon_months,
+        n_shocks,
+        sampling=sampling,
+        antithetic=antithetic,
+    )
+    step = _resolve_chunk_size(
+        num_simulations, time_horizon_months, n_shocks, n_assets, chunk_size, antithetic
     )
 
+    paths = np.empty((num_simulations, time_horizon_months + 1), dtype=float)
+    paths[:, 0] = initial_value
+    for start in range(0, num_simulations, step):
+        stop = min(start + step, num_simulations)
+        shocks = sampler.draw(stop - start)
+        monthly_asset_returns = shocks[:, :, :n_factors] @ loadings.T
+        if residual_vol is not None:
+            monthly_asset_returns += shocks[:, :, n_factors:] * residual_vol
+        del shocks
+        monthly_asset_returns += monthly_drift
+        np.maximum(monthly_asset_returns, -0.99, out=monthly_asset_returns)
+
+        growth = monthly_asset_returns @ weight_vector
+        np.maximum(growth, -0.99, out=growth)
+        growth += 1.0
+        np.cumprod(growth, axis=1, out=paths[start:stop, 1:])
+        paths[start:stop, 1:] *= initial_value
+
     percentile_levels = [5, 25, 50, 75, 95]
     percentile_matrix = np.percentile(paths, percentile_levels, axis=0)
     percentile_paths = {
@@ -303,10 +523,13 @@ def run_monte_carlo(
         "max_loss_pct": float(np.min(terminal_returns_pct)),
     }
 
-    return {
+    result = {
         "num_simulations": int(num_simulations),
         "time_horizon_months": int(time_horizon_months),
         "initial_value": float(initial_value),
         "percentile_paths": percentile_paths,
         "terminal_distribution": terminal_distribution,
     }
+    if warnings_out:
+        result["warnings"] = warnings_out
+    return result
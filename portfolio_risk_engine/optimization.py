@@ -11,6 +11,7 @@ Agent orientation:
 Called by:
     - ``run_risk.run_min_variance``
     - ``run_risk.run_max_return``
+    - efficient-frontier service/tool wrappers (``optimize_efficient_frontier``)
 
 Primary flow:
     1) Resolve portfolio/risk config.
@@ -19,8 +20,9 @@ Primary flow:
     4) Return ``OptimizationResult``.
 """
 
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Union
 from datetime import datetime, UTC
+import time
 
 from portfolio_risk_engine.results import OptimizationResult
 from portfolio_risk_engine.data_objects import PortfolioData, RiskLimitsData
@@ -34,6 +36,7 @@ from portfolio_risk_engine.portfolio_optimizer import (
     run_min_var,
     run_max_return_portfolio,
 )
+from portfolio_risk_engine.efficient_frontier import compute_efficient_frontier
 
 # Import logging decorators for optimization
 from portfolio_risk_engine._logging import (
@@ -48,6 +51,7 @@ from portfolio_risk_engine._logging import (
 def optimize_min_variance(
     portfolio: Union[str, PortfolioData],
     risk_limits: Union[str, RiskLimitsData, Dict[str, Any], None] = "risk_limits.yaml",
+    covariance_model: Optional[str] = None,
 ) -> OptimizationResult:
     """
     Run minimum-variance optimization and return ``OptimizationResult``.
@@ -61,6 +65,8 @@ def optimize_min_variance(
     ----------
     portfolio : Union[str, PortfolioData]
         Portfolio input as YAML filepath or PortfolioData object.
+    covariance_model : str, optional
+        "sample", "factor" or "auto"; defaults to ``OPTIMIZER_COVARIANCE_MODEL``.
         
     Returns
     -------
@@ -108,8 +114,9 @@ def optimize_min_variance(
         config       = config,
         risk_config  = risk_config,
         proxies      = config["stock_factor_proxies"],
-        fmp_ticker_map = fmp_ticker_map,
+        ticker_alias_map = fmp_ticker_map,
         instrument_types = instrument_types,
+        covariance_model = covariance_model,
     )
     
     # --- Return OptimizationResult object ----------------------------------
@@ -137,6 +144,7 @@ def optimize_min_variance(
 def optimize_max_return(
     portfolio: Union[str, PortfolioData],
     risk_limits: Union[str, RiskLimitsData, Dict[str, Any], None] = "risk_limits.yaml",
+    covariance_model: Optional[str] = None,
 ) -> OptimizationResult:
     """
     Run maximum-return optimization and return ``OptimizationResult``.
@@ -149,6 +157,8 @@ def optimize_max_return(
     ----------
     portfolio : Union[str, PortfolioData]
         Portfolio input as YAML filepath or PortfolioData object.
+    covariance_model : str, optional
+        "sample", "factor" or "auto"; defaults to ``OPTIMIZER_COVARIANCE_MODEL``.
         
     Returns
     -------
@@ -196,8 +206,9 @@ def optimize_max_return(
         config      = config,
         risk_config = risk_config,
         proxies     = config["stock_factor_proxies"],
-        fmp_ticker_map = fmp_ticker_map,
+        ticker_alias_map = fmp_ticker_map,
         instrument_types = instrument_types,
+        covariance_model = covariance_model,
     )
     
     # --- Return OptimizationResult object --------------------------------
@@ -215,4 +226,80 @@ def optimize_max_return(
             "original_weights": weights,
             "risk_limits": risk_config  # Pass the actual risk limits configuration
         }
-    ) 
+    )
+
+
+@log_errors("high")
+@log_operation("efficient_frontier")
+@log_timing(60.0)
+def optimize_efficient_frontier(
+    portfolio: Union[str, PortfolioData],
+    risk_limits: Union[str, RiskLimitsData, Dict[str, Any], None] = "risk_limits.yaml",
+    n_points: int = 15,
+    covariance_model: Optional[str] = None,
+):
+    """
+    Compute the efficient frontier and return ``EfficientFrontierResult``.
+
+    Contract notes:
+    - Same input flexibility as ``optimize_max_return``; the portfolio's
+      ``expected_returns`` drive the return axis.
+    - Intermediate points are solved by ``compute_efficient_frontier`` in
+      parallel worker processes (``OPTIMIZER_FRONTIER_WORKERS``).
+
+    Parameters
+    ----------
+    portfolio : Union[str, PortfolioData]
+        Portfolio input as YAML filepath or PortfolioData object.
+    n_points : int
+        Requested frontier points (clamped to the engine's bounds).
+    covariance_model : str, optional
+        "sample", "factor" or "auto"; defaults to ``OPTIMIZER_COVARIANCE_MODEL``.
+
+    Returns
+    -------
+    EfficientFrontierResult
+        Frontier points, endpoints, current portfolio and solve metadata.
+    """
+    from core.result_objects import EfficientFrontierResult
+
+    started = time.perf_counter()
+
+    # --- load configs ------------------------------------------------------
+    config, source_file = resolve_portfolio_config(portfolio)
+    risk_config = resolve_risk_config(risk_limits)
+
+    fmp_ticker_map = config.get("fmp_ticker_map")
+    currency_map = config.get("currency_map")
+    instrument_types = config.get("instrument_types")
+    price_fetcher = lambda t: latest_price(
+        t,
+        fmp_ticker_map=fmp_ticker_map,
+        currency=currency_map.get(t) if currency_map else None,
+        instrument_types=instrument_types,
+    )
+
+    weights = standardize_portfolio_input(
+        config["portfolio_input"],
+        price_fetcher,
+        currency_map=currency_map,
+        fmp_ticker_map=fmp_ticker_map,
+    )["weights"]
+
+    # --- run the engine ----------------------------------------------------
+    frontier = compute_efficient_frontier(
+        weights          = weights,
+        config           = config,
+        risk_config      = risk_config,
+        proxies          = config["stock_factor_proxies"],
+        expected_returns = config.get("expected_returns") or {},
+        ticker_alias_map = fmp_ticker_map,
+        instrument_types = instrument_types,
+        n_points         = n_points,
+        covariance_model = covariance_model,
+    )
+
+    return EfficientFrontierResult(
+        computation_time_s=time.perf_counter() - started,
+        **frontier,
+    )
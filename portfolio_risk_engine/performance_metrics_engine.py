@@ -3,6 +3,8 @@
 Called by:
 - ``portfolio_risk.calculate_portfolio_performance_metrics``.
 - Core/service wrappers that need canonical performance metric payloads.
+- ``backtest_engine.run_backtest_batch`` (one call for many portfolios via
+  ``compute_performance_metrics_batch``).
 
 Contract notes:
 - Inputs must be aligned monthly return series with identical DatetimeIndex.
@@ -16,11 +18,51 @@ from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 
 from fmp.compat import fetch_daily_close
 
 
+def _validate_aligned_returns(portfolio_returns, benchmark_returns):
+    if len(portfolio_returns) != len(benchmark_returns):
+        raise ValueError("portfolio_returns and benchmark_returns must have the same length")
+    if not isinstance(portfolio_returns.index, pd.DatetimeIndex) or not isinstance(
+        benchmark_returns.index, pd.DatetimeIndex
+    ):
+        raise ValueError("portfolio_returns and benchmark_returns must use DatetimeIndex")
+    if not portfolio_returns.index.equals(benchmark_returns.index):
+        raise ValueError("portfolio_returns and benchmark_returns must have the same index")
+    if portfolio_returns.isna().any(axis=None) or benchmark_returns.isna().any():
+        raise ValueError("portfolio_returns and benchmark_returns must not contain NaN values")
+
+
+def _drawdown_metadata(drawdown):
+    """Peak/trough/recovery dates of the deepest drawdown in one drawdown series."""
+    max_dd_trough_idx = drawdown.idxmin()
+
+    pre_trough = drawdown.loc[:max_dd_trough_idx]
+    at_peak = pre_trough[pre_trough >= -1e-10]
+    if len(at_peak) > 0:
+        max_dd_peak_idx = at_peak.index[-1]
+    else:
+        max_dd_peak_idx = pre_trough.index[0]
+
+    post_trough = drawdown.loc[max_dd_trough_idx:]
+    recovered = post_trough[post_trough >= -1e-10]
+    recovered_after = recovered[recovered.index > max_dd_trough_idx]
+    recovery_date = recovered_after.index[0] if len(recovered_after) > 0 else None
+
+    drawdown_duration_days = (max_dd_trough_idx - max_dd_peak_idx).days
+    recovery_days = (recovery_date - max_dd_trough_idx).days if recovery_date else None
+
+    return {
+        "drawdown_peak_date": max_dd_peak_idx.date().isoformat(),
+        "drawdown_trough_date": max_dd_trough_idx.date().isoformat(),
+        "drawdown_duration_days": drawdown_duration_days,
+        "drawdown_recovery_date": recovery_date.date().isoformat() if recovery_date else None,
+        "drawdown_recovery_days": recovery_days,
+    }
+
+
 def compute_performance_metrics(
     portfolio_returns,
     benchmark_returns,
@@ -34,24 +76,50 @@ def compute_performance_metrics(
 
     Ownership:
     - This is the canonical metrics engine; wrappers should not duplicate
-      Sharpe/Sortino/CAPM logic.
+      Sharpe/Sortino/CAPM logic.  The computation itself lives in
+      ``compute_performance_metrics_batch``; a single series is a one-column
+      batch.
 
     Debug pointer:
     - If alpha/beta fields are missing, inspect CAPM preconditions and warning
       text in the returned payload.
     """
+    _validate_aligned_returns(portfolio_returns, benchmark_returns)
+    batch = compute_performance_metrics_batch(
+        portfolio_returns.to_frame(name=0),
+        benchmark_returns,
+        risk_free_rate,
+        benchmark_ticker,
+        start_date,
+        end_date,
+        min_capm_observations=min_capm_observations,
+    )
+    return batch[0]
+
+
+def compute_performance_metrics_batch(
+    portfolio_returns,
+    benchmark_returns,
+    risk_free_rate,
+    benchmark_ticker,
+    start_date,
+    end_date,
+    min_capm_observations=None,
+):
+    """Compute ``compute_performance_metrics`` for every column of a returns frame.
+
+    ``portfolio_returns`` is a months × portfolios DataFrame aligned with
+    ``benchmark_returns`` (same DatetimeIndex, no NaN).  Returns, volatility,
+    Sortino, CAPM (closed-form OLS), drawdowns and rolling windows are
+    computed column-wise in one pass; only the per-portfolio payload dicts
+    and drawdown dates are assembled in a loop.
+
+    Returns ``{column: metrics}`` with the same payload per column as
+    ``compute_performance_metrics``.
+    """
 
     eps = 1e-12
-    if len(portfolio_returns) != len(benchmark_returns):
-        raise ValueError("portfolio_returns and benchmark_returns must have the same length")
-    if not isinstance(portfolio_returns.index, pd.DatetimeIndex) or not isinstance(
-        benchmark_returns.index, pd.DatetimeIndex
-    ):
-        raise ValueError("portfolio_returns and benchmark_returns must use DatetimeIndex")
-    if not portfolio_returns.index.equals(benchmark_returns.index):
-        raise ValueError("portfolio_returns and benchmark_returns must have the same index")
-    if portfolio_returns.isna().any() or benchmark_returns.isna().any():
-        raise ValueError("portfolio_returns and benchmark_returns must not contain NaN values")
+    _validate_aligned_returns(portfolio_returns, benchmark_returns)
     if min_capm_observations is None:
         from portfolio_risk_engine.config import DATA_QUALITY_THRESHOLDS
 
@@ -59,14 +127,15 @@ def compute_performance_metrics(
             "min_observations_for_capm_regression", 12
         )
 
+    returns = portfolio_returns.astype(float)
     risk_free_monthly = risk_free_rate / 12
 
     # Basic performance metrics
-    total_months = len(portfolio_returns)
+    total_months = len(returns)
     years = total_months / 12
 
     # Total returns
-    total_portfolio_return = (1 + portfolio_returns).prod() - 1
+    total_portfolio_return = (1 + returns).prod() - 1
     total_benchmark_return = (1 + benchmark_returns).prod() - 1
 
     # Annualized returns (CAGR)
@@ -74,19 +143,17 @@ def compute_performance_metrics(
     annualized_benchmark_return = (1 + total_benchmark_return) ** (1 / years) - 1
 
     # Volatility (annualized)
-    portfolio_volatility = portfolio_returns.std() * np.sqrt(12)
+    portfolio_volatility = returns.std() * np.sqrt(12)
     benchmark_volatility = benchmark_returns.std() * np.sqrt(12)
 
     # Excess returns
-    portfolio_excess = portfolio_returns - risk_free_monthly
+    portfolio_excess = returns - risk_free_monthly
     benchmark_excess = benchmark_returns - risk_free_monthly
-    tracking_error = (portfolio_returns - benchmark_returns).std() * np.sqrt(12)
+    tracking_error = returns.sub(benchmark_returns, axis=0).std() * np.sqrt(12)
 
     # Risk-adjusted metrics
-    sharpe_ratio = (
-        (annualized_portfolio_return - risk_free_rate) / portfolio_volatility
-        if portfolio_volatility > 0
-        else 0
+    sharpe_ratio = ((annualized_portfolio_return - risk_free_rate) / portfolio_volatility).where(
+        portfolio_volatility > 0, 0.0
     )
     benchmark_sharpe = (
         (annualized_benchmark_return - risk_free_rate) / benchmark_volatility
@@ -95,216 +162,185 @@ def compute_performance_metrics(
     )
 
     # Sortino ratio (downside deviation)
-    downside_returns = portfolio_returns[portfolio_returns < risk_free_monthly] - risk_free_monthly
+    downside = returns < risk_free_monthly
+    downside_count = downside.sum()
+    downside_sq = ((returns - risk_free_monthly) ** 2).where(downside, 0.0).sum()
     downside_deviation = (
-        np.sqrt((downside_returns**2).mean()) * np.sqrt(12) if len(downside_returns) > 0 else 0
-    )
-    sortino_ratio = (
-        (annualized_portfolio_return - risk_free_rate) / downside_deviation
-        if downside_deviation > 0
-        else 0
+        np.sqrt(downside_sq / downside_count.where(downside_count > 0)) * np.sqrt(12)
+    ).fillna(0.0)
+    sortino_ratio = ((annualized_portfolio_return - risk_free_rate) / downside_deviation).where(
+        downside_deviation > 0, 0.0
     )
 
     # Information ratio
     excess_return_vs_benchmark = annualized_portfolio_return - annualized_benchmark_return
-    information_ratio = excess_return_vs_benchmark / tracking_error if tracking_error > 0 else 0
+    information_ratio = (excess_return_vs_benchmark / tracking_error).where(tracking_error > 0, 0.0)
 
-    # Alpha and Beta (CAPM)
+    # Alpha and Beta (CAPM): closed-form OLS of portfolio_excess on benchmark_excess
     capm_warning = None
-    if len(portfolio_returns) >= min_capm_observations:  # Need sufficient data for regression
-        try:
-            bench_std = float(benchmark_excess.std(ddof=0))
-            port_std = float(portfolio_excess.std(ddof=0))
-
-            # Degenerate series (zero variance) can produce noisy warnings in statsmodels.
-            # Use closed-form fallback instead of forcing OLS on singular inputs.
-            if bench_std <= eps or port_std <= eps:
-                beta = 0.0
-                alpha_annual = float(portfolio_excess.mean() * 12.0)
-                r_squared = 0.0
-            else:
-                # Simple linear regression: portfolio_excess = alpha + beta * benchmark_excess
-                X = pd.DataFrame(
-                    {
-                        "const": np.ones(len(benchmark_excess), dtype=float),
-                        "benchmark_excess": benchmark_excess.to_numpy(dtype=float),
-                    },
-                    index=benchmark_excess.index,
-                )
-                y = portfolio_excess.to_numpy(dtype=float)
-                model = sm.OLS(y, X).fit()
-                alpha_monthly = float(model.params.iloc[0])  # const
-                beta = float(model.params.iloc[1])  # benchmark_excess
-                alpha_annual = alpha_monthly * 12.0
-
-                y_hat = model.fittedvalues.to_numpy(dtype=float)
-                sst = float(np.sum((y - y.mean()) ** 2))
-                sse = float(np.sum((y - y_hat) ** 2))
-                r_squared = 1.0 - (sse / sst) if sst > eps else 0.0
-        except Exception as exc:
-            alpha_annual = None
-            beta = None
-            r_squared = None
-            capm_warning = (
-                "CAPM regression failed; alpha/beta/r_squared not computed "
-                f"({type(exc).__name__})"
-            )
+    if total_months >= min_capm_observations:  # Need sufficient data for regression
+        x = benchmark_excess.to_numpy(dtype=float)
+        y = portfolio_excess.to_numpy(dtype=float)
+        x_c = x - x.mean()
+        y_c = y - y.mean(axis=0)
+        bench_std = float(x.std(ddof=0))
+        port_std = y.std(axis=0, ddof=0)
+
+        # Degenerate series (zero variance): beta 0, alpha = mean excess.
+        degenerate = (port_std <= eps) | (bench_std <= eps)
+        beta_values = np.zeros(y.shape[1]) if bench_std <= eps else (x_c @ y_c) / (x_c @ x_c)
+        beta_values = np.where(degenerate, 0.0, beta_values)
+        alpha_values = (y.mean(axis=0) - beta_values * x.mean()) * 12.0
+        sse = ((y_c - np.outer(x_c, beta_values)) ** 2).sum(axis=0)
+        sst = (y_c ** 2).sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2_values = np.where(sst > eps, 1.0 - sse / sst, 0.0)
+        r2_values = np.where(degenerate, 0.0, r2_values)
+        alpha_annual = pd.Series(alpha_values, index=returns.columns)
+        beta = pd.Series(beta_values, index=returns.columns)
+        r_squared = pd.Series(r2_values, index=returns.columns)
     else:
-        alpha_annual = None
-        beta = None
-        r_squared = None
+        alpha_annual = beta = r_squared = None
         capm_warning = (
             "Insufficient data for CAPM regression "
-            f"({len(portfolio_returns)} months < {min_capm_observations} required); "
+            f"({total_months} months < {min_capm_observations} required); "
             "alpha/beta/r_squared not computed"
         )
 
     # Maximum Drawdown
-    cumulative_returns = (1 + portfolio_returns).cumprod()
-    running_max = cumulative_returns.expanding().max()
+    cumulative_returns = (1 + returns).cumprod()
+    running_max = cumulative_returns.cummax()
     drawdown = (cumulative_returns - running_max) / running_max
     maximum_drawdown = drawdown.min()
 
     # Calmar Ratio (return / max drawdown)
-    calmar_ratio = (
-        abs(annualized_portfolio_return / maximum_drawdown) if maximum_drawdown < -0.001 else 0
+    calmar_ratio = (annualized_portfolio_return / maximum_drawdown).abs().where(
+        maximum_drawdown < -0.001, 0.0
     )
 
-    # Drawdown metadata
-    if maximum_drawdown < -0.001:
-        max_dd_trough_idx = drawdown.idxmin()
-
-        pre_trough = drawdown.loc[:max_dd_trough_idx]
-        at_peak = pre_trough[pre_trough >= -1e-10]
-        if len(at_peak) > 0:
-            max_dd_peak_idx = at_peak.index[-1]
-        else:
-            max_dd_peak_idx = pre_trough.index[0]
-
-        post_trough = drawdown.loc[max_dd_trough_idx:]
-        recovered = post_trough[post_trough >= -1e-10]
-        recovered_after = recovered[recovered.index > max_dd_trough_idx]
-        recovery_date = recovered_after.index[0] if len(recovered_after) > 0 else None
-
-        drawdown_duration_days = (max_dd_trough_idx - max_dd_peak_idx).days
-        recovery_days = (recovery_date - max_dd_trough_idx).days if recovery_date else None
-
-        drawdown_metadata = {
-            "drawdown_peak_date": max_dd_peak_idx.date().isoformat(),
-            "drawdown_trough_date": max_dd_trough_idx.date().isoformat(),
-            "drawdown_duration_days": drawdown_duration_days,
-            "drawdown_recovery_date": recovery_date.date().isoformat() if recovery_date else None,
-            "drawdown_recovery_days": recovery_days,
-        }
-    else:
-        drawdown_metadata = {
-            "drawdown_peak_date": None,
-            "drawdown_trough_date": None,
-            "drawdown_duration_days": None,
-            "drawdown_recovery_date": None,
-            "drawdown_recovery_days": None,
-        }
-
     # Win rate and average win/loss
-    positive_months = portfolio_returns[portfolio_returns > 0]
-    negative_months = portfolio_returns[portfolio_returns < 0]
-    win_rate = len(positive_months) / len(portfolio_returns) if len(portfolio_returns) > 0 else 0
-    avg_win = positive_months.mean() if len(positive_months) > 0 else 0
-    avg_loss = negative_months.mean() if len(negative_months) > 0 else 0
-    win_loss_ratio = abs(avg_win / avg_loss) if avg_loss != 0 else 0
-
-    monthly_returns = {
-        k.date().isoformat(): float(v) for k, v in portfolio_returns.round(4).to_dict().items()
-    }
-    benchmark_monthly_returns = {
-        k.date().isoformat(): float(v) for k, v in benchmark_returns.round(4).to_dict().items()
-    }
+    positive = returns > 0
+    negative = returns < 0
+    positive_count = positive.sum()
+    negative_count = negative.sum()
+    win_rate = positive_count / total_months
+    avg_win = returns.where(positive).mean().fillna(0.0)
+    avg_loss = returns.where(negative).mean().fillna(0.0)
+    win_loss_ratio = (avg_win / avg_loss).abs().where(avg_loss != 0, 0.0)
+    average_monthly_return = returns.mean()
+    best_month = returns.max()
+    worst_month = returns.min()
+
+    iso_index = [k.date().isoformat() for k in returns.index]
+    rounded_returns = returns.round(4)
+    benchmark_monthly_returns = dict(
+        zip(iso_index, benchmark_returns.round(4).astype(float).tolist())
+    )
 
     # Rolling metrics (12-month trailing window, full window only)
-    if len(portfolio_returns) >= 12:
-        rolling_vol_series = portfolio_returns.rolling(window=12, min_periods=12).std() * np.sqrt(12)
-        rolling_mean_excess = (
-            portfolio_returns.rolling(window=12, min_periods=12).mean() - risk_free_monthly
-        )
-        rolling_sharpe_series = (rolling_mean_excess * 12) / rolling_vol_series.replace(0, np.nan)
+    if total_months >= 12:
+        rolling_vol_frame = returns.rolling(window=12, min_periods=12).std() * np.sqrt(12)
+        rolling_mean_excess = returns.rolling(window=12, min_periods=12).mean() - risk_free_monthly
+        rolling_sharpe_frame = (rolling_mean_excess * 12) / rolling_vol_frame.replace(0, np.nan)
+    else:
+        rolling_vol_frame = rolling_sharpe_frame = None
 
-        rolling_sharpe = {
-            k.date().isoformat(): round(float(v), 3)
-            for k, v in rolling_sharpe_series.dropna().to_dict().items()
-        }
-        rolling_volatility = {
-            k.date().isoformat(): round(float(v) * 100, 2)
-            for k, v in rolling_vol_series.dropna().to_dict().items()
+    results = {}
+    for column in returns.columns:
+        if maximum_drawdown[column] < -0.001:
+            drawdown_metadata = _drawdown_metadata(drawdown[column])
+        else:
+            drawdown_metadata = {
+                "drawdown_peak_date": None,
+                "drawdown_trough_date": None,
+                "drawdown_duration_days": None,
+                "drawdown_recovery_date": None,
+                "drawdown_recovery_days": None,
+            }
+
+        if rolling_vol_frame is not None:
+            rolling_sharpe = {
+                k.date().isoformat(): round(float(v), 3)
+                for k, v in rolling_sharpe_frame[column].dropna().to_dict().items()
+            }
+            rolling_volatility = {
+                k.date().isoformat(): round(float(v) * 100, 2)
+                for k, v in rolling_vol_frame[column].dropna().to_dict().items()
+            }
+        else:
+            rolling_sharpe = {}
+            rolling_volatility = {}
+
+        column_alpha = float(alpha_annual[column]) if alpha_annual is not None else None
+        column_beta = float(beta[column]) if beta is not None else None
+        column_r_squared = float(r_squared[column]) if r_squared is not None else None
+
+        # Performance summary
+        performance_metrics = {
+            "analysis_period": {
+                "start_date": start_date,
+                "end_date": end_date,
+                "total_months": total_months,
+                "years": round(years, 2),
+            },
+            "returns": {
+                "total_return": round(total_portfolio_return[column] * 100, 2),
+                "annualized_return": round(annualized_portfolio_return[column] * 100, 2),
+                "best_month": round(best_month[column] * 100, 2),
+                "worst_month": round(worst_month[column] * 100, 2),
+                "last_month_return": round(float(returns[column].iloc[-1]) * 100, 2),
+                "last_month_benchmark_return": round(float(benchmark_returns.iloc[-1]) * 100, 2),
+                "positive_months": int(positive_count[column]),
+                "negative_months": int(negative_count[column]),
+                "win_rate": round(win_rate[column] * 100, 1),
+            },
+            "risk_metrics": {
+                "volatility": round(portfolio_volatility[column] * 100, 2),
+                "maximum_drawdown": round(maximum_drawdown[column] * 100, 2),
+                "downside_deviation": round(downside_deviation[column] * 100, 2),
+                "tracking_error": round(tracking_error[column] * 100, 2),
+                **drawdown_metadata,
+            },
+            "risk_adjusted_returns": {
+                "sharpe_ratio": round(sharpe_ratio[column], 3),
+                "sortino_ratio": round(sortino_ratio[column], 3),
+                "information_ratio": round(information_ratio[column], 3),
+                "calmar_ratio": round(calmar_ratio[column], 3),
+            },
+            "benchmark_analysis": {
+                "benchmark_ticker": benchmark_ticker,
+                "alpha_annual": round(column_alpha * 100, 2) if column_alpha is not None else None,
+                "beta": round(column_beta, 3) if column_beta is not None else None,
+                "r_squared": round(column_r_squared, 3) if column_r_squared is not None else None,
+                "excess_return": round(excess_return_vs_benchmark[column] * 100, 2),
+            },
+            "benchmark_comparison": {
+                "portfolio_total_return": round(total_portfolio_return[column] * 100, 2),
+                "benchmark_total_return": round(total_benchmark_return * 100, 2),
+                "portfolio_return": round(annualized_portfolio_return[column] * 100, 2),
+                "benchmark_return": round(annualized_benchmark_return * 100, 2),
+                "portfolio_volatility": round(portfolio_volatility[column] * 100, 2),
+                "benchmark_volatility": round(benchmark_volatility * 100, 2),
+                "portfolio_sharpe": round(sharpe_ratio[column], 3),
+                "benchmark_sharpe": round(benchmark_sharpe, 3),
+            },
+            "monthly_stats": {
+                "average_monthly_return": round(average_monthly_return[column] * 100, 2),
+                "average_win": round(avg_win[column] * 100, 2),
+                "average_loss": round(avg_loss[column] * 100, 2),
+                "win_loss_ratio": round(win_loss_ratio[column], 2),
+            },
+            "risk_free_rate": round(risk_free_rate * 100, 2),
+            "monthly_returns": dict(zip(iso_index, rounded_returns[column].astype(float).tolist())),
+            "benchmark_monthly_returns": dict(benchmark_monthly_returns),
+            "rolling_sharpe": rolling_sharpe,
+            "rolling_volatility": rolling_volatility,
         }
-    else:
-        rolling_sharpe = {}
-        rolling_volatility = {}
-
-    # Performance summary
-    performance_metrics = {
-        "analysis_period": {
-            "start_date": start_date,
-            "end_date": end_date,
-            "total_months": total_months,
-            "years": round(years, 2),
-        },
-        "returns": {
-            "total_return": round(total_portfolio_return * 100, 2),
-            "annualized_return": round(annualized_portfolio_return * 100, 2),
-            "best_month": round(portfolio_returns.max() * 100, 2),
-            "worst_month": round(portfolio_returns.min() * 100, 2),
-            "last_month_return": round(float(portfolio_returns.iloc[-1]) * 100, 2),
-            "last_month_benchmark_return": round(float(benchmark_returns.iloc[-1]) * 100, 2),
-            "positive_months": len(positive_months),
-            "negative_months": len(negative_months),
-            "win_rate": round(win_rate * 100, 1),
-        },
-        "risk_metrics": {
-            "volatility": round(portfolio_volatility * 100, 2),
-            "maximum_drawdown": round(maximum_drawdown * 100, 2),
-            "downside_deviation": round(downside_deviation * 100, 2),
-            "tracking_error": round(tracking_error * 100, 2),
-            **drawdown_metadata,
-        },
-        "risk_adjusted_returns": {
-            "sharpe_ratio": round(sharpe_ratio, 3),
-            "sortino_ratio": round(sortino_ratio, 3),
-            "information_ratio": round(information_ratio, 3),
-            "calmar_ratio": round(calmar_ratio, 3),
-        },
-        "benchmark_analysis": {
-            "benchmark_ticker": benchmark_ticker,
-            "alpha_annual": round(alpha_annual * 100, 2) if alpha_annual is not None else None,
-            "beta": round(beta, 3) if beta is not None else None,
-            "r_squared": round(r_squared, 3) if r_squared is not None else None,
-            "excess_return": round(excess_return_vs_benchmark * 100, 2),
-        },
-        "benchmark_comparison": {
-            "portfolio_total_return": round(total_portfolio_return * 100, 2),
-            "benchmark_total_return": round(total_benchmark_return * 100, 2),
-            "portfolio_return": round(annualized_portfolio_return * 100, 2),
-            "benchmark_return": round(annualized_benchmark_return * 100, 2),
-            "portfolio_volatility": round(portfolio_volatility * 100, 2),
-            "benchmark_volatility": round(benchmark_volatility * 100, 2),
-            "portfolio_sharpe": round(sharpe_ratio, 3),
-            "benchmark_sharpe": round(benchmark_sharpe, 3),
-        },
-        "monthly_stats": {
-            "average_monthly_return": round(portfolio_returns.mean() * 100, 2),
-            "average_win": round(avg_win * 100, 2),
-            "average_loss": round(avg_loss * 100, 2),
-            "win_loss_ratio": round(win_loss_ratio, 2),
-        },
-        "risk_free_rate": round(risk_free_rate * 100, 2),
-        "monthly_returns": monthly_returns,
-        "benchmark_monthly_returns": benchmark_monthly_returns,
-        "rolling_sharpe": rolling_sharpe,
-        "rolling_volatility": rolling_volatility,
-    }
-    if capm_warning:
-        performance_metrics["warnings"] = [capm_warning]
+        if capm_warning:
+            performance_metrics["warnings"] = [capm_warning]
+        results[column] = performance_metrics
 
-    return performance_metrics
+    return results
 
 
 def compute_recent_returns(
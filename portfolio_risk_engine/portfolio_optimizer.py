@@ -4,14 +4,18 @@
 # In[1]:
 
 
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 import cvxpy as cp
 import pandas as pd
 from copy import deepcopy
 
 import pandas as pd
 
-from portfolio_risk_engine.portfolio_risk import build_portfolio_view, normalize_weights
+from portfolio_risk_engine.portfolio_risk import (
+    build_portfolio_view,
+    get_portfolio_risk_model,
+    normalize_weights,
+)
 try:
     from core.run_portfolio_risk import (  # type: ignore
         evaluate_portfolio_risk_limits,
@@ -81,6 +85,44 @@ def _safe_eval_beta_limits(portfolio_factor_betas, max_betas, **kwargs):
     return pd.DataFrame()
 
 
+def _risk_view(
+    weights: Dict[str, float],
+    start_date: str,
+    end_date: str,
+    proxies: Dict[str, Dict[str, Any]] | None,
+    *,
+    asset_classes: Dict[str, str] | None = None,
+    ticker_alias_map: Dict[str, str] | None = None,
+    currency_map: Dict[str, str] | None = None,
+    instrument_types: Dict[str, str] | None = None,
+    contract_identities: Dict[str, Any] | None = None,
+    security_identities: Dict[str, Any] | None = None,
+    security_types: Dict[str, str] | None = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    ``build_portfolio_view`` for ``weights`` plus the risk-model inputs behind it.
+
+    Optimizer and what-if evaluations all go through the cached view entry
+    point (LRU and second tier) with the same key arguments;
+    ``get_portfolio_risk_model(tickers, start_date, end_date, **risk_inputs)``
+    then returns the model the view re-weighted.  The summary is a shallow
+    copy, so callers may add keys without touching the cached view.
+    """
+    risk_inputs = dict(
+        stock_factor_proxies=proxies,
+        asset_classes=asset_classes,
+        ticker_alias_map=ticker_alias_map,
+        currency_map=currency_map,
+        instrument_types=instrument_types,
+        contract_identities=contract_identities,
+        security_identities=security_identities,
+    )
+    summary = build_portfolio_view(
+        weights, start_date, end_date, security_types=security_types, **risk_inputs
+    )
+    return dict(summary), risk_inputs
+
+
 # In[17]:
 
 
@@ -114,11 +156,17 @@ def simulate_portfolio_change(
     instrument_types: Dict[str, str] | None = None,
     asset_classes: Dict[str, str] | None = None,
     security_types: Dict[str, str] | None = None,
+    currency_map: Dict[str, str] | None = None,
+    contract_identities: Dict[str, Any] | None = None,
+    security_identities: Dict[str, Any] | None = None,
 ):
     """
     Build a *new* summary after applying `edits` (delta-weights).
     `edits` can add new tickers or override existing weights.
 
+    The summary is a re-weighting of the cached risk model from the base
+    run; only tickers the base run never saw are fetched and regressed.
+
     Example:
         new_summary, df_risk, df_beta = simulate_portfolio_change(
             weights,
@@ -133,17 +181,17 @@ def simulate_portfolio_change(
     # normalize
     new_w = normalize_weights(new_w)
 
-    summary = build_portfolio_view(
-        new_w,
-        start,
-        end,
-        expected_returns=None,
-        stock_factor_proxies=proxies,
+    summary, risk_inputs = _risk_view(
+        new_w, start, end, proxies,
         asset_classes=asset_classes,
         ticker_alias_map=ticker_alias_map,
+        currency_map=currency_map,
         instrument_types=instrument_types,
+        contract_identities=contract_identities,
+        security_identities=security_identities,
         security_types=security_types,
     )
+    risk_model = get_portfolio_risk_model(new_w, start, end, **risk_inputs)
 
     df_risk = _safe_eval_risk_limits(summary, risk_cfg, security_types=security_types)
 
@@ -153,6 +201,7 @@ def simulate_portfolio_change(
         end, 
         loss_limit_pct=risk_cfg["max_single_factor_loss"],
         ticker_alias_map=ticker_alias_map,
+        worst_losses=risk_model.worst_factor_losses(proxies, ticker_alias_map),
     )
     
     df_beta = _safe_eval_beta_limits(summary["portfolio_factor_betas"], max_betas)
@@ -160,6 +209,277 @@ def simulate_portfolio_change(
     return summary, df_risk, df_beta
 
 
+# ────────────────────────────────────────────────────────────────────────────
+# Parametric CVXPY problems
+#
+# The min-variance, max-return and efficient-frontier solves all share one
+# problem shape per universe: the data (covariance, expected returns, beta
+# rows and caps, weight cap, variance budget) enter as ``cp.Parameter``s, so
+# a cached problem is canonicalized once and every later solve only swaps
+# parameter values and warm-starts from the previous solution.
+# ────────────────────────────────────────────────────────────────────────────
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from portfolio_risk_engine.config import OPTIMIZER_COVARIANCE_MODEL, OPTIMIZER_PROBLEM_CACHE_SIZE
+from portfolio_risk_engine.portfolio_risk import FactorCovariance
+
+_MIN_VARIANCE_SOLVERS = [
+    ("ECOS", {"verbose": False}),
+    ("CLARABEL", {"verbose": False}),
+    ("MOSEK", {"verbose": False}),
+    ("SCS", {"verbose": False, "eps": 1e-6}),
+    ("OSQP", {"verbose": False, "eps_abs": 1e-6, "eps_rel": 1e-6, "adaptive_rho": True}),
+]
+_MAX_RETURN_SOLVERS = [
+    ("CLARABEL", {"verbose": False}),
+    ("OSQP", {"verbose": False, "eps_abs": 1e-5, "eps_rel": 1e-5}),
+    ("ECOS", {"verbose": False}),
+    ("SCS", {"verbose": False, "eps": 1e-4}),
+]
+
+_installed_solvers: set | None = None
+
+
+def _available_solvers(solvers):
+    global _installed_solvers
+    if _installed_solvers is None:
+        _installed_solvers = set(cp.installed_solvers())
+    return [(name, kwargs) for name, kwargs in solvers if name in _installed_solvers]
+
+
+def _covariance_root(cov) -> np.ndarray:
+    """``L`` with ``LᵀL = Σ`` (eigen square root; tiny negative eigenvalues clipped)."""
+    cov = np.asarray(cov, dtype=float)
+    vals, vecs = np.linalg.eigh((cov + cov.T) / 2.0)
+    return (vecs * np.sqrt(np.clip(vals, 0.0, None))).T
+
+
+def _risk_limit_rows(
+    tickers: List[str],
+    beta_mat: pd.DataFrame,
+    factor_caps: Dict[str, float],
+    proxy_caps: Dict[str, float],
+    proxies: Dict[str, Dict[str, Any]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack the aggregate factor and per-industry-proxy beta caps as ``|A w| ≤ b``.
+
+    Industry is capped per proxy only.  Rows that can never bind (infinite
+    cap, or all-zero coefficients with a non-negative cap) are dropped.
+    """
+    rows, caps = [], []
+    for fac, cap in factor_caps.items():
+        if fac not in beta_mat.columns or fac == "industry":
+            continue
+        rows.append(beta_mat[fac].to_numpy(dtype=float))
+        caps.append(float(cap))
+
+    industry = beta_mat["industry"] if "industry" in beta_mat.columns else None
+    for proxy, cap in proxy_caps.items():
+        coeff = np.zeros(len(tickers))
+        if industry is not None:
+            for i, t in enumerate(tickers):
+                if proxies.get(t, {}).get("industry") == proxy:
+                    coeff[i] = industry.loc[t]
+        rows.append(coeff)
+        caps.append(float(cap))
+
+    keep = [
+        i for i, (row, cap) in enumerate(zip(rows, caps))
+        if np.isfinite(cap) and (cap < 0 or not np.allclose(row, 0))
+    ]
+    if not keep:
+        return np.zeros((0, len(tickers))), np.zeros(0)
+    return np.vstack([rows[i] for i in keep]), np.array([caps[i] for i in keep])
+
+
+class _ParametricRiskProblem:
+    """
+    One compiled min-variance or max-return problem for a fixed universe.
+
+        minimise wᵀΣw  or  maximise μᵀw
+        s.t. Σ w = 1,  w ≤ c (|w| ≤ c),  w ≥ 0 (long-only),
+             |A w| ≤ b,  wᵀΣw ≤ v
+
+    With ``n_factors=None`` the risk term is ``‖L w‖²`` for a dense root
+    ``LᵀL = Σ`` (n² parameters).  With a factor count ``k`` it is
+    ``‖R y‖² + ‖√d ∘ w‖²`` with the auxiliary ``y = Bᵀw``, i.e.
+    ``Σ = B F Bᵀ + diag(d)`` (``RᵀR = F``), which grows with n·k.
+    ``μ``, ``c``, ``A``, ``b``, ``v`` and the risk inputs are parameters.
+    Solves are serialized by ``lock`` and warm-start from the previous
+    solution.
+    """
+
+    def __init__(
+        self,
+        n: int,
+        n_limits: int,
+        objective: str,
+        *,
+        allow_short: bool,
+        abs_concentration: bool,
+        n_factors: int | None = None,
+    ) -> None:
+        self.objective = objective
+        self.n_factors = n_factors
+        self.lock = threading.Lock()
+        self.w = cp.Variable(n)
+        self.max_weight = cp.Parameter(nonneg=True)
+        self.var_budget = cp.Parameter(nonneg=True)
+        self.mu = cp.Parameter(n) if objective == "max_return" else None
+        self.limit_rows = cp.Parameter((n_limits, n)) if n_limits else None
+        self.limit_caps = cp.Parameter(n_limits) if n_limits else None
+
+        if n_factors is None:
+            self.cov_root = cp.Parameter((n, n))
+            variance = cp.sum_squares(self.cov_root @ self.w)
+            cons = []
+        else:
+            self.idio_root = cp.Parameter(n, nonneg=True)
+            variance = cp.sum_squares(cp.multiply(self.idio_root, self.w))
+            cons = []
+            if n_factors:
+                self.loadings = cp.Parameter((n, n_factors))
+                self.factor_root = cp.Parameter((n_factors, n_factors))
+                exposure = cp.Variable(n_factors)
+                cons += [exposure == self.loadings.T @ self.w]
+                variance = variance + cp.sum_squares(self.factor_root @ exposure)
+        cons += [
+            cp.sum(self.w) == 1,
+            (cp.abs(self.w) if abs_concentration else self.w) <= self.max_weight,
+        ]
+        if not allow_short:
+            cons += [self.w >= 0]
+        if n_limits:
+            cons += [cp.abs(self.limit_rows @ self.w) <= self.limit_caps]
+        cons += [variance <= self.var_budget]
+
+        if objective == "max_return":
+            obj = cp.Maximize(self.mu @ self.w)
+        else:
+            obj = cp.Minimize(variance)
+        self.problem = cp.Problem(obj, cons)
+
+    def set_data(
+        self,
+        *,
+        risk: "np.ndarray | FactorCovariance",
+        max_weight: float,
+        var_budget: float,
+        limit_rows: np.ndarray,
+        limit_caps: np.ndarray,
+        mu: np.ndarray | None = None,
+    ) -> None:
+        """``risk`` is the dense covariance root, or the ``FactorCovariance``
+        for a factor-form problem."""
+        if self.n_factors is None:
+            self.cov_root.value = risk
+        else:
+            self.idio_root.value = np.sqrt(risk.idio_var)
+            if self.n_factors:
+                self.loadings.value = risk.loadings
+                self.factor_root.value = risk.factor_root()
+        self.max_weight.value = max_weight
+        self.var_budget.value = var_budget
+        if self.limit_rows is not None:
+            self.limit_rows.value = limit_rows
+            self.limit_caps.value = limit_caps
+        if self.mu is not None:
+            self.mu.value = mu
+
+    def solve(self, solvers, *, report: bool = True) -> np.ndarray | None:
+        """
+        Run the solver cascade; return the weight vector, or ``None`` when
+        every solver fails or the problem is infeasible (``report=False``).
+
+        With ``report=True`` progress is printed and failures raise
+        ``ValueError`` like the original one-shot solvers.
+        """
+        prob = self.problem
+        last_error = None
+        for name, kwargs in _available_solvers(solvers):
+            try:
+                prob.solve(solver=name, warm_start=True, **kwargs)
+            except Exception as e:
+                if report:
+                    print(f"❌ {name} failed: {str(e)}")
+                last_error = e
+                continue
+            if prob.status in ("optimal", "optimal_inaccurate"):
+                if report:
+                    print(f"✅ Solved with {name}")
+                return np.asarray(self.w.value, dtype=float)
+            if report:
+                print(f"⚠️ {name} returned status: {prob.status}")
+
+        if not report:
+            return None
+        if prob.status in ("infeasible", "unbounded"):
+            raise ValueError(f"Infeasible under current limits (status={prob.status})")
+        if last_error:
+            raise ValueError(f"All solvers failed. Last error: {last_error}")
+        raise ValueError(f"All solvers failed with status: {prob.status}")
+
+
+_problem_cache: "OrderedDict[tuple, _ParametricRiskProblem]" = OrderedDict()
+_problem_cache_lock = threading.Lock()
+
+
+def _get_parametric_problem(
+    objective: str,
+    tickers: List[str],
+    n_limits: int,
+    *,
+    allow_short: bool,
+    abs_concentration: bool,
+    n_factors: int | None = None,
+) -> _ParametricRiskProblem:
+    """LRU-cached ``_ParametricRiskProblem`` per (objective, universe, shape, flags)."""
+    key = (objective, tuple(tickers), n_limits, allow_short, abs_concentration, n_factors)
+    with _problem_cache_lock:
+        problem = _problem_cache.get(key)
+        if problem is not None:
+            _problem_cache.move_to_end(key)
+            return problem
+    problem = _ParametricRiskProblem(
+        len(tickers), n_limits, objective,
+        allow_short=allow_short, abs_concentration=abs_concentration, n_factors=n_factors,
+    )
+    with _problem_cache_lock:
+        problem = _problem_cache.setdefault(key, problem)
+        _problem_cache.move_to_end(key)
+        while len(_problem_cache) > max(1, OPTIMIZER_PROBLEM_CACHE_SIZE):
+            _problem_cache.popitem(last=False)
+    return problem
+
+
+def clear_optimizer_problem_cache() -> None:
+    with _problem_cache_lock:
+        _problem_cache.clear()
+
+
+def _resolve_covariance_model(
+    covariance_model: str | None,
+    n: int,
+    observation_count: int | None,
+) -> str:
+    """
+    ``"sample"`` (dense, conditioned Σ) or ``"factor"`` (B F Bᵀ + D).
+
+    ``"auto"`` picks the factor form when the universe has more names than
+    monthly observations, where the sample covariance is rank-deficient.
+    """
+    model = str(covariance_model or OPTIMIZER_COVARIANCE_MODEL or "sample").strip().lower()
+    if model == "auto":
+        return "factor" if observation_count is not None and n > int(observation_count) else "sample"
+    if model not in ("sample", "factor"):
+        raise ValueError(f"Unknown covariance_model {covariance_model!r}; use 'sample', 'factor' or 'auto'")
+    return model
+
+
 # ────────────────────────────────────────────────────────────────────────────
 @log_errors("high")
 @log_timing(10.0)
@@ -172,6 +492,9 @@ def solve_min_variance_with_risk_limits(
     ticker_alias_map: Dict[str, str] | None = None,
     instrument_types: Dict[str, str] | None = None,
     allow_short: bool = False,
+    covariance_model: str | None = None,
+    currency_map: Dict[str, str] | None = None,
+    contract_identities: Dict[str, Any] | None = None,
 ):
     """
     Solves minimum variance portfolio optimization subject to convex optimizer constraints.
@@ -215,6 +538,11 @@ def solve_min_variance_with_risk_limits(
         Asset-to-proxy mapping from portfolio.yaml stock_factor_proxies
     allow_short : bool, default False
         If True, allows negative weights (long/short optimization)
+    covariance_model : str, optional
+        "sample" (conditioned sample Σ), "factor" (Σ = B F Bᵀ + D from
+        ``PortfolioRiskModel.factor_covariance``) or "auto" (factor when
+        names outnumber monthly observations).  Defaults to
+        ``OPTIMIZER_COVARIANCE_MODEL``.
 
     Returns
     -------
@@ -231,26 +559,27 @@ def solve_min_variance_with_risk_limits(
     - Uses monthly covariance matrix with proper √12 annualization for volatility
     - Industry beta constraints are applied per-proxy (not globally) to avoid
       over-constraining the system with worst-performing proxy limits
-    - Solver: ECOS with QCP=True for second-order cone constraints
+    - Solver cascade: ECOS → CLARABEL → MOSEK → SCS, then OSQP (installed solvers only)
+    - The CVXPY problem is cached per universe with the covariance, caps and
+      limits as parameters, so repeated solves skip re-canonicalization and
+      warm-start from the previous solution
     - Expected result: High allocation to lowest-risk assets (bonds, low-beta stocks)
     """
     from portfolio_risk_engine.portfolio_risk import normalize_weights
-    from portfolio_risk_engine.risk_helpers import get_worst_monthly_factor_losses
     import numpy as np
     
     # Pre-normalize weights for internal consistency
     normalized_weights = normalize_weights(weights, normalize=True)
 
-    # Pre-compute covariance
-    base_summary = build_portfolio_view(
-        normalized_weights,
-        start,
-        end,
-        None,
-        proxies,
+    # Pre-compute covariance (re-weights the cached risk model when available)
+    base_summary, risk_inputs = _risk_view(
+        normalized_weights, start, end, proxies,
         ticker_alias_map=ticker_alias_map,
+        currency_map=currency_map,
         instrument_types=instrument_types,
+        contract_identities=contract_identities,
     )
+    risk_model = get_portfolio_risk_model(normalized_weights, start, end, **risk_inputs)
 
     # Filter tickers to only those present in covariance matrix (some may lack data)
     cov_tickers = set(base_summary["covariance_matrix"].columns)
@@ -268,164 +597,68 @@ def solve_min_variance_with_risk_limits(
     if not tickers:
         raise ValueError(f"No valid tickers with data found. All tickers failed: {original_tickers}")
 
-    n = len(tickers)
-    covariance_result = condition_covariance_for_optimization(
-        base_summary["covariance_matrix"].loc[tickers, tickers],
-        observation_count=base_summary.get("return_observation_count"),
+    covariance_model = _resolve_covariance_model(
+        covariance_model, len(tickers), base_summary.get("return_observation_count"),
     )
-    if covariance_result.applied:
-        portfolio_logger.warning(
-            "Min-variance covariance conditioned for optimization: %s",
-            covariance_result.metadata,
+    if covariance_model == "factor":
+        # Factor form: no dense Σ, so no conditioning either
+        factor_cov = risk_model.factor_covariance(tickers, ticker_alias_map)
+        risk_input, n_factors = factor_cov, len(factor_cov.factors)
+    else:
+        covariance_result = condition_covariance_for_optimization(
+            base_summary["covariance_matrix"].loc[tickers, tickers],
+            observation_count=base_summary.get("return_observation_count"),
         )
-    Σ = covariance_result.covariance.values
+        if covariance_result.applied:
+            portfolio_logger.warning(
+                "Min-variance covariance conditioned for optimization: %s",
+                covariance_result.metadata,
+            )
+        Σ = covariance_result.covariance.values
+        risk_input, n_factors = _covariance_root(Σ), None
 
     # Limits for betas
+    worst_proxy_loss = risk_model.worst_factor_losses(proxies, ticker_alias_map)
     max_betas = compute_max_betas(
         proxies, 
         start, 
         end, 
         loss_limit_pct=risk_cfg["max_single_factor_loss"],
         ticker_alias_map=ticker_alias_map,
+        worst_losses=worst_proxy_loss,
     )
 
-    # Variables
-    w = cp.Variable(n)
-
-    # Objective: minimise portfolio variance wᵀ Σ w
-    obj = cp.Minimize(cp.quad_form(w, Σ))
-
-    cons = []
-
-    # 1. Weights sum to 1 (fully invested)
-    cons += [cp.sum(w) == 1]
-
-    # 2. Concentration limit
+    # Constraint data: concentration, factor betas (industry handled per-proxy),
+    # per-proxy industry betas and the gross volatility limit
     max_weight = risk_cfg["concentration_limits"]["max_single_stock_weight"]
-    cons += [cp.abs(w) <= max_weight]
-
-    if not allow_short:
-        cons += [w >= 0]
-
-    # 3. Factor beta limits (exclude industry - handled per-proxy)
     beta_mat = base_summary["df_stock_betas"].fillna(0.0).loc[tickers]  # shape n × factors
-    for fac, max_b in max_betas.items():
-        if fac not in beta_mat or fac == "industry":  # Skip industry - handled per-proxy
-            continue
-        cons += [
-            cp.abs(beta_mat[fac].values @ w) <= max_b
-        ]
 
-    # 3b. Per-proxy beta constraints (industry-specific limits) - RE-ENABLED
     loss_lim = risk_cfg["max_single_factor_loss"]
-    worst_proxy_loss = get_worst_monthly_factor_losses(
-        proxies,
-        start,
-        end,
-        ticker_alias_map=ticker_alias_map,
-    )
-    
     proxy_caps = {
         proxy: (np.inf if loss >= 0 else loss_lim / loss)
         for proxy, loss in worst_proxy_loss.items()
     }
-    
-    # Build coefficient vectors for each proxy
-    for proxy, cap in proxy_caps.items():
-        coeff = []
-        for t in tickers:
-            this_proxy = proxies.get(t, {}).get("industry")
-            if this_proxy == proxy:
-                coeff.append(beta_mat.loc[t, "industry"])
-            else:
-                coeff.append(0.0)
-        
-        coeff_array = np.array(coeff)
-        if not np.allclose(coeff_array, 0):  # Only add constraint if non-zero
-            cons += [cp.abs(coeff_array @ w) <= cap]
+    limit_rows, limit_caps = _risk_limit_rows(tickers, beta_mat, max_betas, proxy_caps, proxies)
 
-    # 4. Gross volatility limit (annualize monthly covariance properly)
+    # Gross volatility limit (annual; covariance is monthly)
     max_vol = risk_cfg["portfolio_limits"]["max_volatility"]
-    cons += [cp.quad_form(w, Σ) <= (max_vol / np.sqrt(12)) ** 2]
-
-    prob = cp.Problem(obj, cons)
-    # Try QCP-capable solvers for second-order cone constraints
-    # Order solvers by reliability for QCP problems
-    qcp_solvers = [
-        ("ECOS", cp.ECOS, {"verbose": False}),
-        ("CLARABEL", cp.CLARABEL, {"verbose": False}),
-        ("MOSEK", cp.MOSEK, {"verbose": False}),  # If available
-        ("SCS", cp.SCS, {"verbose": False, "eps": 1e-6}),  # Try SCS with QCP
-    ]
-    
-    # Try non-QCP solvers as fallback (may fail for volatility constraints)
-    fallback_solvers = [
-        ("OSQP", cp.OSQP, {"verbose": False, "eps_abs": 1e-6, "eps_rel": 1e-6, "adaptive_rho": True}),
-    ]
-    
-    solved = False
-    last_error = None
-    
-    # First try QCP solvers
-    for name, solver, kwargs in qcp_solvers:
-        try:
-            # Check DCP compliance before solving
-            if not prob.is_dcp():
-                print(f"⚠️ Problem is not DCP compliant. Attempting with {name} anyway...")
-            
-            prob.solve(solver=solver, qcp=True, **kwargs)
-            if prob.status in ("optimal", "optimal_inaccurate"):
-                print(f"✅ Solved with {name} (QCP mode)")
-                solved = True
-                break
-            else:
-                print(f"⚠️ {name} returned status: {prob.status}")
-        except Exception as e:
-            error_msg = str(e)
-            if "DCP" in error_msg:
-                print(f"❌ {name} failed with DCP error: {error_msg}")
-                # Try enabling QCP mode explicitly
-                try:
-                    print(f"🔄 Retrying {name} with explicit QCP handling...")
-                    prob.solve(solver=solver, qcp=True, verbose=True, **kwargs)
-                    if prob.status in ("optimal", "optimal_inaccurate"):
-                        print(f"✅ Solved with {name} (QCP retry)")
-                        solved = True
-                        break
-                except Exception as retry_e:
-                    print(f"❌ {name} retry also failed: {str(retry_e)}")
-            else:
-                print(f"❌ {name} failed: {error_msg}")
-            last_error = e
-            continue
-    
-    # If QCP solvers failed, try fallback solvers  
-    if not solved:
-        print("🔄 Trying fallback solvers...")
-        for name, solver, kwargs in fallback_solvers:
-            try:
-                prob.solve(solver=solver, **kwargs)
-                if prob.status in ("optimal", "optimal_inaccurate"):
-                    print(f"✅ Solved with {name} (fallback)")
-                    solved = True
-                    break
-                else:
-                    print(f"⚠️ {name} returned status: {prob.status}")
-            except Exception as e:
-                print(f"❌ {name} failed: {str(e)}")
-                last_error = e
-                continue
-    
-    if not solved:
-        if last_error:
-            raise ValueError(f"All solvers failed. Last error: {last_error}")
-        else:
-            raise ValueError(f"All solvers failed with status: {prob.status}")
 
-    if prob.status not in ("optimal", "optimal_inaccurate"):
-        raise ValueError(f"Infeasible under current limits (status={prob.status})")
+    # Solve the cached parametric problem for this universe (warm-started)
+    problem = _get_parametric_problem(
+        "min_variance", tickers, len(limit_caps),
+        allow_short=allow_short, abs_concentration=True, n_factors=n_factors,
+    )
+    with problem.lock:
+        problem.set_data(
+            risk=risk_input,
+            max_weight=max_weight,
+            var_budget=(max_vol / np.sqrt(12)) ** 2,
+            limit_rows=limit_rows,
+            limit_caps=limit_caps,
+        )
+        w_opt = problem.solve(_MIN_VARIANCE_SOLVERS)
 
-    new_w = {t: float(w.value[i]) for i, t in enumerate(tickers)}
+    new_w = {t: float(w_opt[i]) for i, t in enumerate(tickers)}
     return new_w
 
 
@@ -454,6 +687,9 @@ def run_what_if(
     security_types: Dict[str, str] | None = None,
     *,           
     verbose: bool = True,
+    currency_map: Dict[str, str] | None = None,
+    contract_identities: Dict[str, Any] | None = None,
+    security_identities: Dict[str, Any] | None = None,
 ) -> Tuple[dict, pd.DataFrame, pd.DataFrame]:
     """
     Apply absolute weight shifts (`delta`) to `base_weights`, evaluate the
@@ -491,6 +727,9 @@ def run_what_if(
         instrument_types=instrument_types,
         asset_classes=asset_classes,
         security_types=security_types,
+        currency_map=currency_map,
+        contract_identities=contract_identities,
+        security_identities=security_identities,
     )
 
     # 2) optionally pretty-print
@@ -540,23 +779,23 @@ def evaluate_weights(
     proxies: Dict[str, Dict[str, Any]],
     ticker_alias_map: Dict[str, str] | None = None,
     instrument_types: Dict[str, str] | None = None,
+    currency_map: Dict[str, str] | None = None,
+    contract_identities: Dict[str, Any] | None = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Runs the standard risk + beta limit checks on a given weight dict.
     Returns (df_risk, df_beta) – no printing.
     """
-    from portfolio_risk_engine.portfolio_risk import build_portfolio_view
     from portfolio_risk_engine.risk_helpers import compute_max_betas
 
-    summary = build_portfolio_view(
-        weights,
-        start_date,
-        end_date,
-        expected_returns=None,
-        stock_factor_proxies=proxies,
+    summary, risk_inputs = _risk_view(
+        weights, start_date, end_date, proxies,
         ticker_alias_map=ticker_alias_map,
+        currency_map=currency_map,
         instrument_types=instrument_types,
+        contract_identities=contract_identities,
     )
+    risk_model = get_portfolio_risk_model(weights, start_date, end_date, **risk_inputs)
     summary = apply_conditioned_covariance_metrics(summary, weights)
 
     df_risk = _safe_eval_risk_limits(summary, risk_cfg)
@@ -567,6 +806,7 @@ def evaluate_weights(
         end_date=end_date,
         loss_limit_pct=risk_cfg["max_single_factor_loss"],
         ticker_alias_map=ticker_alias_map,
+        worst_losses=risk_model.worst_factor_losses(proxies, ticker_alias_map),
     )
 
     df_beta = _safe_eval_beta_limits(summary["portfolio_factor_betas"], max_betas)
@@ -586,26 +826,23 @@ def evaluate_optimized_weights(
     """Evaluate optimized weights: build portfolio view, run risk/beta/proxy checks.
 
     Returns (portfolio_summary, risk_table, factor_table, proxy_table).
-    Threads currency_map and contract_identities to build_portfolio_view() for
-    FX-sensitive and derivative portfolios.
+    Threads currency_map and contract_identities to the risk model for
+    FX-sensitive and derivative portfolios; the summary re-weights the cached
+    model from the base run instead of rebuilding the view.
     """
-    from portfolio_risk_engine.portfolio_risk import build_portfolio_view
     from portfolio_risk_engine.risk_helpers import compute_max_betas, calc_max_factor_betas
     from portfolio_risk_engine.config import PORTFOLIO_DEFAULTS
 
     max_single_factor_loss = risk_config.get("max_single_factor_loss") or -0.08
     expected_returns = config.get("expected_returns") or None
-    summary = build_portfolio_view(
-        weights,
-        start_date=config["start_date"],
-        end_date=config["end_date"],
-        expected_returns=None,
-        stock_factor_proxies=proxies,
+    summary, risk_inputs = _risk_view(
+        weights, config["start_date"], config["end_date"], proxies,
         ticker_alias_map=ticker_alias_map,
         currency_map=currency_map,
         instrument_types=instrument_types,
         contract_identities=contract_identities,
     )
+    risk_model = get_portfolio_risk_model(weights, config["start_date"], config["end_date"], **risk_inputs)
     summary = apply_conditioned_covariance_metrics(summary, weights)
 
     if expected_returns:
@@ -639,6 +876,7 @@ def evaluate_optimized_weights(
         config["end_date"],
         loss_limit_pct=max_single_factor_loss,
         ticker_alias_map=ticker_alias_map,
+        worst_losses=risk_model.worst_factor_losses(proxies, ticker_alias_map),
     )
     lookback_years = PORTFOLIO_DEFAULTS.get("worst_case_lookback_years", 10)
     _, max_betas_by_proxy, _ = calc_max_factor_betas(
@@ -896,7 +1134,7 @@ def run_what_if_scenario(
         def _drop_factors(df):
             return df
 
-    from portfolio_risk_engine.portfolio_risk import build_portfolio_view, normalize_weights
+    from portfolio_risk_engine.portfolio_risk import normalize_weights
     from portfolio_risk_engine.portfolio_optimizer import run_what_if
 
     _fmt_pct = lambda x: f"{x:.1%}"
@@ -915,6 +1153,15 @@ def run_what_if_scenario(
 
     ticker_alias_map = config.get("ticker_alias_map")
     instrument_types = config.get("instrument_types")
+    view_inputs = dict(
+        asset_classes=asset_classes,
+        ticker_alias_map=ticker_alias_map,
+        currency_map=config.get("currency_map"),
+        instrument_types=instrument_types,
+        contract_identities=config.get("contract_identities"),
+        security_identities=config.get("security_identities"),
+        security_types=security_types,
+    )
     max_single_factor_loss = risk_config.get("max_single_factor_loss") or -0.08
 
     # get proxy-level beta caps
@@ -928,52 +1175,41 @@ def run_what_if_scenario(
         max_single_factor_loss=max_single_factor_loss,
     )
 
+    # construct summary_base first so its risk model is cached for the scenario
+    summary_base, _ = _risk_view(
+        base_weights, config["start_date"], config["end_date"], proxies, **view_inputs
+    )
+
     # construct summary_new
     if new_weights:
         new_weights = normalize_weights(new_weights)
-        summary_new = build_portfolio_view(
-            new_weights, config["start_date"], config["end_date"],
-            expected_returns=None, stock_factor_proxies=proxies,
-            asset_classes=asset_classes,
-            ticker_alias_map=ticker_alias_map,
-            instrument_types=instrument_types,
-            security_types=security_types,
+        summary_new, _ = _risk_view(
+            new_weights, config["start_date"], config["end_date"], proxies, **view_inputs
         )
     else:
         summary_new, *_ = run_what_if(
             base_weights, delta, risk_config,
             config["start_date"], config["end_date"], proxies,
-            ticker_alias_map=ticker_alias_map,
-            instrument_types=instrument_types,
-            asset_classes=asset_classes,
-            security_types=security_types,
-            verbose=False
+            verbose=False,
+            **view_inputs,
         )
 
-    # construct summary_base
-    summary_base = build_portfolio_view(
-        base_weights, config["start_date"], config["end_date"],
-        expected_returns=None, stock_factor_proxies=proxies,
-        asset_classes=asset_classes,
-        ticker_alias_map=ticker_alias_map,
-        instrument_types=instrument_types,
-        security_types=security_types,
-    )
-
     # run risk tables
     def get_risk(summary):
         return _safe_eval_risk_limits(summary, risk_config, security_types=security_types)
 
+    # factor caps are weight-independent: compute once for base and scenario
+    from portfolio_risk_engine.risk_helpers import compute_max_betas
+    factor_max_betas = compute_max_betas(
+        proxies, config["start_date"], config["end_date"],
+        loss_limit_pct=max_single_factor_loss,
+        ticker_alias_map=ticker_alias_map,
+    )
+
     def get_betas(summary):
-        from portfolio_risk_engine.risk_helpers import compute_max_betas
-        max_betas = compute_max_betas(
-            proxies, config["start_date"], config["end_date"],
-            loss_limit_pct=max_single_factor_loss,
-            ticker_alias_map=ticker_alias_map,
-        )
         return _safe_eval_beta_limits(
             summary["portfolio_factor_betas"],
-            max_betas,
+            factor_max_betas,
             proxy_betas=summary["industry_variance"]["per_industry_group_beta"],
             max_proxy_betas=max_betas_by_proxy
         )
@@ -1020,6 +1256,9 @@ def run_min_var_optimiser(
     ticker_alias_map: Dict[str, str] | None = None,
     instrument_types: Dict[str, str] | None = None,
     echo: bool = True,
+    currency_map: Dict[str, str] | None = None,
+    contract_identities: Dict[str, Any] | None = None,
+    covariance_model: str | None = None,
 ) -> Dict[str, float]:
     """
     Minimum-variance portfolio under firm-wide limits
@@ -1048,7 +1287,8 @@ def run_min_var_optimiser(
     risk_cfg : parsed *risk_limits.yaml*  
     start_date, end_date : YYYY-MM-DD window for Σ & betas  
     proxies : `stock_factor_proxies` from portfolio YAML  
-    echo : print weights ≥ 0.01 % when True
+    echo : print weights ≥ 0.01 % when True  
+    covariance_model : "sample", "factor" or "auto" (see the solver)
 
     Returns
     -------
@@ -1064,6 +1304,9 @@ def run_min_var_optimiser(
         proxies,
         ticker_alias_map=ticker_alias_map,
         instrument_types=instrument_types,
+        currency_map=currency_map,
+        contract_identities=contract_identities,
+        covariance_model=covariance_model,
     )
 
     # 2. ---------- optional console output ---------------------------------
@@ -1093,10 +1336,14 @@ def run_min_var(
     proxies: Dict[str, Any],
     ticker_alias_map: Dict[str, str] | None = None,
     instrument_types: Dict[str, str] | None = None,
+    covariance_model: str | None = None,
 ) -> Tuple[Dict[str, float], pd.DataFrame, pd.DataFrame]:
     """
     Runs minimum-variance optimisation under risk constraints.
 
+    ``covariance_model`` ("sample", "factor" or "auto") is passed to the
+    solver; ``None`` uses ``OPTIMIZER_COVARIANCE_MODEL``.
+
     Returns
     -------
     Tuple of:
@@ -1122,6 +1369,9 @@ def run_min_var(
         ticker_alias_map=ticker_alias_map,
         instrument_types=instrument_types,
         echo       = False,
+        currency_map=config.get("currency_map"),
+        contract_identities=config.get("contract_identities"),
+        covariance_model=covariance_model,
     )
 
     risk_tbl, beta_tbl = evaluate_weights(
@@ -1130,6 +1380,8 @@ def run_min_var(
         proxies,
         ticker_alias_map=ticker_alias_map,
         instrument_types=instrument_types,
+        currency_map=config.get("currency_map"),
+        contract_identities=config.get("contract_identities"),
     )
     # LOGGING: Add minimum variance optimization completion logging
     # LOGGING: Add workflow state logging for optimization workflow completion here
@@ -1208,6 +1460,9 @@ def solve_max_return_with_risk_limits(
     ticker_alias_map: Dict[str, str] | None = None,
     instrument_types: Dict[str, str] | None = None,
     allow_short: bool = False,
+    covariance_model: str | None = None,
+    currency_map: Dict[str, str] | None = None,
+    contract_identities: Dict[str, Any] | None = None,
 ) -> Dict[str, float]:
     r"""Return the weight vector *w* that maximises expected portfolio return
     subject to solver-enforced convex risk limits.
@@ -1252,6 +1507,9 @@ def solve_max_return_with_risk_limits(
         Missing tickers default to 0.
     allow_short
         If ``True`` the lower-bound on *w* is removed (long/short optimisation).
+    covariance_model
+        ``"sample"``, ``"factor"`` or ``"auto"``; see
+        :pyfunc:`solve_min_variance_with_risk_limits`.
 
     Returns
     -------
@@ -1274,21 +1532,22 @@ def solve_max_return_with_risk_limits(
         proxy’s historical worst 1-month return (see
         :pyfunc:`risk_helpers.get_worst_monthly_factor_losses`).
     """
-    from portfolio_risk_engine.portfolio_risk import build_portfolio_view, normalize_weights          # reuse: get Σ & betas
-    from portfolio_risk_engine.risk_helpers import compute_max_betas, get_worst_monthly_factor_losses
+    from portfolio_risk_engine.portfolio_risk import normalize_weights
+    from portfolio_risk_engine.risk_helpers import compute_max_betas
 
     # ---------- 0. Pre-normalize weights for internal consistency -----------
     # Always work with normalized weights (sum = 1) to ensure risk calculations
     # and constraints are consistent, regardless of external normalization settings
     normalized_weights = normalize_weights(init_weights, normalize=True)
 
-    view = build_portfolio_view(
-        normalized_weights, start_date, end_date,
-        expected_returns=None,
-        stock_factor_proxies=stock_factor_proxies,
+    view, risk_inputs = _risk_view(
+        normalized_weights, start_date, end_date, stock_factor_proxies,
         ticker_alias_map=ticker_alias_map,
+        currency_map=currency_map,
         instrument_types=instrument_types,
+        contract_identities=contract_identities,
     )
+    risk_model = get_portfolio_risk_model(normalized_weights, start_date, end_date, **risk_inputs)
 
     # Filter tickers to only those present in covariance matrix (some may lack data)
     cov_tickers = set(view["covariance_matrix"].columns)
@@ -1306,16 +1565,24 @@ def solve_max_return_with_risk_limits(
     if not tickers:
         raise ValueError(f"No valid tickers with data found. All tickers failed: {original_tickers}")
 
-    covariance_result = condition_covariance_for_optimization(
-        view["covariance_matrix"].loc[tickers, tickers],
-        observation_count=view.get("return_observation_count"),
+    covariance_model = _resolve_covariance_model(
+        covariance_model, len(tickers), view.get("return_observation_count"),
     )
-    if covariance_result.applied:
-        portfolio_logger.warning(
-            "Max-return covariance conditioned for optimization: %s",
-            covariance_result.metadata,
+    if covariance_model == "factor":
+        factor_cov = risk_model.factor_covariance(tickers, ticker_alias_map)   # B F Bᵀ + D (monthly)
+        risk_input, n_factors = factor_cov, len(factor_cov.factors)
+    else:
+        covariance_result = condition_covariance_for_optimization(
+            view["covariance_matrix"].loc[tickers, tickers],
+            observation_count=view.get("return_observation_count"),
         )
-    Σ_m = covariance_result.covariance.values          # Σ (monthly)
+        if covariance_result.applied:
+            portfolio_logger.warning(
+                "Max-return covariance conditioned for optimization: %s",
+                covariance_result.metadata,
+            )
+        Σ_m = covariance_result.covariance.values          # Σ (monthly)
+        risk_input, n_factors = _covariance_root(Σ_m), None
     β_tbl = view["df_stock_betas"].fillna(0.0).loc[tickers]               # n × factors
 
     μ = np.array([expected_returns.get(t, 0.0) for t in tickers])
@@ -1324,100 +1591,48 @@ def solve_max_return_with_risk_limits(
 
     # ---------- 1. Build β caps -------------------------------------------
     # 1a) Aggregate factors
+    worst_proxy_loss = risk_model.worst_factor_losses(stock_factor_proxies, ticker_alias_map)
     all_caps = compute_max_betas(
         stock_factor_proxies,
         start_date, end_date,
         loss_limit_pct=risk_cfg["max_single_factor_loss"],
         ticker_alias_map=ticker_alias_map,
+        worst_losses=worst_proxy_loss,
     )
     agg_caps = {k: all_caps[k] for k in ("market", "momentum", "value")}
 
     # 1b) Per-industry proxy caps
     loss_lim = risk_cfg["max_single_factor_loss"]            # e.g. -0.10
-    worst_proxy_loss = get_worst_monthly_factor_losses(
-        stock_factor_proxies,
-        start_date,
-        end_date,
-        ticker_alias_map=ticker_alias_map,
-    )
     proxy_caps = {
         proxy: (np.inf if loss >= 0 else loss_lim / loss)
         for proxy, loss in worst_proxy_loss.items()
     }
 
-    # Build coefficient vectors c_proxy (length n) such that
-    #   β_port,proxy = Σ_i c_proxy[i] · w_i
-    coeff_proxy: Dict[str, np.ndarray] = {}
-    for proxy in proxy_caps:
-        coeff = []
-        for t in tickers:
-            this_proxy = stock_factor_proxies.get(t, {}).get("industry")
-            coeff.append(β_tbl.loc[t, "industry"] if this_proxy == proxy else 0.0)
-        coeff_proxy[proxy] = np.array(coeff)
-
-    # ---------- 2. CVXPY variables & objective ----------------------------
-    w = cp.Variable(len(tickers))
-    objective = cp.Maximize(μ @ w)
-
-    # ---------- 3. Constraints -------------------------------------------
-    cons = [cp.sum(w) == 1]                               # fully invested
-    if not allow_short:
-        cons += [w >= 0]
-
-    # single-name cap
-    cons += [w <= risk_cfg["concentration_limits"]["max_single_stock_weight"]]
-
-    # portfolio vol cap (monthly Σ → annual σ)
-    σ_cap = risk_cfg["portfolio_limits"]["max_volatility"]
-    cons += [cp.quad_form(w, Σ_m) <= (σ_cap / np.sqrt(12)) ** 2]
-
-    # 3a) Aggregate β caps
-    for fac, cap in agg_caps.items():
-        if fac in β_tbl.columns:
-            cons += [cp.abs(β_tbl[fac].values @ w) <= cap]
-
-    # 3b) Per-proxy β caps
-    for proxy, cap in proxy_caps.items():
-        cons += [cp.abs(coeff_proxy[proxy] @ w) <= cap]
-
-    # ---------- 4. Solve --------------------------------------------------
-    prob = cp.Problem(objective, cons)
-    # Try multiple solvers in order of preference
-    solvers_to_try = [
-        (cp.CLARABEL, {"verbose": False}),
-        (cp.OSQP, {"verbose": False, "eps_abs": 1e-5, "eps_rel": 1e-5}),
-        (cp.ECOS, {"verbose": False}),
-        (cp.SCS, {"verbose": False, "eps": 1e-4}),
-    ]
-    
-    last_error = None
-    for solver, kwargs in solvers_to_try:
-        try:
-            if solver == cp.ECOS:
-                prob.solve(solver=solver, qcp=True, **kwargs)
-            else:
-                prob.solve(solver=solver, **kwargs)
-            
-            if prob.status in ("optimal", "optimal_inaccurate"):
-                print(f"✅ Solved with {solver}")
-                break
-            else:
-                print(f"⚠️ {solver} returned status: {prob.status}")
-        except Exception as e:
-            print(f"❌ {solver} failed: {str(e)}")
-            last_error = e
-            continue
-    else:
-        # If all solvers failed
-        if last_error:
-            raise ValueError(f"All solvers failed. Last error: {last_error}")
-        else:
-            raise ValueError(f"All solvers failed with status: {prob.status}")
+    # Stack β caps as |A w| ≤ b (per-proxy rows built from the industry betas)
+    limit_rows, limit_caps = _risk_limit_rows(
+        tickers, β_tbl, agg_caps, proxy_caps, stock_factor_proxies,
+    )
 
-    if prob.status not in ("optimal", "optimal_inaccurate"):
-        raise ValueError(f"Solver status = {prob.status} (infeasible)")
+    # ---------- 2. Solve the cached parametric problem --------------------
+    # single-name cap, portfolio vol cap (monthly Σ → annual σ) and β caps
+    # are parameters; consecutive solves for the universe warm-start
+    σ_cap = risk_cfg["portfolio_limits"]["max_volatility"]
+    problem = _get_parametric_problem(
+        "max_return", tickers, len(limit_caps),
+        allow_short=allow_short, abs_concentration=False, n_factors=n_factors,
+    )
+    with problem.lock:
+        problem.set_data(
+            risk=risk_input,
+            max_weight=risk_cfg["concentration_limits"]["max_single_stock_weight"],
+            var_budget=(σ_cap / np.sqrt(12)) ** 2,
+            limit_rows=limit_rows,
+            limit_caps=limit_caps,
+            mu=μ,
+        )
+        w_opt = problem.solve(_MAX_RETURN_SOLVERS)
 
-    return {t: float(w.value[i]) for i, t in enumerate(tickers)}
+    return {t: float(w_opt[i]) for i, t in enumerate(tickers)}
 
 
 # In[27]:
@@ -1433,10 +1648,14 @@ def run_max_return_portfolio(
     proxies: Dict[str, Any],
     ticker_alias_map: Dict[str, str] | None = None,
     instrument_types: Dict[str, str] | None = None,
+    covariance_model: str | None = None,
 ) -> Tuple[Dict[str, float], Dict[str, Any], pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Runs max-return optimisation under risk constraints and returns full output.
 
+    ``covariance_model`` ("sample", "factor" or "auto") is passed to the
+    solver; ``None`` uses ``OPTIMIZER_COVARIANCE_MODEL``.
+
     Returns:
         - Optimised weights (dict)
         - Portfolio summary (from build_portfolio_view)
@@ -1456,6 +1675,9 @@ def run_max_return_portfolio(
         expected_returns     = config["expected_returns"],
         ticker_alias_map       = ticker_alias_map,
         instrument_types     = instrument_types,
+        currency_map         = config.get("currency_map"),
+        contract_identities  = config.get("contract_identities"),
+        covariance_model     = covariance_model,
     )
 
     summary, risk_tbl, df_factors, df_proxies = evaluate_optimized_weights(
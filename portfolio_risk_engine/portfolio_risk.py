@@ -44,11 +44,13 @@ Dividend Analysis Integration:
 import time
 import pandas as pd
 import numpy as np
-from dataclasses import replace
-from typing import Dict, Optional, List, Union, Any, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, List, Set, Union, Any, Tuple, TYPE_CHECKING
 import functools
 import hashlib
 import json
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from portfolio_math.correlation import (
@@ -363,6 +365,71 @@ def compute_portfolio_returns_partial(
     dates, vals = zip(*result)
     return pd.Series(vals, index=pd.DatetimeIndex(dates), name="portfolio")
 
+def compute_portfolio_returns_partial_batch(
+    returns: pd.DataFrame,
+    weights: pd.DataFrame,
+    min_weight_coverage: float = MIN_WEIGHT_COVERAGE,
+) -> pd.DataFrame:
+    """
+    Vectorized compute_portfolio_returns_partial() for many portfolios at once.
+
+    ``weights`` is portfolios × tickers; NaN means the portfolio does not hold
+    the ticker (a missing dict key), while 0.0 is a held zero weight. Every
+    portfolio's monthly return comes from one matmul over the shared returns
+    panel, with the same per-month reweighting and quality guards as the
+    single-portfolio function.
+
+    Returns:
+        pd.DataFrame: months × portfolios; months a portfolio skips are NaN.
+    """
+    tickers = list(weights.columns)
+    values = returns[tickers].to_numpy(dtype=float)
+    held = weights.notna().to_numpy(dtype=float)
+    w = weights.fillna(0.0).to_numpy(dtype=float)
+    if PORTFOLIO_DEFAULTS.get("normalize_weights", True):
+        gross = np.abs(w).sum(axis=1, keepdims=True)
+        if (gross == 0).any():
+            raise ValueError("Sum of absolute weights is zero, cannot normalize.")
+        w = w / gross
+
+    available = ~np.isnan(values)
+    abs_w = np.abs(w)
+    total_abs_weight = abs_w.sum(axis=1)
+    available_abs = available.astype(float) @ abs_w.T
+    any_available = (available.astype(float) @ held.T) > 0
+    weighted = np.where(available, values, 0.0) @ w.T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coverage = available_abs / total_abs_weight
+        gross_scale = total_abs_weight / available_abs
+    has_weight = total_abs_weight > 0.0
+    covered = any_available & has_weight & (coverage >= min_weight_coverage)
+    cancelled = covered & ((available_abs < 1e-10) | (gross_scale > 5.0))
+    valid = covered & ~cancelled
+    result = pd.DataFrame(
+        np.where(valid, weighted * np.where(valid, gross_scale, 0.0), np.nan),
+        index=returns.index,
+        columns=weights.index,
+    )
+
+    skipped_coverage = int((any_available & has_weight & ~covered).sum())
+    skipped_cancel = int(cancelled.sum())
+    if skipped_coverage or skipped_cancel:
+        from portfolio_risk_engine._logging import portfolio_logger
+
+        portfolio_logger.info(
+            "compute_portfolio_returns_partial_batch: %d portfolio-months skipped across %d portfolios "
+            "(coverage < %.0f%%: %d, near-cancel: %d), %d portfolio-months included",
+            skipped_coverage + skipped_cancel,
+            len(weights.index),
+            min_weight_coverage * 100,
+            skipped_coverage,
+            skipped_cancel,
+            int(valid.sum()),
+        )
+
+    return result
+
 def compute_covariance_matrix(
     returns: pd.DataFrame
 ) -> pd.DataFrame:
@@ -541,7 +608,19 @@ def serialize_for_cache(obj):
     else:
         return str(obj)
 
-from portfolio_risk_engine.config import PORTFOLIO_RISK_LRU_SIZE
+from portfolio_risk_engine.config import PORTFOLIO_RISK_LRU_SIZE, PORTFOLIO_RISK_MODEL_CACHE_SIZE
+from portfolio_risk_engine.result_cache import (
+    clear_view_cache,
+    current_data_version,
+    load_view,
+    store_view,
+    view_cache_key,
+    view_cache_stats,
+)
+
+# Request-scoped ReturnSeriesContext handed to the cached computation without
+# entering the LRU key (the memo never changes results, only I/O).
+_view_context = threading.local()
 
 @functools.lru_cache(maxsize=PORTFOLIO_RISK_LRU_SIZE)  # Keep 100 most recent portfolio analyses
 def _cached_build_portfolio_view(
@@ -570,7 +649,19 @@ def _cached_build_portfolio_view(
     - Recent calls: ~10ms (LRU cache retrieval)
     - Memory bounded: Max 100 analyses (~50MB)
     - Automatic cleanup: Least recently used analyses evicted
+
+    On an LRU miss the cross-process second tier (``result_cache``) is
+    consulted before computing, and populated afterwards.
     """
+    tier2_key = view_cache_key(
+        weights_json, start_date, end_date, expected_returns_json, stock_factor_proxies_json,
+        bond_mask_json, cache_version, ticker_alias_map_json, currency_map_json, instrument_types_json,
+        security_types_json, contract_identities_json, security_identities_json,
+    )
+    cached_view = load_view(tier2_key)
+    if cached_view is not None:
+        return cached_view
+
     # NOTE: bond_mask_json and cache_version are part of the cache key only.
     # Build minimal asset_classes mapping from bond mask for computation
     weights = json.loads(weights_json)
@@ -590,7 +681,7 @@ def _cached_build_portfolio_view(
         asset_classes = None
 
     # Call the original computation function
-    return _build_portfolio_view_computation(
+    result = _build_portfolio_view_computation(
         weights,
         start_date,
         end_date,
@@ -603,14 +694,20 @@ def _cached_build_portfolio_view(
         security_types,
         contract_identities,
         security_identities,
+        return_context=getattr(_view_context, "return_context", None),
     )
+    store_view(tier2_key, result)
+    return result
 
-def clear_portfolio_view_cache():
-    """Clear the LRU cache for build_portfolio_view."""
+def clear_portfolio_view_cache(persistent: bool = False):
+    """Clear the LRU cache and risk models for build_portfolio_view (and the shared tier if ``persistent``)."""
     _cached_build_portfolio_view.cache_clear()
+    clear_portfolio_risk_models()
+    if persistent:
+        clear_view_cache()
 
 def get_portfolio_view_cache_stats():
-    """Get LRU cache statistics."""
+    """Get LRU cache statistics plus the cross-process second tier."""
     cache_info = _cached_build_portfolio_view.cache_info()
     return {
         'cache_type': 'LRU',
@@ -618,7 +715,8 @@ def get_portfolio_view_cache_stats():
         'max_size': cache_info.maxsize,
         'hits': cache_info.hits,
         'misses': cache_info.misses,
-        'hit_rate': cache_info.hits / (cache_info.hits + cache_info.misses) if (cache_info.hits + cache_info.misses) > 0 else 0
+        'hit_rate': cache_info.hits / (cache_info.hits + cache_info.misses) if (cache_info.hits + cache_info.misses) > 0 else 0,
+        'second_tier': view_cache_stats(),
     }
 
 # ============================================================================
@@ -775,6 +873,93 @@ def _fetch_option_prices(
     )
 
 
+_BATCH_INELIGIBLE_INSTRUMENT_TYPES = {"unknown", "futures", "option"}
+
+
+def _prefetch_batch_prices(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    ticker_alias_map: Optional[Dict[str, str]] = None,
+    instrument_types: Optional[Dict[str, str]] = None,
+) -> Tuple[Dict[str, pd.Series], Set[str]]:
+    """
+    Prefetch total-return prices for many tickers, one call per instrument type.
+
+    When the active provider implements ``BatchPriceProvider`` each group is
+    priced by its ``fetch_monthly_total_return_price_many`` (with the same
+    alias map the per-ticker path resolves through); otherwise, or if the
+    bulk call raises, the group is fetched concurrently through
+    ``fetch_monthly_total_return_price``.  Cash, futures, option and unknown
+    instruments are left to the per-ticker path.
+
+    Returns:
+        Tuple[Dict[str, pd.Series], Set[str]]: month-end prices for tickers the
+        batch priced, and the tickers it attempted but could not price – the
+        per-ticker path skips straight to the close-price fallback for those
+        instead of asking for total-return prices again.
+    """
+    from portfolio_risk_engine.providers import (
+        _fetch_many_via_single,
+        get_price_provider,
+        supports_batch_prices,
+    )
+
+    groups: Dict[str, List[str]] = {}
+    for ticker in tickers:
+        if is_cur_ticker(ticker):
+            continue
+        instrument_type = _resolve_instrument_type(ticker, instrument_types)
+        if instrument_type in _BATCH_INELIGIBLE_INSTRUMENT_TYPES:
+            continue
+        groups.setdefault(instrument_type or "equity", []).append(ticker)
+    if not any(len(group) >= 2 for group in groups.values()):
+        return {}, set()
+
+    provider = get_price_provider()
+    bulk = supports_batch_prices(provider)
+    prices: Dict[str, pd.Series] = {}
+    failed: Set[str] = set()
+    for instrument_type, group in groups.items():
+        if len(group) < 2:
+            continue
+        frame = None
+        if bulk:
+            try:
+                frame = provider.fetch_monthly_total_return_price_many(
+                    group,
+                    start_date,
+                    end_date,
+                    fmp_ticker_map=ticker_alias_map,
+                    instrument_type=instrument_type,
+                )
+                if frame is None:
+                    frame = pd.DataFrame()
+            except Exception as exc:
+                portfolio_logger.warning(
+                    "Bulk price fetch failed for %d %s tickers, fetching them individually: %s",
+                    len(group),
+                    instrument_type,
+                    exc,
+                )
+        if frame is None:
+            frame = _fetch_many_via_single(
+                fetch_monthly_total_return_price,
+                group,
+                start_date,
+                end_date,
+                ticker_alias_map=ticker_alias_map,
+                instrument_type=instrument_type,
+            )
+        for ticker in group:
+            series = frame[ticker].dropna() if ticker in frame.columns else None
+            if series is None or series.empty:
+                failed.add(ticker)
+            else:
+                prices[ticker] = series.rename(ticker)
+    return prices, failed
+
+
 def _filter_tickers_by_data_availability(
     weights: Dict[str, float],
     start_date: str,
@@ -784,6 +969,7 @@ def _filter_tickers_by_data_availability(
     currency_map: Optional[Dict[str, str]] = None,
     instrument_types: Optional[Dict[str, str]] = None,
     contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    return_context: Optional["ReturnSeriesContext"] = None,
 ) -> Tuple[Dict[str, float], List[str], List[str]]:
     """
     Filter out tickers with insufficient historical data and rebalance remaining weights.
@@ -794,6 +980,8 @@ def _filter_tickers_by_data_availability(
         end_date (str): Analysis end date  
         min_months (int): Minimum months of data required (default: 12)
         instrument_types (Dict[str, str], optional): Mapping of ticker -> instrument type.
+        return_context (ReturnSeriesContext, optional): Request-scoped memo; pass the
+            same context to ``get_returns_dataframe`` so it reuses these series.
         
     Returns:
         tuple: (filtered_weights, excluded_tickers, warnings)
@@ -805,16 +993,39 @@ def _filter_tickers_by_data_availability(
     excluded_tickers = []
     warnings = []
 
+    key_kwargs = dict(
+        ticker_alias_map=ticker_alias_map,
+        currency_map=currency_map,
+        instrument_types=instrument_types,
+        contract_identities=contract_identities,
+    )
+    pending = [
+        ticker
+        for ticker in weights
+        if return_context is None
+        or not return_context.has_ticker_returns(ticker, start_date, end_date, **key_kwargs)
+    ]
+    batch_prices, batch_failed = _prefetch_batch_prices(
+        pending,
+        start_date,
+        end_date,
+        ticker_alias_map=ticker_alias_map,
+        instrument_types=instrument_types,
+    )
+
     def _check_one(ticker: str, weight: float) -> tuple[str, float, int | None, str | None]:
         try:
-            ticker_result = _fetch_ticker_returns(
-                ticker,
-                start_date,
-                end_date,
+            ticker_result = _context_ticker_returns(
+                return_context,
+                ticker=ticker,
+                start_date=start_date,
+                end_date=end_date,
                 ticker_alias_map=ticker_alias_map,
                 currency_map=currency_map,
                 instrument_types=instrument_types,
                 contract_identities=contract_identities,
+                prefetched_prices=batch_prices.get(ticker),
+                total_return_failed=ticker in batch_failed,
             )
             returns = ticker_result["returns"]
             months_available = len(returns) if returns is not None else 0
@@ -836,15 +1047,21 @@ def _filter_tickers_by_data_availability(
                 f"Excluded {ticker}: data fetch failed ({str(exc)[:50]}...)",
             )
 
-    max_workers = min(8, len(weights)) or 1
+    # Batch-priced and already-memoized tickers only need local math; pool the rest.
+    unbatched = [ticker for ticker in pending if ticker not in batch_prices]
+    max_workers = min(8, len(unbatched)) or 1
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures_by_ticker = {
-            ticker: executor.submit(_check_one, ticker, weight)
-            for ticker, weight in weights.items()
+            ticker: executor.submit(_check_one, ticker, weights[ticker])
+            for ticker in unbatched
         }
 
         for ticker in weights:
-            checked_ticker, weight, months_available, warning = futures_by_ticker[ticker].result()
+            if ticker in futures_by_ticker:
+                checked = futures_by_ticker[ticker].result()
+            else:
+                checked = _check_one(ticker, weights[ticker])
+            checked_ticker, weight, months_available, warning = checked
             if warning is None:
                 valid_tickers[checked_ticker] = weight
                 continue
@@ -876,8 +1093,16 @@ def _fetch_ticker_returns(
     instrument_types: Optional[Dict[str, str]] = None,
     include_fx_attribution: bool = False,
     contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    prefetched_prices: Optional[pd.Series] = None,
+    total_return_failed: bool = False,
 ) -> Dict[str, Any]:
-    """Fetch a single ticker return series and optional FX attribution details."""
+    """Fetch a single ticker return series and optional FX attribution details.
+
+    ``prefetched_prices`` (from ``_prefetch_batch_prices``) skips the provider
+    round trip; returns, currency inference and FX adjustment still run here.
+    ``total_return_failed`` marks a ticker the batch already failed to price,
+    so only the close-price fallback is tried.
+    """
     if is_cur_ticker(ticker):
         idx = pd.date_range(start_date, end_date, freq="ME")
         currency = ticker.split(":", 1)[1].upper()
@@ -930,7 +1155,9 @@ def _fetch_ticker_returns(
     )
 
     try:
-        if instrument_type == "futures":
+        if prefetched_prices is not None:
+            prices = prefetched_prices
+        elif instrument_type == "futures":
             prices = _fetch_futures_prices(
                 ticker,
                 start_date,
@@ -953,6 +1180,12 @@ def _fetch_ticker_returns(
         else:
             # Try total return prices first (includes dividends)
             try:
+                if total_return_failed:
+                    raise ReturnSeriesUnavailable(
+                        "not priced by the batch prefetch",
+                        ticker=ticker,
+                        missing_data=True,
+                    )
                 prices = fetch_monthly_total_return_price(
                     ticker,
                     start_date=start_date,
@@ -1080,6 +1313,199 @@ def _fetch_ticker_returns(
     }
 
 
+class ReturnSeriesContext:
+    """
+    Request-scoped memo of return series shared across pipeline stages.
+
+    Entries are keyed by (ticker, window, alias, instrument type, currency,
+    contract identity), so the availability filter, ``get_returns_dataframe``,
+    factor exposures and attribution helpers fetch each series once per
+    request.  Missing-data failures are memoized too and re-raised on reuse.
+    Thread-safe; create one per request and drop it afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _ticker_key(
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        ticker_alias_map: Optional[Dict[str, str]] = None,
+        currency_map: Optional[Dict[str, str]] = None,
+        instrument_types: Optional[Dict[str, str]] = None,
+        contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> tuple:
+        identity = (contract_identities or {}).get(str(ticker or "").strip().upper())
+        return (
+            "ticker",
+            str(ticker),
+            str(start_date),
+            str(end_date),
+            (ticker_alias_map or {}).get(ticker),
+            _resolve_instrument_type(ticker, instrument_types),
+            str((currency_map or {}).get(ticker) or "").strip().upper(),
+            json.dumps(identity, sort_keys=True, default=str) if identity else None,
+        )
+
+    def _lookup(self, key: tuple) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+            return entry
+
+    def _store(self, key: tuple, entry: Any) -> None:
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+
+    @staticmethod
+    def _fx_possible(
+        ticker: str,
+        ticker_alias_map: Optional[Dict[str, str]],
+        currency_map: Optional[Dict[str, str]],
+        instrument_types: Optional[Dict[str, str]],
+    ) -> bool:
+        """Mirror of the currency resolution in ``_fetch_ticker_returns``."""
+        if is_cur_ticker(ticker):
+            return True
+        currency = str((currency_map or {}).get(ticker) or "").strip().upper()
+        if currency and currency != "USD":
+            return True
+        if _resolve_instrument_type(ticker, instrument_types) == "futures":
+            return True
+        return bool(
+            not currency
+            and ticker_alias_map
+            and ticker in ticker_alias_map
+            and _should_infer_currency_from_alias(ticker, ticker_alias_map[ticker])
+        )
+
+    @staticmethod
+    def _unwrap(entry: Any) -> Any:
+        if isinstance(entry, ReturnSeriesUnavailable):
+            raise entry
+        return entry
+
+    def has_ticker_returns(self, ticker: str, start_date: str, end_date: str, **key_kwargs: Any) -> bool:
+        key = self._ticker_key(ticker, start_date, end_date, **key_kwargs)
+        with self._lock:
+            return (key, False) in self._entries or (key, True) in self._entries
+
+    def get_ticker_returns(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        ticker_alias_map: Optional[Dict[str, str]] = None,
+        currency_map: Optional[Dict[str, str]] = None,
+        instrument_types: Optional[Dict[str, str]] = None,
+        include_fx_attribution: bool = False,
+        contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
+        prefetched_prices: Optional[pd.Series] = None,
+        total_return_failed: bool = False,
+    ) -> Dict[str, Any]:
+        """Memoized ``_fetch_ticker_returns`` (same arguments and result)."""
+        key = self._ticker_key(
+            ticker,
+            start_date,
+            end_date,
+            ticker_alias_map=ticker_alias_map,
+            currency_map=currency_map,
+            instrument_types=instrument_types,
+            contract_identities=contract_identities,
+        )
+        # An entry computed with FX attribution also serves plain requests, and a
+        # plain entry serves FX requests for series that can never be FX-adjusted.
+        if include_fx_attribution and self._fx_possible(ticker, ticker_alias_map, currency_map, instrument_types):
+            variants = ((key, True),)
+        else:
+            variants = ((key, False), (key, True))
+        for variant in variants:
+            entry = self._lookup(variant)
+            if entry is not None:
+                return self._unwrap(entry)
+
+        try:
+            entry = _fetch_ticker_returns(
+                ticker,
+                start_date,
+                end_date,
+                ticker_alias_map=ticker_alias_map,
+                currency_map=currency_map,
+                instrument_types=instrument_types,
+                include_fx_attribution=include_fx_attribution,
+                contract_identities=contract_identities,
+                prefetched_prices=prefetched_prices,
+                total_return_failed=total_return_failed,
+            )
+        except ReturnSeriesUnavailable as exc:
+            if not exc.missing_data:
+                raise
+            entry = exc
+        self._store((key, include_fx_attribution), entry)
+        return self._unwrap(entry)
+
+    def get_price_returns(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        ticker_alias_map: Optional[Dict[str, str]] = None,
+    ) -> pd.Series:
+        """Memoized proxy/benchmark returns (total-return prices, close fallback)."""
+        key = ("proxy", str(symbol), str(start_date), str(end_date), (ticker_alias_map or {}).get(symbol))
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+        try:
+            prices = fetch_monthly_total_return_price(
+                symbol, start_date, end_date, ticker_alias_map=ticker_alias_map,
+            )
+        except Exception:
+            prices = fetch_monthly_close(
+                symbol, start_date, end_date, ticker_alias_map=ticker_alias_map,
+            )
+        returns = calc_monthly_returns(prices)
+        self._store(key, returns)
+        return returns
+
+    def get_excess_returns(
+        self,
+        etf_ticker: str,
+        market_ticker: str,
+        start_date: str,
+        end_date: str,
+        ticker_alias_map: Optional[Dict[str, str]] = None,
+    ) -> pd.Series:
+        """Context-backed equivalent of ``factor_utils.fetch_excess_return``."""
+        if not market_ticker:
+            return fetch_excess_return(etf_ticker, market_ticker, start_date, end_date, ticker_alias_map)
+        etf_ret = self.get_price_returns(etf_ticker, start_date, end_date, ticker_alias_map)
+        market_ret = self.get_price_returns(market_ticker, start_date, end_date, ticker_alias_map)
+        common_idx = etf_ret.index.intersection(market_ret.index)
+        return etf_ret.loc[common_idx] - market_ret.loc[common_idx]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def _context_ticker_returns(
+    return_context: Optional[ReturnSeriesContext],
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Route a ``_fetch_ticker_returns`` call through the context when given."""
+    if return_context is None:
+        return _fetch_ticker_returns(**kwargs)
+    return return_context.get_ticker_returns(**kwargs)
+
+
 def get_returns_dataframe(
     weights: Dict[str, float],
     start_date: str,
@@ -1091,6 +1517,7 @@ def get_returns_dataframe(
     fx_attribution_out: Optional[Dict[str, Dict[str, Any]]] = None,
     raw_returns_out: Optional[Dict[str, pd.Series]] = None,
     contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    return_context: Optional[ReturnSeriesContext] = None,
 ) -> pd.DataFrame:
     """
     Fetch and compute monthly returns for all tickers in the weights dictionary.
@@ -1136,6 +1563,9 @@ def get_returns_dataframe(
         fx_attribution_out (Optional[Dict[str, Dict[str, Any]]]): Optional mutable
             output dict populated for FX-adjusted tickers with keys:
             {"currency", "local_returns", "fx_returns"}.
+        return_context (Optional[ReturnSeriesContext]): Request-scoped memo shared
+            with ``_filter_tickers_by_data_availability`` and factor stages so each
+            series is fetched once per request.
 
     Returns:
         pd.DataFrame: Monthly return series for valid tickers only, aligned and cleaned.
@@ -1161,27 +1591,62 @@ def get_returns_dataframe(
     excluded_no_data = []      # Tickers with no data at all
     excluded_insufficient = []  # Tickers with data but < min_observations
 
-    max_workers = min(8, len(weights)) or 1
     include_fx_attribution = fx_attribution_out is not None
     futures_by_ticker = {}
+    fetch_kwargs = dict(
+        start_date=start_date,
+        end_date=end_date,
+        ticker_alias_map=ticker_alias_map,
+        currency_map=currency_map,
+        instrument_types=instrument_types,
+        include_fx_attribution=include_fx_attribution,
+        contract_identities=contract_identities,
+    )
+
+    def _memoized(ticker: str) -> bool:
+        return return_context is not None and return_context.has_ticker_returns(
+            ticker,
+            start_date,
+            end_date,
+            ticker_alias_map=ticker_alias_map,
+            currency_map=currency_map,
+            instrument_types=instrument_types,
+            contract_identities=contract_identities,
+        )
+
+    # Bulk fast path: one provider call per instrument type when supported.
+    pending = [t for t in weights if not _memoized(t)]
+    batch_prices, batch_failed = _prefetch_batch_prices(
+        pending,
+        start_date,
+        end_date,
+        ticker_alias_map=ticker_alias_map,
+        instrument_types=instrument_types,
+    )
+    unbatched = [t for t in pending if t not in batch_prices]
+    max_workers = min(8, len(unbatched)) or 1
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for t in weights:
+        for t in unbatched:
             futures_by_ticker[t] = executor.submit(
-                _fetch_ticker_returns,
+                _context_ticker_returns,
+                return_context,
                 ticker=t,
-                start_date=start_date,
-                end_date=end_date,
-                ticker_alias_map=ticker_alias_map,
-                currency_map=currency_map,
-                instrument_types=instrument_types,
-                include_fx_attribution=include_fx_attribution,
-                contract_identities=contract_identities,
+                total_return_failed=t in batch_failed,
+                **fetch_kwargs,
             )
 
         for t in weights:
             try:
-                ticker_result = futures_by_ticker[t].result()
+                if t in futures_by_ticker:
+                    ticker_result = futures_by_ticker[t].result()
+                else:
+                    ticker_result = _context_ticker_returns(
+                        return_context,
+                        ticker=t,
+                        prefetched_prices=batch_prices.get(t),
+                        **fetch_kwargs,
+                    )
                 ticker_returns = ticker_result["returns"]
                 if ticker_returns is None:
                     excluded_no_data.append((t, "unsupported instrument type"))
@@ -1397,6 +1862,7 @@ def _prefetch_proxy_returns(
     end_date: str,
     ticker_alias_map: Optional[Dict[str, str]] = None,
     stock_return_cache: Optional[Dict[str, pd.Series]] = None,
+    return_context: Optional[ReturnSeriesContext] = None,
 ) -> Dict[object, pd.Series]:
     """Pre-fetch monthly returns for all unique proxy tickers in parallel.
 
@@ -1436,6 +1902,10 @@ def _prefetch_proxy_returns(
     def _fetch_one(job_key: object, job_value: Union[str, List[str]]):
         try:
             if isinstance(job_value, str):
+                if return_context is not None:
+                    return job_key, return_context.get_price_returns(
+                        job_value, start_date, end_date, ticker_alias_map=ticker_alias_map,
+                    )
                 try:
                     prices = fetch_monthly_total_return_price(
                         job_value, start_date, end_date, ticker_alias_map=ticker_alias_map,
@@ -1513,138 +1983,306 @@ def _build_stock_return_cache(
     return cache
 
 
-def _compute_single_ticker_factors(
-    ticker: str,
-    proxies: Dict[str, Union[str, List[str]]],
+def _fetch_proxy_returns_direct(
+    proxy: str,
     start_date: str,
     end_date: str,
     ticker_alias_map: Optional[Dict[str, str]] = None,
-    proxy_cache: Optional[Dict[object, pd.Series]] = None,
-    stock_returns: Optional[pd.Series] = None,
-) -> Optional[Dict[str, Any]]:
-    """Compute factor betas and idiosyncratic variance for one ticker."""
-    stock_ret = pd.to_numeric(stock_returns, errors="coerce").dropna() if stock_returns is not None else pd.Series(dtype=float)
-    if stock_ret.empty:
+) -> pd.Series:
+    try:
+        prices = fetch_monthly_total_return_price(
+            proxy, start_date=start_date, end_date=end_date,
+            ticker_alias_map=ticker_alias_map,
+        )
+    except Exception:
         prices = fetch_monthly_close(
-            ticker,
-            start_date=start_date,
-            end_date=end_date,
+            proxy, start_date=start_date, end_date=end_date,
             ticker_alias_map=ticker_alias_map,
         )
-        stock_ret = calc_monthly_returns(prices)
-    if stock_ret.empty:
-        return None
-    idx = stock_ret.index
-    _pc = proxy_cache or {}
+    return calc_monthly_returns(prices)
 
-    fac_dict: Dict[str, pd.Series] = {}
 
-    mkt_t = proxies.get("market")
-    if mkt_t:
-        if mkt_t in _pc:
-            mkt_ret = _pc[mkt_t].reindex(idx).dropna()
-        else:
-            try:
-                mkt_prices = fetch_monthly_total_return_price(
-                    mkt_t, start_date=start_date, end_date=end_date,
-                    ticker_alias_map=ticker_alias_map,
-                )
-            except Exception:
-                mkt_prices = fetch_monthly_close(
-                    mkt_t, start_date=start_date, end_date=end_date,
-                    ticker_alias_map=ticker_alias_map,
-                )
-            mkt_ret = calc_monthly_returns(mkt_prices).reindex(idx).dropna()
-        fac_dict["market"] = mkt_ret
-
-    mom_t = proxies.get("momentum")
-    if mom_t and mkt_t:
-        cached = _cached_excess_return(mom_t, mkt_t, _pc, idx) if _pc else None
-        if cached is not None:
-            fac_dict["momentum"] = cached
-        else:
-            fac_dict["momentum"] = fetch_excess_return(
-                mom_t, mkt_t, start_date, end_date,
-                ticker_alias_map=ticker_alias_map,
-            ).reindex(idx).dropna()
+def _resolve_ticker_factor_sources(
+    proxies: Dict[str, Union[str, List[str]]],
+    start_date: str,
+    end_date: str,
+    ticker_alias_map: Optional[Dict[str, str]],
+    proxy_cache: Dict[object, pd.Series],
+    fetched: Dict[object, pd.Series],
+) -> Dict[str, Tuple[object, pd.Series]]:
+    """
+    Map each factor of one ticker to ``(source_key, full return series)``.
 
-    val_t = proxies.get("value")
-    if val_t and mkt_t:
-        cached = _cached_excess_return(val_t, mkt_t, _pc, idx) if _pc else None
-        if cached is not None:
-            fac_dict["value"] = cached
-        else:
-            fac_dict["value"] = fetch_excess_return(
-                val_t, mkt_t, start_date, end_date,
-                ticker_alias_map=ticker_alias_map,
-            ).reindex(idx).dropna()
+    Series are not yet aligned to the stock's dates, so tickers sharing a
+    proxy share one source.  Proxies missing from ``proxy_cache`` are fetched
+    once per batch into ``fetched``.
+    """
+    def _fetched(key: object, loader) -> pd.Series:
+        if key not in fetched:
+            fetched[key] = loader()
+        return fetched[key]
+
+    def _single(proxy: str) -> Tuple[object, pd.Series]:
+        if proxy in proxy_cache:
+            return proxy, proxy_cache[proxy]
+        key = ("__fetched__", proxy)
+        return key, _fetched(
+            key, lambda: _fetch_proxy_returns_direct(proxy, start_date, end_date, ticker_alias_map)
+        )
+
+    def _excess(etf: str, market: str) -> Tuple[object, pd.Series]:
+        key = ("__excess__", etf, market)
+        if proxy_cache and etf in proxy_cache and market in proxy_cache:
+            etf_ret, mkt_ret = proxy_cache[etf], proxy_cache[market]
+            common = etf_ret.index.intersection(mkt_ret.index)
+            return key, _fetched(key, lambda: etf_ret.loc[common] - mkt_ret.loc[common])
+        key = ("__fetched__", *key)
+        return key, _fetched(
+            key,
+            lambda: fetch_excess_return(
+                etf, market, start_date, end_date, ticker_alias_map=ticker_alias_map,
+            ),
+        )
 
+    sources: Dict[str, Tuple[object, pd.Series]] = {}
+    mkt_t = proxies.get("market")
+    if mkt_t:
+        sources["market"] = _single(mkt_t)
+    for facname in ("momentum", "value"):
+        etf = proxies.get(facname)
+        if etf and mkt_t:
+            sources[facname] = _excess(etf, mkt_t)
     for facname in ("industry", "subindustry"):
         proxy = proxies.get(facname)
-        if proxy:
-            if isinstance(proxy, list):
-                cache_key = _peer_proxy_cache_key(proxy)
-                ser = _pc.get(cache_key)
-                if ser is None:
-                    ser = fetch_peer_median_monthly_returns(
-                        proxy, start_date, end_date,
-                        ticker_alias_map=ticker_alias_map,
-                    )
-            elif proxy in _pc:
-                ser = _pc[proxy]
+        if not proxy:
+            continue
+        if isinstance(proxy, list):
+            cache_key = _peer_proxy_cache_key(proxy)
+            if proxy_cache.get(cache_key) is not None:
+                sources[facname] = (cache_key, proxy_cache[cache_key])
             else:
-                try:
-                    p = fetch_monthly_total_return_price(
-                        proxy, start_date=start_date, end_date=end_date,
-                        ticker_alias_map=ticker_alias_map,
-                    )
-                except Exception:
-                    p = fetch_monthly_close(
-                        proxy, start_date=start_date, end_date=end_date,
-                        ticker_alias_map=ticker_alias_map,
-                    )
-                ser = calc_monthly_returns(p)
-            fac_dict[facname] = ser.reindex(idx).dropna()
-
+                sources[facname] = (
+                    ("__fetched__", *cache_key),
+                    _fetched(
+                        ("__fetched__", *cache_key),
+                        lambda: fetch_peer_median_monthly_returns(
+                            proxy, start_date, end_date, ticker_alias_map=ticker_alias_map,
+                        ),
+                    ),
+                )
+        else:
+            sources[facname] = _single(proxy)
     commodity_proxy = proxies.get("commodity")
     if commodity_proxy:
-        if commodity_proxy in _pc:
-            fac_dict["commodity"] = _pc[commodity_proxy].reindex(idx).dropna()
-        else:
-            try:
-                commodity_prices = fetch_monthly_total_return_price(
-                    commodity_proxy, start_date=start_date, end_date=end_date,
-                    ticker_alias_map=ticker_alias_map,
-                )
-            except Exception:
-                commodity_prices = fetch_monthly_close(
-                    commodity_proxy, start_date=start_date, end_date=end_date,
-                    ticker_alias_map=ticker_alias_map,
-                )
-            fac_dict["commodity"] = calc_monthly_returns(commodity_prices).reindex(idx).dropna()
+        sources["commodity"] = _single(commodity_proxy)
+    return sources
 
-    factor_df = pd.DataFrame(fac_dict).dropna(how="any")
 
+def _compute_ticker_factors_batch(
+    tickers: List[str],
+    stock_factor_proxies: Dict[str, Dict[str, Union[str, List[str]]]],
+    start_date: str,
+    end_date: str,
+    ticker_alias_map: Optional[Dict[str, str]] = None,
+    proxy_cache: Optional[Dict[object, pd.Series]] = None,
+    stock_return_cache: Optional[Dict[str, pd.Series]] = None,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Factor betas, factor vols and idiosyncratic variance for many tickers at once.
+
+    Tickers sharing a factor set are stacked into ``(names, months, factors)``
+    arrays on one date grid; a mask marks the months where the stock and all
+    its factors are observed.  Single-factor betas and vols come from masked
+    moments, and idiosyncratic variance from the residual of the multi-factor
+    regression (with intercept), solved by one batched SVD of the centred
+    factor panel.  Results match ``_compute_factor_panel_stats`` per ticker;
+    the rare names with non-finite moments are handed to it directly.
+
+    Returns ``{ticker: result or None}`` with the same result dict as the
+    former per-ticker ``_compute_single_ticker_factors``.
+    """
     from portfolio_risk_engine.config import DATA_QUALITY_THRESHOLDS
 
     min_obs = DATA_QUALITY_THRESHOLDS["min_observations_for_factor_betas"]
-    if factor_df.empty or len(factor_df) < min_obs:
-        return None
-
-    aligned_s = stock_ret.reindex(factor_df.index)
-    factor_vols, betas, annual_idio_var = _compute_factor_panel_stats(
-        aligned_s=aligned_s,
-        factor_df=factor_df,
-    )
-    if not betas or annual_idio_var is None:
-        return None
+    proxy_cache = proxy_cache or {}
+    stock_return_cache = stock_return_cache or {}
+    fetched: Dict[object, pd.Series] = {}
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
 
-    return {
-        "ticker": ticker,
-        "betas": betas,
-        "factor_vols": {factor: float(vol) for factor, vol in factor_vols.items()},
-        "annual_idio_var": annual_idio_var,
-    }
+    stock_series: Dict[str, pd.Series] = {}
+    sources_by_ticker: Dict[str, Dict[str, Tuple[object, pd.Series]]] = {}
+    for ticker in tickers:
+        stock_returns = stock_return_cache.get(ticker)
+        stock_ret = (
+            pd.to_numeric(stock_returns, errors="coerce").dropna()
+            if stock_returns is not None
+            else pd.Series(dtype=float)
+        )
+        if stock_ret.empty:
+            prices = fetch_monthly_close(
+                ticker,
+                start_date=start_date,
+                end_date=end_date,
+                ticker_alias_map=ticker_alias_map,
+            )
+            stock_ret = calc_monthly_returns(prices)
+        if stock_ret.empty:
+            results[ticker] = None
+            continue
+        stock_series[ticker] = stock_ret
+        sources_by_ticker[ticker] = _resolve_ticker_factor_sources(
+            stock_factor_proxies.get(ticker, {}),
+            start_date,
+            end_date,
+            ticker_alias_map,
+            proxy_cache,
+            fetched,
+        )
+
+    groups: Dict[Tuple[str, ...], List[str]] = {}
+    for ticker, sources in sources_by_ticker.items():
+        if not sources:
+            results[ticker] = None
+            continue
+        groups.setdefault(tuple(sources), []).append(ticker)
+    if not groups:
+        return {ticker: results.get(ticker) for ticker in tickers}
+
+    # One shared month grid; every source is aligned to it exactly once.
+    stock_frame = pd.DataFrame({ticker: stock_series[ticker] for ticker in sources_by_ticker})
+    grid = stock_frame.index
+    source_columns: Dict[object, int] = {}
+    source_values: List[np.ndarray] = []
+    for sources in sources_by_ticker.values():
+        for key, series in sources.values():
+            if key not in source_columns:
+                source_columns[key] = len(source_values)
+                aligned = pd.to_numeric(series, errors="coerce").reindex(grid)
+                source_values.append(aligned.to_numpy(dtype=float))
+    source_matrix = np.column_stack(source_values)                 # (months, sources)
+    stock_columns = {ticker: i for i, ticker in enumerate(stock_frame.columns)}
+    stock_matrix = stock_frame.to_numpy(dtype=float)               # (months, names)
+
+    for factor_names, group in groups.items():
+        y = stock_matrix[:, [stock_columns[t] for t in group]].T   # (n, T)
+        src_idx = np.array(
+            [[source_columns[sources_by_ticker[t][f][0]] for f in factor_names] for t in group]
+        )
+        x = source_matrix[:, src_idx].transpose(1, 0, 2)           # (n, T, k)
+
+        # Same row filters as the scalar path: the observation gate counts
+        # months with every factor present; the panel also drops infinities.
+        present = ~np.isnan(y) & ~np.isnan(x).any(axis=2)
+        gate = present.sum(axis=1) >= min_obs
+        mask = present & np.isfinite(y) & np.isfinite(x).all(axis=2)
+        count = mask.sum(axis=1).astype(float)
+        usable = gate & (count >= 2)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y0 = np.where(mask, y, 0.0)
+            x0 = np.where(mask[:, :, None], x, 0.0)
+            y_mean = y0.sum(axis=1) / count
+            x_mean = x0.sum(axis=1) / count[:, None]
+            yc = np.where(mask, y - y_mean[:, None], 0.0)
+            xc = np.where(mask[:, :, None], x - x_mean[:, None, :], 0.0)
+            dof = (count - 1.0)[:, None]
+            factor_var = np.einsum("ntk,ntk->nk", xc, xc) / dof
+            covariance = np.einsum("ntk,nt->nk", xc, yc) / dof
+            factor_vols = np.sqrt(factor_var) * np.sqrt(12)
+            betas = np.divide(
+                covariance,
+                factor_var,
+                out=np.zeros_like(covariance),
+                where=np.isfinite(factor_var) & (factor_var != 0),
+            )
+
+            # Residual of y on [1, X]: project the centred y off the span of
+            # the centred factors, with lstsq's singular-value cutoff.
+            u, s, _ = np.linalg.svd(xc, full_matrices=False)
+            cutoff = (
+                s.max(axis=1, initial=0.0)
+                * np.finfo(float).eps
+                * np.maximum(count, len(factor_names) + 1)
+            )
+            keep = s > cutoff[:, None]
+            fitted = np.einsum(
+                "ntk,nk->nt", u, np.einsum("ntk,nt->nk", u, yc) * keep
+            )
+            resid = np.where(mask, yc - fitted, 0.0)
+            idio_var = np.einsum("nt,nt->n", resid, resid) / (count - 1.0) * 12.0
+
+        for row, ticker in enumerate(group):
+            if not usable[row]:
+                results[ticker] = None
+                continue
+            if not np.isfinite(factor_vols[row]).all():
+                results[ticker] = _compute_single_ticker_factors_scalar(
+                    ticker, sources_by_ticker[ticker], stock_series[ticker]
+                )
+                continue
+            beta_row = {
+                factor: float(beta)
+                for factor, beta in zip(factor_names, betas[row])
+                if np.isfinite(beta)
+            }
+            if not beta_row or not np.isfinite(idio_var[row]):
+                results[ticker] = None
+                continue
+            results[ticker] = {
+                "ticker": ticker,
+                "betas": beta_row,
+                "factor_vols": {
+                    factor: float(vol) for factor, vol in zip(factor_names, factor_vols[row])
+                },
+                "annual_idio_var": float(idio_var[row]),
+            }
+
+    return {ticker: results.get(ticker) for ticker in tickers}
+
+
+def _compute_single_ticker_factors_scalar(
+    ticker: str,
+    sources: Dict[str, Tuple[object, pd.Series]],
+    stock_ret: pd.Series,
+) -> Optional[Dict[str, Any]]:
+    """Reference per-ticker path for panels the batch cannot treat uniformly."""
+    idx = stock_ret.index
+    factor_df = pd.DataFrame(
+        {factor: series.reindex(idx).dropna() for factor, (_, series) in sources.items()}
+    ).dropna(how="any")
+    factor_vols, betas, annual_idio_var = _compute_factor_panel_stats(
+        aligned_s=stock_ret.reindex(factor_df.index),
+        factor_df=factor_df,
+    )
+    if not betas or annual_idio_var is None:
+        return None
+    return {
+        "ticker": ticker,
+        "betas": betas,
+        "factor_vols": {factor: float(vol) for factor, vol in factor_vols.items()},
+        "annual_idio_var": annual_idio_var,
+    }
+
+
+def _compute_single_ticker_factors(
+    ticker: str,
+    proxies: Dict[str, Union[str, List[str]]],
+    start_date: str,
+    end_date: str,
+    ticker_alias_map: Optional[Dict[str, str]] = None,
+    proxy_cache: Optional[Dict[object, pd.Series]] = None,
+    stock_returns: Optional[pd.Series] = None,
+) -> Optional[Dict[str, Any]]:
+    """Compute factor betas and idiosyncratic variance for one ticker."""
+    return _compute_ticker_factors_batch(
+        [ticker],
+        {ticker: proxies},
+        start_date,
+        end_date,
+        ticker_alias_map=ticker_alias_map,
+        proxy_cache=proxy_cache,
+        stock_return_cache={ticker: stock_returns} if stock_returns is not None else None,
+    )[ticker]
 
 
 def _compute_factor_panel_stats(
@@ -1720,9 +2358,13 @@ def compute_factor_exposures(
     stock_return_cache: Optional[Dict[str, pd.Series]] = None,
     security_identities: Optional[Dict[str, Any]] = None,
     coverage: Optional[PortfolioCoverage] = None,
+    return_context: Optional[ReturnSeriesContext] = None,
 ) -> Dict[str, Any]:
     """
     Compute stock-level factor exposures and weighted factor variance.
+
+    ``return_context`` (optional) memoizes stock and proxy return fetches
+    across stages of the same request.
     """
     df_stock_betas = pd.DataFrame(index=weights.keys())
     idio_var_dict: Dict[str, float] = {}
@@ -1737,7 +2379,8 @@ def compute_factor_exposures(
         stock_return_cache = {}
         for ticker in weights:
             try:
-                result = _fetch_ticker_returns(
+                result = _context_ticker_returns(
+                    return_context,
                     ticker=ticker,
                     start_date=start_date,
                     end_date=end_date,
@@ -1800,85 +2443,87 @@ def compute_factor_exposures(
             eligible_tickers, proxy_map, start_date, end_date,
             ticker_alias_map=ticker_alias_map,
             stock_return_cache=stock_return_cache,
+            return_context=return_context,
         )
 
-        max_workers = min(12, len(eligible_tickers)) or 1
-        futures_by_ticker = {}
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for ticker in eligible_tickers:
-                futures_by_ticker[ticker] = executor.submit(
-                    _compute_single_ticker_factors,
-                    ticker=ticker,
-                    proxies=proxy_map[ticker],
-                    start_date=start_date,
-                    end_date=end_date,
-                    ticker_alias_map=ticker_alias_map,
-                    proxy_cache=proxy_cache,
-                    stock_returns=stock_return_cache.get(ticker),
-                )
+        factor_results = _compute_ticker_factors_batch(
+            eligible_tickers,
+            proxy_map,
+            start_date,
+            end_date,
+            ticker_alias_map=ticker_alias_map,
+            proxy_cache=proxy_cache,
+            stock_return_cache=stock_return_cache,
+        )
 
-            for ticker in eligible_tickers:
-                ticker_factor_result = futures_by_ticker[ticker].result()
-                betas = ticker_factor_result["betas"] if ticker_factor_result else {}
-                if ticker_factor_result is not None:
-                    df_stock_betas.loc[ticker, betas.keys()] = pd.Series(betas)
-                    factor_vols = ticker_factor_result.get("factor_vols") or {}
-                    if factor_vols:
-                        factor_vols_by_ticker[ticker] = factor_vols
-                    idio_var_dict[ticker] = ticker_factor_result["annual_idio_var"]
-
-                proxies = proxy_map[ticker]
-                if proxies.get("_futures_skip") is True:
-                    factors = {
-                        factor_name: FactorCoverage(modeled=True)
-                        for factor_name in ("market", "momentum", "value")
+        betas_by_ticker: Dict[str, Dict[str, float]] = {}
+        for ticker in eligible_tickers:
+            ticker_factor_result = factor_results[ticker]
+            betas = ticker_factor_result["betas"] if ticker_factor_result else {}
+            if ticker_factor_result is not None:
+                if betas:
+                    betas_by_ticker[ticker] = betas
+                factor_vols = ticker_factor_result.get("factor_vols") or {}
+                if factor_vols:
+                    factor_vols_by_ticker[ticker] = factor_vols
+                idio_var_dict[ticker] = ticker_factor_result["annual_idio_var"]
+
+            proxies = proxy_map[ticker]
+            if proxies.get("_futures_skip") is True:
+                factors = {
+                    factor_name: FactorCoverage(modeled=True)
+                    for factor_name in ("market", "momentum", "value")
+                }
+                factors.update(
+                    {
+                        factor_name: FactorCoverage(
+                            modeled=False,
+                            detail="industry classification unavailable for futures",
+                        )
+                        for factor_name in ("industry", "subindustry")
                     }
-                    factors.update(
-                        {
-                            factor_name: FactorCoverage(
-                                modeled=False,
-                                detail="industry classification unavailable for futures",
-                            )
-                            for factor_name in ("industry", "subindustry")
-                        }
-                    )
+                )
+                overall_status = ModelingStatus.PARTIALLY_MODELED
+            else:
+                factors = _build_factor_coverage_for_ticker(proxies, betas)
+                modeled_factor_count = sum(
+                    1 for factor_coverage in factors.values() if factor_coverage.modeled
+                )
+                if factors and modeled_factor_count == len(factors):
+                    overall_status = ModelingStatus.FULLY_MODELED
+                elif modeled_factor_count > 0:
                     overall_status = ModelingStatus.PARTIALLY_MODELED
                 else:
-                    factors = _build_factor_coverage_for_ticker(proxies, betas)
-                    modeled_factor_count = sum(
-                        1 for factor_coverage in factors.values() if factor_coverage.modeled
-                    )
-                    if factors and modeled_factor_count == len(factors):
-                        overall_status = ModelingStatus.FULLY_MODELED
-                    elif modeled_factor_count > 0:
-                        overall_status = ModelingStatus.PARTIALLY_MODELED
-                    else:
-                        overall_status = ModelingStatus.PARTIALLY_MODELED
-
-                if (
-                    str(
-                        _identity_value(
-                            (security_identities or {}).get(ticker),
-                            "resolution_method",
-                            "",
-                        )
-                    ).lower()
-                    == "unresolved"
-                    and overall_status == ModelingStatus.FULLY_MODELED
-                ):
-                    overall_status = ModelingStatus.UNRESOLVED_IDENTITY
-
-                coverage.add(
-                    SecurityCoverage(
-                        security_key=_coverage_security_key(
-                            ticker,
-                            security_identities=security_identities,
-                        ),
-                        factors=factors,
-                        overall_status=overall_status,
+                    overall_status = ModelingStatus.PARTIALLY_MODELED
+
+            if (
+                str(
+                    _identity_value(
+                        (security_identities or {}).get(ticker),
+                        "resolution_method",
+                        "",
                     )
+                ).lower()
+                == "unresolved"
+                and overall_status == ModelingStatus.FULLY_MODELED
+            ):
+                overall_status = ModelingStatus.UNRESOLVED_IDENTITY
+
+            coverage.add(
+                SecurityCoverage(
+                    security_key=_coverage_security_key(
+                        ticker,
+                        security_identities=security_identities,
+                    ),
+                    factors=factors,
+                    overall_status=overall_status,
                 )
+            )
+
+        if betas_by_ticker:
+            df_stock_betas = pd.DataFrame.from_dict(betas_by_ticker, orient="index").reindex(
+                df_stock_betas.index
+            )
 
     interest_rate_vol: Optional[float] = None
     if asset_classes:
@@ -2162,6 +2807,7 @@ def build_portfolio_view(
     security_types: Optional[Dict[str, str]] = None,
     contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
     security_identities: Optional[Dict[str, Any]] = None,
+    return_context: Optional[ReturnSeriesContext] = None,
 ) -> Dict[str, Any]:
     """
     Build comprehensive portfolio view with LRU caching.
@@ -2184,6 +2830,8 @@ def build_portfolio_view(
     - currency_map enables FX-adjusted returns for non-USD holdings.
     - instrument_types allows explicit futures tagging for safe non-USD futures
       currency inference (avoids ticker collisions with equities).
+    - return_context (ReturnSeriesContext) shares fetched return series with
+      other stages of the same request; it is not part of the cache key.
     """
     # Serialize parameters for LRU cache
     weights_json = serialize_for_cache(weights)
@@ -2201,11 +2849,16 @@ def build_portfolio_view(
     cache_version = "rbeta_v3"
 
     # Return cached computation keyed by bond mask and version
-    return _cached_build_portfolio_view(
-        weights_json, start_date, end_date, expected_returns_json, stock_factor_proxies_json,
-        bond_mask_json, cache_version, ticker_alias_map_json, currency_map_json, instrument_types_json,
-        security_types_json, contract_identities_json, security_identities_json
-    )
+    previous_context = getattr(_view_context, "return_context", None)
+    _view_context.return_context = return_context
+    try:
+        return _cached_build_portfolio_view(
+            weights_json, start_date, end_date, expected_returns_json, stock_factor_proxies_json,
+            bond_mask_json, cache_version, ticker_alias_map_json, currency_map_json, instrument_types_json,
+            security_types_json, contract_identities_json, security_identities_json
+        )
+    finally:
+        _view_context.return_context = previous_context
 
 
 def expand_risk_result_for_tickers(
@@ -2281,133 +2934,719 @@ def expand_risk_result_for_tickers(
     )
     return expanded_result, still_missing
 
-@log_errors("high")
-def _build_portfolio_view_computation(
-    weights: Dict[str, float],
+# ── weight-independent risk model ───────────────────────────────────────────
+
+_RATE_BETA_COLS = ("interest_rate", *_RATE_MATURITY_COL_MAP.values())
+_RISK_MODEL_FRAME_CACHE_SIZE = 8
+
+
+def _risk_model_bond_tickers(
+    asset_classes: Optional[Dict[str, str]],
+    tickers: List[str],
+) -> frozenset:
+    return frozenset(json.loads(_build_bond_injection_mask(asset_classes, dict.fromkeys(tickers, 0.0))))
+
+
+def _risk_model_signature(
+    ticker: str,
+    *,
+    bond_tickers: frozenset,
+    stock_factor_proxies: Optional[Dict[str, Any]] = None,
+    ticker_alias_map: Optional[Dict[str, str]] = None,
+    currency_map: Optional[Dict[str, str]] = None,
+    instrument_types: Optional[Dict[str, str]] = None,
+    contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    security_identities: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Every per-ticker input that changes a ticker's returns, betas or coverage."""
+    identity = (security_identities or {}).get(ticker)
+    return json.dumps(
+        [
+            (stock_factor_proxies or {}).get(ticker),
+            ticker in bond_tickers,
+            (ticker_alias_map or {}).get(ticker),
+            (currency_map or {}).get(ticker),
+            (instrument_types or {}).get(ticker),
+            (contract_identities or {}).get(ticker),
+            _serialize_security_identities_for_cache({ticker: identity}) if identity is not None else None,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _stack_ticker_rows(base: pd.DataFrame, extra: pd.DataFrame, replaced) -> pd.DataFrame:
+    base = base.drop(index=[t for t in replaced if t in base.index])
+    frames = [frame for frame in (base, extra) if len(frame.index)]
+    if not frames:
+        return base
+    return pd.concat(frames, axis=0, sort=False)
+
+
+@dataclass(frozen=True)
+class FactorCovariance:
+    """
+    Factor-structured monthly covariance ``Σ = B F Bᵀ + diag(d)``.
+
+    ``loadings`` (n × k) holds each ticker's joint betas to the distinct
+    proxy return series in ``factors`` (one column per ETF, excess-return
+    pair or peer basket), ``factor_cov`` (k × k) their covariance and
+    ``idio_var`` (n) the idiosyncratic variances.  Memory and optimizer
+    cost grow with n·k instead of n².
+    """
+
+    tickers: Tuple[str, ...]
+    factors: Tuple[str, ...]
+    loadings: np.ndarray
+    factor_cov: np.ndarray
+    idio_var: np.ndarray
+
+    def factor_root(self) -> np.ndarray:
+        """``R`` with ``RᵀR = F`` (k × k)."""
+        vals, vecs = np.linalg.eigh(self.factor_cov)
+        return (vecs * np.sqrt(np.clip(vals, 0.0, None))).T
+
+    def variance(self, weights) -> float:
+        w = np.asarray(weights, dtype=float)
+        exposure = self.loadings.T @ w
+        return float(exposure @ self.factor_cov @ exposure + (self.idio_var * w * w).sum())
+
+    def dense(self) -> pd.DataFrame:
+        """The equivalent n × n covariance (for reporting; O(n²))."""
+        cov = self.loadings @ self.factor_cov @ self.loadings.T + np.diag(self.idio_var)
+        return pd.DataFrame(cov, index=list(self.tickers), columns=list(self.tickers))
+
+
+def _factor_source_label(key: object) -> str:
+    """Stable factor name for a ``_resolve_ticker_factor_sources`` source key."""
+    parts = [str(part) for part in (key if isinstance(key, tuple) else (key,)) if part != "__fetched__"]
+    if parts[0] == "__excess__":
+        return f"{parts[1]}-{parts[2]}"
+    if parts[0] == "__peer_median__":
+        return "peers:" + "+".join(parts[1:])
+    return parts[0]
+
+
+class PortfolioRiskModel:
+    """
+    Weight-independent half of ``build_portfolio_view`` for one ticker universe.
+
+    Per-ticker return series, factor betas, factor vols, idiosyncratic
+    variances and coverage do not depend on weights.  Built once, the model is
+    re-weighted by ``view()`` with pandas/numpy math only (covariance, Euler
+    and factor variance are O(n²) at most) and grown by ``extend()``, which
+    fetches and regresses just the tickers it has not seen.
+
+    ``view(weights)`` returns the same dict as ``build_portfolio_view`` for any
+    weights whose tickers lie in the universe; the covariance window is
+    re-derived from the per-ticker series so dropping or adding names shifts
+    it exactly as a full run would.
+    """
+
+    def __init__(self, start_date: str, end_date: str) -> None:
+        self.start_date = start_date
+        self.end_date = end_date
+        self.data_version = current_data_version()
+        self.signatures: Dict[str, str] = {}
+        self.returns: Dict[str, pd.Series] = {}
+        self.fx_attribution: Dict[str, Dict[str, Any]] = {}
+        self.betas = pd.DataFrame()
+        self.factor_vols = pd.DataFrame()
+        self.idio_var: Dict[str, float] = {}
+        self.coverage: Dict[str, SecurityCoverage] = {}
+        self.stock_factor_proxies: Dict[str, Any] = {}
+        self.bond_tickers: frozenset = frozenset()
+        self.build_steps: Dict[str, float] = {}
+        self.return_context: Optional[ReturnSeriesContext] = None
+        self._frames: "OrderedDict[Tuple[str, ...], Tuple[pd.DataFrame, ...]]" = OrderedDict()
+        self._worst_losses: Dict[Optional[str], Dict[str, float]] = {}
+        self._factor_covariances: "OrderedDict[tuple, FactorCovariance]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self.signatures)
+
+    @classmethod
+    def build(
+        cls,
+        tickers,
+        start_date: str,
+        end_date: str,
+        *,
+        stock_factor_proxies: Optional[Dict[str, Dict[str, Union[str, List[str]]]]] = None,
+        asset_classes: Optional[Dict[str, str]] = None,
+        ticker_alias_map: Optional[Dict[str, str]] = None,
+        currency_map: Optional[Dict[str, str]] = None,
+        instrument_types: Optional[Dict[str, str]] = None,
+        contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
+        security_identities: Optional[Dict[str, Any]] = None,
+        return_context: Optional[ReturnSeriesContext] = None,
+        allow_empty: bool = False,
+    ) -> "PortfolioRiskModel":
+        """
+        Fetch returns and regress factors for ``tickers``.
+
+        Raises ``ValueError`` (from ``get_returns_dataframe``) when no ticker
+        has usable history, unless ``allow_empty`` is set.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        model = cls(start_date, end_date)
+        # Kept on the model so extensions reuse the proxy series fetched here.
+        model.return_context = return_context or ReturnSeriesContext()
+        return_context = model.return_context
+        model.bond_tickers = _risk_model_bond_tickers(asset_classes, tickers)
+        model.signatures = {
+            ticker: _risk_model_signature(
+                ticker,
+                bond_tickers=model.bond_tickers,
+                stock_factor_proxies=stock_factor_proxies,
+                ticker_alias_map=ticker_alias_map,
+                currency_map=currency_map,
+                instrument_types=instrument_types,
+                contract_identities=contract_identities,
+                security_identities=security_identities,
+            )
+            for ticker in tickers
+        }
+        model.stock_factor_proxies = {
+            ticker: (stock_factor_proxies or {})[ticker]
+            for ticker in tickers
+            if ticker in (stock_factor_proxies or {})
+        }
+
+        t0 = time.perf_counter()
+        try:
+            get_returns_dataframe(
+                dict.fromkeys(tickers, 0.0),
+                start_date,
+                end_date,
+                ticker_alias_map=ticker_alias_map,
+                currency_map=currency_map,
+                instrument_types=instrument_types,
+                fx_attribution_out=model.fx_attribution,
+                raw_returns_out=model.returns,
+                contract_identities=contract_identities,
+                return_context=return_context,
+            )
+        except ValueError:
+            if not allow_empty:
+                raise
+        model.fx_attribution = {
+            ticker: value for ticker, value in model.fx_attribution.items() if ticker in model.returns
+        }
+        model.build_steps["get_returns"] = round((time.perf_counter() - t0) * 1000, 2)
+
+        valid = [ticker for ticker in tickers if ticker in model.returns]
+        if not valid:
+            return model
+
+        t1 = time.perf_counter()
+        coverage = PortfolioCoverage()
+        bonds = {ticker: "bond" for ticker in model.bond_tickers}
+        factor_result = compute_factor_exposures(
+            weights=dict.fromkeys(valid, 0.0),
+            df_ret=pd.DataFrame({ticker: model.returns[ticker] for ticker in valid}).dropna(),
+            stock_factor_proxies=stock_factor_proxies,
+            asset_classes=bonds or None,
+            start_date=start_date,
+            end_date=end_date,
+            ticker_alias_map=ticker_alias_map,
+            stock_return_cache=model.returns,
+            security_identities=security_identities,
+            coverage=coverage,
+            return_context=return_context,
+        )
+        model.betas = factor_result["df_stock_betas_raw"]
+        model.factor_vols = factor_result["df_factor_vols"]
+        model.idio_var = dict(factor_result["idio_var_dict"])
+        for ticker in valid:
+            security_coverage = coverage.securities.get(
+                _coverage_security_key(ticker, security_identities=security_identities)
+            )
+            if security_coverage is not None:
+                model.coverage[ticker] = security_coverage
+        model.build_steps["factor_exposures"] = round((time.perf_counter() - t1) * 1000, 2)
+        return model
+
+    def missing_tickers(self, tickers, **ticker_inputs) -> List[str]:
+        """Tickers absent from the model or whose per-ticker inputs changed."""
+        tickers = list(dict.fromkeys(tickers))
+        bond_tickers = _risk_model_bond_tickers(ticker_inputs.pop("asset_classes", None), tickers)
+        return [
+            ticker
+            for ticker in tickers
+            if self.signatures.get(ticker)
+            != _risk_model_signature(ticker, bond_tickers=bond_tickers, **ticker_inputs)
+        ]
+
+    def extend(self, tickers, **kwargs) -> "PortfolioRiskModel":
+        """
+        Return a new model that also covers ``tickers``.
+
+        Only tickers missing from this model (or whose proxies, aliases,
+        currency, instrument type or identity changed) are fetched and
+        regressed; everything else is carried over.  Accepts the keyword
+        arguments of ``build``.
+        """
+        ticker_inputs = {
+            key: kwargs.get(key)
+            for key in (
+                "stock_factor_proxies", "asset_classes", "ticker_alias_map", "currency_map",
+                "instrument_types", "contract_identities", "security_identities",
+            )
+        }
+        missing = self.missing_tickers(tickers, **ticker_inputs)
+        if not missing:
+            return self
+        kwargs["allow_empty"] = True
+        if kwargs.get("return_context") is None:
+            kwargs["return_context"] = self.return_context
+        added = type(self).build(missing, self.start_date, self.end_date, **kwargs)
+        return self._merged(added)
+
+    def _merged(self, added: "PortfolioRiskModel") -> "PortfolioRiskModel":
+        replaced = set(added.signatures)
+        merged = type(self)(self.start_date, self.end_date)
+        merged.data_version = self.data_version
+        merged.signatures = {
+            **{t: s for t, s in self.signatures.items() if t not in replaced},
+            **added.signatures,
+        }
+        merged.returns = {
+            **{t: s for t, s in self.returns.items() if t not in replaced},
+            **added.returns,
+        }
+        merged.fx_attribution = {
+            **{t: v for t, v in self.fx_attribution.items() if t not in replaced},
+            **added.fx_attribution,
+        }
+        merged.idio_var = {
+            **{t: v for t, v in self.idio_var.items() if t not in replaced},
+            **added.idio_var,
+        }
+        merged.coverage = {
+            **{t: c for t, c in self.coverage.items() if t not in replaced},
+            **added.coverage,
+        }
+        merged.stock_factor_proxies = {
+            **{t: p for t, p in self.stock_factor_proxies.items() if t not in replaced},
+            **added.stock_factor_proxies,
+        }
+        merged.bond_tickers = (self.bond_tickers - replaced) | added.bond_tickers
+        merged.betas = _stack_ticker_rows(self.betas, added.betas, replaced)
+        # Rate betas are explicit zeros for non-eligible names; rows from a
+        # part built without rate factors get the same zeros.
+        for col in _RATE_BETA_COLS:
+            if col in merged.betas.columns:
+                merged.betas[col] = merged.betas[col].fillna(0.0)
+        merged.factor_vols = _stack_ticker_rows(self.factor_vols, added.factor_vols, replaced)
+        merged.build_steps = dict(added.build_steps)
+        merged.return_context = added.return_context
+        merged._worst_losses = self._worst_losses
+        return merged
+
+    def _frame(self, tickers: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """(df_ret, covariance, correlation, stock performance) for one ticker set."""
+        key = tuple(tickers)
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached is not None:
+                self._frames.move_to_end(key)
+                return cached
+        df_ret = pd.DataFrame({ticker: self.returns[ticker] for ticker in tickers}).dropna()
+        frame = (
+            df_ret,
+            compute_covariance_matrix(df_ret),
+            compute_correlation_matrix(df_ret),
+            compute_stock_performance_metrics(
+                df_ret,
+                risk_free_rate=0.04,
+                start_date=self.start_date,
+                end_date=self.end_date,
+            ),
+        )
+        with self._lock:
+            self._frames[key] = frame
+            while len(self._frames) > _RISK_MODEL_FRAME_CACHE_SIZE:
+                self._frames.popitem(last=False)
+        return frame
+
+    def _factor_exposures(
+        self,
+        weights: Dict[str, float],
+        include_rate_factors: bool,
+    ) -> Dict[str, Any]:
+        tickers = list(weights)
+        betas_raw = self.betas.reindex(index=tickers)
+        columns = [
+            col for col in betas_raw.columns
+            if betas_raw[col].notna().any() and (include_rate_factors or col not in _RATE_BETA_COLS)
+        ]
+        betas_raw = betas_raw[columns]
+        betas_filled = betas_raw.infer_objects().fillna(0.0)
+
+        if any(ticker in self.stock_factor_proxies for ticker in tickers):
+            df_factor_vols = (
+                self.factor_vols.reindex(index=tickers, columns=columns).infer_objects().fillna(0.0)
+            )
+            weighted_factor_var = calc_weighted_factor_variance(weights, betas_filled, df_factor_vols)
+        else:
+            df_factor_vols = pd.DataFrame(index=betas_raw.index, columns=betas_raw.columns)
+            weighted_factor_var = pd.DataFrame(index=betas_raw.index, columns=betas_raw.columns)
+
+        w_series = pd.Series(weights, dtype=float).reindex(betas_filled.index).fillna(0.0)
+        return {
+            "df_stock_betas": betas_filled,
+            "df_stock_betas_raw": betas_raw,
+            "idio_var_dict": {t: self.idio_var[t] for t in tickers if t in self.idio_var},
+            "df_factor_vols": df_factor_vols,
+            "weighted_factor_var": weighted_factor_var,
+            "portfolio_factor_betas": betas_filled.mul(w_series, axis=0).sum(skipna=True),
+        }
+
+    def view(
+        self,
+        weights: Dict[str, float],
+        expected_returns: Optional[Dict[str, float]] = None,
+        security_types: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Re-weight the model into the ``build_portfolio_view`` result for ``weights``."""
+        outside = [t for t in weights if t not in self.signatures]
+        if outside:
+            raise ValueError(
+                f"Tickers outside the risk model universe: {outside}. Extend the model first."
+            )
+
+        requested = list(weights)
+        excluded_tickers = [t for t in requested if t not in self.returns]
+        coverage = PortfolioCoverage()
+        for ticker in excluded_tickers:
+            coverage.add(
+                SecurityCoverage(
+                    security_key=ticker,
+                    factors={},
+                    overall_status=ModelingStatus.EXCLUDED_NO_HISTORY,
+                    excluded_at="returns",
+                )
+            )
+
+        if excluded_tickers:
+            from portfolio_risk_engine._logging import portfolio_logger
+
+            valid_weights = {t: w for t, w in weights.items() if t in self.returns}
+            total_valid_weight = sum(valid_weights.values())
+
+            if valid_weights and total_valid_weight > 0:
+                weights = {t: w / total_valid_weight for t, w in valid_weights.items()}
+
+                portfolio_logger.warning(
+                    f"📊 WEIGHTS RE-NORMALIZED: Excluded {len(excluded_tickers)} ticker(s) "
+                    f"[{', '.join(excluded_tickers)}]. "
+                    f"Remaining {len(weights)} positions re-normalized from {total_valid_weight:.1%} to 100%."
+                )
+            else:
+                raise ValueError(
+                    f"Cannot compute portfolio view: all tickers excluded. "
+                    f"Excluded: {excluded_tickers}"
+                )
+
+        df_ret, cov_mat, corr_mat, stock_perf = self._frame(list(weights))
+        df_alloc = compute_target_allocations(weights, expected_returns)
+        port_ret = compute_portfolio_returns(df_ret, weights)
+        vol_m = compute_portfolio_volatility(weights, cov_mat)
+        vol_a = vol_m * np.sqrt(12)
+        rc = compute_risk_contributions(weights, cov_mat)
+        hhi = compute_herfindahl(weights, security_types=security_types)
+
+        factor_result = self._factor_exposures(
+            weights,
+            include_rate_factors=any(t in self.bond_tickers for t in requested),
+        )
+        for ticker in weights:
+            if ticker in self.coverage:
+                coverage.add(self.coverage[ticker])
+        var_result = compute_variance_attribution(
+            weights=weights,
+            cov_mat=cov_mat,
+            stock_factor_proxies=self.stock_factor_proxies,
+            weighted_factor_var=factor_result["weighted_factor_var"],
+            idio_var_dict=factor_result["idio_var_dict"],
+            vol_m=vol_m,
+            df_stock_betas=factor_result["df_stock_betas_raw"],
+        )
+        df_asset = compute_asset_vol_summary(
+            df_ret=df_ret,
+            weights=weights,
+            idio_var_dict=factor_result["idio_var_dict"],
+            stock_perf_metrics=stock_perf,
+        )
+
+        return {
+            "allocations": df_alloc,
+            "covariance_matrix": cov_mat,
+            "correlation_matrix": corr_mat,
+            "return_observation_count": len(df_ret),
+            "volatility_monthly": vol_m,
+            "volatility_annual": vol_a,
+            "risk_contributions": rc,
+            "herfindahl": hhi,
+            "df_stock_betas": factor_result["df_stock_betas"],
+            "portfolio_factor_betas": factor_result["portfolio_factor_betas"],
+            "factor_vols": factor_result["df_factor_vols"],
+            "weighted_factor_var": factor_result["weighted_factor_var"],
+            "euler_variance_pct": var_result["euler_variance_pct"],
+            "asset_vol_summary": df_asset,
+            "portfolio_returns": port_ret,
+            "variance_decomposition": var_result["variance_decomposition"],
+            "industry_variance": var_result["industry_variance"],
+            "fx_attribution": {t: self.fx_attribution[t] for t in weights if t in self.fx_attribution},
+            "coverage": coverage,
+        }
+
+    def worst_factor_losses(
+        self,
+        stock_factor_proxies: Dict[str, Dict[str, Union[str, List[str]]]],
+        ticker_alias_map: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, float]:
+        """``get_worst_monthly_factor_losses`` over the model window, memoized per proxy."""
+        from portfolio_risk_engine.risk_helpers import get_worst_monthly_factor_losses
+
+        with self._lock:
+            known = self._worst_losses.setdefault(serialize_for_cache(ticker_alias_map), {})
+        return get_worst_monthly_factor_losses(
+            stock_factor_proxies,
+            self.start_date,
+            self.end_date,
+            ticker_alias_map=ticker_alias_map,
+            known_losses=known,
+        )
+
+    def factor_covariance(
+        self,
+        tickers,
+        ticker_alias_map: Optional[Dict[str, str]] = None,
+    ) -> FactorCovariance:
+        """
+        Factor-structured covariance of ``tickers`` over the model window.
+
+        Factors are the distinct proxy series the model regressed on.  Each
+        ticker's loadings are its joint (multi-factor) betas to its own
+        proxies, the regression whose residual is the model's idiosyncratic
+        variance; single-factor betas would double-count correlated proxies
+        such as market and industry.  Tickers without proxies carry their
+        whole return variance as idiosyncratic.  Memoized per ticker set.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        key = (tuple(tickers), serialize_for_cache(ticker_alias_map))
+        with self._lock:
+            cached = self._factor_covariances.get(key)
+            if cached is not None:
+                self._factor_covariances.move_to_end(key)
+                return cached
+
+        proxy_map = {t: self.stock_factor_proxies[t] for t in tickers if t in self.stock_factor_proxies}
+        proxy_cache = _prefetch_proxy_returns(
+            list(proxy_map), proxy_map, self.start_date, self.end_date,
+            ticker_alias_map=ticker_alias_map,
+            stock_return_cache=self.returns,
+            return_context=self.return_context,
+        ) if proxy_map else {}
+        fetched: Dict[object, pd.Series] = {}
+
+        factor_index: Dict[str, int] = {}
+        factor_series: Dict[str, pd.Series] = {}
+        entries: List[Tuple[int, int, float]] = []
+        idio = np.zeros(len(tickers))
+        for i, ticker in enumerate(tickers):
+            returns = pd.to_numeric(self.returns.get(ticker, pd.Series(dtype=float)), errors="coerce").dropna()
+            sources: Dict[str, Tuple[object, pd.Series]] = {}
+            if ticker in proxy_map and ticker in self.betas.index:
+                try:
+                    sources = _resolve_ticker_factor_sources(
+                        proxy_map[ticker], self.start_date, self.end_date,
+                        ticker_alias_map, proxy_cache, fetched,
+                    )
+                except Exception:
+                    sources = {}
+                betas = self.betas.loc[ticker]
+                sources = {
+                    f: src for f, src in sources.items()
+                    if src[1] is not None and f in betas.index and pd.notna(betas[f])
+                }
+
+            frame = pd.concat(
+                [returns.rename("__y__")] + [src[1].rename(f) for f, src in sources.items()],
+                axis=1,
+                join="inner",
+            ).dropna() if sources else pd.DataFrame()
+            if len(frame) < len(sources) + 2:
+                idio[i] = float(returns.var(ddof=1)) if len(returns) > 1 else 0.0
+                continue
+
+            y = frame["__y__"].to_numpy(dtype=float)
+            x = frame[list(sources)].to_numpy(dtype=float)
+            y = y - y.mean()
+            x = x - x.mean(axis=0)
+            coef, *_ = np.linalg.lstsq(x, y, rcond=None)
+            resid_var = float(((y - x @ coef) ** 2).sum() / (len(y) - 1))
+            annual_idio = self.idio_var.get(ticker)
+            idio[i] = annual_idio / 12.0 if annual_idio is not None and np.isfinite(annual_idio) else resid_var
+
+            for f, beta in zip(sources, coef):
+                label = _factor_source_label(sources[f][0])
+                if label not in factor_index:
+                    factor_index[label] = len(factor_index)
+                    factor_series[label] = pd.to_numeric(sources[f][1], errors="coerce")
+                entries.append((i, factor_index[label], float(beta)))
+
+        factors = list(factor_index)
+        loadings = np.zeros((len(tickers), len(factors)))
+        for i, k, beta in entries:
+            loadings[i, k] += beta
+        if factors:
+            panel = pd.concat([factor_series[f].rename(f) for f in factors], axis=1)
+            factor_cov = panel.cov(min_periods=2).reindex(index=factors, columns=factors).fillna(0.0).to_numpy()
+            # Pairwise-complete estimates need not be PSD; clip to the nearest.
+            vals, vecs = np.linalg.eigh((factor_cov + factor_cov.T) / 2.0)
+            factor_cov = (vecs * np.clip(vals, 0.0, None)) @ vecs.T
+        else:
+            factor_cov = np.zeros((0, 0))
+
+        result = FactorCovariance(
+            tickers=tuple(tickers),
+            factors=tuple(factors),
+            loadings=loadings,
+            factor_cov=factor_cov,
+            idio_var=np.clip(idio, 0.0, None),
+        )
+        with self._lock:
+            self._factor_covariances[key] = result
+            while len(self._factor_covariances) > _RISK_MODEL_FRAME_CACHE_SIZE:
+                self._factor_covariances.popitem(last=False)
+        return result
+
+
+_risk_models: "OrderedDict[int, PortfolioRiskModel]" = OrderedDict()
+_risk_models_lock = threading.Lock()
+
+
+def _remember_risk_model(model: PortfolioRiskModel) -> None:
+    with _risk_models_lock:
+        _risk_models[id(model)] = model
+        _risk_models.move_to_end(id(model))
+        while len(_risk_models) > PORTFOLIO_RISK_MODEL_CACHE_SIZE:
+            _risk_models.popitem(last=False)
+
+
+def get_portfolio_risk_model(
+    tickers,
     start_date: str,
     end_date: str,
-    expected_returns: Optional[Dict[str, float]] = None,
     stock_factor_proxies: Optional[Dict[str, Dict[str, Union[str, List[str]]]]] = None,
     asset_classes: Optional[Dict[str, str]] = None,
     ticker_alias_map: Optional[Dict[str, str]] = None,
     currency_map: Optional[Dict[str, str]] = None,
     instrument_types: Optional[Dict[str, str]] = None,
-    security_types: Optional[Dict[str, str]] = None,
     contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
     security_identities: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
-    """Build a complete portfolio risk profile."""
-    _bpv_t0 = time.perf_counter()
-    _bpv_steps: Dict[str, float] = {}
+    return_context: Optional[ReturnSeriesContext] = None,
+) -> PortfolioRiskModel:
+    """
+    Return a ``PortfolioRiskModel`` covering ``tickers`` (a list or weights dict).
 
-    # Stage 0: Portfolio return setup
-    fx_attribution: Dict[str, Dict[str, Any]] = {}
-    raw_return_cache: Dict[str, pd.Series] = {}
-    df_ret = get_returns_dataframe(
-        weights,
-        start_date,
-        end_date,
+    Every full ``build_portfolio_view`` computation leaves its model here, so
+    what-if and optimizer evaluations over the same window reuse it: the
+    cached model sharing the most tickers is returned as is when it covers all
+    of them, otherwise extended with only the missing ones.  Models are scoped
+    to the data version used by the view cache, so a new trading day rebuilds.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    ticker_inputs = dict(
+        stock_factor_proxies=stock_factor_proxies,
+        asset_classes=asset_classes,
         ticker_alias_map=ticker_alias_map,
         currency_map=currency_map,
         instrument_types=instrument_types,
-        fx_attribution_out=fx_attribution,
-        raw_returns_out=raw_return_cache,
         contract_identities=contract_identities,
+        security_identities=security_identities,
     )
-    fx_attribution = {ticker: value for ticker, value in fx_attribution.items() if ticker in df_ret.columns}
-    _bpv_steps["get_returns"] = round((time.perf_counter() - _bpv_t0) * 1000, 2)
+    version = current_data_version()
+    with _risk_models_lock:
+        candidates = [
+            model for model in reversed(_risk_models.values())
+            if (model.data_version, model.start_date, model.end_date) == (version, start_date, end_date)
+        ]
 
-    valid_tickers = set(df_ret.columns)
-    excluded_tickers = [t for t in weights if t not in valid_tickers]
-    coverage = PortfolioCoverage()
-    for ticker in excluded_tickers:
-        coverage.add(
-            SecurityCoverage(
-                security_key=ticker,
-                factors={},
-                overall_status=ModelingStatus.EXCLUDED_NO_HISTORY,
-                excluded_at="returns",
-            )
+    best: Optional[PortfolioRiskModel] = None
+    best_missing: Optional[List[str]] = None
+    for model in candidates:
+        missing = model.missing_tickers(tickers, **ticker_inputs)
+        if best_missing is None or len(missing) < len(best_missing):
+            best, best_missing = model, missing
+        if not missing:
+            break
+
+    if best is not None and not best_missing:
+        _remember_risk_model(best)
+        return best
+    if best is not None and len(best_missing) < len(tickers):
+        model = best.extend(tickers, return_context=return_context, **ticker_inputs)
+    else:
+        model = PortfolioRiskModel.build(
+            tickers, start_date, end_date, return_context=return_context, **ticker_inputs
         )
+    _remember_risk_model(model)
+    return model
 
-    if excluded_tickers:
-        from portfolio_risk_engine._logging import portfolio_logger
 
-        # Filter to valid tickers only
-        valid_weights = {t: w for t, w in weights.items() if t in valid_tickers}
-        total_valid_weight = sum(valid_weights.values())
+def clear_portfolio_risk_models() -> None:
+    with _risk_models_lock:
+        _risk_models.clear()
 
-        if total_valid_weight > 0:
-            # Re-normalize so weights sum to 1.0
-            weights = {t: w / total_valid_weight for t, w in valid_weights.items()}
 
-            portfolio_logger.warning(
-                f"📊 WEIGHTS RE-NORMALIZED: Excluded {len(excluded_tickers)} ticker(s) "
-                f"[{', '.join(excluded_tickers)}]. "
-                f"Remaining {len(weights)} positions re-normalized from {total_valid_weight:.1%} to 100%."
-            )
-        else:
-            raise ValueError(
-                f"Cannot compute portfolio view: all tickers excluded. "
-                f"Excluded: {excluded_tickers}"
-            )
+@log_errors("high")
+def _build_portfolio_view_computation(
+    weights: Dict[str, float],
+    start_date: str,
+    end_date: str,
+    expected_returns: Optional[Dict[str, float]] = None,
+    stock_factor_proxies: Optional[Dict[str, Dict[str, Union[str, List[str]]]]] = None,
+    asset_classes: Optional[Dict[str, str]] = None,
+    ticker_alias_map: Optional[Dict[str, str]] = None,
+    currency_map: Optional[Dict[str, str]] = None,
+    instrument_types: Optional[Dict[str, str]] = None,
+    security_types: Optional[Dict[str, str]] = None,
+    contract_identities: Optional[Dict[str, Dict[str, Any]]] = None,
+    security_identities: Optional[Dict[str, Any]] = None,
+    return_context: Optional[ReturnSeriesContext] = None,
+) -> Dict[str, Any]:
+    """
+    Build a complete portfolio risk profile.
 
-    _bpv_t1 = time.perf_counter()
-    df_alloc = compute_target_allocations(weights, expected_returns)
-    port_ret = compute_portfolio_returns(df_ret, weights)
-    cov_mat = compute_covariance_matrix(df_ret)
-    corr_mat = compute_correlation_matrix(df_ret)
-    vol_m = compute_portfolio_volatility(weights, cov_mat)
-    vol_a = vol_m * np.sqrt(12)
-    rc = compute_risk_contributions(weights, cov_mat)
-    hhi = compute_herfindahl(weights, security_types=security_types)
-    _bpv_steps["portfolio_math"] = round((time.perf_counter() - _bpv_t1) * 1000, 2)
-
-    # Stage 1-2a: Factor analysis
-    _bpv_t2 = time.perf_counter()
-    factor_result = compute_factor_exposures(
-        weights=weights,
-        df_ret=df_ret,
+    Stage 0-2a (returns, factor regressions) produce a ``PortfolioRiskModel``
+    (``get_portfolio_risk_model``: a cached model covering the tickers is
+    re-weighted, one missing a few is extended); the weight-dependent stages
+    run in ``PortfolioRiskModel.view``.
+    """
+    _bpv_t0 = time.perf_counter()
+    model = get_portfolio_risk_model(
+        list(weights),
+        start_date,
+        end_date,
         stock_factor_proxies=stock_factor_proxies,
         asset_classes=asset_classes,
-        start_date=start_date,
-        end_date=end_date,
         ticker_alias_map=ticker_alias_map,
-        stock_return_cache=raw_return_cache,
+        currency_map=currency_map,
+        instrument_types=instrument_types,
+        contract_identities=contract_identities,
         security_identities=security_identities,
-        coverage=coverage,
-    )
-    _bpv_steps["factor_exposures"] = round((time.perf_counter() - _bpv_t2) * 1000, 2)
-
-    # Stage 2b-3: Variance attribution
-    _bpv_t3 = time.perf_counter()
-    var_result = compute_variance_attribution(
-        weights=weights,
-        cov_mat=cov_mat,
-        stock_factor_proxies=stock_factor_proxies,
-        weighted_factor_var=factor_result["weighted_factor_var"],
-        idio_var_dict=factor_result["idio_var_dict"],
-        vol_m=vol_m,
-        df_stock_betas=factor_result["df_stock_betas_raw"],
-    )
-
-    _bpv_steps["variance_attribution"] = round((time.perf_counter() - _bpv_t3) * 1000, 2)
-
-    # Stage 4: Per-stock performance + per-asset summary
-    _bpv_t4 = time.perf_counter()
-    stock_perf = compute_stock_performance_metrics(
-        df_ret,
-        risk_free_rate=0.04,
-        start_date=start_date,
-        end_date=end_date,
+        return_context=return_context,
     )
-    df_asset = compute_asset_vol_summary(
-        df_ret=df_ret,
-        weights=weights,
-        idio_var_dict=factor_result["idio_var_dict"],
-        stock_perf_metrics=stock_perf,
-    )
-    _bpv_steps["stock_perf_and_asset_vol"] = round((time.perf_counter() - _bpv_t4) * 1000, 2)
+    _bpv_t1 = time.perf_counter()
+    result = model.view(weights, expected_returns=expected_returns, security_types=security_types)
+    _bpv_steps = dict(model.build_steps)
+    _bpv_steps["reweight"] = round((time.perf_counter() - _bpv_t1) * 1000, 2)
     _bpv_steps["total"] = round((time.perf_counter() - _bpv_t0) * 1000, 2)
 
     try:
@@ -2416,27 +3655,7 @@ def _build_portfolio_view_computation(
     except Exception:
         pass
 
-    return {
-        "allocations": df_alloc,
-        "covariance_matrix": cov_mat,
-        "correlation_matrix": corr_mat,
-        "return_observation_count": len(df_ret),
-        "volatility_monthly": vol_m,
-        "volatility_annual": vol_a,
-        "risk_contributions": rc,
-        "herfindahl": hhi,
-        "df_stock_betas": factor_result["df_stock_betas"],
-        "portfolio_factor_betas": factor_result["portfolio_factor_betas"],
-        "factor_vols": factor_result["df_factor_vols"],
-        "weighted_factor_var": factor_result["weighted_factor_var"],
-        "euler_variance_pct": var_result["euler_variance_pct"],
-        "asset_vol_summary": df_asset,
-        "portfolio_returns": port_ret,
-        "variance_decomposition": var_result["variance_decomposition"],
-        "industry_variance": var_result["industry_variance"],
-        "fx_attribution": fx_attribution,
-        "coverage": factor_result["coverage"],
-    }
+    return result
 
 
 # In[ ]:
@@ -2499,6 +3718,7 @@ def calculate_portfolio_performance_metrics(
     instrument_types: Optional[Dict[str, str]] = None,
     include_attribution: bool = True,
     include_optional_metrics: bool = True,
+    return_context: Optional[ReturnSeriesContext] = None,
 ) -> Dict[str, Any]:
     """
     Calculate comprehensive portfolio performance metrics including risk-adjusted returns
@@ -2516,6 +3736,9 @@ def calculate_portfolio_performance_metrics(
             for non-USD tickers (used to FX-adjust returns).
         instrument_types (Optional[Dict[str, str]]): Mapping of ticker -> instrument type.
             Futures-tagged tickers are dispatched through futures pricing sources.
+        return_context (Optional[ReturnSeriesContext]): Request-scoped return memo. A
+            fresh one is created when omitted so the availability filter, returns
+            frame and attribution share fetched series.
         
     Returns:
         Dict[str, Any]: Performance metrics including:
@@ -2552,6 +3775,8 @@ def calculate_portfolio_performance_metrics(
         requested_month_points = 0
     requested_return_observations = max(1, requested_month_points - 1)
     min_obs = min(default_min_obs, requested_return_observations)
+    if return_context is None:
+        return_context = ReturnSeriesContext()
 
     # Pre-filter tickers with insufficient data and rebalance weights
     filtered_weights, excluded_tickers, warnings = _filter_tickers_by_data_availability(
@@ -2562,6 +3787,7 @@ def calculate_portfolio_performance_metrics(
         ticker_alias_map=ticker_alias_map,
         currency_map=currency_map,
         instrument_types=instrument_types,
+        return_context=return_context,
     )
     
     # If no tickers remain after filtering, return error
@@ -2581,6 +3807,7 @@ def calculate_portfolio_performance_metrics(
         currency_map=currency_map,
         min_observations=min_obs,
         instrument_types=instrument_types,
+        return_context=return_context,
     )
     portfolio_returns = compute_portfolio_returns_partial(df_ret, filtered_weights)
     
@@ -2712,6 +3939,7 @@ def calculate_portfolio_performance_metrics(
                 start_date=start_date,
                 end_date=end_date,
                 ticker_alias_map=ticker_alias_map,
+                return_context=return_context,
             )
         except Exception as exc:
             raise PerformanceAttributionUnavailable(
@@ -2893,6 +4121,7 @@ def _compute_factor_attribution(
     start_date: str,
     end_date: str,
     ticker_alias_map: Optional[Dict[str, str]] = None,
+    return_context: Optional[ReturnSeriesContext] = None,
 ) -> List[Dict[str, Any]]:
     """Compute portfolio-level factor return attribution via multivariate OLS."""
     if port_ret is None or port_ret.empty:
@@ -2917,21 +4146,28 @@ def _compute_factor_attribution(
         "value": "Value",
     }
 
+    excess_return = return_context.get_excess_returns if return_context is not None else fetch_excess_return
+
     try:
-        market_prices = fetch_monthly_total_return_price(
-            "SPY",
-            start_date,
-            end_date,
-            ticker_alias_map=ticker_alias_map,
-        )
-        market_returns = calc_monthly_returns(market_prices)
+        if return_context is not None:
+            market_returns = return_context.get_price_returns(
+                "SPY", start_date, end_date, ticker_alias_map=ticker_alias_map,
+            )
+        else:
+            market_prices = fetch_monthly_total_return_price(
+                "SPY",
+                start_date,
+                end_date,
+                ticker_alias_map=ticker_alias_map,
+            )
+            market_returns = calc_monthly_returns(market_prices)
         if not market_returns.empty:
             factor_data["market"] = pd.to_numeric(market_returns, errors="coerce").dropna()
     except Exception:
         pass
 
     try:
-        momentum_returns = fetch_excess_return(
+        momentum_returns = excess_return(
             "MTUM",
             "SPY",
             start_date,
@@ -2944,7 +4180,7 @@ def _compute_factor_attribution(
         pass
 
     try:
-        value_returns = fetch_excess_return(
+        value_returns = excess_return(
             "IWD",
             "SPY",
             start_date,
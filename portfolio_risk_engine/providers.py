@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Protocol, Union, runtime_checkable
+from typing import Any, Iterable, Optional, Protocol, Union, runtime_checkable
 
 import pandas as pd
 
@@ -16,6 +16,66 @@ class PriceProvider(Protocol):
     def fetch_current_dividend_yield(self, ticker, **kw) -> float: ...
 
 
+@runtime_checkable
+class BatchPriceProvider(Protocol):
+    """Optional bulk extension of ``PriceProvider``.
+
+    Returns one DataFrame of month-end prices (index = dates, one column per
+    ticker that could be priced).  Tickers that cannot be priced are omitted
+    rather than raising so callers can fall back per ticker.
+    """
+
+    def fetch_monthly_close_many(self, tickers, start_date=None, end_date=None, **kw) -> pd.DataFrame: ...
+    def fetch_monthly_total_return_price_many(self, tickers, start_date=None, end_date=None, **kw) -> pd.DataFrame: ...
+
+
+def supports_batch_prices(provider: Any) -> bool:
+    return isinstance(provider, BatchPriceProvider)
+
+
+def _align_price_columns(series_by_ticker: dict[str, pd.Series]) -> pd.DataFrame:
+    """Outer-join per-ticker month-end series into one DataFrame (column per ticker)."""
+    columns = {
+        ticker: series
+        for ticker, series in series_by_ticker.items()
+        if isinstance(series, pd.Series) and not series.dropna().empty
+    }
+    if not columns:
+        return pd.DataFrame()
+    return pd.concat(columns, axis=1).sort_index()
+
+
+def _fetch_many_via_single(
+    fetch_one: Any,
+    tickers: Iterable[str],
+    start_date=None,
+    end_date=None,
+    **kw,
+) -> pd.DataFrame:
+    """Default ``*_many`` implementation for providers without a bulk endpoint."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _one(ticker: str) -> Optional[pd.Series]:
+        try:
+            return fetch_one(ticker, start_date, end_date, **kw)
+        except Exception as exc:
+            from utils.logging import portfolio_logger
+
+            portfolio_logger.warning(
+                "Bulk price fetch could not price %s - omitting it from the batch: %s",
+                ticker,
+                exc,
+            )
+            return None
+
+    tickers = list(tickers)
+    if not tickers:
+        return pd.DataFrame()
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+        results = list(executor.map(_one, tickers))
+    return _align_price_columns(dict(zip(tickers, results)))
+
+
 @runtime_checkable
 class FXProvider(Protocol):
     def adjust_returns_for_fx(self, returns: pd.Series, currency: str, **kw) -> Union[pd.Series, dict]: ...
@@ -88,6 +148,69 @@ class _RegistryBackedPriceProvider:
             return last_result
         raise ValueError(f"No provider could price {ticker}") from last_exc
 
+    def fetch_monthly_close_many(self, tickers, start_date=None, end_date=None, **kw) -> pd.DataFrame:
+        """Price many tickers with one registry-chain walk.
+
+        Each chain provider receives only the tickers earlier providers could
+        not price, in a single bulk call when it exposes
+        ``fetch_monthly_close_many``.
+        """
+        from providers.bootstrap import get_registry
+
+        pending = [str(t) for t in dict.fromkeys(tickers)]
+        normalized = self._normalize_kwargs("", {k: v for k, v in kw.items() if k != "fmp_ticker"})
+        chain = get_registry().get_price_chain(normalized["instrument_type"])
+        priced: dict[str, pd.Series] = {}
+
+        for provider in chain:
+            if not pending:
+                break
+            try:
+                if hasattr(provider, "fetch_monthly_close_many"):
+                    frame = provider.fetch_monthly_close_many(pending, start_date, end_date, **normalized)
+                else:
+                    frame = _fetch_many_via_single(
+                        provider.fetch_monthly_close, pending, start_date, end_date, **normalized
+                    )
+            except Exception as exc:
+                from utils.logging import portfolio_logger
+
+                portfolio_logger.warning(
+                    "Bulk close fetch failed on %s for %d tickers - trying next provider: %s",
+                    type(provider).__name__,
+                    len(pending),
+                    exc,
+                )
+                continue
+            if frame is None or frame.empty:
+                continue
+            for ticker in pending:
+                if ticker in frame.columns and not frame[ticker].dropna().empty:
+                    priced[ticker] = frame[ticker].dropna()
+            pending = [t for t in pending if t not in priced]
+
+        return _align_price_columns(priced)
+
+    def fetch_monthly_total_return_price_many(self, tickers, start_date=None, end_date=None, **kw) -> pd.DataFrame:
+        from providers.bootstrap import get_registry
+
+        tickers = [str(t) for t in dict.fromkeys(tickers)]
+        dividend_provider = get_registry().get_dividend_provider()
+        if not dividend_provider:
+            from utils.logging import portfolio_logger
+
+            portfolio_logger.warning(
+                "No DividendProvider registered - falling back to close-only for %d tickers",
+                len(tickers),
+            )
+            return self.fetch_monthly_close_many(tickers, start_date, end_date, **kw)
+
+        if hasattr(dividend_provider, "fetch_monthly_total_return_price_many"):
+            return dividend_provider.fetch_monthly_total_return_price_many(tickers, start_date, end_date, **kw)
+        return _fetch_many_via_single(
+            dividend_provider.fetch_monthly_total_return_price, tickers, start_date, end_date, **kw
+        )
+
     def fetch_monthly_total_return_price(self, ticker, start_date=None, end_date=None, **kw) -> pd.Series:
         from providers.bootstrap import get_registry
 
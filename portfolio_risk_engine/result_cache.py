@@ -0,0 +1,339 @@
+"""Cross-process second-tier cache for portfolio view results.
+
+The in-process ``functools.lru_cache`` in ``portfolio_risk`` is the first
+tier.  This module provides the second tier: a content-addressed store that
+every worker process shares and that survives restarts.
+
+Keys are canonical SHA-256 digests of the view inputs plus a data-version
+stamp, so a new trading day (or an explicit version bump) naturally misses.
+Values are the full view dict (DataFrames, Series, coverage objects)
+serialized with pickle protocol 5 and zlib-compressed.  Because the store
+may be shared, ``DiskViewCache`` HMAC-signs every entry and never unpickles
+one whose signature does not verify; the key comes from
+``PORTFOLIO_VIEW_CACHE_SIGNING_KEY`` or a private key file in the cache
+directory.
+
+Backends are pluggable through ``ViewCacheBackend``; ``DiskViewCache`` is the
+default and is enabled when ``PORTFOLIO_VIEW_CACHE_DIR`` is set.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import secrets
+import pickle
+import threading
+import time
+import zlib
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Optional, Protocol, Union, runtime_checkable
+
+from portfolio_risk_engine._logging import portfolio_logger
+from portfolio_risk_engine.config import (
+    PORTFOLIO_VIEW_CACHE_DIR,
+    PORTFOLIO_VIEW_CACHE_MAX_BYTES,
+    PORTFOLIO_VIEW_CACHE_SIGNING_KEY,
+    PORTFOLIO_VIEW_CACHE_TTL_SECONDS,
+)
+
+_FORMAT_VERSION = "v1"
+_SIGNATURE_BYTES = hashlib.sha256().digest_size
+_KEY_FILE = ".signing_key"
+
+
+@runtime_checkable
+class ViewCacheBackend(Protocol):
+    def get(self, key: str) -> Optional[bytes]: ...
+    def set(self, key: str, payload: bytes) -> None: ...
+    def clear(self) -> None: ...
+    def stats(self) -> dict[str, Any]: ...
+
+
+def _load_signing_key(cache_dir: Path) -> bytes:
+    """
+    The configured signing key, else the directory's private key file.
+
+    The file is created once with mode 0600, so processes of other users
+    that can write the directory still cannot forge entries.
+    """
+    if PORTFOLIO_VIEW_CACHE_SIGNING_KEY:
+        return PORTFOLIO_VIEW_CACHE_SIGNING_KEY.encode("utf-8")
+    path = cache_dir / _KEY_FILE
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        key = path.read_bytes()
+        if len(key) < 32:
+            raise OSError(f"cache signing key {path} is truncated")
+        return key
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(secrets.token_bytes(32))
+    return path.read_bytes()
+
+
+class DiskViewCache:
+    """
+    File-per-entry store shared by all processes on a host.
+
+    Writes are atomic (temp file + ``os.replace``) and every entry is
+    prefixed with an HMAC-SHA256 of its payload; ``get`` drops entries that
+    fail verification instead of returning them.  Entries older than
+    ``ttl_seconds`` are treated as misses and removed.  The directory size
+    is tracked incrementally per write; only when it passes ``max_bytes``
+    (or every ``_RESCAN_SECONDS``, to pick up other processes' writes) is
+    the directory scanned and the least recently used entries (by mtime,
+    refreshed on every hit) evicted.
+    """
+
+    _SUFFIX = ".view.z"
+    _RESCAN_SECONDS = 300.0
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        *,
+        ttl_seconds: float = 86400.0,
+        max_bytes: int = 512 * 1024 * 1024,
+        signing_key: Optional[bytes] = None,
+    ) -> None:
+        self.cache_dir = Path(cache_dir).expanduser().resolve()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_bytes = int(max_bytes)
+        self._signing_key = signing_key or _load_signing_key(self.cache_dir)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.rejected = 0
+        self._size_bytes = 0
+        self._scanned_at = 0.0
+        self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self._SUFFIX}"
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._signing_key, payload, hashlib.sha256).digest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        rejected = False
+        try:
+            stat = path.stat()
+            if self.ttl_seconds > 0 and time.time() - stat.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                payload = None
+            else:
+                signed = path.read_bytes()
+                signature, payload = signed[:_SIGNATURE_BYTES], signed[_SIGNATURE_BYTES:]
+                if hmac.compare_digest(signature, self._sign(payload)):
+                    os.utime(path)            # LRU touch
+                else:
+                    path.unlink(missing_ok=True)
+                    payload, rejected = None, True
+            if payload is None:
+                with self._lock:
+                    self._size_bytes = max(self._size_bytes - stat.st_size, 0)
+        except OSError:
+            payload = None
+        if rejected:
+            portfolio_logger.warning("Discarding unsigned or tampered cache entry %s", path.name)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                self.rejected += rejected
+            else:
+                self.hits += 1
+        return payload
+
+    def set(self, key: str, payload: bytes) -> None:
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        signed = self._sign(payload) + payload
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        try:
+            tmp.write_bytes(signed)
+            os.replace(tmp, path)
+        except OSError as exc:
+            tmp.unlink(missing_ok=True)
+            portfolio_logger.warning("Portfolio view cache write failed for %s: %s", path.name, exc)
+            return
+        with self._lock:
+            self.writes += 1
+            self._size_bytes += len(signed) - replaced
+            due = (
+                (self.max_bytes > 0 and self._size_bytes > self.max_bytes)
+                or time.time() - self._scanned_at > self._RESCAN_SECONDS
+            )
+        if due:
+            self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob(f"*{self._SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Full scan: drop expired entries, evict LRU past ``max_bytes``, re-sync the size."""
+        entries = self._entries()
+        now = time.time()
+        total = 0
+        live = []
+        for mtime, size, path in entries:
+            if self.ttl_seconds > 0 and now - mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                continue
+            total += size
+            live.append((mtime, size, path))
+        evicted = 0
+        if self.max_bytes > 0 and total > self.max_bytes:
+            for mtime, size, path in sorted(live):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+        with self._lock:
+            self.evictions += evicted
+            self._size_bytes = total
+            self._scanned_at = now
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._size_bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        entries = self._entries()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cache_type": "disk",
+                "cache_dir": str(self.cache_dir),
+                "entries": len(entries),
+                "size_bytes": sum(size for _, size, _ in entries),
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "rejected": self.rejected,
+                "hit_rate": self.hits / lookups if lookups else 0,
+            }
+
+
+_backend: Optional[ViewCacheBackend] = None
+_backend_initialized = False
+_data_version_provider: Optional[Callable[[], str]] = None
+
+
+def set_view_cache_backend(backend: Optional[ViewCacheBackend]) -> None:
+    """Install (or with ``None`` disable) the second-tier backend."""
+    global _backend, _backend_initialized
+    _backend = backend
+    _backend_initialized = True
+
+
+def get_view_cache_backend() -> Optional[ViewCacheBackend]:
+    global _backend, _backend_initialized
+    if not _backend_initialized:
+        _backend_initialized = True
+        if PORTFOLIO_VIEW_CACHE_DIR:
+            try:
+                _backend = DiskViewCache(
+                    PORTFOLIO_VIEW_CACHE_DIR,
+                    ttl_seconds=PORTFOLIO_VIEW_CACHE_TTL_SECONDS,
+                    max_bytes=PORTFOLIO_VIEW_CACHE_MAX_BYTES,
+                )
+            except OSError as exc:
+                portfolio_logger.warning("Portfolio view disk cache disabled: %s", exc)
+                _backend = None
+    return _backend
+
+
+def set_data_version_provider(provider: Optional[Callable[[], str]]) -> None:
+    """
+    Override the data-version stamp folded into every key.
+
+    Defaults to ``PORTFOLIO_VIEW_DATA_VERSION`` when set, else today's date,
+    so results computed against yesterday's prices are never served.
+    """
+    global _data_version_provider
+    _data_version_provider = provider
+
+
+def current_data_version() -> str:
+    if _data_version_provider is not None:
+        return str(_data_version_provider())
+    return os.getenv("PORTFOLIO_VIEW_DATA_VERSION") or date.today().isoformat()
+
+
+def view_cache_key(*parts: Optional[str]) -> str:
+    """Canonical digest of the (already canonical JSON) inputs and data version."""
+    digest = hashlib.sha256()
+    for part in (_FORMAT_VERSION, current_data_version(), *parts):
+        digest.update(b"\x00" if part is None else str(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def encode_view(result: Any) -> bytes:
+    return zlib.compress(pickle.dumps(result, protocol=5), 1)
+
+
+def decode_view(payload: bytes) -> Any:
+    return pickle.loads(zlib.decompress(payload))
+
+
+def load_view(key: str) -> Optional[Any]:
+    backend = get_view_cache_backend()
+    if backend is None:
+        return None
+    payload = backend.get(key)
+    if payload is None:
+        return None
+    try:
+        return decode_view(payload)
+    except Exception as exc:
+        portfolio_logger.warning("Discarding unreadable portfolio view cache entry %s: %s", key[:12], exc)
+        return None
+
+
+def store_view(key: str, result: Any) -> None:
+    backend = get_view_cache_backend()
+    if backend is None:
+        return
+    try:
+        payload = encode_view(result)
+    except Exception as exc:
+        portfolio_logger.warning("Portfolio view not cacheable (%s); skipping second tier", exc)
+        return
+    backend.set(key, payload)
+
+
+def view_cache_stats() -> dict[str, Any]:
+    backend = get_view_cache_backend()
+    if backend is None:
+        return {"cache_type": "disabled"}
+    return backend.stats()
+
+
+def clear_view_cache() -> None:
+    backend = get_view_cache_backend()
+    if backend is not None:
+        backend.clear()
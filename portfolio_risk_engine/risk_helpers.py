@@ -7,10 +7,12 @@
 # === Imports for Risk Helper Functions ===
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 from core.cash_helpers import is_cur_ticker
 from portfolio_risk_engine.data_loader import fetch_monthly_close, fetch_monthly_total_return_price
 from portfolio_risk_engine.factor_utils import calc_monthly_returns, fetch_excess_return
+from portfolio_risk_engine.result_cache import current_data_version
 
 # In[ ]:
 
@@ -95,44 +97,100 @@ def _collect_unique_priceable_proxies(
     return unique_proxies
 
 
-def _fetch_single_proxy_worst(
+def _cached_proxy_monthly_returns(
     proxy: str,
     start_date: str,
     end_date: str,
-    ticker_alias_map: Dict[str, str] | None = None,
-) -> Tuple[str, float]:
-    """Fetch the worst monthly return for a single factor proxy."""
+    ticker_alias_items: Tuple[Tuple[str, str], ...] = (),
+    data_version: Optional[str] = None,
+) -> pd.Series:
+    """
+    Monthly returns for one factor proxy (total-return prices, close fallback).
+
+    Memoized per data version (``current_data_version()`` unless given), so
+    a long-lived process picks up new month-end data when the version rolls.
+    Callers get their own copy and may modify it.
+    """
+    version = data_version if data_version is not None else current_data_version()
+    return _proxy_monthly_returns_for_version(
+        proxy, start_date, end_date, ticker_alias_items, version
+    ).copy()
+
+
+@lru_cache(maxsize=512)
+def _proxy_monthly_returns_for_version(
+    proxy: str,
+    start_date: str,
+    end_date: str,
+    ticker_alias_items: Tuple[Tuple[str, str], ...],
+    data_version: str,
+) -> pd.Series:
+    del data_version  # cache key only
+    ticker_alias_map = dict(ticker_alias_items) or None
     try:
+        prices = fetch_monthly_total_return_price(
+            proxy,
+            start_date,
+            end_date,
+            ticker_alias_map=ticker_alias_map,
+        )
+    except Exception:
         try:
-            prices = fetch_monthly_total_return_price(
+            prices = fetch_monthly_close(
                 proxy,
                 start_date,
                 end_date,
                 ticker_alias_map=ticker_alias_map,
             )
-        except Exception:
-            try:
-                prices = fetch_monthly_close(
-                    proxy,
-                    start_date,
-                    end_date,
-                    ticker_alias_map=ticker_alias_map,
-                )
-            except Exception as close_exc:
-                raise WorstCaseDataUnavailable(
-                    f"Unable to fetch price history for factor proxy {proxy}"
-                ) from close_exc
-
-        returns = calc_monthly_returns(prices)
-        if returns.empty:
-            raise WorstCaseDataUnavailable(f"No monthly returns available for factor proxy {proxy}")
-        return proxy, float(returns.min())
-    except WorstCaseDataUnavailable:
-        raise
-    except Exception as exc:
-        raise WorstCaseDataUnavailable(
-            f"Unable to compute worst monthly return for factor proxy {proxy}"
-        ) from exc
+        except Exception as close_exc:
+            raise WorstCaseDataUnavailable(
+                f"Unable to fetch price history for factor proxy {proxy}"
+            ) from close_exc
+
+    returns = calc_monthly_returns(prices)
+    if returns.empty:
+        raise WorstCaseDataUnavailable(f"No monthly returns available for factor proxy {proxy}")
+    return returns
+
+
+def _alias_items(ticker_alias_map: Dict[str, str] | None) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((str(k), str(v)) for k, v in (ticker_alias_map or {}).items()))
+
+
+def get_factor_proxy_return_history(
+    proxies: Iterable[str],
+    start_date: str,
+    end_date: str,
+    ticker_alias_map: Dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """
+    Monthly returns of many factor proxies as one months x proxies panel.
+
+    Each proxy series is fetched once per window and alias map (in parallel,
+    memoized in-process), so worst-case scans, worst-month dates and
+    historical stress replays all read the same history.  Months a proxy
+    did not trade are NaN.
+
+    Raises:
+        WorstCaseDataUnavailable: A proxy has no usable price history.
+    """
+    unique_proxies = sorted({str(proxy) for proxy in proxies if proxy})
+    if not unique_proxies:
+        return pd.DataFrame(dtype=float)
+
+    alias_items = _alias_items(ticker_alias_map)
+    history: Dict[str, pd.Series] = {}
+    max_workers = min(8, len(unique_proxies))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_cached_proxy_monthly_returns, proxy, start_date, end_date, alias_items): proxy
+            for proxy in unique_proxies
+        }
+        for future in as_completed(futures):
+            history[futures[future]] = future.result()
+
+    panel = pd.concat([history[proxy] for proxy in unique_proxies], axis=1, keys=unique_proxies)
+    return panel.sort_index().astype(float)
 
 
 def _fetch_excess_worst(
@@ -142,33 +200,16 @@ def _fetch_excess_worst(
     end_date: str,
     ticker_alias_map: Dict[str, str] | None = None,
 ) -> Tuple[float, str]:
-    """Fetch the worst monthly excess return for a factor proxy versus its market proxy."""
-    try:
-        returns = fetch_excess_return(
-            factor_proxy,
-            market_proxy,
-            start_date,
-            end_date,
-            ticker_alias_map=ticker_alias_map,
-        )
-        if returns.empty:
-            raise WorstCaseDataUnavailable(
-                f"No excess returns available for {factor_proxy} vs {market_proxy}"
-            )
-
-        worst_idx = returns.idxmin()
-        if not hasattr(worst_idx, "strftime"):
-            raise WorstCaseDataUnavailable(
-                f"Worst excess return date is invalid for {factor_proxy} vs {market_proxy}"
-            )
+    """Worst monthly excess return (and its month) for a factor proxy versus its market proxy."""
+    from portfolio_risk_engine.factor_tail_stats import get_factor_tail_stats_table
 
-        return float(returns.min()), worst_idx.strftime("%Y-%m")
-    except WorstCaseDataUnavailable:
-        raise
-    except Exception as exc:
-        raise WorstCaseDataUnavailable(
-            f"Unable to compute worst excess return for {factor_proxy} vs {market_proxy}"
-        ) from exc
+    stats = get_factor_tail_stats_table().get_excess_stats(
+        [(factor_proxy, market_proxy)],
+        start_date,
+        end_date,
+        ticker_alias_map=ticker_alias_map,
+    )[(factor_proxy, market_proxy)]
+    return stats.worst, stats.worst_date
 
 
 def get_worst_monthly_factor_losses(
@@ -176,6 +217,7 @@ def get_worst_monthly_factor_losses(
     start_date: str,
     end_date: str,
     ticker_alias_map: Dict[str, str] | None = None,
+    known_losses: Dict[str, float] | None = None,
 ) -> Dict[str, float]:
     """
     For each unique factor proxy (ETF or peer group), fetch monthly returns over
@@ -186,11 +228,16 @@ def get_worst_monthly_factor_losses(
     Implementation notes (updated):
     - Returns prefer dividend-adjusted (total-return) prices for improved
       accuracy, with a safe fallback to close-only series when needed.
+    - Values come from the shared ``factor_tail_stats`` table, computed once
+      per proxy, window and data version.
 
     Args:
         stock_factor_proxies (Dict): From portfolio.yaml — maps tickers to their factor proxies.
         start_date (str): Start date for return window (YYYY-MM-DD).
         end_date (str): End date for return window (YYYY-MM-DD).
+        known_losses (Dict, optional): Worst returns already computed for the same
+            window and alias map. Proxies found there are not re-fetched, and newly
+            fetched values are added to it.
 
     Returns:
         Dict[str, float]: {proxy: worst 1-month return}
@@ -202,22 +249,22 @@ def get_worst_monthly_factor_losses(
     unique_proxies = _collect_unique_priceable_proxies(stock_factor_proxies)
 
     worst_losses: Dict[str, float] = {}
-    max_workers = min(8, len(unique_proxies)) or 1
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(
-                _fetch_single_proxy_worst,
-                proxy,
-                start_date,
-                end_date,
-                ticker_alias_map,
-            ): proxy
-            for proxy in sorted(unique_proxies)
-        }
-        for future in as_completed(futures):
-            proxy, worst = future.result()
-            worst_losses[proxy] = worst
+    if known_losses is not None:
+        worst_losses = {p: known_losses[p] for p in unique_proxies if p in known_losses}
+        unique_proxies = unique_proxies - set(worst_losses)
+    if unique_proxies:
+        from portfolio_risk_engine.factor_tail_stats import get_factor_tail_stats_table
+
+        tail_stats = get_factor_tail_stats_table().get_proxy_stats(
+            unique_proxies,
+            start_date,
+            end_date,
+            ticker_alias_map=ticker_alias_map,
+        )
+        for proxy, stats in tail_stats.items():
+            worst_losses[proxy] = stats.worst
+            if known_losses is not None:
+                known_losses[proxy] = stats.worst
 
     return worst_losses
 
@@ -229,40 +276,16 @@ def _get_worst_dates_for_proxies(
     ticker_alias_map: Dict[str, str] | None = None,
 ) -> Dict[str, str]:
     """Return {proxy: "YYYY-MM"} for the month of worst return per proxy."""
-    unique_proxies = _collect_unique_priceable_proxies(stock_factor_proxies)
+    from portfolio_risk_engine.factor_tail_stats import get_factor_tail_stats_table
 
-    worst_dates: Dict[str, str] = {}
-
-    for proxy in sorted(unique_proxies):
-        try:
-            prices = fetch_monthly_total_return_price(
-                proxy,
-                start_date,
-                end_date,
-                ticker_alias_map=ticker_alias_map,
-            )
-        except Exception:
-            try:
-                prices = fetch_monthly_close(
-                    proxy,
-                    start_date,
-                    end_date,
-                    ticker_alias_map=ticker_alias_map,
-                )
-            except Exception as close_exc:
-                raise WorstCaseDataUnavailable(
-                    f"Unable to fetch price history for factor proxy {proxy}"
-                ) from close_exc
-
-        returns = calc_monthly_returns(prices)
-        if returns.empty:
-            raise WorstCaseDataUnavailable(f"No monthly returns available for factor proxy {proxy}")
-
-        worst_idx = returns.idxmin()
-        if hasattr(worst_idx, "strftime"):
-            worst_dates[proxy] = worst_idx.strftime("%Y-%m")
-        else:
-            raise WorstCaseDataUnavailable(f"Worst return date is invalid for factor proxy {proxy}")
+    unique_proxies = _collect_unique_priceable_proxies(stock_factor_proxies)
+    tail_stats = get_factor_tail_stats_table().get_proxy_stats(
+        unique_proxies,
+        start_date,
+        end_date,
+        ticker_alias_map=ticker_alias_map,
+    )
+    worst_dates = {proxy: stats.worst_date for proxy, stats in sorted(tail_stats.items())}
 
     return worst_dates
 
@@ -565,18 +588,19 @@ def calc_max_factor_betas(
             if factor_proxy and isinstance(factor_proxy, str) and factor_proxy in worst_per_proxy:
                 excess_pairs.add((factor_proxy, market_proxy))
 
-    for factor_proxy, market_proxy in sorted(excess_pairs):
-        result = _fetch_excess_worst(
-            factor_proxy,
-            market_proxy,
+    if excess_pairs:
+        from portfolio_risk_engine.factor_tail_stats import get_factor_tail_stats_table
+
+        excess_stats = get_factor_tail_stats_table().get_excess_stats(
+            excess_pairs,
             start_str,
             end_str,
             ticker_alias_map=fmp_map,
         )
-        if result:
-            worst_excess_per_proxy[(factor_proxy, market_proxy)] = {
-                "loss": result[0],
-                "date": result[1],
+        for pair in sorted(excess_stats):
+            worst_excess_per_proxy[pair] = {
+                "loss": excess_stats[pair].worst,
+                "date": excess_stats[pair].worst_date,
             }
 
     # 4. --- worst per factor-type -------------------------------------------
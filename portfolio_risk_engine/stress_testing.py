@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 from core.result_objects import RiskAnalysisResult
+from portfolio_risk_engine.risk_helpers import get_factor_proxy_return_history
 
 
 STRESS_SCENARIOS: Dict[str, Dict[str, Any]] = {
@@ -66,6 +69,50 @@ STRESS_SCENARIOS: Dict[str, Dict[str, Any]] = {
 }
 
 
+HISTORICAL_EPISODES: Dict[str, Dict[str, Any]] = {
+    "gfc_2008": {
+        "name": "Global Financial Crisis",
+        "description": "Lehman collapse through the November 2008 lows",
+        "severity": "Extreme",
+        "start": "2008-09",
+        "end": "2008-11",
+    },
+    "euro_debt_2011": {
+        "name": "US Downgrade / Euro Debt Crisis",
+        "description": "S&P downgrade of US debt and euro-area contagion",
+        "severity": "High",
+        "start": "2011-08",
+        "end": "2011-09",
+    },
+    "q4_2018_selloff": {
+        "name": "Q4 2018 Selloff",
+        "description": "Fed tightening and growth scare",
+        "severity": "Medium",
+        "start": "2018-10",
+        "end": "2018-12",
+    },
+    "covid_crash_2020": {
+        "name": "COVID Crash",
+        "description": "Pandemic liquidation in February-March 2020",
+        "severity": "Extreme",
+        "start": "2020-02",
+        "end": "2020-03",
+    },
+    "rates_shock_2022": {
+        "name": "2022 Rate Shock",
+        "description": "Inflation-driven hiking cycle and duration selloff",
+        "severity": "High",
+        "start": "2022-01",
+        "end": "2022-10",
+    },
+}
+
+# Factor columns replayed from proxy history, mirroring how their betas are
+# estimated in portfolio_risk: momentum/value against the market proxy.
+_REPLAY_FACTORS = ("market", "momentum", "value", "industry", "subindustry", "commodity")
+_EXCESS_FACTORS = ("momentum", "value")
+
+
 def _safe_float(value: Any, default: float = 0.0) -> float:
     try:
         if value is None:
@@ -100,65 +147,238 @@ def _get_portfolio_weights(risk_result: RiskAnalysisResult) -> Dict[str, float]:
     return weights
 
 
-def run_stress_test(
+ScenarioSet = Union[Mapping[str, Mapping[str, Any]], pd.DataFrame]
+
+
+@dataclass(frozen=True)
+class StressImpactMatrix:
+    """
+    Impacts of a batch of scenarios, one row per scenario (decimal returns).
+
+    ``shocks`` is scenarios x factors with zeros where a scenario leaves a
+    factor unshocked (``specified`` marks the shocked cells).  Position
+    arrays are scenarios x tickers in ``stock_betas`` row order.
+    """
+
+    scenarios: pd.Index
+    factors: pd.Index
+    tickers: pd.Index
+    shocks: np.ndarray
+    specified: np.ndarray
+    portfolio_betas: np.ndarray
+    weights: np.ndarray
+    leverage_ratio: float
+    factor_contributions: np.ndarray
+    portfolio_impact: np.ndarray
+    position_impacts: np.ndarray
+    position_contributions: np.ndarray
+    portfolio_value: Optional[float] = None
+
+    @property
+    def dollar_impact(self) -> Optional[np.ndarray]:
+        if self.portfolio_value is None:
+            return None
+        return self.portfolio_value * self.portfolio_impact
+
+    def summary(self) -> pd.DataFrame:
+        """One row per scenario with portfolio impact and worst/best position."""
+        frame = pd.DataFrame(
+            {"estimated_portfolio_impact_pct": self.portfolio_impact * 100.0},
+            index=self.scenarios,
+        )
+        dollar_impact = self.dollar_impact
+        frame["estimated_portfolio_impact_dollar"] = dollar_impact if dollar_impact is not None else np.nan
+        if len(self.tickers):
+            worst = np.argmin(self.position_impacts, axis=1)
+            best = np.argmax(self.position_impacts, axis=1)
+            rows = np.arange(len(self.scenarios))
+            frame["worst_position"] = self.tickers.take(worst)
+            frame["worst_position_impact_pct"] = self.position_impacts[rows, worst] * 100.0
+            frame["best_position"] = self.tickers.take(best)
+            frame["best_position_impact_pct"] = self.position_impacts[rows, best] * 100.0
+        return frame.sort_values("estimated_portfolio_impact_pct", kind="stable")
+
+
+def _scenario_shocks(scenario: Mapping[str, Any]) -> Mapping[str, Any]:
+    if "shocks" in scenario or "name" in scenario:
+        return scenario.get("shocks") or {}
+    return scenario
+
+
+def build_shock_matrix(scenarios: ScenarioSet) -> pd.DataFrame:
+    """
+    Scenarios x factors shock matrix, NaN where a scenario leaves a factor unshocked.
+
+    Accepts a catalog shaped like ``STRESS_SCENARIOS`` (entries carrying a
+    ``shocks`` mapping), a plain ``{scenario_id: {factor: shock}}`` mapping,
+    or an existing DataFrame.  Non-numeric shocks count as 0.0, matching
+    the single-scenario path.
+    """
+    if isinstance(scenarios, pd.DataFrame):
+        matrix = scenarios.apply(pd.to_numeric, errors="coerce").astype(float)
+        return matrix.where(scenarios.isna(), matrix.fillna(0.0))
+
+    factors: Dict[str, int] = {}
+    rows: List[Dict[str, float]] = []
+    for scenario in scenarios.values():
+        shocks = _scenario_shocks(scenario or {})
+        rows.append({str(factor): _safe_float(shock, default=0.0) for factor, shock in shocks.items()})
+        for factor in rows[-1]:
+            factors.setdefault(factor, len(factors))
+
+    matrix = np.full((len(rows), len(factors)), np.nan)
+    for row, shocks in enumerate(rows):
+        for factor, shock in shocks.items():
+            matrix[row, factors[factor]] = shock
+    return pd.DataFrame(matrix, index=pd.Index(list(scenarios.keys())), columns=list(factors))
+
+
+def _resolve_portfolio_value(risk_result: RiskAnalysisResult, portfolio_value: Optional[float]) -> Optional[float]:
+    resolved = portfolio_value if portfolio_value is not None else getattr(risk_result, "total_value", None)
+    return _safe_float(resolved, default=0.0) if resolved is not None else None
+
+
+def compute_stress_impacts(
     risk_result: RiskAnalysisResult,
-    shocks: Dict[str, float],
-    scenario_name: str = "Custom",
+    scenarios: ScenarioSet,
     portfolio_value: Optional[float] = None,
-) -> Dict[str, Any]:
+) -> StressImpactMatrix:
     """
-    Run a multi-factor stress test using precomputed risk analysis outputs.
+    Evaluate every scenario against the precomputed risk analysis at once.
 
-    Math:
-    - Portfolio impact: sum(beta_factor * shock_factor) * leverage_ratio
-    - Position impact: sum(stock_beta_factor * shock_factor)
-    - Position contribution: weight * position_impact
+    Math (S scenarios, F factors, N positions):
+    - Factor contribution: shocks[S,F] * portfolio_beta[F] * leverage_ratio
+    - Portfolio impact: row sum of the factor contributions
+    - Position impact: shocks[S,F] @ stock_betas[N,F].T
+    - Position contribution: position impact * weight[N]
     """
-    shocks = shocks or {}
+    shock_frame = build_shock_matrix(scenarios)
+    specified = shock_frame.notna().to_numpy()
+    shocks = shock_frame.fillna(0.0).to_numpy(dtype=float)
+    factors = pd.Index([str(factor) for factor in shock_frame.columns])
+
     factor_exposures = risk_result.get_factor_exposures() if hasattr(risk_result, "get_factor_exposures") else {}
     leverage_ratio = _safe_leverage(getattr(risk_result, "leverage", None))
+    portfolio_betas = np.array(
+        [_safe_float(factor_exposures.get(factor), default=0.0) for factor in factors],
+        dtype=float,
+    )
+    factor_contributions = shocks * portfolio_betas * leverage_ratio
+
+    stock_betas = getattr(risk_result, "stock_betas", None)
+    if isinstance(stock_betas, pd.DataFrame) and not stock_betas.empty:
+        tickers = pd.Index([str(ticker) for ticker in stock_betas.index])
+        beta_matrix = (
+            stock_betas.reindex(columns=factors)
+            .apply(pd.to_numeric, errors="coerce")
+            .fillna(0.0)
+            .to_numpy(dtype=float)
+        )
+    else:
+        tickers = pd.Index([], dtype=object)
+        beta_matrix = np.zeros((0, len(factors)))
+
+    weights_by_ticker = _get_portfolio_weights(risk_result)
+    weights = np.array(
+        [_safe_float(weights_by_ticker.get(ticker), default=0.0) for ticker in tickers],
+        dtype=float,
+    )
+    position_impacts = shocks @ beta_matrix.T
+
+    return StressImpactMatrix(
+        scenarios=pd.Index(shock_frame.index),
+        factors=factors,
+        tickers=tickers,
+        shocks=shocks,
+        specified=specified,
+        portfolio_betas=portfolio_betas,
+        weights=weights,
+        leverage_ratio=leverage_ratio,
+        factor_contributions=factor_contributions,
+        portfolio_impact=factor_contributions.sum(axis=1),
+        position_impacts=position_impacts,
+        position_contributions=position_impacts * weights,
+        portfolio_value=_resolve_portfolio_value(risk_result, portfolio_value),
+    )
+
+
+def sample_stress_scenarios(
+    risk_result: RiskAnalysisResult,
+    n_scenarios: int,
+    *,
+    factors: Optional[Sequence[str]] = None,
+    horizon_months: int = 1,
+    severity: float = 1.0,
+    seed: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Draw random factor shock scenarios for ``compute_stress_impacts``.
+
+    Each factor shock is normal with the factor's annual volatility (median
+    across positions in ``factor_vols``) scaled to ``horizon_months`` and
+    multiplied by ``severity``.  Factors are drawn independently.
+    """
+    if n_scenarios < 1:
+        raise ValueError("n_scenarios must be >= 1")
+    if horizon_months < 1:
+        raise ValueError("horizon_months must be >= 1")
+
+    factor_vols = getattr(risk_result, "factor_vols", None)
+    if not isinstance(factor_vols, pd.DataFrame) or factor_vols.empty:
+        raise ValueError("Risk result has no factor volatilities to sample from")
+    annual_vols = factor_vols.apply(pd.to_numeric, errors="coerce").median(axis=0, skipna=True)
+    if factors is not None:
+        annual_vols = annual_vols.reindex([str(factor) for factor in factors])
+    annual_vols = annual_vols.dropna()
+    annual_vols = annual_vols[annual_vols > 0]
+    if annual_vols.empty:
+        raise ValueError("No positive factor volatilities to sample from")
+
+    scale = annual_vols.to_numpy(dtype=float) * np.sqrt(horizon_months / 12.0) * float(severity)
+    rng = np.random.default_rng(seed)
+    draws = rng.standard_normal((int(n_scenarios), len(scale))) * scale
+    index = pd.Index([f"sampled_{i}" for i in range(int(n_scenarios))])
+    return pd.DataFrame(draws, index=index, columns=annual_vols.index)
+
+
+def _scenario_result(
+    impacts: StressImpactMatrix,
+    row: int,
+    scenario_name: str,
+    risk_result: RiskAnalysisResult,
+    factor_order: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    factor_position = {factor: col for col, factor in enumerate(impacts.factors)}
+    if factor_order is None:
+        factor_order = [factor for col, factor in enumerate(impacts.factors) if impacts.specified[row, col]]
 
-    portfolio_impact = 0.0
     factor_contributions: List[Dict[str, Any]] = []
-    for factor, shock in shocks.items():
-        shock_value = _safe_float(shock, default=0.0)
-        factor_beta = _safe_float(factor_exposures.get(factor), default=0.0)
-        contribution = factor_beta * shock_value * leverage_ratio
-        portfolio_impact += contribution
+    for factor in factor_order:
+        col = factor_position[str(factor)]
         factor_contributions.append(
             {
                 "factor": factor,
-                "shock": shock_value,
-                "portfolio_beta": factor_beta,
-                "contribution_pct": contribution * 100.0,
+                "shock": float(impacts.shocks[row, col]),
+                "portfolio_beta": float(impacts.portfolio_betas[col]),
+                "contribution_pct": float(impacts.factor_contributions[row, col]) * 100.0,
             }
         )
-
     factor_contributions.sort(key=lambda item: item["contribution_pct"])
 
-    weights = _get_portfolio_weights(risk_result)
-    position_impacts: List[Dict[str, Any]] = []
-    stock_betas = getattr(risk_result, "stock_betas", None)
-
-    if isinstance(stock_betas, pd.DataFrame) and not stock_betas.empty:
-        for ticker, row in stock_betas.iterrows():
-            ticker_key = str(ticker)
-            position_impact = 0.0
-            for factor, shock in shocks.items():
-                stock_beta = _safe_float(row.get(factor), default=0.0)
-                position_impact += stock_beta * _safe_float(shock, default=0.0)
-
-            weight = _safe_float(weights.get(ticker_key), default=0.0)
-            portfolio_contribution = weight * position_impact
-            position_impacts.append(
-                {
-                    "ticker": ticker_key,
-                    "weight": weight,
-                    "estimated_impact_pct": position_impact * 100.0,
-                    "portfolio_contribution_pct": portfolio_contribution * 100.0,
-                }
-            )
-
+    position_impacts: List[Dict[str, Any]] = [
+        {
+            "ticker": ticker,
+            "weight": float(weight),
+            "estimated_impact_pct": float(impact) * 100.0,
+            "portfolio_contribution_pct": float(contribution) * 100.0,
+        }
+        for ticker, weight, impact, contribution in zip(
+            impacts.tickers,
+            impacts.weights,
+            impacts.position_impacts[row],
+            impacts.position_contributions[row],
+        )
+    ]
     position_impacts.sort(key=lambda item: item["estimated_impact_pct"])
 
     worst_position = None
@@ -173,18 +393,10 @@ def run_stress_test(
             "impact_pct": position_impacts[-1]["estimated_impact_pct"],
         }
 
-    resolved_portfolio_value = portfolio_value
-    if resolved_portfolio_value is None:
-        resolved_portfolio_value = getattr(risk_result, "total_value", None)
-    resolved_portfolio_value = (
-        _safe_float(resolved_portfolio_value, default=0.0)
-        if resolved_portfolio_value is not None
-        else None
-    )
-
+    portfolio_impact = float(impacts.portfolio_impact[row])
     dollar_impact = None
-    if resolved_portfolio_value is not None:
-        dollar_impact = resolved_portfolio_value * portfolio_impact
+    if impacts.portfolio_value is not None:
+        dollar_impact = impacts.portfolio_value * portfolio_impact
 
     variance_decomposition = getattr(risk_result, "variance_decomposition", {}) or {}
     return {
@@ -195,7 +407,7 @@ def run_stress_test(
         "factor_contributions": factor_contributions,
         "risk_context": {
             "current_volatility": _safe_float(getattr(risk_result, "volatility_annual", 0.0), default=0.0) * 100.0,
-            "leverage_ratio": leverage_ratio,
+            "leverage_ratio": impacts.leverage_ratio,
             "systematic_risk_pct": _safe_float(variance_decomposition.get("factor_pct"), default=0.0) * 100.0,
             "worst_position": worst_position,
             "best_position": best_position,
@@ -203,6 +415,25 @@ def run_stress_test(
     }
 
 
+def run_stress_test(
+    risk_result: RiskAnalysisResult,
+    shocks: Dict[str, float],
+    scenario_name: str = "Custom",
+    portfolio_value: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Run a multi-factor stress test using precomputed risk analysis outputs.
+
+    Math:
+    - Portfolio impact: sum(beta_factor * shock_factor) * leverage_ratio
+    - Position impact: sum(stock_beta_factor * shock_factor)
+    - Position contribution: weight * position_impact
+    """
+    shocks = shocks or {}
+    impacts = compute_stress_impacts(risk_result, {scenario_name: {"shocks": shocks}}, portfolio_value)
+    return _scenario_result(impacts, 0, scenario_name, risk_result, factor_order=list(shocks))
+
+
 def get_stress_scenarios() -> Dict[str, Dict[str, Any]]:
     """Return a copy of the predefined stress scenario catalog."""
     return {
@@ -217,15 +448,32 @@ def get_stress_scenarios() -> Dict[str, Dict[str, Any]]:
 def run_all_stress_tests(
     risk_result: RiskAnalysisResult,
     portfolio_value: Optional[float] = None,
+    scenarios: Optional[ScenarioSet] = None,
 ) -> List[Dict[str, Any]]:
-    """Run all predefined stress tests and sort by worst estimated impact first."""
+    """
+    Run every scenario (default: the predefined catalog) and sort by worst impact first.
+
+    All scenarios are evaluated in one ``compute_stress_impacts`` pass;
+    ``scenarios`` may also be a user catalog or a shock DataFrame such as
+    ``sample_stress_scenarios`` returns.
+    """
+    catalog = STRESS_SCENARIOS if scenarios is None else scenarios
+    impacts = compute_stress_impacts(risk_result, catalog, portfolio_value)
+
     results: List[Dict[str, Any]] = []
-    for scenario_id, scenario_data in STRESS_SCENARIOS.items():
-        result = run_stress_test(
-            risk_result=risk_result,
-            shocks=scenario_data.get("shocks", {}),
-            scenario_name=scenario_data.get("name", scenario_id),
-            portfolio_value=portfolio_value,
+    for row, scenario_id in enumerate(impacts.scenarios):
+        if isinstance(catalog, pd.DataFrame):
+            scenario_data: Mapping[str, Any] = {}
+            factor_order = None
+        else:
+            scenario_data = catalog[scenario_id] or {}
+            factor_order = [str(factor) for factor in _scenario_shocks(scenario_data)]
+        result = _scenario_result(
+            impacts,
+            row,
+            scenario_data.get("name", scenario_id),
+            risk_result,
+            factor_order=factor_order,
         )
         result["scenario"] = scenario_id
         result["severity"] = scenario_data.get("severity")
@@ -233,3 +481,229 @@ def run_all_stress_tests(
 
     results.sort(key=lambda item: item["estimated_portfolio_impact_pct"])
     return results
+
+
+def _episode_window(episode: Mapping[str, Any]) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Month-end bounds of an episode given as ``start``/``end`` dates or ``YYYY-MM``."""
+    try:
+        start = pd.Timestamp(episode["start"]) + pd.offsets.MonthEnd(0)
+        end = pd.Timestamp(episode["end"]) + pd.offsets.MonthEnd(0)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"Historical episode needs valid 'start' and 'end': {episode!r}") from exc
+    if end < start:
+        raise ValueError(f"Historical episode ends before it starts: {episode!r}")
+    return start.normalize(), end.normalize()
+
+
+def _replay_sources(
+    tickers: pd.Index,
+    factors: Sequence[str],
+    factor_proxies: Mapping[str, Any],
+) -> tuple[List[tuple], np.ndarray]:
+    """
+    Distinct return sources and a tickers x factors index into them (-1 = none).
+
+    A source is ``("raw", proxy)``, ``("excess", proxy, market_proxy)`` or
+    ``("peers", *proxies)`` for peer-group industry proxies.
+    """
+    sources: Dict[tuple, int] = {}
+    source_index = np.full((len(tickers), len(factors)), -1, dtype=np.intp)
+    for row, ticker in enumerate(tickers):
+        proxy_map = factor_proxies.get(ticker)
+        if not isinstance(proxy_map, Mapping):
+            continue
+        market_proxy = proxy_map.get("market")
+        for col, factor in enumerate(factors):
+            proxy = proxy_map.get(factor)
+            if not proxy:
+                continue
+            if isinstance(proxy, (list, tuple)):
+                key: tuple = ("peers", *sorted(str(peer) for peer in proxy if peer))
+                if len(key) == 1:
+                    continue
+            elif factor in _EXCESS_FACTORS:
+                if not isinstance(market_proxy, str) or not market_proxy:
+                    continue
+                key = ("excess", str(proxy), market_proxy)
+            else:
+                key = ("raw", str(proxy))
+            source_index[row, col] = sources.setdefault(key, len(sources))
+    return list(sources), source_index
+
+
+def _source_returns(history: pd.DataFrame, source: tuple) -> pd.Series:
+    kind, *proxies = source
+    missing = [proxy for proxy in proxies if proxy not in history.columns]
+    if kind == "peers":
+        available = [proxy for proxy in proxies if proxy in history.columns]
+        if not available:
+            return pd.Series(np.nan, index=history.index)
+        return history[available].median(axis=1, skipna=True)
+    if missing:
+        return pd.Series(np.nan, index=history.index)
+    if kind == "excess":
+        return history[proxies[0]] - history[proxies[1]]
+    return history[proxies[0]]
+
+
+def compute_historical_replay_impacts(
+    risk_result: RiskAnalysisResult,
+    episodes: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    portfolio_value: Optional[float] = None,
+    *,
+    factor_history: Optional[pd.DataFrame] = None,
+    ticker_alias_map: Optional[Dict[str, str]] = None,
+) -> tuple[StressImpactMatrix, Dict[str, List[str]]]:
+    """
+    Replay realized factor proxy returns from past windows against current betas.
+
+    Every position's factor shock is the compounded return of its own proxy
+    over the episode (momentum/value as excess over its market proxy,
+    peer-group industries as the peer median), applied to its current
+    ``stock_betas``.  All episodes are scored together: one months x
+    sources history panel, one episodes x months matmul for the compounded
+    window returns, then a gather into episodes x positions x factors.
+
+    ``factor_history`` (months x proxies monthly returns) skips the fetch;
+    otherwise it comes from ``risk_helpers.get_factor_proxy_return_history``.
+    Reported per-factor ``shocks`` are exposure-weighted averages of the
+    position shocks, so ``portfolio_beta * shock * leverage`` still equals
+    the factor contribution.
+
+    Returns the impacts and, per episode, the return sources with no data in
+    the window (replayed as a zero shock).
+    """
+    episodes = HISTORICAL_EPISODES if episodes is None else episodes
+    if not episodes:
+        raise ValueError("At least one historical episode is required")
+    episode_ids = pd.Index(list(episodes.keys()))
+    windows = [_episode_window(episodes[episode_id] or {}) for episode_id in episode_ids]
+
+    stock_betas = getattr(risk_result, "stock_betas", None)
+    if not isinstance(stock_betas, pd.DataFrame) or stock_betas.empty:
+        raise ValueError("Risk result has no stock betas to replay against")
+    factors = pd.Index([factor for factor in _REPLAY_FACTORS if factor in stock_betas.columns])
+    tickers = pd.Index([str(ticker) for ticker in stock_betas.index])
+    beta_matrix = (
+        stock_betas.reindex(columns=factors)
+        .apply(pd.to_numeric, errors="coerce")
+        .fillna(0.0)
+        .to_numpy(dtype=float)
+    )
+    factor_proxies = getattr(risk_result, "factor_proxies", None) or {}
+    sources, source_index = _replay_sources(tickers, list(factors), factor_proxies)
+
+    if factor_history is None:
+        proxies = {proxy for source in sources for proxy in source[1:]}
+        fetch_start = min(start for start, _ in windows) - pd.offsets.MonthEnd(2)
+        fetch_end = max(end for _, end in windows)
+        factor_history = get_factor_proxy_return_history(
+            proxies,
+            fetch_start.strftime("%Y-%m-%d"),
+            fetch_end.strftime("%Y-%m-%d"),
+            ticker_alias_map=ticker_alias_map,
+        )
+    history = factor_history.copy()
+    history.index = pd.DatetimeIndex(pd.to_datetime(history.index)).normalize() + pd.offsets.MonthEnd(0)
+
+    source_panel = np.column_stack(
+        [_source_returns(history, source).to_numpy(dtype=float) for source in sources]
+    ) if sources else np.zeros((len(history.index), 0))
+    months = history.index.to_numpy(dtype="datetime64[ns]")
+    in_window = np.array(
+        [(months >= start.to_datetime64()) & (months <= end.to_datetime64()) for start, end in windows],
+        dtype=float,
+    ).reshape(len(windows), len(months))
+
+    observed = np.isfinite(source_panel)
+    log_growth = np.log1p(np.where(observed, source_panel, 0.0))
+    window_returns = np.expm1(in_window @ log_growth)          # episodes x sources
+    has_data = (in_window @ observed.astype(float)) > 0
+    window_returns = np.where(has_data, window_returns, 0.0)
+
+    missing_sources: Dict[str, List[str]] = {}
+    for row, episode_id in enumerate(episode_ids):
+        gaps = ["/".join(sources[col][1:]) for col in np.flatnonzero(~has_data[row])]
+        if gaps:
+            missing_sources[str(episode_id)] = gaps
+
+    # episodes x positions x factors; -1 (no proxy) gathers a zero column.
+    padded = np.concatenate([window_returns, np.zeros((len(windows), 1))], axis=1)
+    position_factor_shocks = padded[:, source_index]
+    position_factor_impacts = position_factor_shocks * beta_matrix
+
+    weights_by_ticker = _get_portfolio_weights(risk_result)
+    weights = np.array(
+        [_safe_float(weights_by_ticker.get(ticker), default=0.0) for ticker in tickers],
+        dtype=float,
+    )
+    leverage_ratio = _safe_leverage(getattr(risk_result, "leverage", None))
+    weighted_betas = beta_matrix * weights[:, None]
+    portfolio_betas = weighted_betas.sum(axis=0)
+    factor_contributions = np.einsum("enf,nf->ef", position_factor_shocks, weighted_betas) * leverage_ratio
+
+    exposure = np.abs(weighted_betas)
+    exposure_total = exposure.sum(axis=0)
+    effective_shocks = np.divide(
+        np.einsum("enf,nf->ef", position_factor_shocks, exposure),
+        exposure_total,
+        out=np.zeros((len(windows), len(factors))),
+        where=exposure_total > 0,
+    )
+    position_impacts = position_factor_impacts.sum(axis=2)
+
+    impacts = StressImpactMatrix(
+        scenarios=episode_ids,
+        factors=factors,
+        tickers=tickers,
+        shocks=effective_shocks,
+        specified=np.broadcast_to(exposure_total > 0, effective_shocks.shape),
+        portfolio_betas=portfolio_betas,
+        weights=weights,
+        leverage_ratio=leverage_ratio,
+        factor_contributions=factor_contributions,
+        portfolio_impact=factor_contributions.sum(axis=1),
+        position_impacts=position_impacts,
+        position_contributions=position_impacts * weights,
+        portfolio_value=_resolve_portfolio_value(risk_result, portfolio_value),
+    )
+    return impacts, missing_sources
+
+
+def run_historical_replay(
+    risk_result: RiskAnalysisResult,
+    episodes: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    portfolio_value: Optional[float] = None,
+    *,
+    factor_history: Optional[pd.DataFrame] = None,
+    ticker_alias_map: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run historical-replay stress tests (default: ``HISTORICAL_EPISODES``), worst first.
+
+    Episodes are ``{id: {"start", "end", "name"?, "severity"?}}`` with dates
+    or ``YYYY-MM`` months; each result has the ``run_stress_test`` shape
+    plus ``scenario``, ``severity``, ``window`` and ``missing_proxies``.
+    """
+    episodes = HISTORICAL_EPISODES if episodes is None else episodes
+    impacts, missing_sources = compute_historical_replay_impacts(
+        risk_result,
+        episodes,
+        portfolio_value,
+        factor_history=factor_history,
+        ticker_alias_map=ticker_alias_map,
+    )
+
+    results: List[Dict[str, Any]] = []
+    for row, episode_id in enumerate(impacts.scenarios):
+        episode = episodes[episode_id] or {}
+        start, end = _episode_window(episode)
+        result = _scenario_result(impacts, row, episode.get("name", episode_id), risk_result)
+        result["scenario"] = episode_id
+        result["severity"] = episode.get("severity")
+        result["window"] = {"start": start.strftime("%Y-%m"), "end": end.strftime("%Y-%m")}
+        result["missing_proxies"] = missing_sources.get(str(episode_id), [])
+        results.append(result)
+
+    results.sort(key=lambda item: item["estimated_portfolio_impact_pct"])
+    return results
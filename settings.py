@@ -203,6 +203,9 @@ REALIZED_PROVIDER_FLOWS_REQUIRE_COVERAGE = (
 TRANSACTION_STORE_READ = os.getenv("TRANSACTION_STORE_READ", "true").strip().lower() in ("1", "true", "yes")
 TRANSACTION_STORE_MAX_AGE_HOURS = float(os.getenv("TRANSACTION_STORE_MAX_AGE_HOURS", "24"))
 TRANSACTION_STORE_RETRY_COOLDOWN_MINUTES = float(os.getenv("TRANSACTION_STORE_RETRY_COOLDOWN_MINUTES", "15"))
+# Month-boundary checkpoints for the realized cash replay (disabled when empty).
+REALIZED_REPLAY_CHECKPOINT_DIR = os.getenv("REALIZED_REPLAY_CHECKPOINT_DIR", "")
+REALIZED_REPLAY_CHECKPOINT_MAX_BYTES = int(os.getenv("REALIZED_REPLAY_CHECKPOINT_MAX_BYTES", str(256 * 1024 * 1024)))
 OPTION_BS_FALLBACK_ENABLED = os.getenv("OPTION_BS_FALLBACK_ENABLED", "true").lower() == "true"
 OPTION_MULTIPLIER_NAV_ENABLED = os.getenv("OPTION_MULTIPLIER_NAV_ENABLED", "false").lower() == "true"
 EXERCISE_COST_BASIS_ENABLED = os.getenv("EXERCISE_COST_BASIS_ENABLED", "false").lower() == "true"
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_risk_engine import backtest_engine
+from portfolio_risk_engine.config import PORTFOLIO_DEFAULTS
+
+
+INDEX = pd.date_range("2020-01-31", periods=24, freq="ME")
+
+
+def _returns(tickers):
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(rng.normal(0.01, 0.05, (len(INDEX), len(tickers))), index=INDEX, columns=tickers)
+
+
+@pytest.fixture
+def fake_market(monkeypatch):
+    """Patch the data layer so run_rebalancing_backtest runs on a fixed returns frame."""
+
+    def install(df_ret):
+        # Like the real filter, rescale the kept weights to a net sum of 1.
+        monkeypatch.setattr(
+            backtest_engine,
+            "_filter_tickers_by_data_availability",
+            lambda weights, **kwargs: (
+                {ticker: weight / sum(weights.values()) for ticker, weight in weights.items()},
+                [],
+                [],
+            ),
+        )
+        monkeypatch.setattr(backtest_engine, "get_returns_dataframe", lambda weights, **kwargs: df_ret)
+        monkeypatch.setattr(backtest_engine, "fetch_monthly_close", lambda *args, **kwargs: None)
+        monkeypatch.setattr(
+            backtest_engine, "calc_monthly_returns", lambda prices: pd.Series(0.005, index=INDEX)
+        )
+        monkeypatch.setattr(backtest_engine, "_get_risk_free_rate", lambda *args: 0.0)
+        monkeypatch.setattr(
+            backtest_engine,
+            "compute_performance_metrics_batch",
+            lambda portfolio_returns, **kwargs: [{} for _ in portfolio_returns.columns],
+        )
+
+    return install
+
+
+def _schedules(result):
+    return {schedule["label"]: schedule for schedule in result["schedules"]}
+
+
+def test_calendar_only_monthly_matches_fixed_weights(fake_market):
+    df_ret = _returns(["A", "B"])
+    fake_market(df_ret)
+
+    result = backtest_engine.run_rebalancing_backtest(
+        {"A": 60.0, "B": 40.0}, "2020-01-01", "2021-12-31",
+        rebalance_frequencies=("monthly", "none", "quarterly"), drift_thresholds=(),
+    )
+
+    schedules = _schedules(result)
+    assert list(schedules) == ["monthly", "none", "quarterly"]
+    monthly = pd.Series(schedules["monthly"]["monthly_returns"])
+    expected = df_ret @ np.array([0.6, 0.4])
+    np.testing.assert_allclose(monthly.to_numpy(), expected.to_numpy())
+    assert schedules["none"]["rebalance_count"] == 0
+    assert schedules["quarterly"]["rebalance_count"] == 7
+
+
+def test_drift_only_schedule(fake_market):
+    df_ret = _returns(["A", "B", "C"])
+    fake_market(df_ret)
+
+    result = backtest_engine.run_rebalancing_backtest(
+        {"A": 0.5, "B": 0.3, "C": 0.2}, "2020-01-01", "2021-12-31",
+        rebalance_frequencies=(), drift_thresholds=(2.0, 50.0),
+    )
+
+    schedules = _schedules(result)
+    assert list(schedules) == ["drift_2pp", "drift_50pp"]
+    assert 0 < schedules["drift_2pp"]["rebalance_count"] < len(INDEX) - 1
+    assert schedules["drift_50pp"]["rebalance_count"] == 0
+
+
+def test_unnormalized_weights_do_not_drift_without_returns(fake_market):
+    fake_market(pd.DataFrame(0.0, index=INDEX, columns=["A", "B"]))
+
+    result = backtest_engine.run_rebalancing_backtest(
+        {"A": 30.0, "B": 20.0}, "2020-01-01", "2021-12-31",
+        rebalance_frequencies=("monthly",), drift_thresholds=(2.0,),
+    )
+
+    schedules = _schedules(result)
+    assert schedules["monthly"]["turnover"] == 0.0
+    assert schedules["drift_2pp"]["rebalance_count"] == 0
+
+
+@pytest.mark.parametrize("normalize_default", [False, True])
+def test_long_short_monthly_uses_gross_exposure(fake_market, monkeypatch, normalize_default):
+    monkeypatch.setitem(PORTFOLIO_DEFAULTS, "normalize_weights", normalize_default)
+    df_ret = _returns(["A", "B", "C"])
+    fake_market(df_ret)
+    weights = {"A": 0.6, "B": 0.6, "C": -0.2}
+
+    result = backtest_engine.run_rebalancing_backtest(
+        weights, "2020-01-01", "2021-12-31",
+        rebalance_frequencies=("monthly", "none"), drift_thresholds=(2.0,),
+    )
+
+    schedules = _schedules(result)
+    gross = np.array(list(weights.values())) / 1.4
+    monthly = pd.Series(schedules["monthly"]["monthly_returns"])
+    np.testing.assert_allclose(monthly.to_numpy(), (df_ret @ gross).to_numpy())
+    for schedule in schedules.values():
+        assert np.isfinite(list(schedule["monthly_returns"].values())).all()
+    # Buy and hold compounds the same month-one return before any drift.
+    first_month = INDEX[0].strftime("%Y-%m")
+    assert schedules["none"]["monthly_returns"][first_month] == pytest.approx(float(df_ret.iloc[0] @ gross))